@@ -175,6 +175,7 @@ class EvaluationConfig:
     test_cases: List[str]
     results_dir_name: str = "tests"
     runs: int = 1
+    max_concurrent_tasks: int = 1
     evaluation_settings: EvaluationSettings = field(default_factory=EvaluationSettings)
 
     def __post_init__(self):
@@ -193,6 +194,11 @@ class EvaluationConfig:
         if self.runs < 1:
             raise ConfigurationValidationError("Number of runs must be at least 1")
 
+        if self.max_concurrent_tasks < 1:
+            raise ConfigurationValidationError(
+                "Maximum number of concurrent tasks must be at least 1"
+            )
+
         if not self.results_dir_name or not self.results_dir_name.strip():
             raise ConfigurationValidationError("Results directory name cannot be empty")
 
@@ -282,6 +288,12 @@ class ConfigurationValidator:
             field_type=int,
             default_value=1,
         ),
+        "max_concurrent_tasks": FieldValidator(
+            name="max_concurrent_tasks",
+            validation_level=ValidationLevel.OPTIONAL,
+            field_type=int,
+            default_value=1,
+        ),
         "evaluation_settings": FieldValidator(
             name="evaluation_settings",
             validation_level=ValidationLevel.OPTIONAL,
@@ -552,6 +564,16 @@ class ConfigurationProcessor:
         runs = self.validator.validate_field(
             "runs", raw_config.get("runs"), self.validator.ROOT_LEVEL_RULES, raw_config
         )
+        max_concurrent_tasks = self.validator.validate_field(
+            "max_concurrent_tasks",
+            raw_config.get("max_concurrent_tasks"),
+            self.validator.ROOT_LEVEL_RULES,
+            raw_config,
+        )
+        if max_concurrent_tasks is not None and max_concurrent_tasks < 1:
+            self.validator.report.add_error(
+                "max_concurrent_tasks", "Must be at least 1"
+            )
 
         llm_models_data = raw_config.get("llm_models", [])
         processed_models = []
@@ -597,6 +619,7 @@ class ConfigurationProcessor:
             "test_cases": test_cases or [],
             "results_dir_name": results_dir_name or "tests",
             "runs": runs or 1,
+            "max_concurrent_tasks": max_concurrent_tasks or 1,
             "evaluation_settings": processed_eval_settings,
         }
 
@@ -40,6 +40,9 @@ class EvaluationResult:
     llm_eval_score: Optional[float] = None
     llm_eval_reasoning: Optional[str] = None
     duration_seconds: Optional[float] = None
+    time_to_first_status_seconds: Optional[float] = None
+    time_to_first_token_seconds: Optional[float] = None
+    total_latency_seconds: Optional[float] = None
     errors: List[str] = field(default_factory=list)
 
     def to_dict(self) -> Dict[str, Any]:
@@ -49,6 +52,9 @@ class EvaluationResult:
             "test_case_id": self.test_case_id,
             "test_case_path": self.test_case_path,
             "duration_seconds": self.duration_seconds,
+            "time_to_first_status_seconds": self.time_to_first_status_seconds,
+            "time_to_first_token_seconds": self.time_to_first_token_seconds,
+            "total_latency_seconds": self.total_latency_seconds,
         }
 
         if self.tool_match_score is not None:
@@ -471,6 +477,11 @@ class RunEvaluator:
             test_case_id=test_case["test_case_id"],
             test_case_path=test_case_path,
             duration_seconds=summary_data.get("duration_seconds"),
+            time_to_first_status_seconds=summary_data.get(
+                "time_to_first_status_seconds"
+            ),
+            time_to_first_token_seconds=summary_data.get("time_to_first_token_seconds"),
+            total_latency_seconds=summary_data.get("total_latency_seconds"),
         )
 
         # Run evaluations
@@ -169,7 +169,10 @@ function populateRunDetails(testData, filterModel = 'all') {
                     query: run.query || '',
                     actualResponse: run.actual_response || '',
                     expectedResponse: run.expected_response || '',
-                    executionTime: run.execution_time || 'N/A' // Add execution time with 'N/A' fallback
+                    executionTime: run.execution_time || 'N/A', // Add execution time with 'N/A' fallback
+                    timeToFirstStatus: run.time_to_first_status,
+                    timeToFirstToken: run.time_to_first_token,
+                    totalLatency: run.total_latency
                 });
             });
         });
@@ -244,6 +247,9 @@ function populateRunDetails(testData, filterModel = 'all') {
             </div>
             <div class="run-performance">
                 <div class="run-execution-time">Execution Time: ${typeof run.executionTime === 'number' ? run.executionTime.toFixed(3) + 's' : run.executionTime}</div>
+                ${formatLatency('First Status', run.timeToFirstStatus)}
+                ${formatLatency('First Token', run.timeToFirstToken)}
+                ${formatLatency('Total Latency', run.totalLatency)}
             </div>
         `;
         
@@ -251,6 +257,13 @@ function populateRunDetails(testData, filterModel = 'all') {
     });
 }
 
+function formatLatency(label, seconds) {
+    if (typeof seconds !== 'number') {
+        return '';
+    }
+    return `<div class="run-execution-time">${label}: ${seconds.toFixed(3)}s</div>`;
+}
+
 function generateMockReasoning(responseScore, toolScore, model, runNumber) {
     let responseQuality = '';
     let toolUsage = '';
@@ -435,6 +435,15 @@ class ModalDataService:
                                                 "llm_eval": llm_score,
                                                 "llm_reasoning": reasoning,
                                                 "execution_time": duration,
+                                                "time_to_first_status": run_data.get(
+                                                    "time_to_first_status_seconds"
+                                                ),
+                                                "time_to_first_token": run_data.get(
+                                                    "time_to_first_token_seconds"
+                                                ),
+                                                "total_latency": run_data.get(
+                                                    "total_latency_seconds"
+                                                ),
                                                 "query": "",
                                                 "actual_response": "",
                                                 "expected_response": "",
@@ -516,6 +525,7 @@ class TemplateDataService:
                         if isinstance(model_data, dict) and "runs" in model_data:
                             scores = []
                             durations = []
+                            first_token_times = []
                             success_count = 0
 
                             for run in model_data["runs"]:
@@ -539,6 +549,11 @@ class TemplateDataService:
                                         duration, (int, float)
                                     ):
                                         durations.append(duration)
+                                    first_token_time = run.get(
+                                        "time_to_first_token_seconds"
+                                    )
+                                    if isinstance(first_token_time, (int, float)):
+                                        first_token_times.append(first_token_time)
                                     if (
                                         score is not None
                                         and isinstance(score, (int, float))
@@ -552,6 +567,12 @@ class TemplateDataService:
                                     sum(durations) / len(durations) if durations else 0
                                 )
                                 score_class = self._get_score_class(avg_score)
+                                first_token_html = (
+                                    f'<span class="avg-duration">Avg first token: '
+                                    f"{sum(first_token_times) / len(first_token_times):.1f}s</span>"
+                                    if first_token_times
+                                    else ""
+                                )
 
                                 test_scores.append(
                                     f"""
@@ -559,6 +580,7 @@ class TemplateDataService:
                                         <span class="model-score">{model_name}</span>
                                         <span class="score-value">LLM Eval: {avg_score:.3f}</span>
                                         <span class="avg-duration">Avg time: {avg_duration:.1f}s</span>
+                                        {first_token_html}
                                     </div>
                                 """
                                 )
@@ -13,6 +13,7 @@ import uuid
 import shutil
 import mimetypes
 import threading
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
 from typing import Dict, List, Optional, Tuple, Any
@@ -47,6 +48,7 @@ class EvaluationConfig:
         self.llm_models = config_data.get("llm_models", [])
         self.runs = config_data.get("runs", 1)
         self.results_dir_name = config_data.get("results_dir_name", "tests")
+        self.max_concurrent_tasks = config_data.get("max_concurrent_tasks", 1)
 
         self._validate_config()
 
@@ -62,6 +64,8 @@ class EvaluationConfig:
             raise ValueError(
                 "'llm_models' configuration is required and cannot be empty"
             )
+        if not isinstance(self.max_concurrent_tasks, int) or self.max_concurrent_tasks < 1:
+            raise ValueError("'max_concurrent_tasks' must be a positive integer")
 
 
 @dataclass
@@ -303,6 +307,7 @@ class TestExecutor:
         )
 
         # Submit the task
+        submitted_at = time.time()
         task_id = self.task_service.submit_task(
             test_run.agent, test_run.query, test_run.artifacts
         )
@@ -327,10 +332,12 @@ class TestExecutor:
 
         # Track the task
         task_mappings[task_id] = run_dir
-        subscriber.active_tasks.add(task_id)
+        subscriber.task_tracker.register_task(task_id, submitted_at)
 
         # Wait for completion
-        return self._wait_for_completion(task_id, test_run.wait_time, subscriber)
+        completed = self._wait_for_completion(task_id, test_run.wait_time, subscriber)
+        self._save_timing(task_id, run_dir, completed, subscriber)
+        return completed
 
     def _wait_for_completion(
         self, task_id: str, wait_time: int, subscriber: Subscriber
@@ -340,17 +347,24 @@ class TestExecutor:
             f"Waiting for task {task_id} to complete (timeout: {wait_time} seconds)..."
         )
 
-        start_time = time.time()
-        while task_id in subscriber.active_tasks:
-            if time.time() - start_time > wait_time:
-                print(f"Task {task_id} timed out after {wait_time} seconds")
-                subscriber.active_tasks.discard(task_id)
-                return False
-            time.sleep(1)
+        if not subscriber.task_tracker.wait_for_task(task_id, wait_time):
+            print(f"Task {task_id} timed out after {wait_time} seconds")
+            return False
 
         print(f"Task {task_id} completed successfully")
         return True
 
+    def _save_timing(
+        self, task_id: str, run_dir: str, completed: bool, subscriber: Subscriber
+    ):
+        """Save the task's latency milestones for the summary builder."""
+        timing = subscriber.task_tracker.get_timing(task_id)
+        if timing is None:
+            return
+        timing_data = timing.to_dict()
+        timing_data["completed"] = completed
+        self.file_service.save_json(timing_data, os.path.join(run_dir, "timing.json"))
+
 
 class ModelEvaluator:
     """Handles the evaluation of a single model."""
@@ -434,21 +448,55 @@ class ModelEvaluator:
 
         self._task_mappings = {}
         total_tests = len(test_runs)
-        successful_tests = 0
-
-        print(f"--- Starting sequential execution of {total_tests} tests ---")
+        max_concurrent_tasks = min(self.config.max_concurrent_tasks, total_tests)
 
-        for i, test_run in enumerate(test_runs, 1):
-            print(f"--- Test {i}/{total_tests} ---")
-            success = self.test_executor.execute_test(
-                test_run, model_results_path, self._task_mappings, subscriber
+        if max_concurrent_tasks <= 1:
+            print(f"--- Starting sequential execution of {total_tests} tests ---")
+            results = [
+                self._execute_numbered_test(
+                    i, total_tests, test_run, model_results_path, subscriber
+                )
+                for i, test_run in enumerate(test_runs, 1)
+            ]
+        else:
+            print(
+                f"--- Starting concurrent execution of {total_tests} tests "
+                f"({max_concurrent_tasks} in flight) ---"
             )
-            if success:
-                successful_tests += 1
-            else:
-                print(f"Test {i} failed or timed out")
-
-        return successful_tests
+            with ThreadPoolExecutor(
+                max_workers=max_concurrent_tasks, thread_name_prefix="EvalTest"
+            ) as executor:
+                futures = [
+                    executor.submit(
+                        self._execute_numbered_test,
+                        i,
+                        total_tests,
+                        test_run,
+                        model_results_path,
+                        subscriber,
+                    )
+                    for i, test_run in enumerate(test_runs, 1)
+                ]
+                results = [future.result() for future in futures]
+
+        return sum(results)
+
+    def _execute_numbered_test(
+        self,
+        i: int,
+        total_tests: int,
+        test_run: TestRun,
+        model_results_path: str,
+        subscriber: Subscriber,
+    ) -> bool:
+        """Execute one test run, logging its position in the suite."""
+        print(f"--- Test {i}/{total_tests} ---")
+        success = self.test_executor.execute_test(
+            test_run, model_results_path, self._task_mappings, subscriber
+        )
+        if not success:
+            print(f"Test {i} failed or timed out")
+        return success
 
     def _cleanup_model_evaluation(
         self,
@@ -181,6 +181,30 @@ class TaskCompletionEvent:
     timestamp: float = field(default_factory=time.time)
 
 
+@dataclass
+class TaskTiming:
+    """Wall-clock milestones of a tracked task, as seen by the subscriber."""
+
+    submitted_at: float
+    first_status_at: Optional[float] = None
+    first_token_at: Optional[float] = None
+    completed_at: Optional[float] = None
+
+    def _since_submit(self, timestamp: Optional[float]) -> Optional[float]:
+        if timestamp is None:
+            return None
+        return round(timestamp - self.submitted_at, 3)
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert to dictionary for JSON serialization (durations in seconds)."""
+        return {
+            "submitted_at": self.submitted_at,
+            "time_to_first_status_seconds": self._since_submit(self.first_status_at),
+            "time_to_first_token_seconds": self._since_submit(self.first_token_at),
+            "total_latency_seconds": self._since_submit(self.completed_at),
+        }
+
+
 class MessageSanitizer:
     """Handles message sanitization and cleaning."""
 
@@ -359,7 +383,17 @@ class MessageProcessor:
 
 
 class TaskTracker:
-    """Tracks task completion and manages active tasks."""
+    """
+    Tracks task completion and manages active tasks.
+
+    Tasks registered with `register_task` also get a completion event, so
+    callers can block in `wait_for_task` until the subscriber sees the task's
+    final response instead of polling `active_tasks`, and per-task timings
+    (first status, first streamed text, final response). Gateway messages
+    for a task that arrive before it is registered (the agent can respond
+    before the submitting HTTP request returns) are kept and applied when it
+    is registered.
+    """
 
     def __init__(
         self, active_tasks: Set[str], wave_complete_event: Optional[threading.Event]
@@ -368,6 +402,67 @@ class TaskTracker:
         self.wave_complete_event = wave_complete_event
         self.completed_tasks: List[TaskCompletionEvent] = []
         self._lock = threading.Lock()
+        self._completion_events: Dict[str, threading.Event] = {}
+        self._timings: Dict[str, TaskTiming] = {}
+        self._early_responses: Dict[str, str] = {}
+
+    def register_task(self, task_id: str, submitted_at: Optional[float] = None) -> None:
+        """Start tracking a submitted task."""
+        submitted_at = submitted_at if submitted_at is not None else time.time()
+        with self._lock:
+            timing = self._timings.setdefault(task_id, TaskTiming(submitted_at))
+            timing.submitted_at = submitted_at
+            self._completion_events[task_id] = threading.Event()
+            self.active_tasks.add(task_id)
+            early_response_topic = self._early_responses.pop(task_id, None)
+        if early_response_topic is not None:
+            self.handle_task_completion(early_response_topic)
+
+    def wait_for_task(self, task_id: str, timeout: float) -> bool:
+        """
+        Block until the task completes or the timeout expires.
+
+        Returns:
+            True if the task completed; on timeout the task stops being tracked
+            and False is returned.
+        """
+        with self._lock:
+            event = self._completion_events.get(task_id)
+            if event is None:
+                return task_id not in self.active_tasks
+        if event.wait(timeout):
+            return True
+        with self._lock:
+            if event.is_set():
+                return True
+            self.active_tasks.discard(task_id)
+            self._completion_events.pop(task_id, None)
+        return False
+
+    def get_timing(self, task_id: str) -> Optional[TaskTiming]:
+        """Get the recorded timing of a registered task."""
+        with self._lock:
+            return self._timings.get(task_id)
+
+    def record_status(
+        self, topic: str, payload: Any = None, timestamp: Optional[float] = None
+    ) -> None:
+        """
+        Record the first status update, and the first one carrying text, of a
+        task. Status updates filtered from storage count as well, so call this
+        with `payload=None` for those.
+        """
+        if "/gateway/status/" not in topic:
+            return
+        task_id = self._extract_task_id(topic)
+        timestamp = timestamp if timestamp is not None else time.time()
+        with self._lock:
+            # Timing starts at submission; register_task sets submitted_at.
+            timing = self._timings.setdefault(task_id, TaskTiming(timestamp))
+            if timing.first_status_at is None:
+                timing.first_status_at = timestamp
+            if timing.first_token_at is None and _has_text_part(payload):
+                timing.first_token_at = timestamp
 
     def handle_task_completion(self, topic: str) -> Optional[TaskCompletionEvent]:
         """
@@ -392,6 +487,13 @@ class TaskTracker:
                     logger.info(f"Task {task_id} completed")
                     self.active_tasks.remove(task_id)
 
+                    timing = self._timings.get(task_id)
+                    if timing is not None and timing.completed_at is None:
+                        timing.completed_at = time.time()
+                    completion = self._completion_events.pop(task_id, None)
+                    if completion is not None:
+                        completion.set()
+
                     completion_event = TaskCompletionEvent(task_id=task_id, topic=topic)
                     self.completed_tasks.append(completion_event)
 
@@ -402,6 +504,12 @@ class TaskTracker:
 
                     return completion_event
 
+                if "/gateway/response/" in topic:
+                    self._early_responses[task_id] = topic
+                    timing = self._timings.setdefault(task_id, TaskTiming(time.time()))
+                    if timing.completed_at is None:
+                        timing.completed_at = time.time()
+
         except Exception as e:
             logger.error(f"Error handling task completion: {e}")
 
@@ -425,6 +533,17 @@ class TaskTracker:
             return len(self.completed_tasks)
 
 
+def _has_text_part(data: Any) -> bool:
+    """True if a status payload contains a non-empty text part."""
+    if isinstance(data, dict):
+        if data.get("kind") == "text" and data.get("text"):
+            return True
+        return any(_has_text_part(value) for value in data.values())
+    if isinstance(data, list):
+        return any(_has_text_part(item) for item in data)
+    return False
+
+
 class MessageStorage:
     """Handles message storage and file operations."""
 
@@ -754,14 +873,23 @@ class MessageSubscriber(threading.Thread):
             # Process the message
             processed_message = self.message_processor.process_message(inbound_message)
 
-            if processed_message:
-                self.messages_processed += 1
+            if not processed_message:
+                # Filtered status updates still mark the task's first status.
+                self.task_tracker.record_status(inbound_message.get_destination_name())
+                return
+
+            self.task_tracker.record_status(
+                processed_message.topic,
+                processed_message.payload,
+                processed_message.timestamp,
+            )
+            self.messages_processed += 1
 
-                # Store the message
-                self.message_storage.add_message(processed_message)
+            # Store the message
+            self.message_storage.add_message(processed_message)
 
-                # Handle task completion if applicable
-                self.task_tracker.handle_task_completion(processed_message.topic)
+            # Handle task completion if applicable
+            self.task_tracker.handle_task_completion(processed_message.topic)
 
         except Exception as e:
             logger.warning(f"Error handling message: {e}")
@@ -46,6 +46,9 @@ class TimeMetrics:
     start_time: Optional[str] = None
     end_time: Optional[str] = None
     duration_seconds: Optional[float] = None
+    time_to_first_status_seconds: Optional[float] = None
+    time_to_first_token_seconds: Optional[float] = None
+    total_latency_seconds: Optional[float] = None
 
 
 @dataclass
@@ -80,6 +83,9 @@ class RunSummary:
             "start_time": self.time_metrics.start_time,
             "end_time": self.time_metrics.end_time,
             "duration_seconds": self.time_metrics.duration_seconds,
+            "time_to_first_status_seconds": self.time_metrics.time_to_first_status_seconds,
+            "time_to_first_token_seconds": self.time_metrics.time_to_first_token_seconds,
+            "total_latency_seconds": self.time_metrics.total_latency_seconds,
             "tool_calls": [
                 {
                     "call_id": tc.call_id,
@@ -568,6 +574,9 @@ class SummaryBuilder:
             # Process messages to extract data
             self._process_messages(messages, summary, test_case)
 
+            # Add client-side latency measured while the run executed
+            self._add_latency_metrics(run_path, summary)
+
             # Add artifact information if possible
             self._add_artifact_information(summary, test_case)
 
@@ -690,6 +699,25 @@ class SummaryBuilder:
                     "Could not parse start or end time to calculate duration."
                 )
 
+    def _add_latency_metrics(self, run_path: str, summary: RunSummary):
+        """Add the latency milestones recorded by the runner in timing.json."""
+        timing_path = os.path.join(run_path, "timing.json")
+        if not os.path.exists(timing_path):
+            return
+
+        try:
+            timing = self.file_service.load_json(timing_path)
+        except Exception as e:
+            summary.errors.append(f"Could not load timing data: {e}")
+            return
+
+        metrics = summary.time_metrics
+        metrics.time_to_first_status_seconds = timing.get(
+            "time_to_first_status_seconds"
+        )
+        metrics.time_to_first_token_seconds = timing.get("time_to_first_token_seconds")
+        metrics.total_latency_seconds = timing.get("total_latency_seconds")
+
     def _add_artifact_information(self, summary: RunSummary, test_case: Dict[str, Any]):
         """Add artifact information if configuration is available."""
         if not summary.namespace or not summary.context_id:
@@ -8,14 +8,85 @@ import logging
 import os
 import shutil
 import unicodedata
+import uuid
+import weakref
+from collections.abc import AsyncIterable, Callable
 
 from google.adk.artifacts import BaseArtifactService
 from google.genai import types as adk_types
 from typing_extensions import override
 
+from .listing import (
+    DEFAULT_METADATA_LOAD_CONCURRENCY,
+    ArtifactListing,
+    build_artifact_listings,
+)
+from .streaming import ArtifactStream, ContentDigest, SavedArtifactStream
+
 logger = logging.getLogger(__name__)
 
 METADATA_FILE_SUFFIX = ".meta"
+INDEX_FILE_NAME = ".index.json"
+# One JSON line per saved version (size, mime type, revision). Appended rather
+# than rewritten so a save costs the same however many versions exist.
+VERSION_LOG_FILE_NAME = ".versions.jsonl"
+# Streamed uploads are spooled here, on the same filesystem as the artifacts,
+# so a finished upload is moved into place with a rename.
+UPLOAD_SPOOL_DIR_NAME = ".uploads"
+DURABILITY_MODES = ("fsync", "group_commit")
+
+
+def _next_version(index: dict) -> int:
+    return 0 if index["latest"] is None else index["latest"] + 1
+
+
+def _fsync_paths(paths: list[str]) -> None:
+    """Flushes already-written files to stable storage."""
+    for path in paths:
+        fd = os.open(path, os.O_RDONLY)
+        try:
+            os.fsync(fd)
+        finally:
+            os.close(fd)
+
+
+class _GroupCommitter:
+    """
+    Batches fsyncs from concurrent saves on one event loop.
+
+    Saves register the files they wrote and wait; a single flusher fsyncs every
+    file queued since the previous flush in one worker-thread hop, so N
+    concurrent saves share one round of fsyncs instead of paying for 2N hops.
+    """
+
+    def __init__(self):
+        self._pending: list[tuple[list[str], asyncio.Future]] = []
+        self._flusher: asyncio.Task | None = None
+
+    async def commit(self, paths: list[str]) -> None:
+        future = asyncio.get_running_loop().create_future()
+        self._pending.append((paths, future))
+        if self._flusher is None or self._flusher.done():
+            self._flusher = asyncio.create_task(self._flush())
+        await future
+
+    async def _flush(self) -> None:
+        while self._pending:
+            # Let saves that are about to commit join this batch.
+            await asyncio.sleep(0)
+            batch, self._pending = self._pending, []
+            try:
+                await asyncio.to_thread(
+                    _fsync_paths, [path for paths, _ in batch for path in paths]
+                )
+            except OSError as e:
+                for _, future in batch:
+                    if not future.done():
+                        future.set_exception(e)
+            else:
+                for _, future in batch:
+                    if not future.done():
+                        future.set_result(None)
 
 
 class FilesystemArtifactService(BaseArtifactService):
@@ -25,22 +96,41 @@ class FilesystemArtifactService(BaseArtifactService):
     Stores artifacts in a structured directory based on the effective app name
     (which represents the scope), user ID, session ID (or 'user' namespace),
     filename, and version. Metadata (like mime_type) is stored in a companion file.
+    Each artifact directory also holds a small index file recording the latest
+    version with its size and mime type, so saves and version lookups do not
+    need to list the directory, and a version log recording the size, mime type
+    and revision of every version, so opening any version does not stat it.
     """
 
-    def __init__(self, base_path: str):
+    def __init__(self, base_path: str, durability: str = "fsync"):
         """
         Initializes the FilesystemArtifactService.
 
         Args:
             base_path: The root directory where all artifacts will be stored.
+            durability: 'fsync' (default) fsyncs every save individually.
+                'group_commit' batches the fsyncs of concurrent saves; each save
+                still returns only after its files are on stable storage.
 
         Raises:
-            ValueError: If base_path is not provided or cannot be created.
+            ValueError: If base_path is not provided or cannot be created, or
+                durability is not a supported mode.
         """
         if not base_path:
             raise ValueError("base_path cannot be empty for FilesystemArtifactService")
+        if durability not in DURABILITY_MODES:
+            raise ValueError(
+                f"Unsupported durability mode '{durability}'. Expected one of {DURABILITY_MODES}."
+            )
 
         self.base_path = os.path.abspath(base_path)
+        self.durability = durability
+        self._artifact_locks: weakref.WeakValueDictionary[str, asyncio.Lock] = (
+            weakref.WeakValueDictionary()
+        )
+        self._committers: weakref.WeakKeyDictionary[
+            asyncio.AbstractEventLoop, _GroupCommitter
+        ] = weakref.WeakKeyDictionary()
 
         try:
             os.makedirs(self.base_path, exist_ok=True)
@@ -58,6 +148,22 @@ class FilesystemArtifactService(BaseArtifactService):
                 f"Could not create or access base_path '{self.base_path}': {e}"
             ) from e
 
+    def _get_artifact_lock(self, artifact_dir: str) -> asyncio.Lock:
+        """Returns the lock serializing version allocation for one artifact."""
+        lock = self._artifact_locks.get(artifact_dir)
+        if lock is None:
+            lock = asyncio.Lock()
+            self._artifact_locks[artifact_dir] = lock
+        return lock
+
+    def _get_committer(self) -> _GroupCommitter:
+        loop = asyncio.get_running_loop()
+        committer = self._committers.get(loop)
+        if committer is None:
+            committer = _GroupCommitter()
+            self._committers[loop] = committer
+        return committer
+
     def _file_has_user_namespace(self, filename: str) -> bool:
         """Checks if the filename has a user namespace."""
         return filename.startswith("user:")
@@ -100,6 +206,188 @@ class FilesystemArtifactService(BaseArtifactService):
         """Constructs the file path for a specific artifact version's metadata."""
         return os.path.join(artifact_dir, f"{version}{METADATA_FILE_SUFFIX}")
 
+    def _scan_artifact_dir(self, artifact_dir: str) -> list[int]:
+        """Lists version numbers by scanning an artifact directory."""
+        with os.scandir(artifact_dir) as entries:
+            return sorted(
+                int(entry.name)
+                for entry in entries
+                if entry.name.isdigit() and entry.is_file()
+            )
+
+    def _read_index(self, artifact_dir: str) -> dict | None:
+        """Reads the artifact's version index, or None if missing or unreadable."""
+        try:
+            with open(os.path.join(artifact_dir, INDEX_FILE_NAME), encoding="utf-8") as f:
+                index = json.load(f)
+            if isinstance(index, dict) and "latest" in index:
+                return index
+        except FileNotFoundError:
+            return None
+        except (OSError, ValueError) as e:
+            logger.warning("Ignoring unreadable index in '%s': %s", artifact_dir, e)
+        return None
+
+    def _rebuild_index(self, artifact_dir: str) -> dict:
+        """Builds an index from the files on disk (legacy or stale directories)."""
+        versions = self._scan_artifact_dir(artifact_dir)
+        if not versions:
+            return {"latest": None}
+        latest = versions[-1]
+        index = {
+            "latest": latest,
+            "size_bytes": os.path.getsize(self._get_version_path(artifact_dir, latest)),
+            "mime_type": None,
+        }
+        try:
+            with open(self._get_metadata_path(artifact_dir, latest), encoding="utf-8") as f:
+                index["mime_type"] = json.load(f).get("mime_type")
+        except (OSError, ValueError):
+            pass
+        if versions != list(range(latest + 1)):
+            index["versions"] = versions
+        return index
+
+    def _index_versions(self, index: dict) -> list[int]:
+        """
+        Versions recorded by an index. Versions are allocated contiguously from
+        0, so only directories written before the index existed (and found to
+        have gaps) carry an explicit list.
+        """
+        if "versions" in index:
+            return list(index["versions"])
+        if index["latest"] is None:
+            return []
+        return list(range(index["latest"] + 1))
+
+    def _read_version_entry(self, artifact_dir: str, version: int) -> dict:
+        """Describes a version from its files, as recorded in the version log."""
+        data_stat = os.stat(self._get_version_path(artifact_dir, version))
+        with open(self._get_metadata_path(artifact_dir, version), encoding="utf-8") as f:
+            mime_type = json.load(f).get("mime_type")
+        return {
+            "version": version,
+            "size_bytes": data_stat.st_size,
+            "mime_type": mime_type,
+            "revision": str(data_stat.st_mtime_ns),
+        }
+
+    def _read_version_log(self, artifact_dir: str) -> dict[int, dict]:
+        """
+        Maps versions to their version log entries. Versions saved before the
+        log existed, and torn lines left by a crash, are simply absent.
+        """
+        entries: dict[int, dict] = {}
+        try:
+            with open(
+                os.path.join(artifact_dir, VERSION_LOG_FILE_NAME), encoding="utf-8"
+            ) as f:
+                for line in f:
+                    try:
+                        entry = json.loads(line)
+                        entries[int(entry["version"])] = entry
+                    except (ValueError, KeyError, TypeError):
+                        continue
+        except FileNotFoundError:
+            pass
+        return entries
+
+    def _append_version_log(self, artifact_dir: str, entry: dict) -> None:
+        """
+        Appends a version's entry to the log. Like the index, the log is not
+        fsynced; a version missing from it is described from its files instead.
+        """
+        with open(
+            os.path.join(artifact_dir, VERSION_LOG_FILE_NAME), "a", encoding="utf-8"
+        ) as f:
+            f.write(json.dumps(entry) + "\n")
+
+    def _write_index(self, artifact_dir: str, index: dict) -> None:
+        """
+        Atomically replaces the artifact's index. The index is not fsynced: it
+        can always be rebuilt from the version files, and save_artifact
+        rebuilds it when it finds the index lagging behind the directory.
+        """
+        index_path = os.path.join(artifact_dir, INDEX_FILE_NAME)
+        tmp_path = f"{index_path}.{uuid.uuid4().hex}.tmp"
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            f.write(json.dumps(index))
+        os.replace(tmp_path, index_path)
+
+    def _write_version(
+        self,
+        artifact_dir: str,
+        write_data: Callable[[str], None],
+        size_bytes: int,
+        mime_type: str,
+        log_prefix: str,
+    ) -> tuple[int, list[str]]:
+        """
+        Allocates the next version from the index and writes its data (with
+        `write_data(version_path)`) and metadata files, its version log entry
+        and the updated index, in a worker thread. Returns the version and the
+        files a group commit must flush.
+
+        In group-commit mode the caller flushes those files after releasing the
+        artifact lock, so saves of one artifact do not queue behind each
+        other's fsyncs. The index may therefore briefly name a version that is
+        written but not yet durable.
+        """
+        group_commit = self.durability == "group_commit"
+        try:
+            os.makedirs(artifact_dir, exist_ok=True)
+        except OSError as e:
+            logger.error(
+                "%sFailed to create artifact directory '%s': %s",
+                log_prefix,
+                artifact_dir,
+                e,
+            )
+            raise OSError(f"Could not create artifact directory: {e}") from e
+
+        index = self._read_index(artifact_dir)
+        if index is None or os.path.exists(
+            self._get_version_path(artifact_dir, _next_version(index))
+        ):
+            index = self._rebuild_index(artifact_dir)
+        version = _next_version(index)
+
+        version_path = self._get_version_path(artifact_dir, version)
+        metadata_path = self._get_metadata_path(artifact_dir, version)
+        try:
+            write_data(version_path)
+            with open(metadata_path, "w", encoding="utf-8") as metadata_file:
+                json.dump({"mime_type": mime_type}, metadata_file)
+                if not group_commit:
+                    metadata_file.flush()
+                    os.fsync(metadata_file.fileno())
+            revision = str(os.stat(version_path).st_mtime_ns)
+            logger.debug("%sWrote data and metadata to %s", log_prefix, version_path)
+        except (OSError, TypeError) as e:
+            for path in (version_path, metadata_path):
+                if os.path.exists(path):
+                    os.remove(path)
+            raise OSError(f"Failed to save artifact version {version}: {e}") from e
+
+        new_index = {
+            "latest": version,
+            "size_bytes": size_bytes,
+            "mime_type": mime_type,
+        }
+        if "versions" in index:
+            new_index["versions"] = index["versions"] + [version]
+        self._append_version_log(
+            artifact_dir,
+            {
+                "version": version,
+                "size_bytes": size_bytes,
+                "mime_type": mime_type,
+                "revision": revision,
+            },
+        )
+        self._write_index(artifact_dir, new_index)
+        return version, [version_path, metadata_path]
+
     @override
     async def save_artifact(
         self,
@@ -114,76 +402,133 @@ class FilesystemArtifactService(BaseArtifactService):
 
         filename = self._normalize_filename_unicode(filename)
         artifact_dir = self._get_artifact_dir(app_name, user_id, session_id, filename)
+
+        if not artifact.inline_data or artifact.inline_data.data is None:
+            raise ValueError("Artifact Part has no inline_data to save.")
+        data = artifact.inline_data.data
+        mime_type = artifact.inline_data.mime_type
+        group_commit = self.durability == "group_commit"
+
+        def _write_data(version_path: str) -> None:
+            with open(version_path, "wb") as data_file:
+                data_file.write(data)
+                if not group_commit:
+                    data_file.flush()
+                    os.fsync(data_file.fileno())
+
         try:
-            await asyncio.to_thread(os.makedirs, artifact_dir, exist_ok=True)
+            async with self._get_artifact_lock(artifact_dir):
+                version, written_paths = await asyncio.to_thread(
+                    self._write_version,
+                    artifact_dir,
+                    _write_data,
+                    len(data),
+                    mime_type,
+                    log_prefix,
+                )
+            if group_commit:
+                await self._get_committer().commit(written_paths)
         except OSError as e:
             logger.error(
-                "%sFailed to create artifact directory '%s': %s",
+                "%sFailed to save artifact '%s': %s",
                 log_prefix,
-                artifact_dir,
+                filename,
                 e,
             )
-            raise OSError(f"Could not create artifact directory: {e}") from e
+            raise
 
-        versions = await self.list_versions(
-            app_name=app_name,
-            user_id=user_id,
-            session_id=session_id,
-            filename=filename,
+        logger.info(
+            "%sSaved artifact '%s' version %d successfully.",
+            log_prefix,
+            filename,
+            version,
         )
-        version = 0 if not versions else max(versions) + 1
+        return version
 
-        version_path = self._get_version_path(artifact_dir, version)
-        metadata_path = self._get_metadata_path(artifact_dir, version)
+    async def save_artifact_stream(
+        self,
+        *,
+        app_name: str,
+        user_id: str,
+        session_id: str,
+        filename: str,
+        chunks: AsyncIterable[bytes],
+        mime_type: str,
+        max_size_bytes: int | None = None,
+    ) -> SavedArtifactStream:
+        """
+        Saves a new artifact version from an async iterable of chunks. The
+        chunks are spooled to a temporary file, which becomes the version's
+        data file once complete, so the content is never held in memory.
 
-        try:
-            if not artifact.inline_data or artifact.inline_data.data is None:
-                raise ValueError("Artifact Part has no inline_data to save.")
-
-            metadata = {"mime_type": artifact.inline_data.mime_type}
-
-            def _write_data_file():
-                """Write artifact data and fsync to disk."""
-                with open(version_path, "wb") as f:
-                    f.write(artifact.inline_data.data)
-                    f.flush()
-                    os.fsync(f.fileno())
-                logger.debug("%sWrote data to %s", log_prefix, version_path)
-
-            def _write_metadata_file():
-                """Write artifact metadata and fsync to disk."""
-                with open(metadata_path, "w", encoding="utf-8") as f:
-                    json.dump(metadata, f)
-                    f.flush()
-                    os.fsync(f.fileno())
-                logger.debug("%sWrote metadata to %s", log_prefix, metadata_path)
-
-            # Run file writes concurrently and wait for both to complete
-            await asyncio.gather(
-                asyncio.to_thread(_write_data_file),
-                asyncio.to_thread(_write_metadata_file),
-            )
+        Raises:
+            ArtifactTooLargeError: If the content exceeds `max_size_bytes`.
+            OSError: If the content cannot be written.
+        """
+        log_prefix = "[FSArtifact:SaveStream] "
 
-            logger.info(
-                "%sSaved artifact '%s' version %d successfully.",
-                log_prefix,
-                filename,
-                version,
-            )
-            return version
-        except (OSError, ValueError, TypeError) as e:
+        filename = self._normalize_filename_unicode(filename)
+        artifact_dir = self._get_artifact_dir(app_name, user_id, session_id, filename)
+        group_commit = self.durability == "group_commit"
+        digest = ContentDigest(max_size_bytes)
+        spool_dir = os.path.join(self.base_path, UPLOAD_SPOOL_DIR_NAME)
+        spool_path = os.path.join(spool_dir, f"{uuid.uuid4().hex}.tmp")
+
+        def _open_spool():
+            os.makedirs(spool_dir, exist_ok=True)
+            return open(spool_path, "wb")
+
+        def _finish_spool(spool_file) -> None:
+            if not group_commit:
+                spool_file.flush()
+                os.fsync(spool_file.fileno())
+
+        def _move_spool(version_path: str) -> None:
+            os.replace(spool_path, version_path)
+
+        try:
+            spool_file = await asyncio.to_thread(_open_spool)
+            try:
+                async for chunk in chunks:
+                    digest.update(chunk)
+                    await asyncio.to_thread(spool_file.write, chunk)
+                await asyncio.to_thread(_finish_spool, spool_file)
+            finally:
+                await asyncio.to_thread(spool_file.close)
+
+            async with self._get_artifact_lock(artifact_dir):
+                version, written_paths = await asyncio.to_thread(
+                    self._write_version,
+                    artifact_dir,
+                    _move_spool,
+                    digest.size_bytes,
+                    mime_type,
+                    log_prefix,
+                )
+            if group_commit:
+                await self._get_committer().commit(written_paths)
+        except OSError as e:
             logger.error(
-                "%sFailed to save artifact '%s' version %d: %s",
+                "%sFailed to save artifact '%s': %s",
                 log_prefix,
                 filename,
-                version,
                 e,
             )
-            if await asyncio.to_thread(os.path.exists, version_path):
-                await asyncio.to_thread(os.remove, version_path)
-            if await asyncio.to_thread(os.path.exists, metadata_path):
-                await asyncio.to_thread(os.remove, metadata_path)
-            raise OSError(f"Failed to save artifact version {version}: {e}") from e
+            raise
+        finally:
+            if await asyncio.to_thread(os.path.exists, spool_path):
+                await asyncio.to_thread(os.remove, spool_path)
+
+        logger.info(
+            "%sSaved artifact '%s' version %d successfully (%d bytes).",
+            log_prefix,
+            filename,
+            version,
+            digest.size_bytes,
+        )
+        return SavedArtifactStream(
+            version=version, size_bytes=digest.size_bytes, sha256=digest.hexdigest()
+        )
 
     @override
     async def load_artifact(
@@ -270,6 +615,82 @@ class FilesystemArtifactService(BaseArtifactService):
             )
             return None
 
+    async def open_artifact_stream(
+        self,
+        *,
+        app_name: str,
+        user_id: str,
+        session_id: str,
+        filename: str,
+        version: int | None = None,
+    ) -> ArtifactStream | None:
+        """
+        Opens a version of an artifact (the latest if `version` is None) for
+        chunked, ranged reads from disk, without loading it into memory.
+        """
+        log_prefix = f"[FSArtifact:OpenStream:{filename}] "
+        filename = self._normalize_filename_unicode(filename)
+        artifact_dir = self._get_artifact_dir(app_name, user_id, session_id, filename)
+
+        open_version = version
+        if open_version is None:
+            versions = await self.list_versions(
+                app_name=app_name,
+                user_id=user_id,
+                session_id=session_id,
+                filename=filename,
+            )
+            if not versions:
+                logger.debug("%sNo versions found for artifact.", log_prefix)
+                return None
+            open_version = max(versions)
+
+        version_path = self._get_version_path(artifact_dir, open_version)
+
+        def _describe_version() -> dict:
+            entry = self._read_version_log(artifact_dir).get(open_version)
+            if entry is None:
+                entry = self._read_version_entry(artifact_dir, open_version)
+            return entry
+
+        try:
+            entry = await asyncio.to_thread(_describe_version)
+        except FileNotFoundError:
+            logger.debug(
+                "%sData or metadata file missing for version %d.",
+                log_prefix,
+                open_version,
+            )
+            return None
+        except (OSError, json.JSONDecodeError) as e:
+            logger.error(
+                "%sFailed to open artifact version %d: %s", log_prefix, open_version, e
+            )
+            return None
+
+        async def _read_range(start: int, end: int, chunk_size: int):
+            f = await asyncio.to_thread(open, version_path, "rb")
+            try:
+                await asyncio.to_thread(f.seek, start)
+                remaining = end - start
+                while remaining > 0:
+                    chunk = await asyncio.to_thread(f.read, min(chunk_size, remaining))
+                    if not chunk:
+                        break
+                    remaining -= len(chunk)
+                    yield chunk
+            finally:
+                await asyncio.to_thread(f.close)
+
+        return ArtifactStream(
+            filename=filename,
+            version=open_version,
+            size_bytes=entry["size_bytes"],
+            mime_type=entry["mime_type"] or "application/octet-stream",
+            revision=entry["revision"],
+            _read_range=_read_range,
+        )
+
     @override
     async def list_artifact_keys(
         self, *, app_name: str, user_id: str, session_id: str
@@ -349,21 +770,18 @@ class FilesystemArtifactService(BaseArtifactService):
     ) -> list[int]:
         log_prefix = f"[FSArtifact:ListVersions:{filename}] "
         artifact_dir = self._get_artifact_dir(app_name, user_id, session_id, filename)
-        versions = []
 
-        if not await asyncio.to_thread(os.path.isdir, artifact_dir):
-            logger.debug("%sArtifact directory not found: %s", log_prefix, artifact_dir)
-            return []
+        def _list() -> list[int]:
+            index = self._read_index(artifact_dir)
+            if index is not None:
+                return self._index_versions(index)
+            return self._scan_artifact_dir(artifact_dir)
 
         try:
-            for item in await asyncio.to_thread(os.listdir, artifact_dir):
-                if (
-                    await asyncio.to_thread(
-                        os.path.isfile, os.path.join(artifact_dir, item)
-                    )
-                    and item.isdigit()
-                ):
-                    versions.append(int(item))
+            versions = await asyncio.to_thread(_list)
+        except FileNotFoundError:
+            logger.debug("%sArtifact directory not found: %s", log_prefix, artifact_dir)
+            return []
         except OSError as e:
             logger.error("%sError listing versions in directory '%s'", log_prefix, e)
             return []
@@ -372,6 +790,77 @@ class FilesystemArtifactService(BaseArtifactService):
         logger.debug("%sFound versions: %s", log_prefix, sorted_versions)
         return sorted_versions
 
+    def _scan_versions(self, directory: str, key_prefix: str) -> dict[str, list[int]]:
+        """Maps each artifact directory under `directory` to its version numbers."""
+        versions_by_key: dict[str, list[int]] = {}
+        try:
+            with os.scandir(directory) as artifact_dirs:
+                for artifact_dir in artifact_dirs:
+                    if not artifact_dir.is_dir():
+                        continue
+                    with os.scandir(artifact_dir.path) as entries:
+                        versions_by_key[f"{key_prefix}{artifact_dir.name}"] = [
+                            int(entry.name)
+                            for entry in entries
+                            if entry.name.isdigit() and entry.is_file()
+                        ]
+        except FileNotFoundError:
+            pass
+        return versions_by_key
+
+    async def list_artifacts_with_metadata(
+        self,
+        *,
+        app_name: str,
+        user_id: str,
+        session_id: str,
+        max_concurrency: int = DEFAULT_METADATA_LOAD_CONCURRENCY,
+    ) -> list[ArtifactListing]:
+        """
+        Lists all artifacts for the session (and user namespace) with their
+        versions and latest metadata, using a single directory walk.
+        """
+        log_prefix = "[FSArtifact:ListWithMetadata] "
+        user_base_dir = os.path.join(
+            self.base_path, os.path.basename(app_name), os.path.basename(user_id)
+        )
+        session_base_dir = os.path.join(user_base_dir, os.path.basename(session_id))
+
+        def _walk() -> dict[str, list[int]]:
+            versions_by_key = self._scan_versions(session_base_dir, "")
+            versions_by_key.update(
+                self._scan_versions(os.path.join(user_base_dir, "user"), "user:")
+            )
+            return versions_by_key
+
+        try:
+            versions_by_key = await asyncio.to_thread(_walk)
+        except OSError as e:
+            logger.warning(
+                "%sError walking artifact directories under '%s': %s",
+                log_prefix,
+                user_base_dir,
+                e,
+            )
+            return []
+
+        def _read_metadata_bytes(key: str, version: int) -> bytes | None:
+            artifact_dir = self._get_artifact_dir(app_name, user_id, session_id, key)
+            try:
+                with open(self._get_version_path(artifact_dir, version), "rb") as f:
+                    return f.read()
+            except FileNotFoundError:
+                return None
+
+        async def _load_metadata_bytes(key: str, version: int) -> bytes | None:
+            return await asyncio.to_thread(_read_metadata_bytes, key, version)
+
+        listings = await build_artifact_listings(
+            versions_by_key, _load_metadata_bytes, max_concurrency
+        )
+        logger.debug("%sFound %d artifacts.", log_prefix, len(listings))
+        return listings
+
     def _normalize_filename_unicode(self, filename: str) -> str:
         """
         Normalizes Unicode characters in a filename to their standard form.
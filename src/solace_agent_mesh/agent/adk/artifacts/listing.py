@@ -0,0 +1,156 @@
+"""
+Bulk listing of artifacts together with their latest-version metadata.
+
+Artifact metadata is stored as a companion artifact named
+``<filename>.metadata.json`` whose versions mirror the data artifact. Listing a
+session used to cost several round trips per artifact (latest version, version
+count, metadata load). The helpers here take a single key/version listing from
+the store and load the companion metadata files concurrently with a bounded
+fan-out.
+"""
+
+import asyncio
+import json
+import logging
+from dataclasses import dataclass, field
+from typing import Any, Awaitable, Callable, Dict, List, Optional
+
+from google.adk.artifacts import BaseArtifactService
+
+logger = logging.getLogger(__name__)
+
+METADATA_SUFFIX = ".metadata.json"
+DEFAULT_METADATA_LOAD_CONCURRENCY = 16
+
+
+@dataclass
+class ArtifactListing:
+    """A data artifact, its available versions and its latest metadata."""
+
+    filename: str
+    versions: List[int] = field(default_factory=list)
+    has_metadata_file: bool = False
+    metadata: Optional[Dict[str, Any]] = None
+    metadata_error: Optional[str] = None
+
+    @property
+    def latest_version(self) -> Optional[int]:
+        return max(self.versions) if self.versions else None
+
+
+async def build_artifact_listings(
+    versions_by_key: Dict[str, List[int]],
+    load_metadata_bytes: Callable[[str, int], Awaitable[Optional[bytes]]],
+    max_concurrency: int = DEFAULT_METADATA_LOAD_CONCURRENCY,
+) -> List[ArtifactListing]:
+    """
+    Builds listings for every data artifact in `versions_by_key`.
+
+    Args:
+        versions_by_key: Every key in the store (data and metadata artifacts)
+            mapped to its available versions.
+        load_metadata_bytes: Coroutine returning the raw bytes of a metadata
+            artifact at a given version, or None if it does not exist.
+        max_concurrency: Upper bound on concurrent metadata loads.
+
+    Returns:
+        Listings for data artifacts with at least one version, sorted by filename.
+    """
+    listings = [
+        ArtifactListing(
+            filename=key,
+            versions=sorted(versions),
+            has_metadata_file=f"{key}{METADATA_SUFFIX}" in versions_by_key,
+        )
+        for key, versions in sorted(versions_by_key.items())
+        if not key.endswith(METADATA_SUFFIX) and versions
+    ]
+    semaphore = asyncio.Semaphore(max(1, max_concurrency))
+
+    async def _load(listing: ArtifactListing) -> None:
+        metadata_key = f"{listing.filename}{METADATA_SUFFIX}"
+        async with semaphore:
+            try:
+                data = await load_metadata_bytes(metadata_key, listing.latest_version)
+            except Exception as e:
+                logger.warning(
+                    "Failed to load metadata '%s' v%d: %s",
+                    metadata_key,
+                    listing.latest_version,
+                    e,
+                )
+                listing.metadata_error = f"Failed to load metadata: {e}"
+                return
+        if data is None:
+            return
+        try:
+            listing.metadata = json.loads(data.decode("utf-8"))
+        except (json.JSONDecodeError, UnicodeDecodeError) as e:
+            listing.metadata_error = f"Failed to parse metadata: {e}"
+
+    await asyncio.gather(
+        *(_load(listing) for listing in listings if listing.has_metadata_file)
+    )
+    return listings
+
+
+async def list_artifacts_with_metadata(
+    artifact_service: BaseArtifactService,
+    *,
+    app_name: str,
+    user_id: str,
+    session_id: str,
+    max_concurrency: int = DEFAULT_METADATA_LOAD_CONCURRENCY,
+) -> List[ArtifactListing]:
+    """
+    Lists artifacts and their latest metadata using the most efficient path the
+    service offers.
+
+    Services implementing `list_artifacts_with_metadata` are called directly.
+    Any other `BaseArtifactService` is listed through its standard interface,
+    with version listings and metadata loads fanned out concurrently.
+    """
+    bulk_method = getattr(artifact_service, "list_artifacts_with_metadata", None)
+    if bulk_method is not None:
+        return await bulk_method(
+            app_name=app_name,
+            user_id=user_id,
+            session_id=session_id,
+            max_concurrency=max_concurrency,
+        )
+
+    keys = await artifact_service.list_artifact_keys(
+        app_name=app_name, user_id=user_id, session_id=session_id
+    )
+    semaphore = asyncio.Semaphore(max(1, max_concurrency))
+
+    async def _list_versions(key: str) -> List[int]:
+        async with semaphore:
+            try:
+                return await artifact_service.list_versions(
+                    app_name=app_name,
+                    user_id=user_id,
+                    session_id=session_id,
+                    filename=key,
+                )
+            except Exception as e:
+                logger.warning("Failed to list versions for '%s': %s", key, e)
+                return []
+
+    versions = await asyncio.gather(*(_list_versions(k) for k in keys))
+
+    async def _load_metadata_bytes(key: str, version: int) -> Optional[bytes]:
+        part = await artifact_service.load_artifact(
+            app_name=app_name,
+            user_id=user_id,
+            session_id=session_id,
+            filename=key,
+            version=version,
+        )
+        if not part or not part.inline_data:
+            return None
+        return part.inline_data.data
+
+    return await build_artifact_listings(
+        dict(zip(keys, versions)), _load_metadata_bytes, max_concurrency
+    )
@@ -5,6 +5,7 @@ An ADK ArtifactService implementation using Amazon S3 compatible storage.
 import asyncio
 import logging
 import unicodedata
+from collections.abc import AsyncIterable
 
 import boto3
 from botocore.client import BaseClient
@@ -13,8 +14,19 @@ from google.adk.artifacts import BaseArtifactService
 from google.genai import types as adk_types
 from typing_extensions import override
 
+from .listing import (
+    DEFAULT_METADATA_LOAD_CONCURRENCY,
+    ArtifactListing,
+    build_artifact_listings,
+)
+from .streaming import ArtifactStream, ContentDigest, SavedArtifactStream
+
 logger = logging.getLogger(__name__)
 
+# S3 requires every multipart part except the last to be at least 5 MiB.
+DEFAULT_MULTIPART_PART_SIZE = 8 * 1024 * 1024
+DEFAULT_MULTIPART_CONCURRENCY = 4
+
 
 class S3ArtifactService(BaseArtifactService):
     """
@@ -57,12 +69,18 @@ class S3ArtifactService(BaseArtifactService):
         self,
         bucket_name: str,
         s3_client: BaseClient | None = None,
+        multipart_part_size: int = DEFAULT_MULTIPART_PART_SIZE,
+        multipart_concurrency: int = DEFAULT_MULTIPART_CONCURRENCY,
         **kwargs,
     ):
         """
         Args:
             bucket_name: The name of the S3 bucket to use.
             s3_client: Optional pre-configured S3 client. If None, creates a new client.
+            multipart_part_size: Part size for streamed saves; content of at
+                most one part is saved with a single PutObject.
+            multipart_concurrency: Maximum parts of one streamed save uploaded
+                at once. A save buffers at most this many parts plus one.
             **kwargs: Optional parameters for boto3 client configuration.
 
         Raises:
@@ -73,6 +91,8 @@ class S3ArtifactService(BaseArtifactService):
             raise ValueError("bucket_name cannot be empty for S3ArtifactService")
 
         self.bucket_name = bucket_name
+        self.multipart_part_size = multipart_part_size
+        self.multipart_concurrency = max(1, multipart_concurrency)
 
         if s3_client is None:
             try:
@@ -214,6 +234,183 @@ class S3ArtifactService(BaseArtifactService):
                 f"BotoCore error saving artifact version {version}: {e}"
             ) from e
 
+    async def save_artifact_stream(
+        self,
+        *,
+        app_name: str,
+        user_id: str,
+        session_id: str,
+        filename: str,
+        chunks: AsyncIterable[bytes],
+        mime_type: str,
+        max_size_bytes: int | None = None,
+    ) -> SavedArtifactStream:
+        """
+        Saves a new artifact version from an async iterable of chunks with a
+        multipart upload, uploading up to `multipart_concurrency` parts at
+        once. Content that fits in one part is saved with a single PutObject.
+        An unfinished multipart upload is aborted on failure.
+
+        Raises:
+            ArtifactTooLargeError: If the content exceeds `max_size_bytes`.
+            OSError: If S3 rejects the upload.
+        """
+        log_prefix = f"[S3Artifact:SaveStream:{filename}] "
+        filename = self._normalize_filename_unicode(filename)
+        app_name = app_name.strip('/')
+
+        versions = await self.list_versions(
+            app_name=app_name,
+            user_id=user_id,
+            session_id=session_id,
+            filename=filename,
+        )
+        version = 0 if not versions else max(versions) + 1
+        object_key = self._get_object_key(
+            app_name, user_id, session_id, filename, version
+        )
+        object_metadata = {
+            "original_filename": filename,
+            "user_id": user_id,
+            "session_id": session_id,
+            "version": str(version),
+        }
+
+        digest = ContentDigest(max_size_bytes)
+        buffer = bytearray()
+        upload_id: str | None = None
+        uploaded_parts: list[dict] = []
+        in_flight: set[asyncio.Task] = set()
+        next_part_number = 1
+        failed = False
+        aborted = False
+
+        async def _upload_part(part_number: int, body: bytes) -> None:
+            if failed:
+                return
+            response = await asyncio.to_thread(
+                self.s3.upload_part,
+                Bucket=self.bucket_name,
+                Key=object_key,
+                UploadId=upload_id,
+                PartNumber=part_number,
+                Body=body,
+            )
+            if aborted:
+                logger.warning(
+                    "%sPart %d of multipart upload %s finished after the upload was aborted; its storage may not be freed.",
+                    log_prefix,
+                    part_number,
+                    upload_id,
+                )
+            uploaded_parts.append({"PartNumber": part_number, "ETag": response["ETag"]})
+
+        async def _start_part(body: bytes) -> None:
+            nonlocal upload_id, next_part_number, in_flight
+            if upload_id is None:
+                response = await asyncio.to_thread(
+                    self.s3.create_multipart_upload,
+                    Bucket=self.bucket_name,
+                    Key=object_key,
+                    ContentType=mime_type,
+                    Metadata=object_metadata,
+                )
+                upload_id = response["UploadId"]
+            if len(in_flight) >= self.multipart_concurrency:
+                done, in_flight = await asyncio.wait(
+                    in_flight, return_when=asyncio.FIRST_COMPLETED
+                )
+                for task in done:
+                    task.result()
+            in_flight.add(asyncio.create_task(_upload_part(next_part_number, body)))
+            next_part_number += 1
+
+        try:
+            async for chunk in chunks:
+                digest.update(chunk)
+                buffer += chunk
+                while len(buffer) > self.multipart_part_size:
+                    await _start_part(bytes(buffer[: self.multipart_part_size]))
+                    del buffer[: self.multipart_part_size]
+
+            if upload_id is None:
+                await asyncio.to_thread(
+                    self.s3.put_object,
+                    Bucket=self.bucket_name,
+                    Key=object_key,
+                    Body=bytes(buffer),
+                    ContentType=mime_type,
+                    Metadata=object_metadata,
+                )
+            else:
+                await _start_part(bytes(buffer))
+                await asyncio.gather(*in_flight)
+                in_flight = set()
+                await asyncio.to_thread(
+                    self.s3.complete_multipart_upload,
+                    Bucket=self.bucket_name,
+                    Key=object_key,
+                    UploadId=upload_id,
+                    MultipartUpload={
+                        "Parts": sorted(
+                            uploaded_parts, key=lambda part: part["PartNumber"]
+                        )
+                    },
+                )
+        except BaseException as e:
+            # Cancelling a part task does not stop its upload_part thread, and
+            # a part stored after the abort is kept by S3. Parts that have not
+            # started yet are skipped; running ones are waited for.
+            failed = True
+            try:
+                if in_flight:
+                    await asyncio.wait(in_flight)
+                    for task in in_flight:
+                        if not task.cancelled():
+                            task.exception()
+            finally:
+                if upload_id is not None:
+                    aborted = True
+                    try:
+                        await asyncio.to_thread(
+                            self.s3.abort_multipart_upload,
+                            Bucket=self.bucket_name,
+                            Key=object_key,
+                            UploadId=upload_id,
+                        )
+                    except (ClientError, BotoCoreError) as abort_err:
+                        logger.warning(
+                            "%sFailed to abort multipart upload %s: %s",
+                            log_prefix,
+                            upload_id,
+                            abort_err,
+                        )
+            if isinstance(e, (ClientError, BotoCoreError)):
+                logger.error(
+                    "%sFailed to save artifact '%s' version %d to S3: %s",
+                    log_prefix,
+                    filename,
+                    version,
+                    e,
+                )
+                raise OSError(
+                    f"Failed to save artifact version {version} to S3: {e}"
+                ) from e
+            raise
+
+        logger.info(
+            "%sSaved artifact '%s' version %d (%d bytes, %d part(s)) to S3 key: %s",
+            log_prefix,
+            filename,
+            version,
+            digest.size_bytes,
+            max(1, len(uploaded_parts)),
+            object_key,
+        )
+        return SavedArtifactStream(
+            version=version, size_bytes=digest.size_bytes, sha256=digest.hexdigest()
+        )
+
     @override
     async def load_artifact(
         self,
@@ -293,6 +490,99 @@ class S3ArtifactService(BaseArtifactService):
             )
             return None
 
+    async def open_artifact_stream(
+        self,
+        *,
+        app_name: str,
+        user_id: str,
+        session_id: str,
+        filename: str,
+        version: int | None = None,
+    ) -> ArtifactStream | None:
+        """
+        Opens a version of an artifact (the latest if `version` is None) for
+        chunked reads. Each read is one ranged GetObject whose body is consumed
+        in chunks, so the object is never held in memory.
+        """
+        log_prefix = f"[S3Artifact:OpenStream:{filename}] "
+        filename = self._normalize_filename_unicode(filename)
+        app_name = app_name.strip('/')
+
+        open_version = version
+        if open_version is None:
+            versions = await self.list_versions(
+                app_name=app_name,
+                user_id=user_id,
+                session_id=session_id,
+                filename=filename,
+            )
+            if not versions:
+                logger.debug("%sNo versions found for artifact.", log_prefix)
+                return None
+            open_version = max(versions)
+
+        object_key = self._get_object_key(
+            app_name, user_id, session_id, filename, open_version
+        )
+
+        try:
+            head = await asyncio.to_thread(
+                self.s3.head_object, Bucket=self.bucket_name, Key=object_key
+            )
+        except ClientError as e:
+            error_code = e.response.get("Error", {}).get("Code", "Unknown")
+            if error_code in ("404", "NoSuchKey"):
+                logger.debug("%sArtifact not found: %s", log_prefix, object_key)
+            else:
+                logger.error(
+                    "%sFailed to open artifact version %d: %s",
+                    log_prefix,
+                    open_version,
+                    e,
+                )
+            return None
+        except BotoCoreError as e:
+            logger.error(
+                "%sBotoCore error opening artifact version %d: %s",
+                log_prefix,
+                open_version,
+                e,
+            )
+            return None
+
+        s3_etag = head.get("ETag")
+
+        async def _read_range(start: int, end: int, chunk_size: int):
+            if start >= end:
+                return
+            get_kwargs = {
+                "Bucket": self.bucket_name,
+                "Key": object_key,
+                "Range": f"bytes={start}-{end - 1}",
+            }
+            if s3_etag:
+                # Fail rather than mix bytes from a different object.
+                get_kwargs["IfMatch"] = s3_etag
+            response = await asyncio.to_thread(self.s3.get_object, **get_kwargs)
+            body = response["Body"]
+            try:
+                while True:
+                    chunk = await asyncio.to_thread(body.read, chunk_size)
+                    if not chunk:
+                        break
+                    yield chunk
+            finally:
+                await asyncio.to_thread(body.close)
+
+        return ArtifactStream(
+            filename=filename,
+            version=open_version,
+            size_bytes=head.get("ContentLength", 0),
+            mime_type=head.get("ContentType") or "application/octet-stream",
+            revision=s3_etag,
+            _read_range=_read_range,
+        )
+
     @override
     async def list_artifact_keys(
         self, *, app_name: str, user_id: str, session_id: str
@@ -443,3 +733,73 @@ class S3ArtifactService(BaseArtifactService):
         sorted_versions = sorted(versions)
         logger.debug("%sFound versions: %s", log_prefix, sorted_versions)
         return sorted_versions
+
+    async def list_artifacts_with_metadata(
+        self,
+        *,
+        app_name: str,
+        user_id: str,
+        session_id: str,
+        max_concurrency: int = DEFAULT_METADATA_LOAD_CONCURRENCY,
+    ) -> list[ArtifactListing]:
+        """
+        Lists all artifacts for the session (and user namespace) with their
+        versions and latest metadata. Keys and versions come from one paginated
+        ListObjectsV2 per prefix instead of a listing per artifact.
+        """
+        log_prefix = "[S3Artifact:ListWithMetadata] "
+        app_name = app_name.strip("/")
+        prefixes = {
+            f"{app_name}/{user_id}/{session_id}/": "",
+            f"{app_name}/{user_id}/user/": "user:",
+        }
+
+        def _list_all_versions() -> dict[str, list[int]]:
+            versions_by_key: dict[str, list[int]] = {}
+            paginator = self.s3.get_paginator("list_objects_v2")
+            for prefix, key_prefix in prefixes.items():
+                try:
+                    for page in paginator.paginate(
+                        Bucket=self.bucket_name, Prefix=prefix
+                    ):
+                        for obj in page.get("Contents", []):
+                            parts = obj["Key"].split("/")
+                            if len(parts) < 5:
+                                continue
+                            key = f"{key_prefix}{parts[3]}"
+                            try:
+                                version = int(parts[4])
+                            except ValueError:
+                                continue
+                            versions_by_key.setdefault(key, []).append(version)
+                except ClientError as e:
+                    logger.warning(
+                        "%sError listing objects with prefix '%s': %s",
+                        log_prefix,
+                        prefix,
+                        e,
+                    )
+            return versions_by_key
+
+        versions_by_key = await asyncio.to_thread(_list_all_versions)
+
+        def _get_metadata_bytes(key: str, version: int) -> bytes | None:
+            object_key = self._get_object_key(
+                app_name, user_id, session_id, key, version
+            )
+            try:
+                response = self.s3.get_object(Bucket=self.bucket_name, Key=object_key)
+                return response["Body"].read()
+            except ClientError as e:
+                if e.response.get("Error", {}).get("Code") == "NoSuchKey":
+                    return None
+                raise
+
+        async def _load_metadata_bytes(key: str, version: int) -> bytes | None:
+            return await asyncio.to_thread(_get_metadata_bytes, key, version)
+
+        listings = await build_artifact_listings(
+            versions_by_key, _load_metadata_bytes, max_concurrency
+        )
+        logger.debug("%sFound %d artifacts.", log_prefix, len(listings))
+        return listings
@@ -0,0 +1,234 @@
+"""
+Chunked, ranged reads and streaming writes of artifact versions.
+
+`BaseArtifactService.load_artifact` and `save_artifact` take a whole artifact
+as one `Part`, so moving a large artifact that way holds all of it in memory.
+Services that implement `open_artifact_stream` (filesystem and S3) instead
+describe a stored version and read any byte range of it in chunks, straight
+from disk or S3. Services that implement `save_artifact_stream` write a new
+version from an async iterable of chunks, enforcing a size limit as the
+chunks arrive.
+"""
+
+import hashlib
+import logging
+from dataclasses import dataclass
+from typing import AsyncIterable, AsyncIterator, Callable, Optional
+
+from google.adk.artifacts import BaseArtifactService
+from google.genai import types as adk_types
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_ARTIFACT_CHUNK_SIZE = 1024 * 1024
+
+# (start, end, chunk_size) -> chunks of bytes [start, end).
+RangeReader = Callable[[int, int, int], AsyncIterator[bytes]]
+
+
+@dataclass
+class ArtifactStream:
+    """A stored artifact version whose content can be read in ranges."""
+
+    filename: str
+    version: int
+    size_bytes: int
+    mime_type: str
+    # Identifies the stored bytes (file mtime, S3 ETag), so a version number
+    # reused after the artifact was deleted gets a different entity tag.
+    revision: Optional[str]
+    _read_range: RangeReader
+
+    def iter_bytes(
+        self,
+        start: int = 0,
+        end: Optional[int] = None,
+        chunk_size: int = DEFAULT_ARTIFACT_CHUNK_SIZE,
+    ) -> AsyncIterator[bytes]:
+        """
+        Yields the content from byte `start` up to, but not including, byte
+        `end` (the end of the artifact if None), in chunks of `chunk_size`.
+        """
+        end = self.size_bytes if end is None else min(end, self.size_bytes)
+        if not 0 <= start <= end:
+            raise ValueError(
+                f"Invalid byte range [{start}, {end}) for {self.size_bytes} bytes."
+            )
+        return self._read_range(start, end, chunk_size)
+
+    async def read(self) -> bytes:
+        """Reads the whole content into memory."""
+        return b"".join([chunk async for chunk in self.iter_bytes()])
+
+    @property
+    def etag(self) -> str:
+        """A strong entity tag for this version's content."""
+        identity = (
+            f"{self.filename}\0{self.version}\0{self.size_bytes}\0{self.revision or ''}"
+        )
+        digest = hashlib.sha256(identity.encode("utf-8")).hexdigest()
+        return f'"{digest[:32]}"'
+
+
+def _bytes_range_reader(data: bytes) -> RangeReader:
+    async def read_range(start: int, end: int, chunk_size: int):
+        view = memoryview(data)
+        for offset in range(start, end, chunk_size):
+            yield bytes(view[offset : min(offset + chunk_size, end)])
+
+    return read_range
+
+
+async def open_artifact_stream(
+    artifact_service: BaseArtifactService,
+    *,
+    app_name: str,
+    user_id: str,
+    session_id: str,
+    filename: str,
+    version: Optional[int] = None,
+) -> Optional[ArtifactStream]:
+    """
+    Opens a version of an artifact (the latest if `version` is None) for ranged
+    reads, using the most efficient path the service offers.
+
+    Services implementing `open_artifact_stream` read from storage on demand.
+    Any other `BaseArtifactService` is loaded in full through `load_artifact`
+    and read from memory.
+
+    Returns:
+        The stream, or None if the artifact or version does not exist.
+    """
+    stream_method = getattr(artifact_service, "open_artifact_stream", None)
+    if stream_method is not None:
+        return await stream_method(
+            app_name=app_name,
+            user_id=user_id,
+            session_id=session_id,
+            filename=filename,
+            version=version,
+        )
+
+    versions = await artifact_service.list_versions(
+        app_name=app_name,
+        user_id=user_id,
+        session_id=session_id,
+        filename=filename,
+    )
+    if version is None:
+        if not versions:
+            return None
+        version = max(versions)
+    elif version not in versions:
+        # Not every service returns None for a missing version.
+        return None
+    part = await artifact_service.load_artifact(
+        app_name=app_name,
+        user_id=user_id,
+        session_id=session_id,
+        filename=filename,
+        version=version,
+    )
+    if part is None or part.inline_data is None or part.inline_data.data is None:
+        return None
+    data = part.inline_data.data
+    return ArtifactStream(
+        filename=filename,
+        version=version,
+        size_bytes=len(data),
+        mime_type=part.inline_data.mime_type or "application/octet-stream",
+        revision=hashlib.sha256(data).hexdigest(),
+        _read_range=_bytes_range_reader(data),
+    )
+
+
+class ArtifactTooLargeError(ValueError):
+    """Streamed artifact content exceeded the allowed size."""
+
+    def __init__(self, max_size_bytes: int):
+        super().__init__(
+            f"Artifact content exceeds the maximum size of {max_size_bytes} bytes."
+        )
+        self.max_size_bytes = max_size_bytes
+
+
+@dataclass
+class SavedArtifactStream:
+    """The version written by a streaming save, with its size and SHA-256."""
+
+    version: int
+    size_bytes: int
+    sha256: str
+
+
+class ContentDigest:
+    """
+    Tracks the size and SHA-256 of streamed content, raising
+    ArtifactTooLargeError as soon as it exceeds `max_size_bytes`.
+    """
+
+    def __init__(self, max_size_bytes: Optional[int] = None):
+        self.max_size_bytes = max_size_bytes
+        self.size_bytes = 0
+        self._hash = hashlib.sha256()
+
+    def update(self, chunk: bytes) -> None:
+        self.size_bytes += len(chunk)
+        if self.max_size_bytes is not None and self.size_bytes > self.max_size_bytes:
+            raise ArtifactTooLargeError(self.max_size_bytes)
+        self._hash.update(chunk)
+
+    def hexdigest(self) -> str:
+        return self._hash.hexdigest()
+
+
+async def save_artifact_stream(
+    artifact_service: BaseArtifactService,
+    *,
+    app_name: str,
+    user_id: str,
+    session_id: str,
+    filename: str,
+    chunks: AsyncIterable[bytes],
+    mime_type: str,
+    max_size_bytes: Optional[int] = None,
+) -> SavedArtifactStream:
+    """
+    Saves a new version of an artifact from an async iterable of chunks, using
+    the most efficient path the service offers.
+
+    Services implementing `save_artifact_stream` write the chunks to storage
+    as they arrive. Any other `BaseArtifactService` gets the joined content
+    through `save_artifact`.
+
+    Raises:
+        ArtifactTooLargeError: If the content exceeds `max_size_bytes`. Nothing
+            is saved in that case.
+    """
+    stream_method = getattr(artifact_service, "save_artifact_stream", None)
+    if stream_method is not None:
+        return await stream_method(
+            app_name=app_name,
+            user_id=user_id,
+            session_id=session_id,
+            filename=filename,
+            chunks=chunks,
+            mime_type=mime_type,
+            max_size_bytes=max_size_bytes,
+        )
+
+    digest = ContentDigest(max_size_bytes)
+    parts = []
+    async for chunk in chunks:
+        digest.update(chunk)
+        parts.append(chunk)
+    version = await artifact_service.save_artifact(
+        app_name=app_name,
+        user_id=user_id,
+        session_id=session_id,
+        filename=filename,
+        artifact=adk_types.Part.from_bytes(data=b"".join(parts), mime_type=mime_type),
+    )
+    return SavedArtifactStream(
+        version=version, size_bytes=digest.size_bytes, sha256=digest.hexdigest()
+    )
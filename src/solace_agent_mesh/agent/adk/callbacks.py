@@ -33,6 +33,7 @@ from ...agent.utils.context_helpers import (
     get_session_from_callback_context,
 )
 from ..tools.tool_definition import BuiltinTool
+from .models.lite_llm import append_request_context
 
 from ...common.utils.embeds import (
     EMBED_DELIMITER_OPEN,
@@ -1092,11 +1093,6 @@ If a plan is created:
             e_last_call,
         )
 
-    if host_component.get_config("inject_current_time", True):
-        current_time = datetime.now(timezone.utc).strftime("%A, %d %b %Y %H:%M:%S UTC")
-        instruction = f"Current time {current_time}."
-        injected_instructions.append(instruction)
-
     if injected_instructions:
         combined_instructions = "\n\n---\n\n".join(injected_instructions)
         if llm_request.config is None:
@@ -1125,6 +1121,10 @@ If a plan is created:
             log_identifier,
         )
 
+    if host_component.get_config("inject_current_time", True) and llm_request.config:
+        current_time = datetime.now(timezone.utc).strftime("%A, %d %b %Y %H:%M:%S UTC")
+        append_request_context(llm_request, f"Current time {current_time}.")
+
     return None
 
 
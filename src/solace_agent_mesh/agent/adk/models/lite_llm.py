@@ -17,6 +17,8 @@ from __future__ import annotations
 import base64
 import json
 import logging
+import pickle
+import re
 from typing import Any
 from typing import AsyncGenerator
 from typing import cast
@@ -54,10 +56,57 @@ from google.adk.models.base_llm import BaseLlm
 from google.adk.models.llm_request import LlmRequest
 from google.adk.models.llm_response import LlmResponse
 
+from ....common.utils.bounded_cache import BoundedTTLCache
+from ....common.utils.metrics import get_metrics_registry
+
 logger = logging.getLogger("google_adk." + __name__)
 
 _NEW_LINE = "\n"
 _EXCLUDED_PART_FIELD = {"inline_data": {"data"}}
+_JSON_WHITESPACE = " \t\n\r"
+_JSON_STRUCTURAL_RE = re.compile(r'[{}\[\]"\\]')
+
+# History items and tool declarations are converted once and reused across the
+# LLM calls of an agent loop. ADK deep-copies `llm_request.contents` for every
+# call, so history items are keyed by content; tool declarations are matched
+# by the identity of their parameter schema. Items with inline data (images,
+# files) are not cached: their key and base64 message would hold the data
+# twice. Each namespace is also bounded by the approximate size of its entries.
+_CONVERSION_CACHE_MAX_ENTRIES = 2048
+_CONVERSION_CACHE_MAX_BYTES = 32 * 1024 * 1024
+_CONVERSION_CACHE_TTL_SECONDS = 900
+_MESSAGES_NAMESPACE = "messages"
+_TOOLS_NAMESPACE = "tools"
+_conversion_cache = BoundedTTLCache(
+    max_entries=_CONVERSION_CACHE_MAX_ENTRIES,
+    max_bytes=_CONVERSION_CACHE_MAX_BYTES,
+    name="LiteLlmConversionCache",
+)
+get_metrics_registry().register_stats(
+    "sam_llm_conversion_cache",
+    "Cache of converted LLM request messages and tools: hits, misses and size.",
+    _conversion_cache.get_stats,
+    group_label="namespace",
+)
+
+# Per-request text (the current time, details of the requesting user) is
+# added to the system instruction under this heading, after the instructions
+# that are the same for every call. With prompt caching it is sent at the end
+# of the request instead, so that it does not invalidate the cached prefix.
+REQUEST_CONTEXT_HEADING = "Request Context:"
+_INSTRUCTION_BLOCK_SEPARATOR = "\n\n---\n\n"
+_REQUEST_CONTEXT_SECTION = f"{REQUEST_CONTEXT_HEADING}\n"
+_CACHE_CONTROL = {"type": "ephemeral"}
+
+_GENERATION_PARAMS = {
+    "temperature": "temperature",
+    "max_output_tokens": "max_completion_tokens",
+    "top_p": "top_p",
+    "top_k": "top_k",
+    "stop_sequences": "stop",
+    "presence_penalty": "presence_penalty",
+    "frequency_penalty": "frequency_penalty",
+}
 
 
 class FunctionChunk(BaseModel):
@@ -75,6 +124,107 @@ class UsageMetadataChunk(BaseModel):
     prompt_tokens: int
     completion_tokens: int
     total_tokens: int
+    cached_tokens: int = 0
+
+
+class _StreamedJsonBuffer:
+    """Accumulates streamed tool-call argument fragments.
+
+    Fragments are kept in a list and joined only when the full string is needed.
+    Completeness is tracked incrementally: each fragment is scanned once for
+    braces, brackets and string delimiters, and `json.loads` runs only when the
+    top-level object or array has closed. `append` therefore reports the same
+    result as calling `json.loads` on the accumulated string after every
+    fragment, at linear instead of quadratic cost.
+    """
+
+    __slots__ = (
+        "_parts",
+        "_depth",
+        "_in_string",
+        "_escape_pending",
+        "_mode",
+        "_valid",
+    )
+
+    def __init__(self):
+        self._parts: List[str] = []
+        self._depth = 0
+        self._in_string = False
+        self._escape_pending = False
+        # None until the first non-whitespace character; then "structural" for an
+        # object/array, "scalar" for anything else, "closed" once the top-level
+        # container has closed and "invalid" once non-whitespace follows it.
+        self._mode: Optional[str] = None
+        self._valid: Optional[bool] = None
+
+    def getvalue(self) -> str:
+        if len(self._parts) > 1:
+            self._parts = ["".join(self._parts)]
+        return self._parts[0] if self._parts else ""
+
+    def append(self, fragment: str) -> bool:
+        """Appends a fragment and returns whether the buffer is complete JSON."""
+        self._parts.append(fragment)
+        start = 0
+        if self._mode is None:
+            stripped = fragment.lstrip(_JSON_WHITESPACE)
+            if not stripped:
+                return False
+            start = len(fragment) - len(stripped)
+            self._mode = "structural" if stripped[0] in "{[" else "scalar"
+
+        if self._mode == "scalar":
+            try:
+                json.loads(self.getvalue())
+                return True
+            except json.JSONDecodeError:
+                return False
+
+        if self._mode == "structural":
+            start = self._scan(fragment, start)
+            if start is None:
+                return False
+            self._mode = "closed"
+
+        if self._mode == "closed" and fragment[start:].strip(_JSON_WHITESPACE):
+            self._mode = "invalid"
+        if self._mode == "invalid":
+            return False
+
+        if self._valid is None:
+            try:
+                json.loads(self.getvalue())
+                self._valid = True
+            except json.JSONDecodeError:
+                self._valid = False
+        return self._valid
+
+    def _scan(self, fragment: str, start: int) -> Optional[int]:
+        """Advances the scanner; returns the offset after the top-level close."""
+        escape_at = start if self._escape_pending else -1
+        self._escape_pending = False
+        for match in _JSON_STRUCTURAL_RE.finditer(fragment, start):
+            pos = match.start()
+            if pos == escape_at:
+                continue
+            char = fragment[pos]
+            if self._in_string:
+                if char == "\\":
+                    escape_at = pos + 1
+                    if escape_at == len(fragment):
+                        self._escape_pending = True
+                elif char == '"':
+                    self._in_string = False
+            elif char == '"':
+                self._in_string = True
+            elif char in "{[":
+                self._depth += 1
+            elif char in "}]":
+                self._depth -= 1
+                if self._depth == 0:
+                    return pos + 1
+        return None
 
 
 class LiteLLMClient:
@@ -143,6 +293,92 @@ def _safe_json_serialize(obj) -> str:
         return str(obj)
 
 
+def _copy_json_value(value: Any) -> Any:
+    """Copies the dicts and lists of a JSON-like value, sharing the leaves.
+
+    Cached messages are copied before they are handed to litellm, which
+    rewrites some messages and tool schemas in place for certain providers.
+    """
+
+    if isinstance(value, dict):
+        return {key: _copy_json_value(item) for key, item in value.items()}
+    if isinstance(value, list):
+        return [_copy_json_value(item) for item in value]
+    return value
+
+
+def _part_cache_key(part: types.Part) -> tuple:
+    """Builds a hashable key from every field of a part that affects conversion.
+
+    Parts with inline data are not cached, so it is not part of the key.
+    """
+
+    function_call = part.function_call
+    function_response = part.function_response
+    return (
+        part.text,
+        (
+            (
+                function_call.id,
+                function_call.name,
+                _safe_json_serialize(function_call.args),
+            )
+            if function_call
+            else None
+        ),
+        (
+            (function_response.id, _safe_json_serialize(function_response.response))
+            if function_response
+            else None
+        ),
+    )
+
+
+def _cached_content_to_message_param(
+    content: types.Content,
+) -> Union[Message, list[Message]]:
+    """Memoized `_content_to_message_param`, keyed by the content's parts.
+
+    Contents with inline data are converted without caching.
+
+    Args:
+      content: The content to convert.
+
+    Returns:
+      A copy of the cached litellm Message or list of Messages.
+    """
+
+    if any(part.inline_data for part in content.parts):
+        return _content_to_message_param(content)
+    part_keys = tuple(_part_cache_key(part) for part in content.parts)
+    key = (content.role, part_keys)
+    message = _conversion_cache.get(key, namespace=_MESSAGES_NAMESPACE)
+    if message is None:
+        message = _content_to_message_param(content)
+        # The converted message repeats the text of the key.
+        size = 2 * sum(
+            len(value) for part_key in part_keys for value in _key_strings(part_key)
+        )
+        _conversion_cache.set(
+            key,
+            message,
+            ttl=_CONVERSION_CACHE_TTL_SECONDS,
+            namespace=_MESSAGES_NAMESPACE,
+            size=size,
+        )
+    return _copy_json_value(message)
+
+
+def _key_strings(value: Any) -> Iterable[str]:
+    """Yields the strings nested in the tuples of a cache key."""
+
+    if isinstance(value, str):
+        yield value
+    elif isinstance(value, tuple):
+        for item in value:
+            yield from _key_strings(item)
+
+
 def _content_to_message_param(
     content: types.Content,
 ) -> Union[Message, list[Message]]:
@@ -350,6 +586,43 @@ def _function_declaration_to_tool_param(
     }
 
 
+def _cached_function_declaration_to_tool_param(
+    function_declaration: types.FunctionDeclaration,
+) -> dict:
+    """Memoized `_function_declaration_to_tool_param`.
+
+    A cached conversion is reused while the declaration has the same name and
+    description and the very same parameter schema object, which tools that
+    build their schema once (dynamic, MCP and peer agent tools) pass on every
+    call. Comparing schemas by value costs as much as converting them, so a
+    tool that rebuilds its schema simply replaces its entry. The result is
+    cached pickled: unpickling a copy is cheaper than copying the nested
+    schema dicts.
+
+    Args:
+      function_declaration: The function declaration to convert.
+
+    Returns:
+      A copy of the cached openapi spec dictionary.
+    """
+
+    parameters = function_declaration.parameters
+    key = (function_declaration.name, function_declaration.description)
+    cached = _conversion_cache.get(key, namespace=_TOOLS_NAMESPACE)
+    if cached is not None and cached[0] is parameters:
+        return pickle.loads(cached[1])
+    tool_param = _function_declaration_to_tool_param(function_declaration)
+    pickled = pickle.dumps(tool_param, pickle.HIGHEST_PROTOCOL)
+    _conversion_cache.set(
+        key,
+        (parameters, pickled),
+        ttl=_CONVERSION_CACHE_TTL_SECONDS,
+        namespace=_TOOLS_NAMESPACE,
+        size=len(pickled),
+    )
+    return tool_param
+
+
 def _model_response_to_chunk(
     response: ModelResponse,
 ) -> Generator[
@@ -406,9 +679,33 @@ def _model_response_to_chunk(
             prompt_tokens=response["usage"].get("prompt_tokens", 0),
             completion_tokens=response["usage"].get("completion_tokens", 0),
             total_tokens=response["usage"].get("total_tokens", 0),
+            cached_tokens=_cached_prompt_tokens(response["usage"]),
         ), None
 
 
+def _cached_prompt_tokens(usage: Any) -> int:
+    """Returns how many prompt tokens were read from the provider's cache.
+
+    litellm reports them as `prompt_tokens_details.cached_tokens` for every
+    provider; older versions only set `cache_read_input_tokens` for Anthropic.
+
+    Args:
+      usage: The usage of a litellm response.
+
+    Returns:
+      The number of cached prompt tokens, 0 if none were reported.
+    """
+
+    details = usage.get("prompt_tokens_details", None)
+    if isinstance(details, dict):
+        cached_tokens = details.get("cached_tokens")
+    else:
+        cached_tokens = getattr(details, "cached_tokens", None)
+    if cached_tokens is None:
+        cached_tokens = usage.get("cache_read_input_tokens", None)
+    return cached_tokens or 0
+
+
 def _model_response_to_generate_content_response(
     response: ModelResponse,
 ) -> LlmResponse:
@@ -434,6 +731,7 @@ def _model_response_to_generate_content_response(
             prompt_token_count=response["usage"].get("prompt_tokens", 0),
             candidates_token_count=response["usage"].get("completion_tokens", 0),
             total_token_count=response["usage"].get("total_tokens", 0),
+            cached_content_token_count=_cached_prompt_tokens(response["usage"]),
         )
     return llm_response
 
@@ -477,8 +775,74 @@ def _message_to_generate_content_response(
     )
 
 
+def append_request_context(llm_request: LlmRequest, text: str) -> None:
+    """Appends per-request text to the system instruction.
+
+    All such text is collected in one section under `REQUEST_CONTEXT_HEADING`
+    at the end of the system instruction, so callbacks that add instructions
+    which are the same for every call must run before any that add request
+    context.
+
+    Args:
+      llm_request: The request whose system instruction is extended.
+      text: The text that may change from one LLM call to the next.
+    """
+
+    instruction = llm_request.config.system_instruction or ""
+    if instruction.startswith(_REQUEST_CONTEXT_SECTION) or (
+        _INSTRUCTION_BLOCK_SEPARATOR + _REQUEST_CONTEXT_SECTION in instruction
+    ):
+        instruction += "\n\n" + text
+    elif instruction:
+        instruction += _INSTRUCTION_BLOCK_SEPARATOR + _REQUEST_CONTEXT_SECTION + text
+    else:
+        instruction = _REQUEST_CONTEXT_SECTION + text
+    llm_request.config.system_instruction = instruction
+
+
+def _split_request_context(system_instruction: str) -> Tuple[str, str]:
+    """Splits a system instruction into its stable part and request context.
+
+    Args:
+      system_instruction: The system instruction of a request.
+
+    Returns:
+      The instructions before the request context section and the section
+      itself, either of which may be empty.
+    """
+
+    if system_instruction.startswith(_REQUEST_CONTEXT_SECTION):
+        return "", system_instruction
+    index = system_instruction.find(
+        _INSTRUCTION_BLOCK_SEPARATOR + _REQUEST_CONTEXT_SECTION
+    )
+    if index < 0:
+        return system_instruction, ""
+    return (
+        system_instruction[:index],
+        system_instruction[index + len(_INSTRUCTION_BLOCK_SEPARATOR) :],
+    )
+
+
+def _add_cache_breakpoint(message: Message) -> None:
+    """Marks the end of a message as a prompt cache breakpoint.
+
+    Args:
+      message: The message to mark, a copy owned by the caller.
+    """
+
+    content = message.get("content")
+    if isinstance(content, list) and content:
+        content[-1]["cache_control"] = dict(_CACHE_CONTROL)
+    elif not content and message.get("tool_calls"):
+        message["tool_calls"][-1]["cache_control"] = dict(_CACHE_CONTROL)
+    else:
+        message["cache_control"] = dict(_CACHE_CONTROL)
+
+
 def _get_completion_inputs(
     llm_request: LlmRequest,
+    prompt_caching: bool = False,
 ) -> Tuple[
     List[Message],
     Optional[List[Dict]],
@@ -487,26 +851,54 @@ def _get_completion_inputs(
 ]:
     """Converts an LlmRequest to litellm inputs and extracts generation params.
 
+    With `prompt_caching`, the request context section of the system
+    instruction is sent as a user message after the history, and the tools,
+    the rest of the system instruction and the history are marked as prompt
+    cache breakpoints. Every call of an agent loop then starts with the
+    prefix cached by the previous one. Providers without explicit caching
+    ignore the markers but still benefit from the stable prefix.
+
     Args:
       llm_request: The LlmRequest to convert.
+      prompt_caching: Whether to order and mark the request for prompt caching.
 
     Returns:
       The litellm inputs (message list, tool dictionary and response format).
     """
     messages: List[Message] = []
     for content in llm_request.contents or []:
-        message_param_or_list = _content_to_message_param(content)
+        message_param_or_list = _cached_content_to_message_param(content)
         if isinstance(message_param_or_list, list):
             messages.extend(message_param_or_list)
         elif message_param_or_list:  # Ensure it's not None before appending
             messages.append(message_param_or_list)
 
-    if llm_request.config.system_instruction:
+    system_instruction = llm_request.config.system_instruction
+    if prompt_caching and isinstance(system_instruction, str):
+        if messages:
+            _add_cache_breakpoint(messages[-1])
+        system_instruction, request_context = _split_request_context(
+            system_instruction
+        )
+        if request_context:
+            messages.append(
+                ChatCompletionUserMessage(role="user", content=request_context)
+            )
+        if system_instruction:
+            system_instruction = [
+                ChatCompletionTextObject(
+                    type="text",
+                    text=system_instruction,
+                    cache_control=dict(_CACHE_CONTROL),
+                )
+            ]
+
+    if system_instruction:
         messages.insert(
             0,
             ChatCompletionDeveloperMessage(
                 role="developer",
-                content=llm_request.config.system_instruction,
+                content=system_instruction,
             ),
         )
 
@@ -518,9 +910,11 @@ def _get_completion_inputs(
         and llm_request.config.tools[0].function_declarations
     ):
         tools = [
-            _function_declaration_to_tool_param(tool)
+            _cached_function_declaration_to_tool_param(tool)
             for tool in llm_request.config.tools[0].function_declarations
         ]
+        if prompt_caching:
+            tools[-1]["cache_control"] = dict(_CACHE_CONTROL)
 
     # 3. Handle response format
     response_format: Optional[types.SchemaUnion] = None
@@ -530,29 +924,17 @@ def _get_completion_inputs(
     # 4. Extract generation parameters
     generation_params: Optional[Dict] = None
     if llm_request.config:
-        config_dict = llm_request.config.model_dump(exclude_none=True)
         # Generate LiteLlm parameters here,
         # Following https://docs.litellm.ai/docs/completion/input.
+        # The fields are read directly; dumping the config would also
+        # serialize every tool declaration.
         generation_params = {}
-        param_mapping = {
-            "max_output_tokens": "max_completion_tokens",
-            "stop_sequences": "stop",
-        }
-        for key in (
-            "temperature",
-            "max_output_tokens",
-            "top_p",
-            "top_k",
-            "stop_sequences",
-            "presence_penalty",
-            "frequency_penalty",
-        ):
-            if key in config_dict:
-                mapped_key = param_mapping.get(key, key)
-                generation_params[mapped_key] = config_dict[key]
-
-            if not generation_params:
-                generation_params = None
+        for key, mapped_key in _GENERATION_PARAMS.items():
+            value = getattr(llm_request.config, key, None)
+            if value is not None:
+                generation_params[mapped_key] = value
+        if not generation_params:
+            generation_params = None
 
     return messages, tools, response_format, generation_params
 
@@ -654,15 +1036,20 @@ class LiteLlm(BaseLlm):
     """The LLM client to use for the model."""
 
     _additional_args: Dict[str, Any] = None
+    _prompt_caching: bool = False
 
-    def __init__(self, model: str, **kwargs):
+    def __init__(self, model: str, prompt_caching: bool = False, **kwargs):
         """Initializes the LiteLlm class.
 
         Args:
           model: The name of the LiteLlm model.
+          prompt_caching: Whether to order each request so that its stable
+            prefix (tools, system instruction, history) can be cached by the
+            provider, and mark that prefix with `cache_control` breakpoints.
           **kwargs: Additional arguments to pass to the litellm completion api.
         """
         super().__init__(model=model, **kwargs)
+        self._prompt_caching = prompt_caching
         self._additional_args = kwargs
         # preventing generation call with llm_client
         # and overriding messages, tools and stream which are managed internally
@@ -690,10 +1077,11 @@ class LiteLlm(BaseLlm):
             "tool",
         ]:
             self._maybe_append_user_content(llm_request)
-        logger.debug(_build_request_log(llm_request))
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(_build_request_log(llm_request))
 
         messages, tools, response_format, generation_params = _get_completion_inputs(
-            llm_request
+            llm_request, prompt_caching=self._prompt_caching
         )
         completion_args = {
             "model": self.model,
@@ -711,7 +1099,7 @@ class LiteLlm(BaseLlm):
             completion_args.pop("parallel_tool_calls")
 
         if stream:
-            text = ""
+            text_parts: List[str] = []
             function_calls = {}  # index -> {name, args, id}
             completion_args["stream"] = True
             aggregated_llm_response = None
@@ -723,26 +1111,25 @@ class LiteLlm(BaseLlm):
                     if isinstance(chunk, FunctionChunk):
                         index = chunk.index or fallback_index
                         if index not in function_calls:
-                            function_calls[index] = {"name": "", "args": "", "id": None}
+                            function_calls[index] = {
+                                "name": "",
+                                "args": _StreamedJsonBuffer(),
+                                "id": None,
+                            }
 
                         if chunk.name:
                             function_calls[index]["name"] += chunk.name
                         if chunk.args:
-                            function_calls[index]["args"] += chunk.args
-
                             # check if args is completed (workaround for improper chunk
                             # indexing)
-                            try:
-                                json.loads(function_calls[index]["args"])
+                            if function_calls[index]["args"].append(chunk.args):
                                 fallback_index += 1
-                            except json.JSONDecodeError:
-                                pass
 
                         function_calls[index]["id"] = (
                             chunk.id or function_calls[index]["id"] or str(index)
                         )
                     elif isinstance(chunk, TextChunk):
-                        text += chunk.text
+                        text_parts.append(chunk.text)
                         yield _message_to_generate_content_response(
                             ChatCompletionAssistantMessage(
                                 role="assistant",
@@ -755,6 +1142,7 @@ class LiteLlm(BaseLlm):
                             prompt_token_count=chunk.prompt_tokens,
                             candidates_token_count=chunk.completion_tokens,
                             total_token_count=chunk.total_tokens,
+                            cached_content_token_count=chunk.cached_tokens,
                         )
 
                     if (
@@ -769,7 +1157,7 @@ class LiteLlm(BaseLlm):
                                         id=func_data["id"],
                                         function=Function(
                                             name=func_data["name"],
-                                            arguments=func_data["args"],
+                                            arguments=func_data["args"].getvalue(),
                                             index=index,
                                         ),
                                     )
@@ -778,13 +1166,13 @@ class LiteLlm(BaseLlm):
                             _message_to_generate_content_response(
                                 ChatCompletionAssistantMessage(
                                     role="assistant",
-                                    content=text or "",
+                                    content="".join(text_parts),
                                     tool_calls=tool_calls,
                                 )
                             )
                         )
                         function_calls.clear()
-                        text = ""
+                        text_parts.clear()
                     elif finish_reason == "length":
                         # The stream was interrupted due to token limit.
                         # Create a final response indicating interruption, including any
@@ -798,7 +1186,7 @@ class LiteLlm(BaseLlm):
                                         id=func_data["id"],
                                         function=Function(
                                             name=func_data["name"],
-                                            arguments=func_data["args"],
+                                            arguments=func_data["args"].getvalue(),
                                             index=index,
                                         ),
                                     )
@@ -807,7 +1195,7 @@ class LiteLlm(BaseLlm):
                         aggregated_llm_response = _message_to_generate_content_response(
                             ChatCompletionAssistantMessage(
                                 role="assistant",
-                                content=text or None,
+                                content="".join(text_parts) or None,
                                 tool_calls=tool_calls or None,
                             )
                         )
@@ -828,14 +1216,12 @@ class LiteLlm(BaseLlm):
                             ),
                             is_partial=True,
                         )
-                        text = ""
-                    elif finish_reason == "stop" and text:
+                        text_parts.clear()
+                    elif finish_reason == "stop" and (text := "".join(text_parts)):
                         aggregated_llm_response = _message_to_generate_content_response(
-                            ChatCompletionAssistantMessage(
-                                role="assistant", content=text
-                            )
+                            ChatCompletionAssistantMessage(role="assistant", content=text)
                         )
-                        text = ""
+                        text_parts.clear()
 
             # waiting until streaming ends to yield the llm_response as litellm tends
             # to send chunk that contains usage_metadata after the chunk with
@@ -4,7 +4,7 @@ Initializes ADK Services based on configuration.
 
 import os
 import re
-from typing import Dict, Optional, List, Any
+from typing import AsyncIterable, Dict, Optional, List, Any
 from typing_extensions import override
 
 from google.genai import types as adk_types
@@ -27,7 +27,19 @@ from google.adk.memory import (
     VertexAiRagMemoryService,
 )
 
+from ...common.utils.artifact_cache import get_artifact_cache
 from .artifacts.filesystem_artifact_service import FilesystemArtifactService
+from .artifacts.listing import (
+    DEFAULT_METADATA_LOAD_CONCURRENCY,
+    ArtifactListing,
+    list_artifacts_with_metadata,
+)
+from .artifacts.streaming import (
+    ArtifactStream,
+    SavedArtifactStream,
+    open_artifact_stream,
+    save_artifact_stream,
+)
 
 try:
     from sam_test_infrastructure.artifact_service.service import (
@@ -77,6 +89,13 @@ class ScopedArtifactServiceWrapper(BaseArtifactService):
         # typically the agent_name or gateway_id.
         return app_name
 
+    def get_artifact_cache_scope(self, app_name: str):
+        """
+        Returns the backing service and effective app name, so the shared
+        artifact cache keys entries by where the artifact is actually stored.
+        """
+        return self.wrapped_service, self._get_scoped_app_name(app_name)
+
     @override
     async def save_artifact(
         self,
@@ -88,13 +107,19 @@ class ScopedArtifactServiceWrapper(BaseArtifactService):
         artifact: adk_types.Part,
     ) -> int:
         scoped_app_name = self._get_scoped_app_name(app_name)
-        return await self.wrapped_service.save_artifact(
+        version = await self.wrapped_service.save_artifact(
             app_name=scoped_app_name,
             user_id=user_id,
             session_id=session_id,
             filename=filename,
             artifact=artifact,
         )
+        # A version number can be reused if the artifact was deleted meanwhile.
+        cache = get_artifact_cache()
+        cache.invalidate(
+            cache.make_key(self, app_name, user_id, session_id, filename, version)
+        )
+        return version
 
     @override
     async def load_artifact(
@@ -135,6 +160,10 @@ class ScopedArtifactServiceWrapper(BaseArtifactService):
             session_id=session_id,
             filename=filename,
         )
+        cache = get_artifact_cache()
+        cache.invalidate(
+            cache.make_key(self, app_name, user_id, session_id, filename, 0)[:-1]
+        )
         return
 
     @override
@@ -149,6 +178,70 @@ class ScopedArtifactServiceWrapper(BaseArtifactService):
             filename=filename,
         )
 
+    async def list_artifacts_with_metadata(
+        self,
+        *,
+        app_name: str,
+        user_id: str,
+        session_id: str,
+        max_concurrency: int = DEFAULT_METADATA_LOAD_CONCURRENCY,
+    ) -> List[ArtifactListing]:
+        scoped_app_name = self._get_scoped_app_name(app_name)
+        return await list_artifacts_with_metadata(
+            self.wrapped_service,
+            app_name=scoped_app_name,
+            user_id=user_id,
+            session_id=session_id,
+            max_concurrency=max_concurrency,
+        )
+
+    async def open_artifact_stream(
+        self,
+        *,
+        app_name: str,
+        user_id: str,
+        session_id: str,
+        filename: str,
+        version: Optional[int] = None,
+    ) -> Optional[ArtifactStream]:
+        scoped_app_name = self._get_scoped_app_name(app_name)
+        return await open_artifact_stream(
+            self.wrapped_service,
+            app_name=scoped_app_name,
+            user_id=user_id,
+            session_id=session_id,
+            filename=filename,
+            version=version,
+        )
+
+    async def save_artifact_stream(
+        self,
+        *,
+        app_name: str,
+        user_id: str,
+        session_id: str,
+        filename: str,
+        chunks: AsyncIterable[bytes],
+        mime_type: str,
+        max_size_bytes: Optional[int] = None,
+    ) -> SavedArtifactStream:
+        scoped_app_name = self._get_scoped_app_name(app_name)
+        saved = await save_artifact_stream(
+            self.wrapped_service,
+            app_name=scoped_app_name,
+            user_id=user_id,
+            session_id=session_id,
+            filename=filename,
+            chunks=chunks,
+            mime_type=mime_type,
+            max_size_bytes=max_size_bytes,
+        )
+        cache = get_artifact_cache()
+        cache.invalidate(
+            cache.make_key(self, app_name, user_id, session_id, filename, saved.version)
+        )
+        return saved
+
 
 def _sanitize_for_path(identifier: str) -> str:
     """Sanitizes a string to be safe for use as a directory name."""
@@ -253,7 +346,10 @@ def initialize_artifact_service(component) -> BaseArtifactService:
             )
 
         try:
-            concrete_service = FilesystemArtifactService(base_path=base_path)
+            concrete_service = FilesystemArtifactService(
+                base_path=base_path,
+                durability=config.get("durability", "fsync"),
+            )
         except Exception as e:
             log.error(
                 "%s Failed to initialize FilesystemArtifactService: %s",
@@ -269,7 +365,11 @@ def initialize_artifact_service(component) -> BaseArtifactService:
             )
 
         try:
-            from .artifacts.s3_artifact_service import S3ArtifactService
+            from .artifacts.s3_artifact_service import (
+                DEFAULT_MULTIPART_CONCURRENCY,
+                DEFAULT_MULTIPART_PART_SIZE,
+                S3ArtifactService,
+            )
 
             valid_boto3_params = [
                 "aws_access_key_id",
@@ -292,7 +392,14 @@ def initialize_artifact_service(component) -> BaseArtifactService:
             if aws_secret_access_key:
                 s3_config["aws_secret_access_key"] = aws_secret_access_key
 
-            concrete_service = S3ArtifactService(bucket_name=bucket_name, **s3_config)
+            concrete_service = S3ArtifactService(
+                bucket_name=bucket_name,
+                multipart_part_size=config.get("multipart_part_size_bytes")
+                or DEFAULT_MULTIPART_PART_SIZE,
+                multipart_concurrency=config.get("multipart_concurrency")
+                or DEFAULT_MULTIPART_CONCURRENCY,
+                **s3_config,
+            )
         except ImportError as e:
             log.error(
                 "%s S3 dependencies not available: %s",
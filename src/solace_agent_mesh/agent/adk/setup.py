@@ -3,10 +3,13 @@ Handles ADK Agent and Runner initialization, including tool loading and callback
 """
 
 from typing import Dict, List, Optional, Union, Callable, Tuple, Set, Any, TYPE_CHECKING, Type
+import asyncio
 import functools
 import inspect
+import time
 from solace_ai_connector.common.log import log
 from solace_ai_connector.common.utils import import_module
+from ...common.utils.bounded_cache import BoundedTTLCache
 from ...common.utils.type_utils import is_subclass_by_name
 
 from .app_llm_agent import AppLlmAgent
@@ -45,6 +48,9 @@ from ...agent.adk import callbacks as adk_callbacks
 from ...agent.adk.models.lite_llm import LiteLlm
 
 
+# How long a call's start time is kept when its after-callback never runs.
+CALL_TIMING_TTL_SECONDS = 3600
+
 # Define a clear return type for all tool-loading helpers
 ToolLoadingResult = Tuple[List[Union[BaseTool, Callable]], List[BuiltinTool], List[Callable]]
 
@@ -388,6 +394,33 @@ async def _load_python_tool(component: "SamAgentComponent", tool_config: Dict) -
 
     return loaded_python_tools, [], cleanup_hooks
 
+def _builtin_tool_cleanup_hooks(
+    component: "SamAgentComponent",
+    tool_defs: List[BuiltinTool],
+    tool_config: Dict[str, Any],
+) -> List[Callable]:
+    """Wraps the distinct `cleanup_function`s of built-in tools as cleanup hooks."""
+    cleanup_functions = []
+    for tool_def in tool_defs:
+        if (
+            tool_def.cleanup_function
+            and tool_def.cleanup_function not in cleanup_functions
+        ):
+            cleanup_functions.append(tool_def.cleanup_function)
+
+    def make_hook(cleanup_function: Callable) -> Callable:
+        async def hook():
+            log.info(
+                "%s Running built-in tool cleanup function '%s'.",
+                component.log_identifier,
+                cleanup_function.__name__,
+            )
+            cleanup_function(component, tool_config)
+
+        return hook
+
+    return [make_hook(cleanup_function) for cleanup_function in cleanup_functions]
+
 async def _load_builtin_tool(component: "SamAgentComponent", tool_config: Dict) -> ToolLoadingResult:
     """Loads a single built-in tool from the SAM or ADK tool registry."""
     from pydantic import TypeAdapter
@@ -414,7 +447,10 @@ async def _load_builtin_tool(component: "SamAgentComponent", tool_config: Dict)
             component.log_identifier,
             sam_tool_def.name,
         )
-        return [tool_callable], [sam_tool_def], []
+        cleanup_hooks = _builtin_tool_cleanup_hooks(
+            component, [sam_tool_def], tool_config_model.tool_config
+        )
+        return [tool_callable], [sam_tool_def], cleanup_hooks
 
     # Fallback to ADK built-in tools module
     adk_tool = getattr(adk_tools_module, tool_name, None)
@@ -500,7 +536,10 @@ async def _load_builtin_group_tool(component: "SamAgentComponent", tool_config:
         len(loaded_tools),
         group_name,
     )
-    return loaded_tools, enabled_builtin_tools, []
+    cleanup_hooks = _builtin_tool_cleanup_hooks(
+        component, tools_in_group, tool_config_model.tool_config
+    )
+    return loaded_tools, enabled_builtin_tools, cleanup_hooks
 
 async def _load_mcp_tool(component: "SamAgentComponent", tool_config: Dict) -> ToolLoadingResult:
     """Loads an MCP toolset based on connection parameters."""
@@ -644,6 +683,214 @@ def _load_internal_tools(component: "SamAgentComponent", loaded_tool_names: Set[
     return loaded_tools, enabled_builtin_tools, []
 
 
+def _callback_name(callback: Callable) -> str:
+    """Returns the name a callback is reported under in the callback metrics."""
+    func = callback.func if isinstance(callback, functools.partial) else callback
+    return getattr(func, "__name__", type(func).__name__)
+
+
+def _record_llm_usage(
+    component: "SamAgentComponent",
+    usage: Any,
+    duration_seconds: Optional[float],
+) -> None:
+    component.metrics.record_llm_usage(
+        prompt_tokens=usage.prompt_token_count or 0,
+        completion_tokens=usage.candidates_token_count or 0,
+        cached_tokens=usage.cached_content_token_count or 0,
+        duration_seconds=duration_seconds,
+    )
+
+
+def _describe_tool_config(tool_config: Dict) -> str:
+    """Returns a short label identifying a tool config entry in logs and timings."""
+    tool_type = str(tool_config.get("tool_type", "unknown")).lower()
+    if tool_type == "builtin-group":
+        detail = tool_config.get("group_name")
+    elif tool_type == "mcp":
+        connection_params = tool_config.get("connection_params") or {}
+        detail = (
+            tool_config.get("tool_name")
+            or connection_params.get("url")
+            or connection_params.get("command")
+        )
+    else:
+        detail = (
+            tool_config.get("tool_name")
+            or tool_config.get("function_name")
+            or tool_config.get("class_name")
+            or tool_config.get("component_module")
+        )
+    return f"{tool_type}:{detail}" if detail else tool_type
+
+
+async def _load_tool_entry(
+    component: "SamAgentComponent", tool_config: Dict, any_tool_adapter
+) -> Tuple[ToolLoadingResult, List[Tuple[str, str]]]:
+    """
+    Loads one entry of the 'tools' list and discovers the names it provides.
+
+    MCP toolsets are asked for their tools here, so the server connection and
+    handshake happen inside the (concurrent) loading phase.
+
+    Returns:
+        The loader's result and the (tool name, source) pairs to register, in
+        the order the tools were loaded.
+    """
+    tool_config_model = any_tool_adapter.validate_python(tool_config)
+    tool_type = tool_config_model.tool_type.lower()
+
+    new_tools, new_builtins, new_cleanups = [], [], []
+
+    if tool_type == "python":
+        new_tools, new_builtins, new_cleanups = await _load_python_tool(
+            component, tool_config
+        )
+    elif tool_type == "builtin":
+        new_tools, new_builtins, new_cleanups = await _load_builtin_tool(
+            component, tool_config
+        )
+    elif tool_type == "builtin-group":
+        new_tools, new_builtins, new_cleanups = await _load_builtin_group_tool(
+            component, tool_config
+        )
+    elif tool_type == "mcp":
+        new_tools, new_builtins, new_cleanups = await _load_mcp_tool(
+            component, tool_config
+        )
+    else:
+        log.warning(
+            "%s Unknown tool type '%s' in config: %s",
+            component.log_identifier,
+            tool_type,
+            tool_config,
+        )
+
+    names_to_register: List[Tuple[str, str]] = []
+    try:
+        for tool in new_tools:
+            if isinstance(tool, EmbedResolvingMCPToolset):
+                # Special handling for MCPToolset which can load multiple tools
+                try:
+                    mcp_tools = await tool.get_tools()
+                except Exception as e:
+                    log.error(
+                        "%s Failed to discover tools from MCP server for name registration: %s",
+                        component.log_identifier,
+                        str(e),
+                    )
+                    raise
+                names_to_register.extend(
+                    (mcp_tool.name, "mcp") for mcp_tool in mcp_tools
+                )
+            else:
+                tool_name = getattr(tool, "name", getattr(tool, "__name__", None))
+                if tool_name:
+                    names_to_register.append((tool_name, tool_type))
+    except BaseException:
+        # Includes the cancellation by a load timeout, which typically lands
+        # inside get_tools() after the MCP connection was opened. The entry
+        # never reaches the caller, so it is released here.
+        await _release_tool_entry(component, new_tools, new_cleanups)
+        raise
+
+    return (new_tools, new_builtins, new_cleanups), names_to_register
+
+
+async def _load_tool_entries_concurrently(
+    component: "SamAgentComponent", tools_config: List[Dict], any_tool_adapter
+) -> Tuple[List[Any], List[Dict[str, Any]]]:
+    """
+    Runs `_load_tool_entry` for every configured tool, at most
+    `tool_loading_concurrency` at a time, each bounded by its timeout.
+
+    Returns:
+        One outcome per config entry, in config order: either the entry's
+        result or the exception it raised; and the per-entry timing records.
+    """
+    concurrency = max(1, int(component.get_config("tool_loading_concurrency", 8)))
+    default_timeout = component.get_config("tool_load_timeout_seconds", 120.0)
+    semaphore = asyncio.Semaphore(concurrency)
+    timings: List[Dict[str, Any]] = [{} for _ in tools_config]
+
+    async def load(index: int, tool_config: Dict):
+        label = _describe_tool_config(tool_config)
+        timeout = tool_config.get("load_timeout_seconds") or default_timeout
+        async with semaphore:
+            start = time.perf_counter()
+            status = "error"
+            tool_count = 0
+            try:
+                result, names = await asyncio.wait_for(
+                    _load_tool_entry(component, tool_config, any_tool_adapter),
+                    timeout=timeout,
+                )
+                status = "ok"
+                tool_count = len(names)
+                return result, names
+            except asyncio.TimeoutError as e:
+                status = "timeout"
+                raise TimeoutError(
+                    f"Loading tool '{label}' did not complete within {timeout} seconds."
+                ) from e
+            finally:
+                timings[index] = {
+                    "tool": label,
+                    "tool_type": str(tool_config.get("tool_type", "unknown")).lower(),
+                    "status": status,
+                    "duration_ms": round((time.perf_counter() - start) * 1000, 1),
+                    "tool_count": tool_count,
+                }
+
+    outcomes = await asyncio.gather(
+        *(load(index, tool_config) for index, tool_config in enumerate(tools_config)),
+        return_exceptions=True,
+    )
+    return outcomes, timings
+
+
+async def _release_tool_entry(
+    component: "SamAgentComponent",
+    new_tools: List[Any],
+    new_cleanups: List[Callable],
+) -> None:
+    """Runs an entry's cleanup hooks and closes its MCP connections."""
+    for hook in new_cleanups:
+        try:
+            await hook()
+        except Exception as e:
+            log.error(
+                "%s Error running cleanup hook after failed tool loading: %s",
+                component.log_identifier,
+                e,
+            )
+    for tool in new_tools:
+        if isinstance(tool, EmbedResolvingMCPToolset):
+            try:
+                await tool.close()
+            except Exception as e:
+                log.error(
+                    "%s Error closing MCP toolset after failed tool loading: %s",
+                    component.log_identifier,
+                    e,
+                )
+
+
+async def _release_loaded_tool_entries(
+    component: "SamAgentComponent", outcomes: List[Any]
+) -> None:
+    """
+    Releases every entry that loaded successfully, when startup fails because
+    of another entry. Since entries load concurrently, this includes entries
+    after the failing one. Entries that failed released themselves.
+    """
+    for outcome in reversed(outcomes):
+        if isinstance(outcome, BaseException):
+            continue
+        (new_tools, _, new_cleanups), _ = outcome
+        await _release_tool_entry(component, new_tools, new_cleanups)
+
+
 async def load_adk_tools(
     component,
 ) -> Tuple[List[Union[BaseTool, Callable]], List[BuiltinTool], List[Callable]]:
@@ -653,6 +900,12 @@ async def load_adk_tools(
     - SAM Built-in tools (Artifact, Data, etc.) from the tool registry,
       filtered by agent configuration.
 
+    Configured tools are loaded concurrently (see `tool_loading_concurrency`
+    and `tool_load_timeout_seconds`), then their names are registered and the
+    results aggregated in config order, so registration order and duplicate
+    detection do not depend on which tool finished loading first. Per-tool
+    load timings are logged and stored on `component.tool_startup_timings`.
+
     Args:
         component: The SamAgentComponent instance.
 
@@ -664,6 +917,7 @@ async def load_adk_tools(
 
     Raises:
         ImportError: If a configured tool or its dependencies cannot be loaded.
+        TimeoutError: If a configured tool does not load within its timeout.
     """
     loaded_tools: List[Union[BaseTool, Callable]] = []
     enabled_builtin_tools: List[BuiltinTool] = []
@@ -671,7 +925,7 @@ async def load_adk_tools(
     cleanup_hooks: List[Callable] = []
     tools_config = component.get_config("tools", [])
 
-    from pydantic import TypeAdapter, ValidationError
+    from pydantic import TypeAdapter
 
     any_tool_adapter = TypeAdapter(AnyToolConfig)
 
@@ -679,89 +933,61 @@ async def load_adk_tools(
         log.info(
             "%s No explicit tools configured in 'tools' list.", component.log_identifier
         )
+        component.tool_startup_timings = {"total_ms": 0.0, "tools": []}
     else:
         log.info(
             "%s Loading %d tool(s) from 'tools' list configuration...",
             component.log_identifier,
             len(tools_config),
         )
-        for tool_config in tools_config:
+        start = time.perf_counter()
+        outcomes, timings = await _load_tool_entries_concurrently(
+            component, tools_config, any_tool_adapter
+        )
+        total_ms = round((time.perf_counter() - start) * 1000, 1)
+        component.tool_startup_timings = {"total_ms": total_ms, "tools": timings}
+        for timing in timings:
+            log.info(
+                "%s Tool '%s' finished loading after %.1f ms (%s, %d tool(s)).",
+                component.log_identifier,
+                timing["tool"],
+                timing["duration_ms"],
+                timing["status"],
+                timing["tool_count"],
+            )
+        log.info(
+            "%s Loaded %d tool config(s) in %.1f ms (sum of per-tool times: %.1f ms).",
+            component.log_identifier,
+            len(tools_config),
+            total_ms,
+            sum(timing["duration_ms"] for timing in timings),
+        )
+
+        for tool_config, outcome in zip(tools_config, outcomes):
             try:
-                tool_config_model = any_tool_adapter.validate_python(tool_config)
-                tool_type = tool_config_model.tool_type.lower()
-
-                new_tools, new_builtins, new_cleanups = [], [], []
-
-                if tool_type == "python":
-                    (
-                        new_tools,
-                        new_builtins,
-                        new_cleanups,
-                    ) = await _load_python_tool(component, tool_config)
-                elif tool_type == "builtin":
-                    (
-                        new_tools,
-                        new_builtins,
-                        new_cleanups,
-                    ) = await _load_builtin_tool(component, tool_config)
-                elif tool_type == "builtin-group":
-                    (
-                        new_tools,
-                        new_builtins,
-                        new_cleanups,
-                    ) = await _load_builtin_group_tool(component, tool_config)
-                elif tool_type == "mcp":
-                    (
-                        new_tools,
-                        new_builtins,
-                        new_cleanups,
-                    ) = await _load_mcp_tool(component, tool_config)
-                else:
-                    log.warning(
-                        "%s Unknown tool type '%s' in config: %s",
-                        component.log_identifier,
-                        tool_type,
-                        tool_config,
-                    )
+                if isinstance(outcome, BaseException):
+                    raise outcome
+                (new_tools, new_builtins, new_cleanups), names = outcome
 
                 # Centralized name checking and result aggregation
-                for tool in new_tools:
-                    if isinstance(tool, EmbedResolvingMCPToolset):
-                        # Special handling for MCPToolset which can load multiple tools
-                        try:
-                            mcp_tools = await tool.get_tools()
-                            for mcp_tool in mcp_tools:
-                                _check_and_register_tool_name(
-                                    mcp_tool.name, "mcp", loaded_tool_names
-                                )
-                        except Exception as e:
-                            log.error(
-                                "%s Failed to discover tools from MCP server for name registration: %s",
-                                component.log_identifier,
-                                str(e),
-                            )
-                            raise
-                    else:
-                        tool_name = getattr(
-                            tool, "name", getattr(tool, "__name__", None)
-                        )
-                        if tool_name:
-                            _check_and_register_tool_name(
-                                tool_name, tool_type, loaded_tool_names
-                            )
+                for tool_name, source in names:
+                    _check_and_register_tool_name(tool_name, source, loaded_tool_names)
 
                 loaded_tools.extend(new_tools)
                 enabled_builtin_tools.extend(new_builtins)
                 # Prepend cleanup hooks to maintain LIFO execution order
                 cleanup_hooks = new_cleanups + cleanup_hooks
 
-            except Exception as e:
+            except BaseException as e:
+                # BaseException, so an entry that was cancelled or interrupted
+                # also releases the entries that did load.
                 log.error(
                     "%s Failed to load tool config %s: %s",
                     component.log_identifier,
                     tool_config,
                     e,
                 )
+                await _release_loaded_tool_entries(component, outcomes)
                 raise e
 
     # Load internal framework tools
@@ -880,6 +1106,12 @@ def initialize_adk_agent(
             "%s Attached host_component reference to AppLlmAgent.",
             component.log_identifier,
         )
+        # Start times of in-flight LLM calls (by invocation) and tool calls (by
+        # function call ID), for the LLM token rate and tool latency metrics.
+        # Bounded because a failed call never reaches its after-callback.
+        call_started_at = BoundedTTLCache(
+            max_entries=10_000, name=f"CallTimings:{agent_name}"
+        )
         callbacks_in_order_for_before_model = []
 
         callbacks_in_order_for_before_model.append(
@@ -907,14 +1139,6 @@ def initialize_adk_agent(
                 "%s Added _filter_tools_by_capability_callback to before_model chain.",
                 component.log_identifier,
             )
-        if hasattr(component, "_inject_gateway_instructions_callback"):
-            callbacks_in_order_for_before_model.append(
-                component._inject_gateway_instructions_callback
-            )
-            log.info(
-                "%s Added _inject_gateway_instructions_callback to before_model chain.",
-                component.log_identifier,
-            )
 
         dynamic_instruction_callback_with_component = functools.partial(
             adk_callbacks.inject_dynamic_instructions_callback,
@@ -928,6 +1152,16 @@ def initialize_adk_agent(
             "%s Added inject_dynamic_instructions_callback to before_model chain.",
             component.log_identifier,
         )
+        # Gateway instructions are request context, which follows the
+        # instructions that are the same for every call.
+        if hasattr(component, "_inject_gateway_instructions_callback"):
+            callbacks_in_order_for_before_model.append(
+                component._inject_gateway_instructions_callback
+            )
+            log.info(
+                "%s Added _inject_gateway_instructions_callback to before_model chain.",
+                component.log_identifier,
+            )
 
         solace_llm_trigger_callback_with_component = functools.partial(
             adk_callbacks.solace_llm_invocation_callback, host_component=component
@@ -938,12 +1172,18 @@ def initialize_adk_agent(
         ) -> Optional[LlmResponse]:
             early_response: Optional[LlmResponse] = None
             for cb_func in callbacks_in_order_for_before_model:
-                response = cb_func(callback_context, llm_request)
+                with component.metrics.time_callback(_callback_name(cb_func)):
+                    response = cb_func(callback_context, llm_request)
                 if response:
                     early_response = response
                     break
 
             solace_llm_trigger_callback_with_component(callback_context, llm_request)
+            call_started_at.set(
+                ("llm", callback_context.invocation_id),
+                time.perf_counter(),
+                ttl=CALL_TIMING_TTL_SECONDS,
+            )
 
             if early_response:
                 return early_response
@@ -960,7 +1200,17 @@ def initialize_adk_agent(
             adk_callbacks.notify_tool_invocation_start_callback,
             host_component=component,
         )
-        agent.before_tool_callback = tool_invocation_start_cb_with_component
+        def before_tool_callback_with_timing(
+            tool: BaseTool, args: Dict, tool_context: ToolContext
+        ):
+            call_started_at.set(
+                ("tool", tool_context.function_call_id),
+                time.perf_counter(),
+                ttl=CALL_TIMING_TTL_SECONDS,
+            )
+            return tool_invocation_start_cb_with_component(tool, args, tool_context)
+
+        agent.before_tool_callback = before_tool_callback_with_timing
         log.info(
             "%s Assigned notify_tool_invocation_start_callback as before_tool_callback.",
             component.log_identifier,
@@ -994,6 +1244,18 @@ def initialize_adk_agent(
                 type(tool_response).__name__,
             )
 
+            started = call_started_at.pop(("tool", tool_context.function_call_id))
+            if started is not None:
+                status = (
+                    "error"
+                    if isinstance(tool_response, dict)
+                    and tool_response.get("status") == "error"
+                    else "success"
+                )
+                component.metrics.observe_tool(
+                    tool.name, time.perf_counter() - started, status
+                )
+
             try:
                 # First, notify the UI about the raw result.
                 # This is a fire-and-forget notification that does not modify the response.
@@ -1002,20 +1264,26 @@ def initialize_adk_agent(
                 )
 
                 # Now, proceed with the existing chain that modifies the response for the LLM.
-                processed_by_large_handler = await large_response_cb_with_component(
-                    tool, args, tool_context, tool_response
-                )
+                with component.metrics.time_callback(
+                    "manage_large_mcp_tool_responses_callback"
+                ):
+                    processed_by_large_handler = await large_response_cb_with_component(
+                        tool, args, tool_context, tool_response
+                    )
                 response_for_metadata_injector = (
                     processed_by_large_handler
                     if processed_by_large_handler is not None
                     else tool_response
                 )
 
-                final_response_after_metadata = (
-                    await metadata_injection_cb_with_component(
-                        tool, args, tool_context, response_for_metadata_injector
+                with component.metrics.time_callback(
+                    "after_tool_callback_inject_metadata"
+                ):
+                    final_response_after_metadata = (
+                        await metadata_injection_cb_with_component(
+                            tool, args, tool_context, response_for_metadata_injector
+                        )
                     )
-                )
 
                 final_result = (
                     final_response_after_metadata
@@ -1024,9 +1292,12 @@ def initialize_adk_agent(
                 )
 
                 # Track produced artifacts. This callback does not modify the response.
-                await track_artifacts_cb_with_component(
-                    tool, args, tool_context, final_result
-                )
+                with component.metrics.time_callback(
+                    "track_produced_artifacts_callback"
+                ):
+                    await track_artifacts_cb_with_component(
+                        tool, args, tool_context, final_result
+                    )
 
                 log.debug(
                     "%s Tool callback chain completed for tool: %s, final response type: %s",
@@ -1091,12 +1362,21 @@ def initialize_adk_agent(
         async def final_after_model_wrapper(
             callback_context: CallbackContext, llm_response: LlmResponse
         ) -> Optional[LlmResponse]:
+            if llm_response.usage_metadata and not llm_response.partial:
+                started = call_started_at.pop(("llm", callback_context.invocation_id))
+                _record_llm_usage(
+                    component,
+                    llm_response.usage_metadata,
+                    time.perf_counter() - started if started is not None else None,
+                )
+
             for cb_func in callbacks_in_order_for_after_model:
                 # Await async callbacks, call sync callbacks
-                if inspect.iscoroutinefunction(cb_func):
-                    response = await cb_func(callback_context, llm_response)
-                else:
-                    response = cb_func(callback_context, llm_response)
+                with component.metrics.time_callback(_callback_name(cb_func)):
+                    if inspect.iscoroutinefunction(cb_func):
+                        response = await cb_func(callback_context, llm_response)
+                    else:
+                        response = cb_func(callback_context, llm_response)
 
                 # If a callback returns a response, it hijacks the flow.
                 if response:
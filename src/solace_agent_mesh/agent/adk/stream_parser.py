@@ -88,16 +88,29 @@ class FencedBlockStreamParser:
         """Initializes the parser and its state machine."""
         self._state = ParserState.IDLE
         self._speculative_buffer = ""
-        self._artifact_buffer = ""
-        self._block_params: Dict[str, Any] = {}
         self._progress_update_interval = progress_update_interval_bytes
+        self._reset_block_buffer()
+        self._block_params: Dict[str, Any] = {}
         self._last_progress_update_size = 0
 
+    def _reset_block_buffer(self):
+        """
+        Clears the block content buffer. Content is kept as a list of spans
+        (joined once when the block closes) plus a short window of recent text
+        from which progress chunks are sliced.
+        """
+        self._artifact_parts: List[str] = []
+        self._artifact_chars = 0
+        self._artifact_bytes = 0
+        self._artifact_tail = ""
+        self._window_parts: List[str] = []
+        self._window_start = 0
+
     def _reset_state(self):
         """Resets the parser to its initial IDLE state."""
         self._state = ParserState.IDLE
         self._speculative_buffer = ""
-        self._artifact_buffer = ""
+        self._reset_block_buffer()
         self._block_params = {}
         self._last_progress_update_size = 0
 
@@ -105,6 +118,10 @@ class FencedBlockStreamParser:
         """
         Processes the next chunk of text from the stream.
 
+        Text outside blocks and block content are located with `str.find` and
+        copied as whole spans; only the few characters of a potential block
+        start are examined one at a time.
+
         Args:
             text_chunk: The string content from the LLM stream.
 
@@ -114,14 +131,18 @@ class FencedBlockStreamParser:
         """
         user_text_parts: List[str] = []
         events: List[ParserEvent] = []
+        pos = 0
+        length = len(text_chunk)
 
-        for char in text_chunk:
+        while pos < length:
             if self._state == ParserState.IDLE:
-                self._process_idle(char, user_text_parts)
+                pos = self._consume_idle(text_chunk, pos, user_text_parts)
             elif self._state == ParserState.POTENTIAL_BLOCK:
-                self._process_potential(char, user_text_parts, events)
-            elif self._state == ParserState.IN_BLOCK:
-                self._process_in_block(char, events)
+                pos = self._consume_potential(
+                    text_chunk, pos, user_text_parts, events
+                )
+            else:
+                pos = self._consume_in_block(text_chunk, pos, events)
 
         return ParserResult("".join(user_text_parts), events)
 
@@ -146,38 +167,146 @@ class FencedBlockStreamParser:
             # The orchestrator is responsible for interpreting this as a failure.
             events.append(
                 BlockCompletedEvent(
-                    params=self._block_params, content=self._artifact_buffer
+                    params=self._block_params, content="".join(self._artifact_parts)
                 )
             )
 
         self._reset_state()
         return ParserResult("".join(user_text_parts), events)
 
-    def _process_idle(self, char: str, user_text_parts: List[str]):
-        """State handler for when the parser is outside any block."""
-        if char == BLOCK_START_SEQUENCE[0]:
-            self._state = ParserState.POTENTIAL_BLOCK
-            self._speculative_buffer += char
+    def _consume_idle(self, text: str, pos: int, user_text_parts: List[str]) -> int:
+        """Copies user-facing text up to the next possible block start."""
+        start = text.find(BLOCK_START_SEQUENCE[0], pos)
+        if start == -1:
+            user_text_parts.append(text[pos:])
+            return len(text)
+        if start > pos:
+            user_text_parts.append(text[pos:start])
+        self._state = ParserState.POTENTIAL_BLOCK
+        self._speculative_buffer = BLOCK_START_SEQUENCE[0]
+        return start + 1
+
+    def _consume_potential(
+        self,
+        text: str,
+        pos: int,
+        user_text_parts: List[str],
+        events: List[ParserEvent],
+    ) -> int:
+        """Matches the start sequence, then buffers the parameters line."""
+        if not self._speculative_buffer.startswith(BLOCK_START_SEQUENCE):
+            self._process_potential(text[pos], user_text_parts, events)
+            return pos + 1
+
+        newline = text.find("\n", pos)
+        if newline == -1:
+            self._speculative_buffer += text[pos:]
+            return len(text)
+
+        self._speculative_buffer += text[pos:newline]
+        # Extract the parameters string between the start sequence and the newline
+        params_str = self._speculative_buffer[len(BLOCK_START_SEQUENCE) :]
+        self._state = ParserState.IN_BLOCK
+        self._block_params = dict(PARAMS_REGEX.findall(params_str))
+        events.append(BlockStartedEvent(params=self._block_params))
+        self._speculative_buffer = ""
+        return newline + 1
+
+    def _consume_in_block(
+        self, text: str, pos: int, events: List[ParserEvent]
+    ) -> int:
+        """Buffers block content up to and including the closing delimiter."""
+        # The delimiter may straddle the previous chunk. The buffer never ends
+        # with a full delimiter, so a match always finishes inside `text`.
+        carry = self._artifact_tail
+        match = (carry + text[pos : pos + len(carry)]).find(
+            ARTIFACT_BLOCK_DELIMITER_CLOSE
+        )
+        if match == -1:
+            match = text.find(ARTIFACT_BLOCK_DELIMITER_CLOSE, pos)
+            close_end = -1 if match == -1 else match + len(ARTIFACT_BLOCK_DELIMITER_CLOSE)
         else:
-            user_text_parts.append(char)
+            close_end = pos + match + len(ARTIFACT_BLOCK_DELIMITER_CLOSE) - len(carry)
+        if close_end == -1:
+            self._append_block_content(text[pos:], events)
+            return len(text)
+
+        self._append_block_content(text[pos : close_end - 1], events)
+        self._artifact_parts.append(text[close_end - 1])
+        final_content = "".join(self._artifact_parts)[
+            : -len(ARTIFACT_BLOCK_DELIMITER_CLOSE)
+        ]
+        events.append(
+            BlockCompletedEvent(params=self._block_params, content=final_content)
+        )
+        self._reset_state()
+        return close_end
+
+    def _append_block_content(self, span: str, events: List[ParserEvent]):
+        """
+        Appends content to the block buffer, emitting a progress event each
+        time another `progress_update_interval_bytes` of UTF-8 has accumulated.
+
+        A progress chunk is the buffer sliced from the previous event's byte
+        size to the current byte size, bounded by the buffer's length at that
+        moment (byte sizes have always been used as slice indices here).
+        """
+        if not span:
+            return
+        chars_before = self._artifact_chars
+        bytes_before = self._artifact_bytes
+        self._artifact_parts.append(span)
+        self._window_parts.append(span)
+        self._artifact_chars += len(span)
+        self._artifact_tail = (self._artifact_tail + span[-2:])[-2:]
+
+        # (byte size, buffer length) at each point a progress event falls due.
+        due: List[tuple] = []
+        interval = self._progress_update_interval
+        last = self._last_progress_update_size
+        if span.isascii():
+            # Every ASCII character adds one byte, so the due sizes can be
+            # computed directly instead of per character.
+            self._artifact_bytes += len(span)
+            size = max(last + interval, bytes_before + 1)
+            while size <= self._artifact_bytes:
+                due.append((size, chars_before + size - bytes_before))
+                size = max(size + interval, size + 1)
+        else:
+            size = bytes_before
+            for length, char in enumerate(span, chars_before + 1):
+                size += len(char.encode("utf-8"))
+                if size - last >= interval:
+                    due.append((size, length))
+                    last = size
+            self._artifact_bytes = size
+
+        if due:
+            self._emit_progress(due, events)
+
+    def _emit_progress(self, due: List[tuple], events: List[ParserEvent]):
+        """Emits the due progress events and trims the progress window."""
+        window = "".join(self._window_parts)
+        start = self._window_start
+        last = self._last_progress_update_size
+        for size, length in due:
+            new_chunk = window[last - start : min(size, length) - start]
+            events.append(BlockProgressedEvent(buffered_size=size, chunk=new_chunk))
+            last = size
+        self._last_progress_update_size = last
+        keep_from = min(last, self._artifact_chars)
+        self._window_parts = [window[keep_from - start :]]
+        self._window_start = keep_from
 
     def _process_potential(
         self, char: str, user_text_parts: List[str], events: List[ParserEvent]
     ):
-        """State handler for when a block might be starting."""
+        """State handler for a single character while a block might be starting."""
         self._speculative_buffer += char
 
-        # If we have the full start sequence, we are now looking for the newline.
+        # Once the full start sequence is buffered, _consume_potential takes
+        # over to find the newline ending the parameters line.
         if self._speculative_buffer.startswith(BLOCK_START_SEQUENCE):
-            if char == "\n":
-                # We found the newline, the block is officially started.
-                self._state = ParserState.IN_BLOCK
-                # Extract the parameters string between the start sequence and the newline
-                params_str = self._speculative_buffer[len(BLOCK_START_SEQUENCE) : -1]
-                self._block_params = dict(PARAMS_REGEX.findall(params_str))
-                events.append(BlockStartedEvent(params=self._block_params))
-                self._speculative_buffer = ""  # Clear buffer, we are done with it.
-            # else, we are still buffering the parameters line.
             return
 
         # If we are still building up the start sequence itself
@@ -191,31 +320,3 @@ class FencedBlockStreamParser:
         user_text_parts.append(rolled_back_text)
         events.append(BlockInvalidatedEvent(rolled_back_text=rolled_back_text))
         self._reset_state()
-
-    def _process_in_block(self, char: str, events: List[ParserEvent]):
-        """State handler for when the parser is inside a block, buffering content."""
-        self._artifact_buffer += char
-
-        # Check for the closing delimiter
-        if self._artifact_buffer.endswith(ARTIFACT_BLOCK_DELIMITER_CLOSE):
-            # Block is complete.
-            final_content = self._artifact_buffer[
-                : -len(ARTIFACT_BLOCK_DELIMITER_CLOSE)
-            ]
-            events.append(
-                BlockCompletedEvent(params=self._block_params, content=final_content)
-            )
-            self._reset_state()
-        else:
-            # Check if we should emit a progress update
-            current_size = len(self._artifact_buffer.encode("utf-8"))
-            if (
-                current_size - self._last_progress_update_size
-            ) >= self._progress_update_interval:
-                new_chunk = self._artifact_buffer[
-                    self._last_progress_update_size : current_size
-                ]
-                events.append(
-                    BlockProgressedEvent(buffered_size=current_size, chunk=new_chunk)
-                )
-                self._last_progress_update_size = current_size
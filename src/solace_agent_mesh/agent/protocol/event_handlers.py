@@ -34,7 +34,6 @@ from ...common.a2a import (
     get_agent_status_subscription_topic,
     get_sam_events_subscription_topic,
     get_text_from_message,
-    topic_matches_subscription,
 )
 from ...agent.utils.artifact_helpers import (
     generate_artifact_metadata_summary,
@@ -80,6 +79,21 @@ def _register_peer_artifacts_in_parent_context(
                 )
 
 
+def build_topic_dispatcher(namespace: str, agent_name: str) -> a2a.TopicDispatcher:
+    """Builds the dispatcher routing an agent's inbound topics to handlers."""
+    dispatcher = a2a.TopicDispatcher()
+    dispatcher.add(get_agent_request_topic(namespace, agent_name), "request")
+    dispatcher.add(get_discovery_topic(namespace), "discovery")
+    dispatcher.add(get_sam_events_subscription_topic(namespace, "session"), "sam_event")
+    dispatcher.add(
+        get_agent_response_subscription_topic(namespace, agent_name), "peer_response"
+    )
+    dispatcher.add(
+        get_agent_status_subscription_topic(namespace, agent_name), "peer_response"
+    )
+    return dispatcher
+
+
 async def process_event(component, event: Event):
     """
     Processes incoming events (Messages, Timers, etc.). Routes to specific handlers.
@@ -110,30 +124,20 @@ async def process_event(component, event: Event):
                     component.log_identifier,
                     topic,
                 )
-            namespace = component.get_config("namespace")
             agent_name = component.get_config("agent_name")
-            agent_request_topic = get_agent_request_topic(namespace, agent_name)
-            discovery_topic = get_discovery_topic(namespace)
-            agent_response_sub_prefix = (
-                get_agent_response_subscription_topic(namespace, agent_name)[:-2] + "/"
-            )
-            agent_status_sub_prefix = (
-                get_agent_status_subscription_topic(namespace, agent_name)[:-2] + "/"
-            )
-            sam_events_topic = get_sam_events_subscription_topic(namespace, "session")
-            if topic == agent_request_topic:
+            route = component.topic_dispatcher.match(topic)
+            route_name = route.handler if route else None
+            if route_name == "request":
                 await handle_a2a_request(component, message)
-            elif topic == discovery_topic:
+            elif route_name == "discovery":
                 payload = message.get_payload()
                 if isinstance(payload, dict) and payload.get("name") != agent_name:
                     handle_agent_card_message(component, message)
                 else:
                     message.call_acknowledgements()
-            elif topic_matches_subscription(topic, sam_events_topic):
+            elif route_name == "sam_event":
                 handle_sam_event(component, message, topic)
-            elif topic.startswith(agent_response_sub_prefix) or topic.startswith(
-                agent_status_sub_prefix
-            ):
+            elif route_name == "peer_response":
                 await handle_a2a_response(component, message)
             else:
                 log.warning(
@@ -807,7 +811,7 @@ def handle_agent_card_message(component, message: SolaceMessage):
 
         if is_allowed:
             # The received card is stored as-is. We don't need to modify it.
-            component.peer_agents[agent_name] = agent_card
+            component.agent_registry.add_or_update_agent(agent_card)
 
         message.call_acknowledgements()
 
@@ -827,21 +831,9 @@ async def handle_a2a_response(component, message: SolaceMessage):
 
     try:
         topic = message.get_topic()
-        agent_response_sub = a2a.get_agent_response_subscription_topic(
-            component.namespace, component.agent_name
-        )
-        agent_status_sub = a2a.get_agent_status_subscription_topic(
-            component.namespace, component.agent_name
-        )
-
-        if a2a.topic_matches_subscription(topic, agent_response_sub):
-            sub_task_id = a2a.extract_task_id_from_topic(
-                topic, agent_response_sub, component.log_identifier
-            )
-        elif a2a.topic_matches_subscription(topic, agent_status_sub):
-            sub_task_id = a2a.extract_task_id_from_topic(
-                topic, agent_status_sub, component.log_identifier
-            )
+        route = component.topic_dispatcher.match(topic)
+        if route and route.handler == "peer_response":
+            sub_task_id = route.task_id
         else:
             sub_task_id = None
 
@@ -1453,6 +1445,9 @@ def publish_agent_card(component):
         )
         DISPLAY_NAME_EXTENSION_URI = "https://solace.com/a2a/extensions/display-name"
         TOOLS_EXTENSION_URI = "https://solace.com/a2a/extensions/sam/tools"
+        TOOL_STARTUP_EXTENSION_URI = (
+            "https://solace.com/a2a/extensions/sam/tool-startup-timings"
+        )
 
         extensions_list = []
 
@@ -1497,6 +1492,18 @@ def publish_agent_card(component):
             )
             extensions_list.append(tools_extension)
 
+        # Create the extension object for the per-tool startup timings.
+        tool_startup_timings = getattr(component, "tool_startup_timings", None)
+        if isinstance(tool_startup_timings, dict) and tool_startup_timings.get(
+            "tools"
+        ):
+            tool_startup_extension = AgentExtension(
+                uri=TOOL_STARTUP_EXTENSION_URI,
+                description="Time taken to load each configured tool when the agent started.",
+                params=tool_startup_timings,
+            )
+            extensions_list.append(tool_startup_extension)
+
         # Build the capabilities object, including our custom extensions.
         capabilities = AgentCapabilities(
             streaming=supports_streaming,
@@ -77,6 +77,10 @@ class AgentDiscoveryConfig(SamConfigBase):
     enabled: bool = Field(
         default=True, description="Enable discovery and instruction injection."
     )
+    peer_ttl_seconds: Optional[int] = Field(
+        default=None,
+        description="Forget peer agents that have not re-published their card within this many seconds. Disabled if not set.",
+    )
 
 
 class InterAgentCommunicationConfig(SamConfigBase):
@@ -92,6 +96,10 @@ class InterAgentCommunicationConfig(SamConfigBase):
         default=DEFAULT_COMMUNICATION_TIMEOUT,
         description="Timeout for peer requests (seconds).",
     )
+    max_pending_sub_tasks: int = Field(
+        default=10_000,
+        description="Maximum number of peer sub-tasks awaiting a response. Beyond this, the oldest pending sub-task is treated as timed out.",
+    )
 
 
 class AgentInitCleanupConfig(SamConfigBase):
@@ -183,9 +191,23 @@ class ArtifactServiceConfig(SamConfigBase):
         default=None,
         description="Base directory path (required for type 'filesystem').",
     )
+    durability: Literal["fsync", "group_commit"] = Field(
+        default="fsync",
+        description="Write durability for type 'filesystem': 'fsync' flushes each save individually, 'group_commit' batches the flushes of concurrent saves.",
+    )
     bucket_name: Optional[str] = Field(
         default=None, description="GCS bucket name (required for type 'gcs')."
     )
+    multipart_part_size_bytes: Optional[int] = Field(
+        default=None,
+        ge=5 * 1024 * 1024,
+        description="Part size for streamed saves with type 's3' (default 8 MiB). Content of at most one part is saved with a single PutObject.",
+    )
+    multipart_concurrency: Optional[int] = Field(
+        default=None,
+        ge=1,
+        description="Maximum parts of one streamed save uploaded at once with type 's3' (default 4).",
+    )
     artifact_scope: Literal["namespace", "app", "custom"] = Field(
         default="namespace", description="Process-wide scope for all artifact services."
     )
@@ -219,6 +241,33 @@ class SessionServiceConfig(SamConfigBase):
     )
 
 
+class MetricsConfig(SamConfigBase):
+    """Configuration for the runtime metrics of the agent."""
+
+    enabled: bool = Field(
+        default=True,
+        description="Record runtime metrics (event-loop lag, active tasks, queue depths, callback, tool and artifact I/O latency, LLM tokens).",
+    )
+    event_loop_lag_interval_seconds: float = Field(
+        default=0.5,
+        ge=0,
+        description="Interval at which event-loop lag is sampled. 0 disables sampling.",
+    )
+    publish_interval_seconds: float = Field(
+        default=0,
+        ge=0,
+        description="Interval at which a metrics snapshot is published on the SAM events topic '<namespace>/sam/events/metrics/snapshot'. 0 disables publishing.",
+    )
+    prometheus_port: Optional[int] = Field(
+        default=None,
+        description="If set, serves all metrics of this process in the Prometheus text format at http://<prometheus_host>:<port>/metrics. The endpoint is unauthenticated.",
+    )
+    prometheus_host: str = Field(
+        default="127.0.0.1",
+        description="Interface the Prometheus endpoint listens on. Use '0.0.0.0' to allow scraping from other hosts.",
+    )
+
+
 class SamAgentAppConfig(SamConfigBase):
     """Pydantic model for the complete agent application configuration."""
 
@@ -243,6 +292,16 @@ class SamAgentAppConfig(SamConfigBase):
         default_factory=list,
         description="List of tool configurations (python, mcp, built-in). Each tool can have 'required_scopes'.",
     )
+    tool_loading_concurrency: int = Field(
+        default=8,
+        ge=1,
+        description="Maximum number of configured tools (e.g. MCP server connections) loaded concurrently at startup. 1 loads them one at a time.",
+    )
+    tool_load_timeout_seconds: float = Field(
+        default=120.0,
+        gt=0,
+        description="Default maximum time to load a single configured tool at startup, including MCP tool discovery.",
+    )
     supports_streaming: bool = Field(
         default=False,
         description="Whether this host supports A2A streaming (tasks/sendSubscribe).",
@@ -310,6 +369,11 @@ class SamAgentAppConfig(SamConfigBase):
         default=0,
         description="Minimum size in bytes for accumulated text from LLM stream before sending a status update.",
     )
+    stream_batching_max_latency_ms: int = Field(
+        default=50,
+        ge=0,
+        description="Maximum time in milliseconds streamed text is held back while batching before a status update is sent, even if 'stream_batching_threshold_bytes' has not been reached. 0 disables the time limit. Only applies when batching is enabled.",
+    )
     max_message_size_bytes: int = Field(
         default=10_000_000,
         description="Maximum allowed message size in bytes before rejecting publication.",
@@ -374,6 +438,10 @@ class SamAgentAppConfig(SamConfigBase):
         default_factory=McpProcessingConfig,
         description="Configuration for intelligent processing of MCP tool responses.",
     )
+    metrics: MetricsConfig = Field(
+        default_factory=MetricsConfig,
+        description="Runtime metrics collection and publication.",
+    )
 
 
 class SamAgentApp(App):
@@ -2,7 +2,17 @@
 Custom Solace AI Connector Component to Host Google ADK Agents via A2A Protocol.
 """
 
-from typing import Any, Dict, Optional, Union, Callable, List, Tuple, TYPE_CHECKING
+from typing import (
+    Any,
+    Dict,
+    Optional,
+    Union,
+    Callable,
+    List,
+    Mapping,
+    Tuple,
+    TYPE_CHECKING,
+)
 import asyncio
 import functools
 import threading
@@ -62,10 +72,12 @@ from ...agent.adk.setup import (
     initialize_adk_runner,
 )
 from ...agent.protocol.event_handlers import (
+    build_topic_dispatcher,
     process_event,
     publish_agent_card,
 )
 from ...agent.adk.runner import run_adk_async_task_thread_wrapper, TaskCancelledError
+from ...agent.adk.models.lite_llm import append_request_context
 from ...agent.tools.peer_agent_tool import (
     CORRELATION_DATA_PREFIX,
     PeerAgentTool,
@@ -74,6 +86,9 @@ from ...agent.tools.peer_agent_tool import (
 from ...agent.adk.invocation_monitor import InvocationMonitor
 from ...common.middleware.registry import MiddlewareRegistry
 from ...common.constants import DEFAULT_COMMUNICATION_TIMEOUT
+from ...common.utils.bounded_cache import BoundedTTLCache, EVICTION_REASON_CAPACITY
+from ...common.utils.metrics import timed_method
+from ...common.agent_registry import AgentRegistry
 from ...agent.tools.registry import tool_registry
 from ...common.sac.sam_component_base import SamComponentBase
 
@@ -135,9 +150,15 @@ class SamAgentComponent(SamComponentBase):
             self.stream_batching_threshold_bytes = self.get_config(
                 "stream_batching_threshold_bytes", 0
             )
+            self.stream_batching_max_latency_ms = self.get_config(
+                "stream_batching_max_latency_ms", 50
+            )
             self.agent_name = self.get_config("agent_name")
             if not self.agent_name:
                 raise ValueError("Internal Error: Agent name missing after validation.")
+            self.topic_dispatcher = build_topic_dispatcher(
+                self.namespace, self.agent_name
+            )
             self.model_config = self.get_config("model")
             if not self.model_config:
                 raise ValueError(
@@ -235,7 +256,12 @@ class SamAgentComponent(SamComponentBase):
         self.adk_agent: LlmAgent = None
         self.runner: Runner = None
         self.agent_card_tool_manifest: List[Dict[str, Any]] = []
-        self.peer_agents: Dict[str, Any] = {}
+        self.tool_startup_timings: Dict[str, Any] = {}
+        self.agent_registry = AgentRegistry(
+            ttl_seconds=self.agent_discovery_config.get("peer_ttl_seconds")
+        )
+        self._allowed_peers_cache: Tuple[int, List[Tuple[str, AgentCard]]] = (-1, [])
+        self._peer_declarations_cache: Tuple[int, Dict[str, Any]] = (-1, {})
         self._card_publish_timer_id: str = f"publish_card_{self.agent_name}"
         self._async_init_future = None
         self.peer_response_queues: Dict[str, asyncio.Queue] = {}
@@ -243,6 +269,24 @@ class SamAgentComponent(SamComponentBase):
         self.agent_specific_state: Dict[str, Any] = {}
         self.active_tasks: Dict[str, "TaskExecutionContext"] = {}
         self.active_tasks_lock = threading.Lock()
+        self.metrics.active_tasks.set_function(lambda: len(self.active_tasks))
+        # Maps peer sub-task IDs to their parent logical task ID. Entries
+        # expire after the peer request timeout and are turned into
+        # CACHE_EXPIRY events by _on_peer_sub_task_evicted.
+        self.peer_sub_task_cache = BoundedTTLCache(
+            max_entries=self.inter_agent_communication_config.get(
+                "max_pending_sub_tasks", 10_000
+            ),
+            on_evict=self._on_peer_sub_task_evicted,
+            name=f"PeerSubTasks:{self.agent_name}",
+        )
+        self.peer_sub_task_cache.start_sweeper()
+        self.metrics.register_stats(
+            "sam_peer_sub_task_cache",
+            "Pending peer sub-task cache occupancy, hits, misses and evictions.",
+            self.peer_sub_task_cache.get_stats,
+            group_label="namespace",
+        )
         self._tool_cleanup_hooks: List[Callable] = []
         self._agent_system_instruction_string: Optional[str] = None
         self._agent_system_instruction_callback: Optional[
@@ -445,7 +489,7 @@ class SamAgentComponent(SamComponentBase):
             loop = self.get_async_loop()
             is_loop_running = loop.is_running() if loop else False
             if loop and is_loop_running:
-                coro = process_event(self, event)
+                coro = self._process_event_when_ready(event)
                 future = asyncio.run_coroutine_threadsafe(coro, loop)
                 future.add_done_callback(
                     functools.partial(
@@ -495,12 +539,62 @@ class SamAgentComponent(SamComponentBase):
                         nack_e,
                     )
 
+    async def _process_event_when_ready(self, event: Event):
+        """
+        Processes an event once async initialization (tools, ADK agent and
+        runner) has finished. Events can arrive as soon as the broker
+        subscriptions exist, which may be before the runner is built. If
+        initialization failed, messages are NACKed instead.
+        """
+        init_future = self._async_init_future
+        if init_future is not None:
+            if not init_future.done():
+                log.debug(
+                    "%s Waiting for async initialization before processing event: %s",
+                    self.log_identifier,
+                    event.event_type,
+                )
+            try:
+                await asyncio.wrap_future(init_future)
+            except Exception as init_e:
+                log.error(
+                    "%s Cannot process event %s; async initialization failed: %s",
+                    self.log_identifier,
+                    event.event_type,
+                    init_e,
+                )
+                if event.event_type == EventType.MESSAGE:
+                    event.data.call_negative_acknowledgements()
+                return
+        await process_event(self, event)
+
     def handle_timer_event(self, timer_data: Dict[str, Any]):
         """Handles timer events, specifically for agent card publishing."""
         log.debug("%s Received timer event: %s", self.log_identifier, timer_data)
         if timer_data.get("timer_id") == self._card_publish_timer_id:
             publish_agent_card(self)
 
+    def _on_peer_sub_task_evicted(
+        self, namespace: str, sub_task_id: str, logical_task_id: str, reason: str
+    ):
+        """
+        Enqueues a CACHE_EXPIRY event for a peer sub-task whose timeout entry
+        expired, or was evicted because too many sub-tasks are pending, so the
+        parent task is not left waiting forever.
+        """
+        if reason == EVICTION_REASON_CAPACITY:
+            log.warning(
+                "%s Too many pending peer sub-tasks; treating sub-task %s as timed out.",
+                self.log_identifier,
+                sub_task_id,
+            )
+        self.enqueue(
+            Event(
+                EventType.CACHE_EXPIRY,
+                {"key": sub_task_id, "metadata": None, "expired_data": logical_task_id},
+            )
+        )
+
     async def handle_cache_expiry_event(self, cache_data: Dict[str, Any]):
         """
         Handles cache expiry events for peer timeouts by calling the atomic claim helper.
@@ -547,7 +641,7 @@ class SamAgentComponent(SamComponentBase):
         Non-destructively retrieves correlation data for a sub-task.
         Used for intermediate events where the sub-task should remain active.
         """
-        logical_task_id = self.cache_service.get_data(sub_task_id)
+        logical_task_id = self.peer_sub_task_cache.get(sub_task_id)
         if not logical_task_id:
             log.warning(
                 "%s No cache entry for sub-task %s. Cannot get correlation data.",
@@ -587,7 +681,7 @@ class SamAgentComponent(SamComponentBase):
         logical_task_id = logical_task_id_from_event
 
         if not logical_task_id:
-            logical_task_id = self.cache_service.get_data(sub_task_id)
+            logical_task_id = self.peer_sub_task_cache.get(sub_task_id)
             if not logical_task_id:
                 log.warning(
                     "%s No cache entry found. Task has likely timed out and been cleaned up. Cannot claim.",
@@ -604,14 +698,14 @@ class SamAgentComponent(SamComponentBase):
                 log_id,
                 logical_task_id,
             )
-            self.cache_service.remove_data(sub_task_id)
+            self.peer_sub_task_cache.delete(sub_task_id)
             return None
 
         correlation_data = task_context.claim_sub_task_completion(sub_task_id)
 
         if correlation_data:
             # If we successfully claimed the task, remove the timeout tracker from the cache.
-            self.cache_service.remove_data(sub_task_id)
+            self.peer_sub_task_cache.delete(sub_task_id)
             log.info("%s Successfully claimed completion.", log_id)
             return correlation_data
         else:
@@ -811,6 +905,57 @@ class SamAgentComponent(SamComponentBase):
             results_to_inject, correlation_data, task_context
         )
 
+    @property
+    def peer_agents(self) -> Mapping[str, AgentCard]:
+        """Read-only view of the currently discovered peer agents."""
+        return self.agent_registry.snapshot().agents
+
+    def _get_allowed_peers(self) -> List[Tuple[str, AgentCard]]:
+        """
+        Returns the discovered peers that pass the allow/deny lists. The result
+        is cached until the agent registry changes.
+        """
+        snapshot = self.agent_registry.snapshot()
+        cached_version, cached_peers = self._allowed_peers_cache
+        if cached_version == snapshot.version:
+            return cached_peers
+
+        inter_agent_config = self.get_config("inter_agent_communication", {})
+        allow_list = inter_agent_config.get("allow_list", ["*"])
+        deny_list = set(self.get_config("deny_list", []))
+        self_name = self.get_config("agent_name")
+
+        allowed_peers = []
+        for peer_name, agent_card in snapshot.agents.items():
+            if not isinstance(agent_card, AgentCard) or peer_name == self_name:
+                continue
+            if any(fnmatch.fnmatch(peer_name, p) for p in allow_list) and not any(
+                fnmatch.fnmatch(peer_name, p) for p in deny_list
+            ):
+                allowed_peers.append((peer_name, agent_card))
+
+        self._allowed_peers_cache = (snapshot.version, allowed_peers)
+        return allowed_peers
+
+    def get_peer_tool_declaration(
+        self, peer_name: str, build: Callable[[], Any]
+    ) -> Any:
+        """
+        Returns the cached FunctionDeclaration for a peer tool, calling `build`
+        only if the agent registry changed since it was last built.
+        """
+        version = self.agent_registry.version
+        cached_version, declarations = self._peer_declarations_cache
+        if cached_version != version:
+            declarations = {}
+            self._peer_declarations_cache = (version, declarations)
+        declaration = declarations.get(peer_name)
+        if declaration is None:
+            declaration = build()
+            if declaration is not None:
+                declarations[peer_name] = declaration
+        return declaration
+
     def _inject_peer_tools_callback(
         self, callback_context: CallbackContext, llm_request: LlmRequest
     ) -> Optional[LlmResponse]:
@@ -830,45 +975,29 @@ class SamAgentComponent(SamComponentBase):
             else {}
         )
 
-        inter_agent_config = self.get_config("inter_agent_communication", {})
-        allow_list = inter_agent_config.get("allow_list", ["*"])
-        deny_list = set(self.get_config("deny_list", []))
-        self_name = self.get_config("agent_name")
-
         peer_tools_to_add = []
         allowed_peer_descriptions = []
+        config_resolver = MiddlewareRegistry.get_config_resolver()
 
-        for peer_name, agent_card in self.peer_agents.items():
-            if not isinstance(agent_card, AgentCard) or peer_name == self_name:
-                continue
-
-            is_allowed = any(
-                fnmatch.fnmatch(peer_name, p) for p in allow_list
-            ) and not any(fnmatch.fnmatch(peer_name, p) for p in deny_list)
-
-            if is_allowed:
-                config_resolver = MiddlewareRegistry.get_config_resolver()
-                operation_spec = {
-                    "operation_type": "peer_delegation",
-                    "target_agent": peer_name,
-                    "delegation_context": "peer_discovery",
-                }
-                validation_context = {
-                    "discovery_phase": "peer_enumeration",
-                    "agent_context": {"component_type": "peer_discovery"},
-                }
-                validation_result = config_resolver.validate_operation_config(
-                    user_config, operation_spec, validation_context
+        for peer_name, agent_card in self._get_allowed_peers():
+            operation_spec = {
+                "operation_type": "peer_delegation",
+                "target_agent": peer_name,
+                "delegation_context": "peer_discovery",
+            }
+            validation_context = {
+                "discovery_phase": "peer_enumeration",
+                "agent_context": {"component_type": "peer_discovery"},
+            }
+            validation_result = config_resolver.validate_operation_config(
+                user_config, operation_spec, validation_context
+            )
+            if not validation_result.get("valid", True):
+                log.debug(
+                    "%s Peer agent '%s' filtered out by user configuration.",
+                    self.log_identifier,
+                    peer_name,
                 )
-                if not validation_result.get("valid", True):
-                    log.debug(
-                        "%s Peer agent '%s' filtered out by user configuration.",
-                        self.log_identifier,
-                        peer_name,
-                    )
-                    is_allowed = False
-
-            if not is_allowed:
                 continue
 
             try:
@@ -1207,17 +1336,9 @@ class SamAgentComponent(SamComponentBase):
             )
             return None
 
-        if llm_request.config.system_instruction is None:
-            llm_request.config.system_instruction = ""
-
-        combined_new_instructions = "\n\n".join(gateway_instructions_to_add)
-
-        if llm_request.config.system_instruction:
-            llm_request.config.system_instruction += (
-                f"\n\n---\n\n{combined_new_instructions}"
-            )
-        else:
-            llm_request.config.system_instruction = combined_new_instructions
+        # The user profile differs between users, so all of it goes in the
+        # request context after the instructions shared by every call.
+        append_request_context(llm_request, "\n\n".join(gateway_instructions_to_add))
 
         log.info(
             "%s Injected %d gateway instruction block(s) into llm_request.config.system_instruction.",
@@ -1287,11 +1408,12 @@ class SamAgentComponent(SamComponentBase):
             )
 
     async def _publish_agent_status_signal_update(
-        self, status_text: str, a2a_context: Dict
+        self, status_text: str, a2a_context: Dict, skip_buffer_flush: bool = False
     ):
         """
         Constructs and publishes a TaskStatusUpdateEvent specifically for agent_status_message signals.
-        This method will flush the buffer before publishing to maintain proper message ordering.
+        This method will flush the buffer before publishing to maintain proper message ordering,
+        unless `skip_buffer_flush` is set because the buffer is being flushed already.
         """
         logical_task_id = a2a_context.get("logical_task_id", "unknown_task")
         log_identifier_helper = (
@@ -1317,7 +1439,7 @@ class SamAgentComponent(SamComponentBase):
             await self._publish_status_update_with_buffer_flush(
                 status_update_event,
                 a2a_context,
-                skip_buffer_flush=False,
+                skip_buffer_flush=skip_buffer_flush,
             )
 
             log.debug(
@@ -1333,6 +1455,7 @@ class SamAgentComponent(SamComponentBase):
                 e,
             )
 
+    @timed_method("flush_buffer")
     async def _flush_buffer_if_needed(
         self, a2a_context: Dict, reason: str = "status_update"
     ) -> bool:
@@ -1360,56 +1483,58 @@ class SamAgentComponent(SamComponentBase):
             )
             return False
 
-        buffer_content = task_context.get_streaming_buffer_content()
-        if not buffer_content:
-            log.debug(
-                "%s No buffer content to flush (reason: %s).",
+        # Holding the flush lock keeps a latency flush of the same buffer from
+        # publishing after (or interleaved with) the update that follows.
+        async with task_context.streaming_flush_lock:
+            buffer_size = task_context.get_streaming_buffer_size_bytes()
+            if not buffer_size:
+                log.debug(
+                    "%s No buffer content to flush (reason: %s).",
+                    log_identifier,
+                    reason,
+                )
+                return False
+
+            log.info(
+                "%s Flushing buffer content (size: %d bytes, reason: %s).",
                 log_identifier,
+                buffer_size,
                 reason,
             )
-            return False
 
-        buffer_size = len(buffer_content.encode("utf-8"))
-        log.info(
-            "%s Flushing buffer content (size: %d bytes, reason: %s).",
-            log_identifier,
-            buffer_size,
-            reason,
-        )
+            try:
+                resolved_text, unprocessed_tail = await self._flush_and_resolve_buffer(
+                    a2a_context, is_final=False
+                )
 
-        try:
-            resolved_text, unprocessed_tail = await self._flush_and_resolve_buffer(
-                a2a_context, is_final=False
-            )
+                if resolved_text:
+                    await self._publish_text_as_partial_a2a_status_update(
+                        resolved_text,
+                        a2a_context,
+                        is_stream_terminating_content=False,
+                    )
+                    log.debug(
+                        "%s Successfully flushed and published buffer content (resolved: %d bytes).",
+                        log_identifier,
+                        len(resolved_text.encode("utf-8")),
+                    )
+                    return True
+                else:
+                    log.debug(
+                        "%s Buffer flush completed but no resolved text to publish.",
+                        log_identifier,
+                    )
+                    return False
 
-            if resolved_text:
-                await self._publish_text_as_partial_a2a_status_update(
-                    resolved_text,
-                    a2a_context,
-                    is_stream_terminating_content=False,
-                )
-                log.debug(
-                    "%s Successfully flushed and published buffer content (resolved: %d bytes).",
-                    log_identifier,
-                    len(resolved_text.encode("utf-8")),
-                )
-                return True
-            else:
-                log.debug(
-                    "%s Buffer flush completed but no resolved text to publish.",
+            except Exception as e:
+                log.exception(
+                    "%s Error during buffer flush (reason: %s): %s",
                     log_identifier,
+                    reason,
+                    e,
                 )
                 return False
 
-        except Exception as e:
-            log.exception(
-                "%s Error during buffer flush (reason: %s): %s",
-                log_identifier,
-                reason,
-                e,
-            )
-            return False
-
     async def _publish_status_update_with_buffer_flush(
         self,
         status_update_event: TaskStatusUpdateEvent,
@@ -1549,6 +1674,7 @@ class SamAgentComponent(SamComponentBase):
 
         return adk_event
 
+    @timed_method("process_adk_event")
     async def process_and_publish_adk_event(
         self, adk_event: ADKEvent, a2a_context: Dict
     ):
@@ -1611,68 +1737,36 @@ class SamAgentComponent(SamComponentBase):
                         log.debug(
                             "%s Appended text to buffer. New buffer size: %d bytes",
                             log_id_main,
-                            len(
-                                task_context.get_streaming_buffer_content().encode(
-                                    "utf-8"
-                                )
-                            ),
+                            task_context.get_streaming_buffer_size_bytes(),
                         )
 
-            buffer_content = task_context.get_streaming_buffer_content()
-            batching_disabled = self.stream_batching_threshold_bytes <= 0
-            buffer_has_content = bool(buffer_content)
-            threshold_met = (
-                buffer_has_content
-                and not batching_disabled
-                and (
-                    len(buffer_content.encode("utf-8"))
-                    >= self.stream_batching_threshold_bytes
-                )
-            )
-
-            if buffer_has_content and (batching_disabled or threshold_met):
-                log.info(
-                    "%s Partial event triggered buffer flush due to size/batching config.",
-                    log_id_main,
-                )
-                resolved_text, _ = await self._flush_and_resolve_buffer(
-                    a2a_context, is_final=False
-                )
-
-                if resolved_text:
-                    if is_run_based_session:
-                        task_context.append_to_run_based_buffer(resolved_text)
-                        log.debug(
-                            "%s [RUN_BASED] Appended %d bytes to run_based_response_buffer.",
-                            log_id_main,
-                            len(resolved_text.encode("utf-8")),
-                        )
-                    else:
-                        await self._publish_text_as_partial_a2a_status_update(
-                            resolved_text, a2a_context
-                        )
+            if self._get_streaming_flush_reason(task_context):
+                await self._flush_partial_streaming_buffer(task_context, a2a_context)
+            elif task_context.get_streaming_buffer_size_bytes():
+                self._schedule_streaming_buffer_flush(task_context, a2a_context)
         else:
-            buffer_content = task_context.get_streaming_buffer_content()
-            if buffer_content:
-                log.info(
-                    "%s Final event triggered flush of remaining buffer content.",
-                    log_id_main,
-                )
-                resolved_text, _ = await self._flush_and_resolve_buffer(
-                    a2a_context, is_final=True
-                )
-                if resolved_text:
-                    if is_run_based_session:
-                        task_context.append_to_run_based_buffer(resolved_text)
-                        log.debug(
-                            "%s [RUN_BASED] Appended final %d bytes to run_based_response_buffer.",
-                            log_id_main,
-                            len(resolved_text.encode("utf-8")),
-                        )
-                    else:
-                        await self._publish_text_as_partial_a2a_status_update(
-                            resolved_text, a2a_context
-                        )
+            async with task_context.streaming_flush_lock:
+                buffer_content = task_context.get_streaming_buffer_content()
+                if buffer_content:
+                    log.info(
+                        "%s Final event triggered flush of remaining buffer content.",
+                        log_id_main,
+                    )
+                    resolved_text, _ = await self._flush_and_resolve_buffer(
+                        a2a_context, is_final=True, reason="final"
+                    )
+                    if resolved_text:
+                        if is_run_based_session:
+                            task_context.append_to_run_based_buffer(resolved_text)
+                            log.debug(
+                                "%s [RUN_BASED] Appended final %d bytes to run_based_response_buffer.",
+                                log_id_main,
+                                len(resolved_text.encode("utf-8")),
+                            )
+                        else:
+                            await self._publish_text_as_partial_a2a_status_update(
+                                resolved_text, a2a_context
+                            )
 
             # Prepare and publish the final event for observability
             event_to_publish = await self._filter_text_from_final_streaming_event(
@@ -1701,8 +1795,111 @@ class SamAgentComponent(SamComponentBase):
 
             await self._handle_artifact_return_signals(adk_event, a2a_context)
 
+    def _get_streaming_flush_reason(
+        self, task_context: "TaskExecutionContext"
+    ) -> Optional[str]:
+        """
+        Decides whether buffered stream text should be published now.
+
+        Returns:
+            "unbatched" if batching is disabled, "bytes" if the batching
+            threshold is reached, "latency" if the oldest buffered text has
+            waited for `stream_batching_max_latency_ms`, otherwise None.
+        """
+        buffer_size = task_context.get_streaming_buffer_size_bytes()
+        if not buffer_size:
+            return None
+        if self.stream_batching_threshold_bytes <= 0:
+            return "unbatched"
+        if buffer_size >= self.stream_batching_threshold_bytes:
+            return "bytes"
+        if (
+            self.stream_batching_max_latency_ms > 0
+            and task_context.get_streaming_buffer_age_seconds() * 1000
+            >= self.stream_batching_max_latency_ms
+        ):
+            return "latency"
+        return None
+
+    def _schedule_streaming_buffer_flush(
+        self, task_context: "TaskExecutionContext", a2a_context: Dict
+    ) -> None:
+        """
+        Schedules a flush for when the buffered text reaches its maximum
+        latency, so a pause in the LLM stream does not hold text back.
+        """
+        if (
+            self.stream_batching_threshold_bytes <= 0
+            or self.stream_batching_max_latency_ms <= 0
+            or (
+                task_context.streaming_flush_task
+                and not task_context.streaming_flush_task.done()
+            )
+        ):
+            return
+        delay = max(
+            0.0,
+            self.stream_batching_max_latency_ms / 1000
+            - task_context.get_streaming_buffer_age_seconds(),
+        )
+        task_context.streaming_flush_task = asyncio.create_task(
+            self._flush_streaming_buffer_after(delay, task_context, a2a_context)
+        )
+
+    async def _flush_streaming_buffer_after(
+        self, delay: float, task_context: "TaskExecutionContext", a2a_context: Dict
+    ) -> None:
+        """Flushes the streaming buffer after `delay` seconds if it is still due."""
+        await asyncio.sleep(delay)
+        if task_context.is_cancelled():
+            return
+        try:
+            await self._flush_partial_streaming_buffer(task_context, a2a_context)
+        except Exception as e:
+            log.exception(
+                "%s Error flushing streaming buffer for task %s: %s",
+                self.log_identifier,
+                task_context.task_id,
+                e,
+            )
+
+    async def _flush_partial_streaming_buffer(
+        self, task_context: "TaskExecutionContext", a2a_context: Dict
+    ) -> None:
+        """
+        Resolves and publishes the buffered stream text as a partial status
+        update (or appends it to the run-based response buffer), if the flush
+        policy still calls for it once the flush lock is held.
+        """
+        async with task_context.streaming_flush_lock:
+            reason = self._get_streaming_flush_reason(task_context)
+            if reason is None:
+                return
+            log.debug(
+                "%s Flushing streamed text for task %s (reason: %s).",
+                self.log_identifier,
+                task_context.task_id,
+                reason,
+            )
+            resolved_text, _ = await self._flush_and_resolve_buffer(
+                a2a_context, is_final=False, reason=reason
+            )
+            if not resolved_text:
+                return
+            if a2a_context.get("is_run_based_session", False):
+                task_context.append_to_run_based_buffer(resolved_text)
+                log.debug(
+                    "%s [RUN_BASED] Appended %d bytes to run_based_response_buffer.",
+                    self.log_identifier,
+                    len(resolved_text.encode("utf-8")),
+                )
+            else:
+                await self._publish_text_as_partial_a2a_status_update(
+                    resolved_text, a2a_context
+                )
+
     async def _flush_and_resolve_buffer(
-        self, a2a_context: Dict, is_final: bool
+        self, a2a_context: Dict, is_final: bool, reason: str = "status_update"
     ) -> Tuple[str, str]:
         """Flushes buffer, resolves embeds, handles signals, returns (resolved_text, unprocessed_tail)."""
         logical_task_id = a2a_context.get("logical_task_id", "unknown_task")
@@ -1719,6 +1916,9 @@ class SamAgentComponent(SamComponentBase):
             )
             return "", ""
 
+        self.metrics.record_stream_flush(
+            reason, task_context.get_streaming_buffer_chunk_count()
+        )
         text_to_process = task_context.flush_streaming_buffer()
 
         resolved_text, signals_found, unprocessed_tail = (
@@ -1758,8 +1958,9 @@ class SamAgentComponent(SamComponentBase):
                         log_id,
                         status_text,
                     )
+                    # Called while holding the streaming flush lock.
                     await self._publish_agent_status_signal_update(
-                        status_text, a2a_context
+                        status_text, a2a_context, skip_buffer_flush=True
                     )
 
         return resolved_text, unprocessed_tail
@@ -2662,6 +2863,7 @@ class SamAgentComponent(SamComponentBase):
                 with self.active_tasks_lock:
                     removed_task_context = self.active_tasks.pop(logical_task_id, None)
                     if removed_task_context:
+                        removed_task_context.cancel_streaming_flush()
                         log.debug(
                             "%s Removed TaskExecutionContext for task %s.",
                             log_id,
@@ -2860,21 +3062,33 @@ class SamAgentComponent(SamComponentBase):
 
             log.info("%s Populating agent card tool manifest...", self.log_identifier)
             tool_manifest = []
+            mcp_toolsets = [
+                tool for tool in loaded_tools if isinstance(tool, MCPToolset)
+            ]
+            log.debug(
+                "%s Retrieving tools from %d MCPToolset(s) for Agent %s...",
+                self.log_identifier,
+                len(mcp_toolsets),
+                self.agent_name,
+            )
+            mcp_tool_lists = dict(
+                zip(
+                    map(id, mcp_toolsets),
+                    await asyncio.gather(
+                        *(toolset.get_tools() for toolset in mcp_toolsets),
+                        return_exceptions=True,
+                    ),
+                )
+            )
             for tool in loaded_tools:
                 if isinstance(tool, MCPToolset):
-                    try:
-                        log.debug(
-                            "%s Retrieving tools from MCPToolset for Agent %s...",
-                            self.log_identifier,
-                            self.agent_name,
-                        )
-                        mcp_tools = await tool.get_tools()
-                    except Exception as e:
+                    mcp_tools = mcp_tool_lists[id(tool)]
+                    if isinstance(mcp_tools, Exception):
                         log.error(
                             "%s Error retrieving tools from MCPToolset for Agent Card %s: %s",
                             self.log_identifier,
                             self.agent_name,
-                            e,
+                            mcp_tools,
                         )
                         continue
                     for mcp_tool in mcp_tools:
@@ -2948,6 +3162,7 @@ class SamAgentComponent(SamComponentBase):
         """Clean up resources on component shutdown."""
         log.info("%s Cleaning up A2A ADK Host Component.", self.log_identifier)
         self.cancel_timer(self._card_publish_timer_id)
+        self.peer_sub_task_cache.stop_sweeper()
 
         cleanup_func_details = self.get_config("agent_cleanup_function")
 
@@ -3119,6 +3334,7 @@ class SamAgentComponent(SamComponentBase):
         """
         return self.agent_name
 
+    @timed_method("resolve_embeds")
     async def _resolve_early_embeds_and_handle_signals(
         self, raw_text: str, a2a_context: Dict
     ) -> Tuple[str, List[Tuple[int, Any]], str]:
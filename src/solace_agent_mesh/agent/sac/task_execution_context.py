@@ -4,6 +4,7 @@ Encapsulates the runtime state for a single, in-flight agent task.
 
 import asyncio
 import threading
+import time
 from typing import Any, Dict, List, Optional
 
 
@@ -25,7 +26,15 @@ class TaskExecutionContext:
         self.task_id: str = task_id
         self.a2a_context: Dict[str, Any] = a2a_context
         self.cancellation_event: asyncio.Event = asyncio.Event()
-        self.streaming_buffer: str = ""
+        # Streamed text is kept as a list of chunks with a running UTF-8 size,
+        # so appending and checking the batching threshold stay O(chunk).
+        self._streaming_chunks: List[str] = []
+        self._streaming_buffer_bytes: int = 0
+        self._streaming_chunk_count: int = 0
+        self._streaming_buffer_started_at: Optional[float] = None
+        # Serializes flushes of streamed text so partial updates stay in order.
+        self.streaming_flush_lock: asyncio.Lock = asyncio.Lock()
+        self.streaming_flush_task: Optional[asyncio.Task] = None
         self.run_based_response_buffer: str = ""
         self.active_peer_sub_tasks: Dict[str, Dict[str, Any]] = {}
         self.parallel_tool_calls: Dict[str, Dict[str, Any]] = {}
@@ -42,22 +51,61 @@ class TaskExecutionContext:
         """Checks if the cancellation event has been set."""
         return self.cancellation_event.is_set()
 
+    def cancel_streaming_flush(self) -> None:
+        """Cancels the pending latency flush of streamed text, if any."""
+        flush_task, self.streaming_flush_task = self.streaming_flush_task, None
+        if flush_task is not None and not flush_task.done():
+            flush_task.cancel()
+
+    @property
+    def streaming_buffer(self) -> str:
+        """The current streaming buffer content."""
+        return self.get_streaming_buffer_content()
+
     def append_to_streaming_buffer(self, text: str) -> None:
         """Appends a chunk of text to the main streaming buffer."""
+        if not text:
+            return
         with self.lock:
-            self.streaming_buffer += text
+            if not self._streaming_chunks:
+                self._streaming_buffer_started_at = time.monotonic()
+            self._streaming_chunks.append(text)
+            self._streaming_buffer_bytes += len(text.encode("utf-8"))
+            self._streaming_chunk_count += 1
 
     def flush_streaming_buffer(self) -> str:
         """Returns the entire content of the streaming buffer and clears it."""
         with self.lock:
-            content = self.streaming_buffer
-            self.streaming_buffer = ""
+            content = "".join(self._streaming_chunks)
+            self._streaming_chunks = []
+            self._streaming_buffer_bytes = 0
+            self._streaming_chunk_count = 0
+            self._streaming_buffer_started_at = None
             return content
 
     def get_streaming_buffer_content(self) -> str:
         """Returns the current buffer content without clearing it."""
         with self.lock:
-            return self.streaming_buffer
+            if len(self._streaming_chunks) > 1:
+                self._streaming_chunks = ["".join(self._streaming_chunks)]
+            return self._streaming_chunks[0] if self._streaming_chunks else ""
+
+    def get_streaming_buffer_size_bytes(self) -> int:
+        """Returns the UTF-8 size of the buffered text."""
+        with self.lock:
+            return self._streaming_buffer_bytes
+
+    def get_streaming_buffer_chunk_count(self) -> int:
+        """Returns how many chunks were appended since the buffer was last flushed."""
+        with self.lock:
+            return self._streaming_chunk_count
+
+    def get_streaming_buffer_age_seconds(self) -> float:
+        """Returns how long the oldest buffered text has been waiting, or 0 if empty."""
+        with self.lock:
+            if self._streaming_buffer_started_at is None:
+                return 0.0
+            return time.monotonic() - self._streaming_buffer_started_at
 
     def append_to_run_based_buffer(self, text: str) -> None:
         """Appends a chunk of processed text to the run-based response buffer."""
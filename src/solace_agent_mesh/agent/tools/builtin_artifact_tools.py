@@ -27,6 +27,7 @@ from ...agent.utils.artifact_helpers import (
     METADATA_SUFFIX,
     DEFAULT_SCHEMA_MAX_KEYS,
 )
+from ...agent.adk.artifacts.listing import list_artifacts_with_metadata
 from ...common.utils.embeds import (
     evaluate_embed,
     EMBED_REGEX,
@@ -209,138 +210,61 @@ async def list_artifacts(tool_context: ToolContext = None) -> Dict[str, Any]:
         app_name = tool_context._invocation_context.app_name
         user_id = tool_context._invocation_context.user_id
         session_id = get_original_session_id(tool_context._invocation_context)
-        list_keys_method = getattr(artifact_service, "list_artifact_keys")
-        all_keys = await list_keys_method(
-            app_name=app_name, user_id=user_id, session_id=session_id
+        listings = await list_artifacts_with_metadata(
+            artifact_service,
+            app_name=app_name,
+            user_id=user_id,
+            session_id=session_id,
         )
         response_files = []
-        processed_data_files = set()
-        for key in all_keys:
-            if key.endswith(METADATA_SUFFIX):
-                continue  # Skip metadata files initially
-
-            if key in processed_data_files:
-                continue  # Already processed this data file
-
-            filename = key
-            metadata_summary = None
-            versions = []
-            try:
-                versions = await artifact_service.list_versions(
-                    app_name=app_name,
-                    user_id=user_id,
-                    session_id=session_id,
-                    filename=filename,
+        for listing in listings:
+            filename = listing.filename
+            metadata_filename = f"{filename}{METADATA_SUFFIX}"
+            if not listing.has_metadata_file:
+                log.debug(
+                    "%s No companion metadata file found for '%s'.",
+                    log_identifier,
+                    filename,
                 )
-                if not versions:
-                    log.warning(
-                        "%s Found artifact key '%s' but no versions listed. Skipping.",
-                        log_identifier,
-                        filename,
-                    )
-                    continue
-                latest_version = max(versions)
-                metadata_filename = f"{filename}{METADATA_SUFFIX}"
-                if metadata_filename in all_keys:
-                    try:
-                        metadata_part = await artifact_service.load_artifact(
-                            app_name=app_name,
-                            user_id=user_id,
-                            session_id=session_id,
-                            filename=metadata_filename,
-                            version=latest_version,
-                        )
-                        if metadata_part and metadata_part.inline_data:
-                            try:
-                                metadata_dict = json.loads(
-                                    metadata_part.inline_data.data.decode("utf-8")
-                                )
-                                schema = metadata_dict.get("schema", {})
-                                metadata_summary = {
-                                    "description": metadata_dict.get("description"),
-                                    "source": metadata_dict.get("source"),
-                                    "type": metadata_dict.get("mime_type"),
-                                    "size": metadata_dict.get("size_bytes"),
-                                    "schema_type": schema.get(
-                                        "type", metadata_dict.get("mime_type")
-                                    ),
-                                    "schema_inferred": schema.get("inferred"),
-                                }
-                                metadata_summary = {
-                                    k: v
-                                    for k, v in metadata_summary.items()
-                                    if v is not None
-                                }
-                                log.debug(
-                                    "%s Loaded metadata summary for '%s' v%d.",
-                                    log_identifier,
-                                    filename,
-                                    latest_version,
-                                )
-                            except json.JSONDecodeError as json_err:
-                                log.warning(
-                                    "%s Failed to parse metadata JSON for '%s' v%d: %s",
-                                    log_identifier,
-                                    metadata_filename,
-                                    latest_version,
-                                    json_err,
-                                )
-                                metadata_summary = {"error": "Failed to parse metadata"}
-                            except Exception as fmt_err:
-                                log.warning(
-                                    "%s Failed to format metadata summary for '%s' v%d: %s",
-                                    log_identifier,
-                                    metadata_filename,
-                                    latest_version,
-                                    fmt_err,
-                                )
-                                metadata_summary = {
-                                    "error": "Failed to format metadata"
-                                }
-                        else:
-                            log.warning(
-                                "%s Metadata file '%s' v%d found but empty or unreadable.",
-                                log_identifier,
-                                metadata_filename,
-                                latest_version,
-                            )
-                            metadata_summary = {
-                                "error": "Metadata file empty or unreadable"
-                            }
-                    except Exception as load_err:
-                        log.warning(
-                            "%s Failed to load metadata file '%s' v%d: %s",
-                            log_identifier,
-                            metadata_filename,
-                            latest_version,
-                            load_err,
-                        )
-                        metadata_summary = {
-                            "error": f"Failed to load metadata: {load_err}"
-                        }
-                else:
-                    log.debug(
-                        "%s No companion metadata file found for '%s'.",
-                        log_identifier,
-                        filename,
-                    )
-                    metadata_summary = {"info": "No metadata file found"}
-            except Exception as version_err:
+                metadata_summary = {"info": "No metadata file found"}
+            elif listing.metadata_error:
                 log.warning(
-                    "%s Failed to list versions or process metadata for file '%s': %s. Skipping file.",
+                    "%s Failed to load metadata file '%s' v%d: %s",
                     log_identifier,
-                    filename,
-                    version_err,
+                    metadata_filename,
+                    listing.latest_version,
+                    listing.metadata_error,
+                )
+                metadata_summary = {"error": listing.metadata_error}
+            elif not isinstance(listing.metadata, dict):
+                log.warning(
+                    "%s Metadata file '%s' v%d found but empty or unreadable.",
+                    log_identifier,
+                    metadata_filename,
+                    listing.latest_version,
                 )
-                continue
+                metadata_summary = {"error": "Metadata file empty or unreadable"}
+            else:
+                metadata_dict = listing.metadata
+                schema = metadata_dict.get("schema", {})
+                metadata_summary = {
+                    "description": metadata_dict.get("description"),
+                    "source": metadata_dict.get("source"),
+                    "type": metadata_dict.get("mime_type"),
+                    "size": metadata_dict.get("size_bytes"),
+                    "schema_type": schema.get("type", metadata_dict.get("mime_type")),
+                    "schema_inferred": schema.get("inferred"),
+                }
+                metadata_summary = {
+                    k: v for k, v in metadata_summary.items() if v is not None
+                }
             response_files.append(
                 {
                     "filename": filename,
-                    "versions": versions,
+                    "versions": listing.versions,
                     "metadata_summary": metadata_summary,
                 }
             )
-            processed_data_files.add(filename)
         log.info(
             "%s Found %d data artifacts for session %s.",
             log_identifier,
@@ -2,6 +2,7 @@
 Built-in ADK Tools for Data Analysis (SQL, JQ, Plotly).
 """
 
+import importlib.util
 import json
 from typing import Any, Dict, Tuple, Optional, Literal
 from datetime import datetime, timezone
@@ -13,22 +14,6 @@ try:
 except ImportError:
     PYYAML_AVAILABLE = False
 
-try:
-    import plotly.io as pio
-    import plotly.graph_objects as go
-
-    PLOTLY_AVAILABLE = True
-    try:
-        import kaleido
-
-        KALEIDO_AVAILABLE = True
-    except ImportError:
-        KALEIDO_AVAILABLE = False
-except ImportError:
-    PLOTLY_AVAILABLE = False
-    KALEIDO_AVAILABLE = False
-
-
 from google.adk.tools import ToolContext
 from google.genai import types as adk_types
 from solace_ai_connector.common.log import log
@@ -40,29 +25,108 @@ from ...agent.utils.artifact_helpers import (
 )
 
 from ...agent.utils.context_helpers import get_original_session_id
+from ...common.utils.bounded_cache import BoundedTTLCache
+from ...common.utils.chart_rendering import (
+    ChartRenderBusyError,
+    acquire_chart_renderer,
+    figure_content_hash,
+    get_chart_renderer,
+    release_chart_renderer,
+)
 
 from .tool_definition import BuiltinTool
 from .registry import tool_registry
 
+# Charts are rendered in worker processes (see `ChartRenderer`), so plotly and
+# kaleido are only checked for here, not imported.
+PLOTLY_AVAILABLE = importlib.util.find_spec("plotly") is not None
+KALEIDO_AVAILABLE = PLOTLY_AVAILABLE and importlib.util.find_spec("kaleido") is not None
+
 CATEGORY_NAME = "Data Analysis"
 CATEGORY_DESCRIPTION = "Create static chart images from data in JSON or YAML format."
 
+# (app_name, user_id, session_id, content hash) -> (filename, version) of the
+# chart artifact already rendered from an identical figure config.
+_rendered_chart_cache = BoundedTTLCache(max_entries=1024, name="RenderedChartCache")
+
+
+def _renderer_config(tool_config: Optional[Dict[str, Any]]) -> Optional[Dict[str, Any]]:
+    """
+    Initializers and cleanups get the tool group's config; the tool itself is
+    given its entry under its own name, so the renderer is configured from that
+    entry.
+    """
+    return (tool_config or {}).get("create_chart_from_plotly_config")
+
+
+def _start_chart_renderer(component: Any, tool_config: Dict[str, Any]) -> None:
+    """
+    Tool initializer: registers the agent with the chart renderer for its
+    settings. The worker processes start on the first render, so they do not
+    compete with agent startup.
+    """
+    if not (PLOTLY_AVAILABLE and KALEIDO_AVAILABLE):
+        return
+    acquire_chart_renderer(_renderer_config(tool_config))
+
+
+def _stop_chart_renderer(component: Any, tool_config: Dict[str, Any]) -> None:
+    """
+    Tool cleanup: releases the agent's chart renderer, stopping its workers
+    once no other agent in the process uses it.
+    """
+    if not (PLOTLY_AVAILABLE and KALEIDO_AVAILABLE):
+        return
+    release_chart_renderer(_renderer_config(tool_config))
+
+
+async def _find_rendered_chart(
+    artifact_service, app_name: str, user_id: str, session_id: str, cache_key
+) -> Optional[Tuple[str, int]]:
+    """Returns the cached (filename, version) if that artifact version still exists."""
+    cached = _rendered_chart_cache.get(cache_key)
+    if cached is None:
+        return None
+    filename, version = cached
+    try:
+        versions = await artifact_service.list_versions(
+            app_name=app_name,
+            user_id=user_id,
+            session_id=session_id,
+            filename=filename,
+        )
+    except Exception:
+        versions = []
+    if version in versions:
+        return cached
+    _rendered_chart_cache.delete(cache_key)
+    return None
+
+
 async def create_chart_from_plotly_config(
     config_content: str,
     config_format: Literal["json", "yaml"],
     output_filename: str,
     output_format: Optional[str] = "png",
     tool_context: ToolContext = None,
+    tool_config: Optional[Dict[str, Any]] = None,
 ) -> Dict[str, Any]:
     """
     Generates a static chart image from a Plotly configuration provided as a string.
 
+    Rendering runs in a pool of warm worker processes (see `ChartRenderer`), so
+    it does not block the agent's event loop. If an identical figure config was
+    already rendered to the same format in this session, the existing image
+    artifact is returned instead of rendering it again.
+
     Args:
         config_content: The Plotly configuration (JSON or YAML) as a string.
         config_format: The format of the config_content ('json' or 'yaml').
         output_filename: The desired filename for the output image artifact.
         output_format: The desired image format ('png', 'jpg', 'svg', 'pdf', etc.). Default 'png'.
         tool_context: The context provided by the ADK framework.
+        tool_config: Optional settings for the rendering pool: `render_workers`,
+            `render_queue_limit` and `render_timeout_seconds`.
 
     Returns:
         A dictionary with status and output artifact details.
@@ -80,6 +144,7 @@ async def create_chart_from_plotly_config(
             "message": "The kaleido library is required for chart generation but it is not installed.",
         }
 
+    output_format = output_format or "png"
     log_identifier = f"[DataTool:create_chart:{output_filename}]"
     log.info(
         "%s Processing request to create chart '%s' from %s config.",
@@ -111,25 +176,6 @@ async def create_chart_from_plotly_config(
                 f"Invalid config_format: {config_format}. Expected 'json' or 'yaml'."
             )
 
-        try:
-            fig = go.Figure(plotly_config_dict)
-        except Exception as fig_err:
-            raise ValueError(
-                f"Failed to create Plotly figure from config: {fig_err}"
-            ) from fig_err
-
-        try:
-            image_bytes = pio.to_image(fig, format=output_format, engine="kaleido")
-            log.info(
-                "%s Successfully generated %s image bytes using Kaleido.",
-                log_identifier,
-                output_format,
-            )
-        except Exception as img_err:
-            raise ValueError(
-                f"Failed to generate {output_format} image using Plotly/Kaleido: {img_err}. Ensure 'kaleido' package is installed and functional."
-            ) from img_err
-
         mime_map = {
             "png": "image/png",
             "jpg": "image/jpeg",
@@ -145,6 +191,51 @@ async def create_chart_from_plotly_config(
         artifact_service = inv_context.artifact_service
         if not artifact_service:
             raise ValueError("ArtifactService is not available in the context.")
+        session_id = get_original_session_id(inv_context)
+
+        cache_key = (
+            inv_context.app_name,
+            inv_context.user_id,
+            session_id,
+            figure_content_hash(plotly_config_dict, output_format),
+        )
+        existing = await _find_rendered_chart(
+            artifact_service,
+            inv_context.app_name,
+            inv_context.user_id,
+            session_id,
+            cache_key,
+        )
+        if existing:
+            existing_filename, existing_version = existing
+            log.info(
+                "%s Identical chart already rendered as '%s' v%d; reusing it.",
+                log_identifier,
+                existing_filename,
+                existing_version,
+            )
+            return {
+                "status": "success",
+                "message": f"An identical chart was already created as '{existing_filename}' v{existing_version}; returning the existing image instead of rendering it again.",
+                "output_filename": existing_filename,
+                "output_version": existing_version,
+            }
+
+        try:
+            image_bytes = await get_chart_renderer(tool_config).render(
+                plotly_config_dict, output_format
+            )
+            log.info(
+                "%s Successfully generated %s image bytes using Kaleido.",
+                log_identifier,
+                output_format,
+            )
+        except (ValueError, ChartRenderBusyError, TimeoutError):
+            raise
+        except Exception as img_err:
+            raise ValueError(
+                f"Failed to generate {output_format} image using Plotly/Kaleido: {img_err}. Ensure 'kaleido' package is installed and functional."
+            ) from img_err
         host_component = getattr(inv_context.agent, "host_component", None)
         schema_max_keys = (
             host_component.get_config("schema_max_keys", DEFAULT_SCHEMA_MAX_KEYS)
@@ -162,7 +253,7 @@ async def create_chart_from_plotly_config(
             artifact_service=artifact_service,
             app_name=inv_context.app_name,
             user_id=inv_context.user_id,
-            session_id=get_original_session_id(inv_context),
+            session_id=session_id,
             filename=final_output_filename,
             content_bytes=image_bytes,
             mime_type=output_mime_type,
@@ -176,6 +267,9 @@ async def create_chart_from_plotly_config(
             raise IOError(
                 f"Failed to save chart image artifact: {save_result.get('message', 'Unknown error')}"
             )
+        _rendered_chart_cache.set(
+            cache_key, (final_output_filename, save_result["data_version"])
+        )
         log.info(
             "%s Successfully created chart artifact '%s' v%d.",
             log_identifier,
@@ -192,6 +286,9 @@ async def create_chart_from_plotly_config(
     except ValueError as e:
         log.warning("%s Value error: %s", log_identifier, e)
         return {"status": "error", "message": str(e)}
+    except (ChartRenderBusyError, TimeoutError) as e:
+        log.warning("%s Chart rendering unavailable: %s", log_identifier, e)
+        return {"status": "error", "message": str(e)}
     except ImportError as e:
         log.warning("%s Missing library error: %s", log_identifier, e)
         return {"status": "error", "message": str(e)}
@@ -212,6 +309,8 @@ create_chart_from_plotly_config_tool_def = BuiltinTool(
     category_name=CATEGORY_NAME,
     category_description=CATEGORY_DESCRIPTION,
     required_scopes=["tool:data:chart"],
+    initializer=_start_chart_renderer,
+    cleanup_function=_stop_chart_renderer,
     parameters=adk_types.Schema(
         type=adk_types.Type.OBJECT,
         properties={
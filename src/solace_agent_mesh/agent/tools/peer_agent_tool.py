@@ -91,7 +91,12 @@ class PeerAgentTool(BaseTool):
             agent_card.description
             or f"Interact with the {self.target_agent_name} agent."
         )
+        return self.host_component.get_peer_tool_declaration(
+            self.target_agent_name, self._build_declaration
+        )
 
+    def _build_declaration(self) -> adk_types.FunctionDeclaration:
+        """Builds the FunctionDeclaration for this peer from scratch."""
         parameters_schema = adk_types.Schema(
             type=adk_types.Type.OBJECT,
             properties={
@@ -255,11 +260,8 @@ class PeerAgentTool(BaseTool):
             task_context_obj.register_peer_sub_task(sub_task_id, correlation_data)
 
             # Add a simple mapping to the cache for timeout tracking.
-            self.host_component.cache_service.add_data(
-                key=sub_task_id,
-                value=main_logical_task_id,
-                expiry=timeout_sec,
-                component=self.host_component,
+            self.host_component.peer_sub_task_cache.set(
+                sub_task_id, main_logical_task_id, ttl=timeout_sec
             )
 
             try:
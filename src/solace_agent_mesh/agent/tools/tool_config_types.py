@@ -11,6 +11,11 @@ class BaseToolConfig(SamConfigBase):
 
     required_scopes: List[str] = Field(default_factory=list)
     tool_config: Dict[str, Any] = Field(default_factory=dict)
+    load_timeout_seconds: Optional[float] = Field(
+        default=None,
+        gt=0,
+        description="Maximum time to load this tool at startup. Defaults to the agent's 'tool_load_timeout_seconds'.",
+    )
 
 
 class BuiltinToolConfig(BaseToolConfig):
@@ -44,6 +44,10 @@ class BuiltinTool(BaseModel):
         default=None,
         description="An optional function to initialize the tool or its dependencies.",
     )
+    cleanup_function: Optional[Callable[[Any, Dict[str, Any]], None]] = Field(
+        default=None,
+        description="An optional function, run when the agent shuts down, to release what the tool or its initializer started.",
+    )
     raw_string_args: List[str] = Field(
         default_factory=list,
         description="A list of argument names that should be passed as raw strings without embed pre-resolution.",
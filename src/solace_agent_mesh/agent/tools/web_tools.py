@@ -4,6 +4,7 @@ Collection of Python tools for web-related tasks, such as making HTTP requests.
 
 import json
 import uuid
+from contextlib import AsyncExitStack
 from datetime import datetime, timezone
 from typing import Any, Dict, Optional
 import ipaddress
@@ -18,6 +19,7 @@ from google.adk.tools import ToolContext
 from solace_ai_connector.common.log import log
 
 from ...agent.utils.artifact_helpers import (
+    save_artifact_stream_with_metadata,
     save_artifact_with_metadata,
     DEFAULT_SCHEMA_MAX_KEYS,
 )
@@ -30,6 +32,18 @@ from .registry import tool_registry
 
 CATEGORY_NAME = "Web Access"
 CATEGORY_DESCRIPTION = "Access the web to find information to complete user requests."
+TEXT_APPLICATION_CONTENT_TYPES = (
+    "application/json",
+    "application/xml",
+    "application/javascript",
+)
+
+
+def _is_text_content_type(content_type: str) -> bool:
+    return (
+        content_type.startswith("text/")
+        or content_type in TEXT_APPLICATION_CONTENT_TYPES
+    )
 
 def _is_safe_url(url: str) -> bool:
     """
@@ -103,6 +117,7 @@ async def web_request(
             "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/135.0.0.0 Safari/537.36"
         )
 
+    exit_stack = AsyncExitStack()
     try:
         inv_context = tool_context._invocation_context
         if not inv_context:
@@ -134,21 +149,24 @@ async def web_request(
         if body:
             request_body_bytes = body.encode("utf-8")
 
-        async with httpx.AsyncClient(timeout=30.0) as client:
-            log.debug(
-                f"{log_identifier} Making {method} request to {url} with headers: {headers}"
-            )
-            response = await client.request(
+        client = await exit_stack.enter_async_context(
+            httpx.AsyncClient(timeout=30.0)
+        )
+        log.debug(
+            f"{log_identifier} Making {method} request to {url} with headers: {headers}"
+        )
+        response = await exit_stack.enter_async_context(
+            client.stream(
                 method=method.upper(),
                 url=url,
                 headers=headers,
                 content=request_body_bytes,
             )
-            log.debug(
-                f"{log_identifier} Received response with status code: {response.status_code}"
-            )
+        )
+        log.debug(
+            f"{log_identifier} Received response with status code: {response.status_code}"
+        )
 
-        response_content_bytes = response.content
         response_headers = dict(response.headers)
         response_status_code = response.status_code
         original_content_type = (
@@ -156,6 +174,14 @@ async def web_request(
             .split(";")[0]
             .strip()
         )
+        # Binary content (PDFs, images, archives) is saved as it downloads
+        # instead of being held in memory; text is read to be converted and
+        # previewed.
+        stream_to_artifact = (
+            response_status_code < 400
+            and not _is_text_content_type(original_content_type)
+        )
+        response_content_bytes = b"" if stream_to_artifact else await response.aread()
 
         final_content_to_save_str = ""
         final_content_to_save_bytes = response_content_bytes
@@ -173,11 +199,7 @@ async def web_request(
                 final_content_to_save_bytes = final_content_to_save_str.encode("utf-8")
                 processed_content_type = "text/markdown"
                 log.debug(f"{log_identifier} Converted HTML to Markdown.")
-            elif original_content_type.startswith("text/") or original_content_type in [
-                "application/json",
-                "application/xml",
-                "application/javascript",
-            ]:
+            elif _is_text_content_type(original_content_type):
                 try:
                     final_content_to_save_str = response_content_bytes.decode("utf-8")
                     log.debug(
@@ -192,11 +214,7 @@ async def web_request(
             log.warning(
                 f"{log_identifier} HTTP request returned status {response_status_code}. Saving raw response content."
             )
-            if original_content_type.startswith("text/") or original_content_type in [
-                "application/json",
-                "application/xml",
-                "application/javascript",
-            ]:
+            if _is_text_content_type(original_content_type):
                 try:
                     final_content_to_save_str = response_content_bytes.decode(
                         "utf-8", errors="replace"
@@ -246,19 +264,34 @@ async def web_request(
         log.info(
             f"{log_identifier} Saving artifact '{final_artifact_filename}' with mime_type '{processed_content_type}'."
         )
-        save_result = await save_artifact_with_metadata(
-            artifact_service=artifact_service,
-            app_name=app_name,
-            user_id=user_id,
-            session_id=session_id,
-            filename=final_artifact_filename,
-            content_bytes=final_content_to_save_bytes,
-            mime_type=processed_content_type,
-            metadata_dict=metadata_dict,
-            timestamp=datetime.now(timezone.utc),
-            schema_max_keys=DEFAULT_SCHEMA_MAX_KEYS,
-            tool_context=tool_context,
-        )
+        if stream_to_artifact:
+            save_result = await save_artifact_stream_with_metadata(
+                artifact_service=artifact_service,
+                app_name=app_name,
+                user_id=user_id,
+                session_id=session_id,
+                filename=final_artifact_filename,
+                chunks=response.aiter_bytes(),
+                mime_type=processed_content_type,
+                metadata_dict=metadata_dict,
+                timestamp=datetime.now(timezone.utc),
+                schema_max_keys=DEFAULT_SCHEMA_MAX_KEYS,
+                tool_context=tool_context,
+            )
+        else:
+            save_result = await save_artifact_with_metadata(
+                artifact_service=artifact_service,
+                app_name=app_name,
+                user_id=user_id,
+                session_id=session_id,
+                filename=final_artifact_filename,
+                content_bytes=final_content_to_save_bytes,
+                mime_type=processed_content_type,
+                metadata_dict=metadata_dict,
+                timestamp=datetime.now(timezone.utc),
+                schema_max_keys=DEFAULT_SCHEMA_MAX_KEYS,
+                tool_context=tool_context,
+            )
 
         if save_result.get("status") == "error":
             raise IOError(
@@ -341,6 +374,8 @@ async def web_request(
     except Exception as e:
         log.exception(f"{log_identifier} Unexpected error in web_request: {e}")
         return {"status": "error", "message": f"An unexpected error occurred: {e}"}
+    finally:
+        await exit_stack.aclose()
 
 
 web_request_tool_def = BuiltinTool(
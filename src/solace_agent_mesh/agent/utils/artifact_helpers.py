@@ -9,25 +9,45 @@ import csv
 import io
 import inspect
 import os
+import time
 import yaml
-import traceback
 from datetime import datetime, timezone
-from typing import Any, Dict, Optional, Tuple, List, Union, TYPE_CHECKING
+from typing import (
+    Any,
+    AsyncIterable,
+    Dict,
+    Optional,
+    Tuple,
+    List,
+    Union,
+    TYPE_CHECKING,
+)
 from urllib.parse import urlparse, parse_qs, urlunparse, urlencode
 from google.adk.artifacts import BaseArtifactService
 from google.genai import types as adk_types
 from solace_ai_connector.common.log import log
 from ...common.a2a.types import ArtifactInfo
+from ...common.utils.metrics import record_artifact_io
 from ...common.utils.mime_helpers import is_text_based_mime_type, is_text_based_file
 from ...common.constants import TEXT_ARTIFACT_CONTEXT_MAX_LENGTH_CAPACITY, TEXT_ARTIFACT_CONTEXT_DEFAULT_LENGTH
 from ...agent.utils.context_helpers import get_original_session_id
+from ...agent.adk.artifacts.listing import (
+    METADATA_SUFFIX,
+    list_artifacts_with_metadata,
+)
+from ...agent.adk.artifacts.streaming import (
+    ArtifactTooLargeError,
+    save_artifact_stream,
+)
 
 if TYPE_CHECKING:
     from google.adk.tools import ToolContext
     from ...agent.sac.component import SamAgentComponent
 
-METADATA_SUFFIX = ".metadata.json"
 DEFAULT_SCHEMA_MAX_KEYS = 20
+# Streamed artifacts larger than this are saved without an inferred schema
+# (except CSV, whose header is read from the first bytes).
+SCHEMA_INFERENCE_MAX_BYTES = 1024 * 1024
 
 
 def is_filename_safe(filename: str) -> bool:
@@ -214,6 +234,126 @@ def _infer_schema(
     return schema_info
 
 
+async def _save_data_artifact_metadata(
+    artifact_service: BaseArtifactService,
+    app_name: str,
+    user_id: str,
+    session_id: str,
+    filename: str,
+    data_version: int,
+    mime_type: str,
+    size_bytes: int,
+    schema_content: Optional[bytes],
+    metadata_dict: Dict[str, Any],
+    timestamp: datetime,
+    explicit_schema: Optional[Dict],
+    schema_inference_depth: int,
+    schema_max_keys: int,
+    tool_context: Optional["ToolContext"],
+    log_identifier: str,
+) -> Tuple[Optional[int], str, str]:
+    """
+    Records a saved data artifact version for ADK callbacks and saves its
+    metadata artifact, inferring the schema from `schema_content` if given.
+
+    Returns:
+        The metadata version (None if it could not be saved), status and message.
+    """
+    metadata_filename = f"{filename}{METADATA_SUFFIX}"
+    metadata_version = None
+
+    # Populate artifact_delta for ADK callbacks if tool_context is provided
+    if (
+        tool_context
+        and hasattr(tool_context, "actions")
+        and hasattr(tool_context.actions, "artifact_delta")
+    ):
+        tool_context.actions.artifact_delta[filename] = data_version
+        log.debug(
+            "%s Populated artifact_delta for ADK callbacks: %s -> %s",
+            log_identifier,
+            filename,
+            data_version,
+        )
+
+    final_metadata = {
+        "filename": filename,
+        "mime_type": mime_type,
+        "size_bytes": size_bytes,
+        "timestamp_utc": (
+            timestamp
+            if isinstance(timestamp, (int, float))
+            else timestamp.timestamp()
+        ),
+        **(metadata_dict or {}),
+    }
+    if explicit_schema:
+        final_metadata["schema"] = {
+            "type": mime_type,
+            "inferred": False,
+            **explicit_schema,
+        }
+        log.debug("%s Using explicit schema provided by caller.", log_identifier)
+    elif schema_content is None:
+        final_metadata["schema"] = {
+            "type": mime_type,
+            "inferred": False,
+            "error": None,
+        }
+        log.debug(
+            "%s Content too large for schema inference; schema not inferred.",
+            log_identifier,
+        )
+    else:
+        inferred_schema = _infer_schema(
+            schema_content, mime_type, schema_inference_depth, schema_max_keys
+        )
+        final_metadata["schema"] = inferred_schema
+        if inferred_schema.get("inferred"):
+            log.debug(
+                "%s Added inferred schema (max_keys=%d).",
+                log_identifier,
+                schema_max_keys,
+            )
+        elif inferred_schema.get("error"):
+            log.warning(
+                "%s Schema inference failed: %s",
+                log_identifier,
+                inferred_schema["error"],
+            )
+    try:
+        metadata_bytes = json.dumps(final_metadata, indent=2).encode("utf-8")
+        metadata_artifact_part = adk_types.Part.from_bytes(
+            data=metadata_bytes, mime_type="application/json"
+        )
+        save_metadata_method = getattr(artifact_service, "save_artifact")
+        metadata_version = await save_metadata_method(
+            app_name=app_name,
+            user_id=user_id,
+            session_id=session_id,
+            filename=metadata_filename,
+            artifact=metadata_artifact_part,
+        )
+        log.info(
+            "%s Saved metadata artifact '%s' as version %s.",
+            log_identifier,
+            metadata_filename,
+            metadata_version,
+        )
+        status = "success"
+        status_message = "Artifact and metadata saved successfully."
+    except Exception as meta_save_err:
+        log.exception(
+            "%s Failed to save metadata artifact '%s': %s",
+            log_identifier,
+            metadata_filename,
+            meta_save_err,
+        )
+        status = "partial_success"
+        status_message = f"Data artifact saved (v{data_version}), but failed to save metadata: {meta_save_err}"
+    return metadata_version, status, status_message
+
+
 async def save_artifact_with_metadata(
     artifact_service: BaseArtifactService,
     app_name: str,
@@ -269,6 +409,7 @@ async def save_artifact_with_metadata(
                         f"{log_identifier} Could not get signature of save_artifact: {e_inspect}"
                     )
         save_data_method = getattr(artifact_service, "save_artifact")
+        save_started = time.perf_counter()
         data_version = await save_data_method(
             app_name=app_name,
             user_id=user_id,
@@ -276,6 +417,9 @@ async def save_artifact_with_metadata(
             filename=filename,
             artifact=data_artifact_part,
         )
+        record_artifact_io(
+            app_name, "write", len(content_bytes), time.perf_counter() - save_started
+        )
         log.info(
             "%s Saved data artifact '%s' as version %s.",
             log_identifier,
@@ -283,85 +427,142 @@ async def save_artifact_with_metadata(
             data_version,
         )
 
-        # Populate artifact_delta for ADK callbacks if tool_context is provided
-        if (
-            tool_context
-            and hasattr(tool_context, "actions")
-            and hasattr(tool_context.actions, "artifact_delta")
-        ):
-            tool_context.actions.artifact_delta[filename] = data_version
-            log.debug(
-                "%s Populated artifact_delta for ADK callbacks: %s -> %s",
-                log_identifier,
-                filename,
-                data_version,
-            )
+        metadata_version, status, status_message = await _save_data_artifact_metadata(
+            artifact_service,
+            app_name,
+            user_id,
+            session_id,
+            filename,
+            data_version,
+            mime_type=mime_type,
+            size_bytes=len(content_bytes),
+            schema_content=content_bytes,
+            metadata_dict=metadata_dict,
+            timestamp=timestamp,
+            explicit_schema=explicit_schema,
+            schema_inference_depth=schema_inference_depth,
+            schema_max_keys=schema_max_keys,
+            tool_context=tool_context,
+            log_identifier=log_identifier,
+        )
+    except Exception as data_save_err:
+        log.exception(
+            "%s Failed to save data artifact '%s': %s",
+            log_identifier,
+            filename,
+            data_save_err,
+        )
+        status = "error"
+        status_message = f"Failed to save data artifact: {data_save_err}"
+    return {
+        "status": status,
+        "data_filename": filename,
+        "data_version": data_version,
+        "metadata_filename": metadata_filename,
+        "metadata_version": metadata_version,
+        "message": status_message,
+    }
 
-        final_metadata = {
-            "filename": filename,
-            "mime_type": mime_type,
-            "size_bytes": len(content_bytes),
-            "timestamp_utc": (
-                timestamp
-                if isinstance(timestamp, (int, float))
-                else timestamp.timestamp()
-            ),
-            **(metadata_dict or {}),
-        }
-        if explicit_schema:
-            final_metadata["schema"] = {
-                "type": mime_type,
-                "inferred": False,
-                **explicit_schema,
-            }
-            log.debug("%s Using explicit schema provided by caller.", log_identifier)
-        else:
-            inferred_schema = _infer_schema(
-                content_bytes, mime_type, schema_inference_depth, schema_max_keys
-            )
-            final_metadata["schema"] = inferred_schema
-            if inferred_schema.get("inferred"):
-                log.debug(
-                    "%s Added inferred schema (max_keys=%d).",
-                    log_identifier,
-                    schema_max_keys,
-                )
-            elif inferred_schema.get("error"):
-                log.warning(
-                    "%s Schema inference failed: %s",
-                    log_identifier,
-                    inferred_schema["error"],
+
+async def save_artifact_stream_with_metadata(
+    artifact_service: BaseArtifactService,
+    app_name: str,
+    user_id: str,
+    session_id: str,
+    filename: str,
+    chunks: AsyncIterable[bytes],
+    mime_type: str,
+    metadata_dict: Dict[str, Any],
+    timestamp: datetime,
+    max_size_bytes: Optional[int] = None,
+    explicit_schema: Optional[Dict] = None,
+    schema_inference_depth: int = 2,
+    schema_max_keys: int = DEFAULT_SCHEMA_MAX_KEYS,
+    tool_context: Optional["ToolContext"] = None,
+) -> Dict[str, Any]:
+    """
+    Saves a data artifact from an async iterable of chunks, and its metadata
+    artifact, without holding the content in memory. Services that support
+    streaming saves write the chunks as they arrive.
+
+    The schema is inferred from the content if it is at most
+    SCHEMA_INFERENCE_MAX_BYTES (from its first bytes for CSV).
+
+    Returns:
+        The same result as `save_artifact_with_metadata`, plus the content's
+        `size_bytes` and `sha256` on success.
+
+    Raises:
+        ArtifactTooLargeError: If the content exceeds `max_size_bytes`. Nothing
+            is saved in that case.
+    """
+    log_identifier = f"[ArtifactHelper:save_stream:{filename}]"
+    log.debug("%s Streaming artifact and metadata...", log_identifier)
+    data_version = None
+    metadata_version = None
+    metadata_filename = f"{filename}{METADATA_SUFFIX}"
+    schema_sample = bytearray()
+
+    async def _sample_chunks():
+        async for chunk in chunks:
+            if len(schema_sample) < SCHEMA_INFERENCE_MAX_BYTES:
+                schema_sample.extend(
+                    chunk[: SCHEMA_INFERENCE_MAX_BYTES - len(schema_sample)]
                 )
-        try:
-            metadata_bytes = json.dumps(final_metadata, indent=2).encode("utf-8")
-            metadata_artifact_part = adk_types.Part.from_bytes(
-                data=metadata_bytes, mime_type="application/json"
-            )
-            save_metadata_method = getattr(artifact_service, "save_artifact")
-            metadata_version = await save_metadata_method(
-                app_name=app_name,
-                user_id=user_id,
-                session_id=session_id,
-                filename=metadata_filename,
-                artifact=metadata_artifact_part,
-            )
-            log.info(
-                "%s Saved metadata artifact '%s' as version %s.",
-                log_identifier,
-                metadata_filename,
-                metadata_version,
-            )
-            status = "success"
-            status_message = "Artifact and metadata saved successfully."
-        except Exception as meta_save_err:
-            log.exception(
-                "%s Failed to save metadata artifact '%s': %s",
-                log_identifier,
-                metadata_filename,
-                meta_save_err,
-            )
-            status = "partial_success"
-            status_message = f"Data artifact saved (v{data_version}), but failed to save metadata: {meta_save_err}"
+            yield chunk
+
+    result: Dict[str, Any] = {}
+    try:
+        save_started = time.perf_counter()
+        saved = await save_artifact_stream(
+            artifact_service,
+            app_name=app_name,
+            user_id=user_id,
+            session_id=session_id,
+            filename=filename,
+            chunks=_sample_chunks(),
+            mime_type=mime_type,
+            max_size_bytes=max_size_bytes,
+        )
+        data_version = saved.version
+        record_artifact_io(
+            app_name, "write", saved.size_bytes, time.perf_counter() - save_started
+        )
+        log.info(
+            "%s Saved data artifact '%s' as version %s (%d bytes, sha256 %s).",
+            log_identifier,
+            filename,
+            data_version,
+            saved.size_bytes,
+            saved.sha256,
+        )
+        result = {"size_bytes": saved.size_bytes, "sha256": saved.sha256}
+
+        schema_content = None
+        if saved.size_bytes <= SCHEMA_INFERENCE_MAX_BYTES or (
+            mime_type and mime_type.lower() == "text/csv"
+        ):
+            schema_content = bytes(schema_sample)
+        metadata_version, status, status_message = await _save_data_artifact_metadata(
+            artifact_service,
+            app_name,
+            user_id,
+            session_id,
+            filename,
+            data_version,
+            mime_type=mime_type,
+            size_bytes=saved.size_bytes,
+            schema_content=schema_content,
+            metadata_dict=metadata_dict,
+            timestamp=timestamp,
+            explicit_schema=explicit_schema,
+            schema_inference_depth=schema_inference_depth,
+            schema_max_keys=schema_max_keys,
+            tool_context=tool_context,
+            log_identifier=log_identifier,
+        )
+    except ArtifactTooLargeError:
+        raise
     except Exception as data_save_err:
         log.exception(
             "%s Failed to save data artifact '%s': %s",
@@ -378,6 +579,7 @@ async def save_artifact_with_metadata(
         "metadata_filename": metadata_filename,
         "metadata_version": metadata_version,
         "message": status_message,
+        **result,
     }
 
 
@@ -681,112 +883,64 @@ async def get_artifact_info_list(
     artifact_info_list: List[ArtifactInfo] = []
 
     try:
-        list_keys_method = getattr(artifact_service, "list_artifact_keys")
-        keys = await list_keys_method(
-            app_name=app_name, user_id=user_id, session_id=session_id
-        )
-        log.info(
-            "%s Found %d artifact keys. Fetching details...", log_prefix, len(keys)
+        listings = await list_artifacts_with_metadata(
+            artifact_service,
+            app_name=app_name,
+            user_id=user_id,
+            session_id=session_id,
         )
+        log.info("%s Found %d artifacts with metadata.", log_prefix, len(listings))
 
-        for filename in keys:
-            if filename.endswith(METADATA_SUFFIX):
-                continue
-
-            log_identifier_item = f"{log_prefix} [{filename}]"
-            try:
-
-                version_count: int = 0
-                latest_version_num: Optional[int] = await get_latest_artifact_version(
-                    artifact_service, app_name, user_id, session_id, filename
-                )
-
-                if hasattr(artifact_service, "list_versions"):
-                    try:
-                        available_versions = await artifact_service.list_versions(
-                            app_name=app_name,
-                            user_id=user_id,
-                            session_id=session_id,
-                            filename=filename,
-                        )
-                        version_count = len(available_versions)
-                    except Exception as list_ver_err:
-                        log.error(
-                            "%s Error listing versions for count: %s.",
-                            log_identifier_item,
-                            list_ver_err,
-                        )
-
-                data = await load_artifact_content_or_metadata(
-                    artifact_service=artifact_service,
-                    app_name=app_name,
-                    user_id=user_id,
-                    session_id=session_id,
-                    filename=filename,
-                    version="latest",
-                    load_metadata_only=True,
-                    log_identifier_prefix=log_identifier_item,
-                )
-
-                metadata = data.get("metadata", {})
-                mime_type = metadata.get("mime_type", "application/data")
-                size = metadata.get("size_bytes", 0)
-                schema_definition = metadata.get("schema", {})
-                description = metadata.get("description", "No description provided")
-                loaded_version_num = data.get("version", latest_version_num)
-
-                last_modified_ts = metadata.get("timestamp_utc")
-                last_modified_ts = metadata.get("timestamp_utc")
-                last_modified_iso = (
-                    datetime.fromtimestamp(
-                        last_modified_ts, tz=timezone.utc
-                    ).isoformat()
-                    if last_modified_ts
-                    else None
-                )
-
-                artifact_info_list.append(
-                    ArtifactInfo(
-                        filename=filename,
-                        mime_type=mime_type,
-                        size=size,
-                        last_modified=last_modified_iso,
-                        schema_definition=schema_definition,
-                        description=description,
-                        version=loaded_version_num,
-                        version_count=version_count,
-                    )
-                )
-                log.debug(
-                    "%s Successfully processed artifact info.", log_identifier_item
-                )
-
-            except FileNotFoundError:
-                log.warning(
-                    "%s Artifact file not found by service for key '%s'. Skipping.",
-                    log_prefix,
-                    filename,
-                )
-            except Exception as detail_e:
+        for listing in listings:
+            filename = listing.filename
+            if listing.metadata_error:
                 log.error(
-                    "%s Error processing details for artifact '%s': %s\n%s",
+                    "%s Error processing details for artifact '%s': %s",
                     log_prefix,
                     filename,
-                    detail_e,
-                    traceback.format_exc(),
+                    listing.metadata_error,
                 )
                 artifact_info_list.append(
                     ArtifactInfo(
                         filename=filename,
                         size=0,
-                        description=f"Error loading details: {detail_e}",
+                        description=f"Error loading details: {listing.metadata_error}",
                         mime_type="application/octet-stream",
                     )
                 )
+                continue
+            if listing.metadata is None:
+                log.warning(
+                    "%s Metadata for artifact '%s' v%s not found. Skipping.",
+                    log_prefix,
+                    filename,
+                    listing.latest_version,
+                )
+                continue
+
+            metadata = listing.metadata
+            last_modified_ts = metadata.get("timestamp_utc")
+            last_modified_iso = (
+                datetime.fromtimestamp(last_modified_ts, tz=timezone.utc).isoformat()
+                if last_modified_ts
+                else None
+            )
+            artifact_info_list.append(
+                ArtifactInfo(
+                    filename=filename,
+                    mime_type=metadata.get("mime_type", "application/data"),
+                    size=metadata.get("size_bytes", 0),
+                    last_modified=last_modified_iso,
+                    schema_definition=metadata.get("schema", {}),
+                    description=metadata.get("description", "No description provided"),
+                    version=listing.latest_version,
+                    version_count=len(listing.versions),
+                )
+            )
 
     except Exception as e:
         log.exception(
-            "%s Error listing artifact keys or processing list: %s", log_prefix, e
+            "%s Error listing artifacts or processing list: %s", log_prefix, e
         )
         return []
     return artifact_info_list
@@ -918,6 +1072,7 @@ async def load_artifact_content_or_metadata(
         )
 
         load_artifact_method = getattr(artifact_service, "load_artifact")
+        load_started = time.perf_counter()
         artifact_part = await load_artifact_method(
             app_name=app_name,
             user_id=user_id,
@@ -934,6 +1089,9 @@ async def load_artifact_content_or_metadata(
         mime_type = artifact_part.inline_data.mime_type
         data_bytes = artifact_part.inline_data.data
         size_bytes = len(data_bytes)
+        record_artifact_io(
+            app_name, "read", size_bytes, time.perf_counter() - load_started
+        )
 
         if load_metadata_only:
             if mime_type != "application/json":
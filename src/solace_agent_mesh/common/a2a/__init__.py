@@ -94,6 +94,8 @@ from .protocol import (
     extract_task_id_from_topic,
     subscription_to_regex,
     topic_matches_subscription,
+    TopicDispatcher,
+    TopicMatch,
 )
 from .task import (
     create_final_task,
@@ -199,6 +201,8 @@ __all__ = [
     "extract_task_id_from_topic",
     "subscription_to_regex",
     "topic_matches_subscription",
+    "TopicDispatcher",
+    "TopicMatch",
     # task.py
     "create_final_task",
     "create_initial_task",
@@ -2,9 +2,11 @@
 Helpers for A2A protocol-level concerns, such as topic construction and
 parsing of JSON-RPC requests and responses.
 """
+import functools
 import re
 import uuid
-from typing import Any, Dict, Optional, Union
+from dataclasses import dataclass
+from typing import Any, Dict, List, Optional, Tuple, Union
 
 from solace_ai_connector.common.log import log
 
@@ -208,10 +210,122 @@ def subscription_to_regex(subscription: str) -> str:
     return pattern
 
 
+@functools.lru_cache(maxsize=1024)
+def _compile_subscription(subscription: str) -> "re.Pattern[str]":
+    return re.compile(subscription_to_regex(subscription))
+
+
 def topic_matches_subscription(topic: str, subscription: str) -> bool:
     """Checks if a topic matches a Solace subscription pattern."""
-    regex_pattern = subscription_to_regex(subscription)
-    return re.fullmatch(regex_pattern, topic) is not None
+    return _compile_subscription(subscription).fullmatch(topic) is not None
+
+
+@dataclass(frozen=True)
+class TopicMatch:
+    """The result of routing a topic through a `TopicDispatcher`."""
+
+    handler: Any
+    subscription: str
+    task_id: Optional[str]
+
+
+class _TopicTrieNode:
+    __slots__ = ("literal", "star", "partial", "exact", "multi")
+
+    def __init__(self):
+        self.literal: Dict[str, "_TopicTrieNode"] = {}
+        self.star: Optional["_TopicTrieNode"] = None
+        self.partial: List[Tuple["re.Pattern[str]", "_TopicTrieNode"]] = []
+        # (registration order, handler, subscription)
+        self.exact: Optional[Tuple[int, Any, str]] = None
+        self.multi: Optional[Tuple[int, Any, str]] = None
+
+
+class TopicDispatcher:
+    """
+    Routes topics to handlers using a trie of precompiled subscriptions.
+
+    Subscriptions are split into `/`-separated levels. A level of `*` matches
+    exactly one non-empty level, a level containing `*` (e.g. `abc*`) matches
+    one level against that pattern, and a trailing `>` matches one or more
+    remaining levels, which are returned as the task ID. Matching semantics
+    are the same as `topic_matches_subscription`. If several subscriptions
+    match a topic, the one added first wins.
+    """
+
+    def __init__(self):
+        self._root = _TopicTrieNode()
+        self._count = 0
+
+    def add(self, subscription: str, handler: Any) -> None:
+        """Registers a handler for a subscription."""
+        levels = subscription.split("/")
+        is_multi = len(levels) > 1 and levels[-1] == ">"
+        if is_multi:
+            levels = levels[:-1]
+
+        node = self._root
+        for level in levels:
+            if level == "*":
+                if node.star is None:
+                    node.star = _TopicTrieNode()
+                node = node.star
+            elif "*" in level:
+                pattern = re.compile(re.escape(level).replace(r"\*", "[^/]+"))
+                for existing_pattern, child in node.partial:
+                    if existing_pattern.pattern == pattern.pattern:
+                        node = child
+                        break
+                else:
+                    child = _TopicTrieNode()
+                    node.partial.append((pattern, child))
+                    node = child
+            else:
+                node = node.literal.setdefault(level, _TopicTrieNode())
+
+        entry = (self._count, handler, subscription)
+        self._count += 1
+        if is_multi:
+            if node.multi is None:
+                node.multi = entry
+        elif node.exact is None:
+            node.exact = entry
+
+    def match(self, topic: str) -> Optional[TopicMatch]:
+        """
+        Returns the handler, subscription and task ID for a topic, or None if
+        no subscription matches. The task ID is the part of the topic matched
+        by a trailing `>`, or None for subscriptions without one.
+        """
+        levels = topic.split("/")
+        best = self._match_node(self._root, levels, 0, None)
+        if best is None:
+            return None
+        _, entry, remainder_index = best
+        task_id = None
+        if remainder_index is not None:
+            task_id = "/".join(levels[remainder_index:]).lstrip("/") or None
+        return TopicMatch(handler=entry[1], subscription=entry[2], task_id=task_id)
+
+    def _match_node(self, node, levels, index, best):
+        if node.multi is not None and index < len(levels):
+            if best is None or node.multi[0] < best[0]:
+                best = (node.multi[0], node.multi, index)
+        if index == len(levels):
+            if node.exact is not None and (best is None or node.exact[0] < best[0]):
+                best = (node.exact[0], node.exact, None)
+            return best
+
+        level = levels[index]
+        child = node.literal.get(level)
+        if child is not None:
+            best = self._match_node(child, levels, index + 1, best)
+        if node.star is not None and level:
+            best = self._match_node(node.star, levels, index + 1, best)
+        for pattern, child in node.partial:
+            if pattern.fullmatch(level):
+                best = self._match_node(child, levels, index + 1, best)
+        return best
 
 
 # --- JSON-RPC Envelope Helpers ---
@@ -507,15 +621,25 @@ def create_send_streaming_message_success_response(
     return SendStreamingMessageSuccessResponse(id=request_id, result=result)
 
 
+@functools.lru_cache(maxsize=256)
+def _single_subscription_dispatcher(subscription_pattern: str) -> TopicDispatcher:
+    dispatcher = TopicDispatcher()
+    dispatcher.add(subscription_pattern, subscription_pattern)
+    return dispatcher
+
+
 def extract_task_id_from_topic(
     topic: str, subscription_pattern: str, log_identifier: str
 ) -> Optional[str]:
-    """Extracts the task ID from the end of a topic string based on the subscription."""
-    base_regex_str = subscription_to_regex(subscription_pattern).replace(r".*", "")
-    match = re.match(base_regex_str, topic)
+    """
+    Extracts the task ID from the end of a topic string based on the subscription.
+
+    Prefer routing through a `TopicDispatcher`, which matches the topic and
+    extracts the task ID in a single pass.
+    """
+    match = _single_subscription_dispatcher(subscription_pattern).match(topic)
     if match:
-        task_id_part = topic[match.end() :]
-        task_id = task_id_part.lstrip("/")
+        task_id = match.task_id
         if task_id:
             log.debug(
                 "%s Extracted Task ID '%s' from topic '%s'",
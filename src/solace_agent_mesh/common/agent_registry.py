@@ -4,39 +4,215 @@ Consolidated from src/tools/common/agent_registry.py and src/tools/a2a_cli_clien
 """
 
 import threading
-from typing import Dict, List, Optional
+import time
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from types import MappingProxyType
+from typing import Callable, Dict, FrozenSet, List, Mapping, Optional, Set, Tuple
 
 from a2a.types import AgentCard
+from solace_ai_connector.common.log import log
+
+
+@dataclass(frozen=True)
+class AgentRegistrySnapshot:
+    """An immutable view of the registry at a given version."""
+
+    version: int
+    agents: Mapping[str, AgentCard] = field(
+        default_factory=lambda: MappingProxyType({})
+    )
+    names: Tuple[str, ...] = ()
+
+
+def _card_index_keys(agent_card: AgentCard) -> Tuple[Set[str], Set[str]]:
+    skills: Set[str] = set()
+    tags: Set[str] = set()
+    for skill in agent_card.skills or []:
+        if skill.id:
+            skills.add(skill.id)
+        if skill.name:
+            skills.add(skill.name)
+        tags.update(skill.tags or [])
+    return skills, tags
 
 
 class AgentRegistry:
-    """Stores and manages discovered AgentCards."""
+    """Stores and manages discovered AgentCards.
+
+    Every change increments `version`, so consumers can cache values derived
+    from the registry (e.g. tool declarations) and rebuild them only when the
+    version changes. If `ttl_seconds` is set, agents that have not re-published
+    their card within that time are dropped.
+    """
 
-    def __init__(self):
+    def __init__(self, ttl_seconds: Optional[float] = None):
         self._agents: Dict[str, AgentCard] = {}
+        self._last_seen: "OrderedDict[str, float]" = OrderedDict()
+        self._skill_index: Dict[str, Set[str]] = {}
+        self._tag_index: Dict[str, Set[str]] = {}
+        self._ttl_seconds = ttl_seconds
+        self._version = 0
+        self._snapshot = AgentRegistrySnapshot(version=0)
+        self._subscribers: List[Callable[[AgentRegistrySnapshot], None]] = []
         self._lock = threading.Lock()
 
+    @property
+    def version(self) -> int:
+        """A counter incremented on every change to the registered agents."""
+        return self._version
+
+    def _index_locked(self, name: str, agent_card: AgentCard, add: bool):
+        skills, tags = _card_index_keys(agent_card)
+        for index, keys in ((self._skill_index, skills), (self._tag_index, tags)):
+            for key in keys:
+                if add:
+                    index.setdefault(key, set()).add(name)
+                else:
+                    names = index.get(key)
+                    if names is not None:
+                        names.discard(name)
+                        if not names:
+                            del index[key]
+
+    def _remove_locked(self, name: str) -> bool:
+        agent_card = self._agents.pop(name, None)
+        self._last_seen.pop(name, None)
+        if agent_card is None:
+            return False
+        self._index_locked(name, agent_card, add=False)
+        return True
+
+    def _expire_locked(self, now: float) -> bool:
+        if self._ttl_seconds is None:
+            return False
+        deadline = now - self._ttl_seconds
+        expired = []
+        for name, last_seen in self._last_seen.items():
+            if last_seen >= deadline:
+                break
+            expired.append(name)
+        for name in expired:
+            self._remove_locked(name)
+            log.info("[AgentRegistry] Agent '%s' expired (no card within TTL).", name)
+        return bool(expired)
+
+    def _commit_locked(self) -> AgentRegistrySnapshot:
+        self._version += 1
+        self._snapshot = AgentRegistrySnapshot(
+            version=self._version,
+            agents=MappingProxyType(dict(self._agents)),
+            names=tuple(sorted(self._agents)),
+        )
+        return self._snapshot
+
+    def _notify(self, snapshot: Optional[AgentRegistrySnapshot]):
+        if snapshot is None:
+            return
+        for callback in list(self._subscribers):
+            try:
+                callback(snapshot)
+            except Exception as e:
+                log.error("[AgentRegistry] Subscriber callback failed: %s", e)
+
     def add_or_update_agent(self, agent_card: AgentCard):
         """Adds a new agent or updates an existing one."""
         if not agent_card or not agent_card.name:
             return
 
+        changed = None
         with self._lock:
-            is_new = agent_card.name not in self._agents
-            self._agents[agent_card.name] = agent_card
-            return is_new
+            name = agent_card.name
+            now = time.monotonic()
+            expired = self._expire_locked(now)
+            existing = self._agents.get(name)
+            is_new = existing is None
+            self._last_seen[name] = now
+            self._last_seen.move_to_end(name)
+            if existing != agent_card:
+                if existing is not None:
+                    self._index_locked(name, existing, add=False)
+                self._agents[name] = agent_card
+                self._index_locked(name, agent_card, add=True)
+                changed = self._commit_locked()
+            elif expired:
+                changed = self._commit_locked()
+        self._notify(changed)
+        return is_new
+
+    def remove_agent(self, agent_name: str) -> bool:
+        """Removes an agent. Returns True if it was registered."""
+        changed = None
+        with self._lock:
+            if self._remove_locked(agent_name):
+                changed = self._commit_locked()
+        self._notify(changed)
+        return changed is not None
+
+    def remove_expired_agents(self) -> int:
+        """Drops agents whose card has not been seen within the TTL."""
+        changed = None
+        with self._lock:
+            before = len(self._agents)
+            if self._expire_locked(time.monotonic()):
+                changed = self._commit_locked()
+            removed = before - len(self._agents)
+        self._notify(changed)
+        return removed
+
+    def snapshot(self) -> AgentRegistrySnapshot:
+        """Returns an immutable snapshot of the currently registered agents."""
+        if self._ttl_seconds is not None:
+            self.remove_expired_agents()
+        return self._snapshot
+
+    def subscribe(
+        self, callback: Callable[[AgentRegistrySnapshot], None]
+    ) -> Callable[[], None]:
+        """
+        Registers a callback invoked with the new snapshot after every change.
+
+        Returns:
+            A function that removes the subscription.
+        """
+        with self._lock:
+            self._subscribers.append(callback)
+
+        def unsubscribe():
+            with self._lock:
+                if callback in self._subscribers:
+                    self._subscribers.remove(callback)
+
+        return unsubscribe
 
     def get_agent(self, agent_name: str) -> Optional[AgentCard]:
         """Retrieves an agent card by name."""
-        with self._lock:
-            return self._agents.get(agent_name)
+        return self.snapshot().agents.get(agent_name)
 
     def get_agent_names(self) -> List[str]:
         """Returns a sorted list of discovered agent names."""
+        return list(self.snapshot().names)
+
+    def find_agents_by_skill(self, skill: str) -> FrozenSet[str]:
+        """Returns the names of agents advertising a skill, by skill id or name."""
+        self.snapshot()
+        with self._lock:
+            return frozenset(self._skill_index.get(skill, ()))
+
+    def find_agents_by_tag(self, tag: str) -> FrozenSet[str]:
+        """Returns the names of agents with at least one skill carrying a tag."""
+        self.snapshot()
         with self._lock:
-            return sorted(list(self._agents.keys()))
+            return frozenset(self._tag_index.get(tag, ()))
 
     def clear(self):
         """Clears all registered agents."""
+        changed = None
         with self._lock:
-            self._agents.clear()
+            if self._agents:
+                self._agents.clear()
+                self._last_seen.clear()
+                self._skill_index.clear()
+                self._tag_index.clear()
+                changed = self._commit_locked()
+        self._notify(changed)
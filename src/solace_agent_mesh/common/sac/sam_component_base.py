@@ -10,8 +10,16 @@ from typing import Any
 from solace_ai_connector.common.log import log
 from solace_ai_connector.components.component_base import ComponentBase
 
+from ..a2a.protocol import get_sam_events_topic
 from ..exceptions import MessageSizeExceededError
+from ..sam_events import MetricsSnapshotEvent
 from ..utils.message_utils import validate_message_size
+from ..utils.metrics import (
+    ComponentMetrics,
+    MetricsRegistry,
+    monitor_event_loop_lag,
+    start_metrics_http_server,
+)
 
 
 class SamComponentBase(ComponentBase, abc.ABC):
@@ -21,6 +29,8 @@ class SamComponentBase(ComponentBase, abc.ABC):
     Provides a standardized framework for:
     - Managing a dedicated asyncio event loop running in a separate thread.
     - Publishing A2A messages with built-in size validation.
+    - Runtime metrics: event-loop lag sampling, queue depths, and optional
+      Prometheus and SAM events publication.
     """
 
     def __init__(self, info: dict[str, Any], **kwargs: Any):
@@ -53,6 +63,30 @@ class SamComponentBase(ComponentBase, abc.ABC):
 
         self._async_loop: asyncio.AbstractEventLoop | None = None
         self._async_thread: threading.Thread | None = None
+
+        metrics_config = self.get_config("metrics") or {}
+        self.metrics_enabled: bool = metrics_config.get("enabled", True)
+        self.metrics_event_loop_lag_interval_seconds: float = metrics_config.get(
+            "event_loop_lag_interval_seconds", 0.5
+        )
+        self.metrics_publish_interval_seconds: float = metrics_config.get(
+            "publish_interval_seconds", 0
+        )
+        self.metrics_prometheus_port: int | None = metrics_config.get(
+            "prometheus_port"
+        )
+        self.metrics_prometheus_host: str = metrics_config.get(
+            "prometheus_host", "127.0.0.1"
+        )
+        # When disabled, metrics are recorded into a registry that is never
+        # exported, so instrumented code does not need to check.
+        self.metrics = ComponentMetrics(
+            self.get_config("agent_name") or self.get_config("gateway_id") or self.name,
+            registry=None if self.metrics_enabled else MetricsRegistry(),
+        )
+        self.metrics.queue_depth("input").set_function(
+            lambda: self.input_queue.qsize()
+        )
         log.info("%s SamComponentBase initialized successfully.", self.log_identifier)
 
     def publish_a2a_message(
@@ -143,12 +177,14 @@ class SamComponentBase(ComponentBase, abc.ABC):
         asyncio.set_event_loop(self._async_loop)
 
         main_task = None
+        metrics_tasks: list[asyncio.Task] = []
         try:
             log.info(
                 "%s Starting _async_setup_and_run as an asyncio task.",
                 self.log_identifier,
             )
             main_task = self._async_loop.create_task(self._async_setup_and_run())
+            metrics_tasks = self._start_metrics_tasks()
 
             log.info(
                 "%s Running asyncio event loop forever (or until stop_signal).",
@@ -164,6 +200,8 @@ class SamComponentBase(ComponentBase, abc.ABC):
             )
             self.stop_signal.set()
         finally:
+            for task in metrics_tasks:
+                task.cancel()
             if main_task and not main_task.done():
                 log.info(
                     "%s Cancelling main async task (_async_setup_and_run).",
@@ -173,7 +211,7 @@ class SamComponentBase(ComponentBase, abc.ABC):
                 try:
                     # Use gather to await the cancellation
                     self._async_loop.run_until_complete(
-                        asyncio.gather(main_task, return_exceptions=True)
+                        asyncio.gather(main_task, *metrics_tasks, return_exceptions=True)
                     )
                 except RuntimeError as loop_err:
                     log.warning(
@@ -193,6 +231,60 @@ class SamComponentBase(ComponentBase, abc.ABC):
                 self.log_identifier,
             )
 
+    def _start_metrics_tasks(self) -> list[asyncio.Task]:
+        """Starts event-loop lag sampling and metrics publication, as configured."""
+        if not self.metrics_enabled:
+            return []
+        tasks = []
+        if self.metrics_event_loop_lag_interval_seconds > 0:
+            tasks.append(
+                self._async_loop.create_task(
+                    monitor_event_loop_lag(
+                        self.metrics.event_loop_lag,
+                        self.metrics_event_loop_lag_interval_seconds,
+                    )
+                )
+            )
+        if self.metrics_publish_interval_seconds > 0:
+            tasks.append(
+                self._async_loop.create_task(
+                    self._publish_metrics_periodically(
+                        self.metrics_publish_interval_seconds
+                    )
+                )
+            )
+        if self.metrics_prometheus_port:
+            try:
+                start_metrics_http_server(
+                    self.metrics_prometheus_port, host=self.metrics_prometheus_host
+                )
+            except OSError as e:
+                log.error(
+                    "%s Could not serve metrics on %s:%s: %s",
+                    self.log_identifier,
+                    self.metrics_prometheus_host,
+                    self.metrics_prometheus_port,
+                    e,
+                )
+        return tasks
+
+    async def _publish_metrics_periodically(self, interval_seconds: float) -> None:
+        """Publishes this component's metrics on the SAM events topic."""
+        topic = get_sam_events_topic(self.namespace, "metrics", "snapshot")
+        while True:
+            await asyncio.sleep(interval_seconds)
+            event = MetricsSnapshotEvent.create(
+                namespace=self.namespace,
+                source_component=self.metrics.component_name,
+                metrics=self.metrics.snapshot(),
+            )
+            try:
+                self.publish_a2a_message(event.to_dict(), topic)
+            except Exception as e:
+                log.warning(
+                    "%s Failed to publish metrics snapshot: %s", self.log_identifier, e
+                )
+
     def run(self):
         """Starts the component's dedicated async thread."""
         log.info("%s Starting SamComponentBase run method.", self.log_identifier)
@@ -248,6 +340,8 @@ class SamComponentBase(ComponentBase, abc.ABC):
             # We just need to close it from this thread.
             self._async_loop.call_soon_threadsafe(self._async_loop.close)
 
+        self.metrics.remove()
+
         super().cleanup()
         log.info("%s SamComponentBase cleanup finished.", self.log_identifier)
 
@@ -4,6 +4,16 @@ SAM Events - System-level event messaging for Solace Agent Mesh.
 Provides clean separation between A2A task communication and system events.
 """
 
-from .event_service import SamEventService, SamEvent, SessionDeletedEvent
+from .event_service import (
+    SamEventService,
+    SamEvent,
+    SessionDeletedEvent,
+    MetricsSnapshotEvent,
+)
 
-__all__ = ["SamEventService", "SamEvent", "SessionDeletedEvent"]
\ No newline at end of file
+__all__ = [
+    "SamEventService",
+    "SamEvent",
+    "SessionDeletedEvent",
+    "MetricsSnapshotEvent",
+]
\ No newline at end of file
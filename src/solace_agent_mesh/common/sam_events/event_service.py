@@ -58,6 +58,21 @@ class SessionDeletedEvent(SamEvent):
         return super().create("session.deleted", source_component, namespace, data)
 
 
+@dataclass
+class MetricsSnapshotEvent(SamEvent):
+    """System event carrying a component's current runtime metrics."""
+
+    @classmethod
+    def create(cls, namespace: str, source_component: str,
+               metrics: Dict[str, Any]) -> "MetricsSnapshotEvent":
+        """Create a metrics snapshot event."""
+        data = {
+            "component": source_component,
+            "metrics": metrics
+        }
+        return super().create("metrics.snapshot", source_component, namespace, data)
+
+
 class SamEventService:
     """Service for publishing and subscribing to SAM system events."""
     
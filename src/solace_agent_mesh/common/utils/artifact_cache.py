@@ -0,0 +1,300 @@
+"""
+A per-process cache of loaded and parsed artifact versions.
+
+Artifact versions are immutable once saved, so the bytes of a given
+(service, app, user, session, filename, version) can be reused across embed
+evaluations instead of being reloaded, and the structures parsed from them
+(JSON, YAML, CSV rows, Mustache templates) can be reused instead of being
+re-parsed. The cache is shared by all gateways and agents in the process.
+
+Entries are evicted least-recently-used once the estimated total size exceeds
+`max_bytes`, and expire after `ttl_seconds` as a safety net against versions
+being deleted and re-created by another process. Saves and deletes made
+through `ScopedArtifactServiceWrapper` invalidate affected entries directly.
+
+Cached values are shared between callers and must be treated as read-only.
+"""
+
+import threading
+import time
+import weakref
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, Hashable, Optional, Tuple
+
+from google.genai import types as adk_types
+from solace_ai_connector.common.log import log
+
+from .metrics import get_metrics_registry
+
+DEFAULT_MAX_BYTES = 256 * 1024 * 1024
+DEFAULT_TTL_SECONDS = 600
+DEFAULT_MAX_EXPRESSIONS = 512
+# Parsed Python structures are several times larger than their source bytes.
+PARSED_SIZE_FACTOR = 3
+
+ArtifactCacheKey = Tuple[int, str, str, str, str, int]
+
+_MISSING = object()
+
+
+@dataclass
+class _CacheEntry:
+    part: adk_types.Part
+    size_bytes: int
+    expires_at: float
+    parsed: Dict[str, Any] = field(default_factory=dict)
+
+
+class ArtifactCache:
+    """Size-bounded LRU cache of artifact versions and their parsed forms."""
+
+    def __init__(
+        self,
+        max_bytes: int = DEFAULT_MAX_BYTES,
+        ttl_seconds: float = DEFAULT_TTL_SECONDS,
+        max_entry_bytes: Optional[int] = None,
+        max_expressions: int = DEFAULT_MAX_EXPRESSIONS,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        self.max_bytes = max_bytes
+        self.ttl_seconds = ttl_seconds
+        self.max_entry_bytes = (
+            max_entry_bytes if max_entry_bytes is not None else max_bytes // 4
+        )
+        self._max_expressions = max_expressions
+        self._clock = clock
+        self._entries: "OrderedDict[ArtifactCacheKey, _CacheEntry]" = OrderedDict()
+        self._expressions: "OrderedDict[Tuple[str, str], Any]" = OrderedDict()
+        self._total_bytes = 0
+        self._lock = threading.Lock()
+        self._service_tokens: "weakref.WeakKeyDictionary[Any, int]" = (
+            weakref.WeakKeyDictionary()
+        )
+        self._next_service_token = 0
+        self._stats = {
+            "raw_hits": 0,
+            "raw_misses": 0,
+            "parsed_hits": 0,
+            "parsed_misses": 0,
+            "expression_hits": 0,
+            "expression_misses": 0,
+            "evictions": 0,
+            "expirations": 0,
+            "invalidations": 0,
+        }
+
+    def make_key(
+        self,
+        artifact_service: Any,
+        app_name: str,
+        user_id: str,
+        session_id: str,
+        filename: str,
+        version: int,
+    ) -> ArtifactCacheKey:
+        """
+        Builds the cache key for an artifact version.
+
+        Services that remap the app name (like ScopedArtifactServiceWrapper)
+        expose `get_artifact_cache_scope`, so entries are keyed by the backing
+        store and the effective app name rather than by the wrapper.
+        """
+        get_scope = getattr(artifact_service, "get_artifact_cache_scope", None)
+        if get_scope is not None:
+            artifact_service, app_name = get_scope(app_name)
+        with self._lock:
+            token = self._service_tokens.get(artifact_service)
+            if token is None:
+                token = self._next_service_token
+                self._next_service_token += 1
+                self._service_tokens[artifact_service] = token
+        return (token, app_name, user_id, session_id, filename, version)
+
+    def _get_entry_locked(self, key: ArtifactCacheKey) -> Optional[_CacheEntry]:
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        if entry.expires_at <= self._clock():
+            self._remove_locked(key)
+            self._stats["expirations"] += 1
+            return None
+        self._entries.move_to_end(key)
+        return entry
+
+    def _remove_locked(self, key: ArtifactCacheKey):
+        entry = self._entries.pop(key, None)
+        if entry is not None:
+            self._total_bytes -= entry.size_bytes
+
+    def _evict_locked(self):
+        while self._total_bytes > self.max_bytes and self._entries:
+            _, entry = self._entries.popitem(last=False)
+            self._total_bytes -= entry.size_bytes
+            self._stats["evictions"] += 1
+
+    def get_part(self, key: ArtifactCacheKey) -> Optional[adk_types.Part]:
+        """Returns the cached artifact part for a version, if present."""
+        with self._lock:
+            entry = self._get_entry_locked(key)
+            self._stats["raw_hits" if entry else "raw_misses"] += 1
+            return entry.part if entry else None
+
+    def put_part(self, key: ArtifactCacheKey, part: adk_types.Part):
+        """Caches a loaded artifact part. Parts with no inline data are skipped."""
+        if not part or not part.inline_data or part.inline_data.data is None:
+            return
+        size = len(part.inline_data.data)
+        if size > self.max_entry_bytes:
+            return
+        with self._lock:
+            self._remove_locked(key)
+            self._entries[key] = _CacheEntry(
+                part=part,
+                size_bytes=size,
+                expires_at=self._clock() + self.ttl_seconds,
+            )
+            self._total_bytes += size
+            self._evict_locked()
+
+    def get_parsed(self, key: ArtifactCacheKey, kind: str) -> Any:
+        """
+        Returns the structure of the given kind parsed from a cached version,
+        or None if the version or that parsed form is not cached.
+        """
+        with self._lock:
+            entry = self._get_entry_locked(key)
+            value = entry.parsed.get(kind, _MISSING) if entry else _MISSING
+            hit = value is not _MISSING
+            self._stats["parsed_hits" if hit else "parsed_misses"] += 1
+            return value if hit else None
+
+    def put_parsed(self, key: ArtifactCacheKey, kind: str, value: Any):
+        """
+        Attaches a parsed form to a cached version. Ignored if the version
+        itself is not cached, so parsed forms never outlive their source.
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None or kind in entry.parsed:
+                return
+            extra = len(entry.part.inline_data.data) * PARSED_SIZE_FACTOR
+            if entry.size_bytes + extra > self.max_entry_bytes:
+                return
+            entry.parsed[kind] = value
+            entry.size_bytes += extra
+            self._total_bytes += extra
+            self._evict_locked()
+
+    def get_or_compile(
+        self, kind: str, source: str, compile_func: Callable[[str], Any]
+    ) -> Any:
+        """
+        Returns a compiled expression (e.g. JSONPath) for `source`, compiling it
+        with `compile_func` on first use. Compilation errors are not cached.
+        """
+        cache_key = (kind, source)
+        with self._lock:
+            compiled = self._expressions.get(cache_key, _MISSING)
+            if compiled is not _MISSING:
+                self._expressions.move_to_end(cache_key)
+                self._stats["expression_hits"] += 1
+                return compiled
+            self._stats["expression_misses"] += 1
+        compiled = compile_func(source)
+        with self._lock:
+            self._expressions[cache_key] = compiled
+            while len(self._expressions) > self._max_expressions:
+                self._expressions.popitem(last=False)
+        return compiled
+
+    def invalidate(self, key_prefix: Tuple[Hashable, ...]) -> int:
+        """
+        Drops every cached version whose key starts with `key_prefix`, e.g. a
+        full key or the key without its version to drop all versions of a file.
+        """
+        size = len(key_prefix)
+        with self._lock:
+            matching = [k for k in self._entries if k[:size] == key_prefix]
+            for key in matching:
+                self._remove_locked(key)
+            self._stats["invalidations"] += len(matching)
+        return len(matching)
+
+    def clear(self):
+        """Drops all cached artifacts and compiled expressions."""
+        with self._lock:
+            self._entries.clear()
+            self._expressions.clear()
+            self._total_bytes = 0
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Returns hit/miss counters, hit rates and current occupancy."""
+        with self._lock:
+            stats: Dict[str, Any] = dict(self._stats)
+            stats.update(
+                entries=len(self._entries),
+                total_bytes=self._total_bytes,
+                max_bytes=self.max_bytes,
+                expressions=len(self._expressions),
+            )
+        for prefix in ("raw", "parsed", "expression"):
+            lookups = stats[f"{prefix}_hits"] + stats[f"{prefix}_misses"]
+            stats[f"{prefix}_hit_rate"] = (
+                stats[f"{prefix}_hits"] / lookups if lookups else 0.0
+            )
+        return stats
+
+
+_artifact_cache: Optional[ArtifactCache] = None
+_artifact_cache_lock = threading.Lock()
+
+
+def get_artifact_cache() -> ArtifactCache:
+    """Returns the process-wide artifact cache, creating it on first use."""
+    global _artifact_cache
+    if _artifact_cache is None:
+        with _artifact_cache_lock:
+            if _artifact_cache is None:
+                _artifact_cache = ArtifactCache()
+                get_metrics_registry().register_stats(
+                    "sam_artifact_cache",
+                    "Artifact cache hits, misses, hit rates and occupancy.",
+                    _artifact_cache.get_stats,
+                )
+    return _artifact_cache
+
+
+async def load_artifact_cached(
+    artifact_service: Any,
+    *,
+    app_name: str,
+    user_id: str,
+    session_id: str,
+    filename: str,
+    version: int,
+) -> Tuple[Optional[adk_types.Part], ArtifactCacheKey]:
+    """
+    Loads a specific artifact version through the process-wide cache.
+
+    Returns:
+        The artifact part (None if not found) and the cache key, which callers
+        can use to cache structures parsed from the part.
+    """
+    cache = get_artifact_cache()
+    key = cache.make_key(
+        artifact_service, app_name, user_id, session_id, filename, version
+    )
+    part = cache.get_part(key)
+    if part is not None:
+        log.debug("[ArtifactCache] Hit for '%s' v%s.", filename, version)
+        return part, key
+    part = await artifact_service.load_artifact(
+        app_name=app_name,
+        user_id=user_id,
+        session_id=session_id,
+        filename=filename,
+        version=version,
+    )
+    cache.put_part(key, part)
+    return part, key
@@ -0,0 +1,362 @@
+"""Bounded in-memory cache with TTL expiry, LRU eviction and namespaces."""
+
+import heapq
+import itertools
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, Hashable, List, Optional, Tuple
+
+from solace_ai_connector.common.log import log
+
+DEFAULT_NAMESPACE = "default"
+
+EVICTION_REASON_EXPIRED = "expired"
+EVICTION_REASON_CAPACITY = "capacity"
+
+EvictionCallback = Callable[[str, Hashable, Any, str], None]
+
+_MISSING = object()
+
+
+@dataclass
+class _Entry:
+    value: Any
+    expires_at: Optional[float]
+    seq: int
+    size: int = 0
+
+
+@dataclass
+class CacheStats:
+    """Counters for a single cache namespace."""
+
+    hits: int = 0
+    misses: int = 0
+    evictions: int = 0
+    expirations: int = 0
+
+
+class BoundedTTLCache:
+    """A thread-safe, bounded key-value cache.
+
+    Entries live in per-namespace LRU maps. Each namespace is capped at its own
+    number of entries, and optionally at a total of the sizes given to `set`;
+    inserting into a full namespace evicts its least recently used entries. Entries with a TTL are also tracked in a min-heap of
+    expiry times, so expired entries are removed proactively (on every write,
+    on `sweep()`, and by an optional background sweeper thread) rather than
+    only when the same key happens to be read again.
+
+    An optional `on_evict(namespace, key, value, reason)` callback is invoked,
+    outside the cache lock, for every entry removed by expiry or by capacity
+    eviction. It is not invoked for explicit deletes.
+    """
+
+    def __init__(
+        self,
+        max_entries: int = 10_000,
+        namespace_limits: Optional[Dict[str, int]] = None,
+        max_bytes: Optional[int] = None,
+        on_evict: Optional[EvictionCallback] = None,
+        clock: Callable[[], float] = time.monotonic,
+        name: str = "BoundedTTLCache",
+    ):
+        """Initialize the cache.
+
+        Args:
+            max_entries: Default capacity of each namespace.
+            namespace_limits: Per-namespace capacities overriding max_entries.
+            max_bytes: Budget for the total size of the entries of each
+                namespace, as reported to `set`. None for no budget.
+            on_evict: Callback for entries removed by expiry or capacity.
+            clock: Monotonic time source, in seconds.
+            name: Name used in log messages and by the sweeper thread.
+        """
+        if max_entries <= 0:
+            raise ValueError("max_entries must be a positive integer.")
+        if max_bytes is not None and max_bytes <= 0:
+            raise ValueError("max_bytes must be a positive integer.")
+        self._max_entries = max_entries
+        self._max_bytes = max_bytes
+        self._namespace_limits: Dict[str, int] = dict(namespace_limits or {})
+        self._on_evict = on_evict
+        self._clock = clock
+        self._name = name
+        self._data: Dict[str, "OrderedDict[Hashable, _Entry]"] = {}
+        self._stats: Dict[str, CacheStats] = {}
+        self._bytes: Dict[str, int] = {}
+        self._expiry_heap: List[Tuple[float, int, str, Hashable]] = []
+        self._seq = itertools.count()
+        self._lock = threading.RLock()
+        self._wakeup = threading.Condition(self._lock)
+        self._sweeper: Optional[threading.Thread] = None
+        self._stopping = False
+
+    def set_namespace_limit(self, namespace: str, max_entries: int) -> None:
+        """Set the capacity of a namespace, evicting entries if it shrinks."""
+        if max_entries <= 0:
+            raise ValueError("max_entries must be a positive integer.")
+        with self._lock:
+            self._namespace_limits[namespace] = max_entries
+            evicted = self._enforce_capacity_locked(namespace)
+        self._notify_evicted(evicted)
+
+    def set(
+        self,
+        key: Hashable,
+        value: Any,
+        ttl: Optional[float] = None,
+        namespace: str = DEFAULT_NAMESPACE,
+        size: int = 0,
+    ) -> None:
+        """Set a key-value pair.
+
+        Args:
+            key: The key for the data.
+            value: The data to store.
+            ttl: Time to live in seconds. If None, data will not expire.
+            namespace: The namespace the key belongs to.
+            size: Approximate size of the entry in bytes, counted against
+                `max_bytes`. An entry larger than the whole budget is not
+                stored, and replaces any previous value of the key.
+        """
+        if self._max_bytes is not None and size > self._max_bytes:
+            self.delete(key, namespace=namespace)
+            return
+        with self._lock:
+            now = self._clock()
+            evicted = self._sweep_locked(now)
+            entries = self._data.get(namespace)
+            if entries is None:
+                entries = self._data[namespace] = OrderedDict()
+                self._stats.setdefault(namespace, CacheStats())
+
+            seq = next(self._seq)
+            expires_at = now + ttl if ttl is not None else None
+            previous = entries.get(key)
+            if previous is not None:
+                self._bytes[namespace] -= previous.size
+            entries[key] = _Entry(value, expires_at, seq, size)
+            self._bytes[namespace] = self._bytes.get(namespace, 0) + size
+            entries.move_to_end(key)
+            if expires_at is not None:
+                notify_sweeper = (
+                    not self._expiry_heap or expires_at < self._expiry_heap[0][0]
+                )
+                heapq.heappush(self._expiry_heap, (expires_at, seq, namespace, key))
+                if notify_sweeper:
+                    self._wakeup.notify()
+            evicted.extend(self._enforce_capacity_locked(namespace))
+            self._maybe_compact_heap_locked()
+        self._notify_evicted(evicted)
+
+    def get(
+        self, key: Hashable, default: Any = None, namespace: str = DEFAULT_NAMESPACE
+    ) -> Any:
+        """Get the value associated with a key, marking it as recently used.
+
+        Args:
+            key: The key for the data.
+            default: The value to return if the key is not found or has expired.
+            namespace: The namespace the key belongs to.
+
+        Returns:
+            The cached value, or the default value if not found.
+        """
+        expired = None
+        with self._lock:
+            entries = self._data.get(namespace)
+            entry = entries.get(key) if entries is not None else None
+            stats = self._stats.setdefault(namespace, CacheStats())
+            if entry is None:
+                stats.misses += 1
+                return default
+            if entry.expires_at is not None and self._clock() >= entry.expires_at:
+                del entries[key]
+                self._bytes[namespace] -= entry.size
+                stats.misses += 1
+                stats.expirations += 1
+                expired = (namespace, key, entry.value, EVICTION_REASON_EXPIRED)
+            else:
+                entries.move_to_end(key)
+                stats.hits += 1
+                return entry.value
+        self._notify_evicted([expired])
+        return default
+
+    def pop(
+        self, key: Hashable, default: Any = None, namespace: str = DEFAULT_NAMESPACE
+    ) -> Any:
+        """Remove a key and return its value, or default if it was not present."""
+        with self._lock:
+            entries = self._data.get(namespace)
+            if entries is None or key not in entries:
+                return default
+            entry = entries.pop(key)
+            self._bytes[namespace] -= entry.size
+        if entry.expires_at is not None and self._clock() >= entry.expires_at:
+            return default
+        return entry.value
+
+    def delete(self, key: Hashable, namespace: str = DEFAULT_NAMESPACE) -> bool:
+        """Delete a key.
+
+        Returns:
+            True if the key was found and deleted, False otherwise.
+        """
+        return self.pop(key, _MISSING, namespace=namespace) is not _MISSING
+
+    def clear(self, namespace: Optional[str] = None) -> None:
+        """Remove all entries, or only those of one namespace."""
+        with self._lock:
+            if namespace is None:
+                self._data.clear()
+                self._bytes.clear()
+                self._expiry_heap.clear()
+            else:
+                self._data.pop(namespace, None)
+                self._bytes.pop(namespace, None)
+
+    def __len__(self) -> int:
+        with self._lock:
+            return sum(len(entries) for entries in self._data.values())
+
+    def size(self, namespace: str = DEFAULT_NAMESPACE) -> int:
+        """Return the number of entries stored in a namespace."""
+        with self._lock:
+            return len(self._data.get(namespace, ()))
+
+    def sweep(self) -> int:
+        """Remove every expired entry now.
+
+        Returns:
+            The number of entries that expired.
+        """
+        with self._lock:
+            expired = self._sweep_locked(self._clock())
+        self._notify_evicted(expired)
+        return len(expired)
+
+    def get_stats(self) -> Dict[str, Dict[str, int]]:
+        """Return hit/miss/eviction/expiration counters and size per namespace."""
+        with self._lock:
+            return {
+                namespace: {
+                    "size": len(self._data.get(namespace, ())),
+                    "capacity": self._capacity(namespace),
+                    "bytes": self._bytes.get(namespace, 0),
+                    "hits": stats.hits,
+                    "misses": stats.misses,
+                    "evictions": stats.evictions,
+                    "expirations": stats.expirations,
+                }
+                for namespace, stats in self._stats.items()
+            }
+
+    def start_sweeper(self) -> None:
+        """Start a daemon thread that expires entries as soon as they are due."""
+        with self._lock:
+            if self._sweeper is not None and self._sweeper.is_alive():
+                return
+            self._stopping = False
+            self._sweeper = threading.Thread(
+                target=self._sweeper_loop, name=f"{self._name}-sweeper", daemon=True
+            )
+            self._sweeper.start()
+
+    def stop_sweeper(self, timeout: Optional[float] = 5.0) -> None:
+        """Stop the background sweeper thread, if running."""
+        with self._lock:
+            sweeper = self._sweeper
+            self._stopping = True
+            self._wakeup.notify_all()
+        if sweeper is not None and sweeper is not threading.current_thread():
+            sweeper.join(timeout)
+        self._sweeper = None
+
+    def _capacity(self, namespace: str) -> int:
+        return self._namespace_limits.get(namespace, self._max_entries)
+
+    def _is_current(self, namespace: str, key: Hashable, seq: int) -> bool:
+        entries = self._data.get(namespace)
+        entry = entries.get(key) if entries is not None else None
+        return entry is not None and entry.seq == seq
+
+    def _sweep_locked(self, now: float) -> List[Tuple[str, Hashable, Any, str]]:
+        expired = []
+        heap = self._expiry_heap
+        while heap and heap[0][0] <= now:
+            _, seq, namespace, key = heapq.heappop(heap)
+            if not self._is_current(namespace, key, seq):
+                continue
+            entry = self._data[namespace].pop(key)
+            self._bytes[namespace] -= entry.size
+            self._stats[namespace].expirations += 1
+            expired.append((namespace, key, entry.value, EVICTION_REASON_EXPIRED))
+        return expired
+
+    def _enforce_capacity_locked(
+        self, namespace: str
+    ) -> List[Tuple[str, Hashable, Any, str]]:
+        entries = self._data.get(namespace)
+        if entries is None:
+            return []
+        evicted = []
+        capacity = self._capacity(namespace)
+        while len(entries) > capacity or (
+            self._max_bytes is not None and self._bytes[namespace] > self._max_bytes
+        ):
+            key, entry = entries.popitem(last=False)
+            self._bytes[namespace] -= entry.size
+            self._stats[namespace].evictions += 1
+            evicted.append((namespace, key, entry.value, EVICTION_REASON_CAPACITY))
+        if evicted:
+            log.debug(
+                "[%s] Evicted %d least recently used entries from namespace '%s'.",
+                self._name,
+                len(evicted),
+                namespace,
+            )
+        return evicted
+
+    def _maybe_compact_heap_locked(self) -> None:
+        # Overwritten, deleted and evicted entries leave stale heap records
+        # behind; rebuild once they outnumber the live ones.
+        heap = self._expiry_heap
+        if len(heap) <= 64 or len(heap) <= 2 * len(self):
+            return
+        self._expiry_heap = [
+            item for item in heap if self._is_current(item[2], item[3], item[1])
+        ]
+        heapq.heapify(self._expiry_heap)
+
+    def _notify_evicted(self, evicted) -> None:
+        if not evicted or self._on_evict is None:
+            return
+        for namespace, key, value, reason in evicted:
+            try:
+                self._on_evict(namespace, key, value, reason)
+            except Exception as e:
+                log.error(
+                    "[%s] Eviction callback failed for key '%s' in namespace '%s': %s",
+                    self._name,
+                    key,
+                    namespace,
+                    e,
+                )
+
+    def _sweeper_loop(self) -> None:
+        while True:
+            with self._lock:
+                if self._stopping:
+                    return
+                now = self._clock()
+                expired = self._sweep_locked(now)
+                if not expired:
+                    timeout = (
+                        self._expiry_heap[0][0] - now if self._expiry_heap else None
+                    )
+                    self._wakeup.wait(timeout)
+                    continue
+            self._notify_evicted(expired)
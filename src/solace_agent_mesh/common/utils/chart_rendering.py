@@ -0,0 +1,297 @@
+"""
+Renders Plotly figures to static images in a pool of warm worker processes.
+
+Kaleido rendering is CPU-bound and takes hundreds of milliseconds per chart, so
+running it inside an async tool blocks the agent's event loop. `ChartRenderer`
+runs it in a bounded process pool instead. The workers are started on the first
+render, and each starts Kaleido once and keeps it for later renders. Requests
+beyond the pool's queue limit are rejected immediately, and a render that
+exceeds its timeout retires the pool so a stuck Kaleido process does not hold a
+worker.
+
+This module is kept free of heavy imports because every worker process imports
+it; Plotly is only imported inside the workers.
+"""
+
+import asyncio
+import hashlib
+import json
+import multiprocessing
+import threading
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from typing import Any, Dict, Optional, Tuple
+
+from solace_ai_connector.common.log import log
+
+DEFAULT_RENDER_WORKERS = 2
+DEFAULT_RENDER_QUEUE_LIMIT = 8
+DEFAULT_RENDER_TIMEOUT_SECONDS = 30.0
+
+
+class ChartRenderBusyError(Exception):
+    """The render queue is full; the request was not queued."""
+
+
+def figure_content_hash(figure_config: Dict[str, Any], output_format: str) -> str:
+    """
+    Returns a hash identifying the image a figure config renders to, independent
+    of key order and whitespace in the original JSON/YAML.
+    """
+    canonical = json.dumps(
+        figure_config, sort_keys=True, separators=(",", ":"), default=str
+    )
+    digest = hashlib.sha256(canonical.encode("utf-8"))
+    digest.update(b"\0" + output_format.lower().encode("utf-8"))
+    return digest.hexdigest()
+
+
+def _warm_worker() -> None:
+    """Worker initializer: imports Plotly and starts Kaleido with a tiny render."""
+    try:
+        import plotly.graph_objects as go
+        import plotly.io as pio
+
+        pio.to_image(go.Figure(), format="png", engine="kaleido", width=10, height=10)
+    except Exception:
+        # A broken Kaleido install is reported by the first real render.
+        pass
+
+
+def _render_in_worker(figure_config: Dict[str, Any], output_format: str) -> bytes:
+    import plotly.graph_objects as go
+    import plotly.io as pio
+
+    # Exceptions are re-raised with plain messages so they always unpickle.
+    try:
+        fig = go.Figure(figure_config)
+    except Exception as fig_err:
+        raise ValueError(
+            f"Failed to create Plotly figure from config: {fig_err}"
+        ) from None
+    try:
+        return pio.to_image(fig, format=output_format, engine="kaleido")
+    except Exception as img_err:
+        raise RuntimeError(str(img_err)) from None
+
+
+def _terminate_executor(executor: ProcessPoolExecutor) -> None:
+    # Shutting down does not stop a worker that is stuck in Kaleido, so the
+    # workers are terminated.
+    for process in list((getattr(executor, "_processes", None) or {}).values()):
+        process.terminate()
+    executor.shutdown(wait=False, cancel_futures=True)
+
+
+class ChartRenderer:
+    """
+    A bounded pool of worker processes rendering Plotly figures with Kaleido.
+
+    At most `max_workers` charts render at once and at most `queue_limit` more
+    wait for a worker; `render` raises ChartRenderBusyError beyond that.
+    """
+
+    def __init__(
+        self,
+        max_workers: int = DEFAULT_RENDER_WORKERS,
+        queue_limit: int = DEFAULT_RENDER_QUEUE_LIMIT,
+        timeout_seconds: float = DEFAULT_RENDER_TIMEOUT_SECONDS,
+    ):
+        if max_workers <= 0:
+            raise ValueError("max_workers must be a positive integer.")
+        if queue_limit < 0:
+            raise ValueError("queue_limit cannot be negative.")
+        self.max_workers = max_workers
+        self.queue_limit = queue_limit
+        self.timeout_seconds = timeout_seconds
+        self._executor: Optional[ProcessPoolExecutor] = None
+        self._in_flight = 0
+        # Renders still running on each pool, including retired ones.
+        self._executor_in_flight: Dict[ProcessPoolExecutor, int] = {}
+        self._retired: set = set()
+        self._lock = threading.Lock()
+
+    def start(self) -> None:
+        """Starts the worker processes (and their Kaleido instances) if needed."""
+        with self._lock:
+            self._ensure_executor_locked()
+
+    def _ensure_executor_locked(self) -> ProcessPoolExecutor:
+        if self._executor is None:
+            # Workers are spawned rather than forked: the agent process runs
+            # many threads, which fork does not copy safely.
+            self._executor = ProcessPoolExecutor(
+                max_workers=self.max_workers,
+                mp_context=multiprocessing.get_context("spawn"),
+                initializer=_warm_worker,
+            )
+            # Process pools start workers on demand; submitting one no-op per
+            # worker starts (and warms) all of them now.
+            for _ in range(self.max_workers):
+                self._executor.submit(int)
+            log.info(
+                "[ChartRenderer] Started %d chart rendering worker(s).",
+                self.max_workers,
+            )
+        return self._executor
+
+    def _retire(self, executor: ProcessPoolExecutor, reason: str) -> None:
+        """
+        Stops sending renders to `executor`; later renders start a new pool.
+        The retired pool is terminated once the renders still running on it
+        have finished or timed out, so they are not broken by another render's
+        timeout.
+        """
+        with self._lock:
+            if self._executor is executor:
+                self._executor = None
+                log.warning(
+                    "[ChartRenderer] Replacing chart rendering workers: %s", reason
+                )
+            self._retired.add(executor)
+            idle = not self._executor_in_flight.get(executor)
+        if idle:
+            self._terminate_retired(executor)
+
+    def _terminate_retired(self, executor: ProcessPoolExecutor) -> None:
+        with self._lock:
+            if executor not in self._retired or self._executor_in_flight.get(
+                executor
+            ):
+                return
+            self._retired.discard(executor)
+            self._executor_in_flight.pop(executor, None)
+        _terminate_executor(executor)
+
+    async def render(self, figure_config: Dict[str, Any], output_format: str) -> bytes:
+        """
+        Renders a Plotly figure config to image bytes in a worker process.
+
+        Raises:
+            ChartRenderBusyError: If the render queue is full.
+            TimeoutError: If rendering takes longer than `timeout_seconds`.
+            ValueError: If the config is not a valid Plotly figure.
+            RuntimeError: If Kaleido fails to render the figure.
+        """
+        with self._lock:
+            if self._in_flight >= self.max_workers + self.queue_limit:
+                raise ChartRenderBusyError(
+                    f"Chart rendering is busy ({self._in_flight} charts rendering or "
+                    "queued). Try again shortly."
+                )
+            self._in_flight += 1
+            executor = self._ensure_executor_locked()
+            self._executor_in_flight[executor] = (
+                self._executor_in_flight.get(executor, 0) + 1
+            )
+        try:
+            future = executor.submit(_render_in_worker, figure_config, output_format)
+            return await asyncio.wait_for(
+                asyncio.wrap_future(future), timeout=self.timeout_seconds
+            )
+        except asyncio.TimeoutError as e:
+            self._retire(executor, "render timed out")
+            raise TimeoutError(
+                f"Chart rendering did not complete within {self.timeout_seconds} seconds."
+            ) from e
+        except BrokenProcessPool as e:
+            self._retire(executor, "a worker process exited")
+            raise RuntimeError(f"Chart rendering worker failed: {e}") from e
+        finally:
+            with self._lock:
+                self._in_flight -= 1
+                remaining = self._executor_in_flight.pop(executor, 0) - 1
+                if remaining > 0:
+                    self._executor_in_flight[executor] = remaining
+                retired_and_idle = executor in self._retired and remaining <= 0
+            if retired_and_idle:
+                self._terminate_retired(executor)
+
+    def shutdown(self) -> None:
+        """Stops the worker processes."""
+        with self._lock:
+            executor, self._executor = self._executor, None
+            retired, self._retired = self._retired, set()
+            self._executor_in_flight.clear()
+        for retired_executor in retired:
+            _terminate_executor(retired_executor)
+        if executor is not None:
+            executor.shutdown(wait=False, cancel_futures=True)
+
+
+# Agents in one process share a renderer when their rendering settings match;
+# a renderer is stopped when the last agent that acquired it releases it.
+_chart_renderers: Dict[Tuple[int, int, float], ChartRenderer] = {}
+_chart_renderer_users: Dict[Tuple[int, int, float], int] = {}
+_chart_renderers_lock = threading.Lock()
+
+
+def _renderer_settings(config: Optional[Dict[str, Any]]) -> Tuple[int, int, float]:
+    config = config or {}
+    return (
+        int(config.get("render_workers", DEFAULT_RENDER_WORKERS)),
+        int(config.get("render_queue_limit", DEFAULT_RENDER_QUEUE_LIMIT)),
+        float(config.get("render_timeout_seconds", DEFAULT_RENDER_TIMEOUT_SECONDS)),
+    )
+
+
+def _get_or_create_locked(settings: Tuple[int, int, float]) -> ChartRenderer:
+    renderer = _chart_renderers.get(settings)
+    if renderer is None:
+        if _chart_renderers:
+            log.warning(
+                "[ChartRenderer] Chart rendering settings %s differ from those "
+                "already in use in this process (%s); starting a separate "
+                "rendering pool.",
+                settings,
+                ", ".join(str(other) for other in _chart_renderers),
+            )
+        max_workers, queue_limit, timeout_seconds = settings
+        renderer = ChartRenderer(max_workers, queue_limit, timeout_seconds)
+        _chart_renderers[settings] = renderer
+    return renderer
+
+
+def get_chart_renderer(config: Optional[Dict[str, Any]] = None) -> ChartRenderer:
+    """
+    Returns the chart renderer for the given rendering settings, creating it
+    if no agent in this process has acquired one with the same settings.
+
+    Args:
+        config: Tool configuration; `render_workers`, `render_queue_limit` and
+            `render_timeout_seconds` select the renderer.
+    """
+    with _chart_renderers_lock:
+        return _get_or_create_locked(_renderer_settings(config))
+
+
+def acquire_chart_renderer(config: Optional[Dict[str, Any]] = None) -> ChartRenderer:
+    """
+    Registers an agent as a user of the renderer for its settings. The worker
+    processes are not started until the first render.
+    """
+    settings = _renderer_settings(config)
+    with _chart_renderers_lock:
+        renderer = _get_or_create_locked(settings)
+        _chart_renderer_users[settings] = _chart_renderer_users.get(settings, 0) + 1
+        return renderer
+
+
+def release_chart_renderer(config: Optional[Dict[str, Any]] = None) -> None:
+    """
+    Releases an agent's hold on the renderer for its settings, stopping its
+    workers once no agent in this process uses it. Does nothing if no agent
+    acquired a renderer with these settings.
+    """
+    settings = _renderer_settings(config)
+    with _chart_renderers_lock:
+        if settings not in _chart_renderer_users:
+            return
+        users = _chart_renderer_users[settings] - 1
+        if users > 0:
+            _chart_renderer_users[settings] = users
+            return
+        _chart_renderer_users.pop(settings, None)
+        renderer = _chart_renderers.pop(settings, None)
+    if renderer is not None:
+        renderer.shutdown()
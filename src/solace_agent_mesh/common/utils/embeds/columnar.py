@@ -0,0 +1,281 @@
+"""
+A column-oriented representation of tabular data for the modifier chain.
+
+Row modifiers (select_cols, filter_rows_eq, slice_rows, select_fields,
+sort_rows) normally work on a list of dicts, building one dict per row. When
+NumPy is available, uniform CSV and JSON/YAML tables are instead held as one
+object array per column, so these modifiers become array operations and the
+list of dicts is only built if a later modifier or serializer needs it.
+
+Only tables that the list-of-dicts path would represent with the same keys in
+every row are converted; anything else (ragged or duplicate CSV columns,
+records with differing keys) stays on the list-of-dicts path, so results are
+identical either way.
+"""
+
+import csv
+import io
+import itertools
+from typing import Any, Callable, Dict, Iterable, List, Optional, Sequence, Tuple
+
+try:
+    import numpy as np
+
+    COLUMNAR_AVAILABLE = True
+except ImportError:
+    COLUMNAR_AVAILABLE = False
+
+CSV_PARSE_BATCH_ROWS = 8192
+
+
+def _object_array(values: Iterable[Any], count: int) -> "np.ndarray":
+    # fromiter keeps list/dict values as elements instead of adding dimensions.
+    return np.fromiter(values, dtype=object, count=count)
+
+
+class ColumnarTable:
+    """
+    An immutable table of named columns, each a NumPy object array.
+
+    Operations return new tables that share their source's arrays, so a table
+    may be cached and shared between modifier chains. Filtering and sorting
+    only record which source rows to keep (`row_index`); a column is gathered
+    when it is first read, so columns that are never read are never copied.
+    """
+
+    def __init__(
+        self,
+        columns: List[str],
+        arrays: Dict[str, "np.ndarray"],
+        num_rows: int,
+        string_valued: bool = False,
+        row_index: Optional["np.ndarray"] = None,
+    ):
+        self.columns = columns
+        self.arrays = arrays
+        self.num_rows = num_rows
+        # True when every value is a str, as with parsed CSV.
+        self.string_valued = string_valued
+        self.row_index = row_index
+        # Values derived from whole columns (str() views, sort orders),
+        # computed at most once per table.
+        self._derived: Dict[Tuple[Any, ...], "np.ndarray"] = {}
+
+    def __len__(self) -> int:
+        return self.num_rows
+
+    @classmethod
+    def from_csv(cls, text: str) -> Optional["ColumnarTable"]:
+        """
+        Parses CSV text with a header row, as csv.DictReader would.
+
+        Returns:
+            The table, or None if the CSV is malformed or not uniform (rows with
+            a different number of fields than the header, duplicate header
+            names), in which case it must be parsed as a list of dicts.
+        """
+        # Without quotes, NULs or lone carriage returns, every line is a record
+        # and every comma a separator, so the text can be split directly.
+        if '"' not in text and "\x00" not in text:
+            crlf_count = text.count("\r\n")
+            if text.count("\r") == crlf_count:
+                return cls._from_unquoted_csv(
+                    text.replace("\r\n", "\n") if crlf_count else text
+                )
+        reader = csv.reader(io.StringIO(text))
+        try:
+            header = next(reader, None)
+            if header is None:
+                return cls([], {}, 0, string_valued=True)
+            if not header or len(set(header)) != len(header):
+                return None
+            batches: List[List["np.ndarray"]] = [[] for _ in header]
+            num_rows = 0
+            while True:
+                batch = list(itertools.islice(reader, CSV_PARSE_BATCH_ROWS))
+                if not batch:
+                    break
+                # DictReader skips blank lines.
+                rows = [row for row in batch if row]
+                if any(len(row) != len(header) for row in rows):
+                    return None
+                for index, column_batches in enumerate(batches):
+                    column_batches.append(
+                        np.array([row[index] for row in rows], dtype=object)
+                    )
+                num_rows += len(rows)
+        except csv.Error:
+            return None
+
+        arrays = {
+            name: (
+                np.concatenate(column_batches)
+                if column_batches
+                else np.empty(0, dtype=object)
+            )
+            for name, column_batches in zip(header, batches)
+        }
+        return cls(list(header), arrays, num_rows, string_valued=True)
+
+    @classmethod
+    def _from_unquoted_csv(cls, text: str) -> Optional["ColumnarTable"]:
+        lines = text.split("\n")
+        if not lines[0]:
+            # Empty input or a blank header line; left to the csv module.
+            return None
+        lines = [line for line in lines if line]
+        header = lines[0].split(",")
+        if len(set(header)) != len(header):
+            return None
+        separators = len(header) - 1
+        if any(line.count(",") != separators for line in lines):
+            return None
+        num_rows = len(lines) - 1
+        if not num_rows:
+            arrays = {name: np.empty(0, dtype=object) for name in header}
+        else:
+            cells = np.array(",".join(lines[1:]).split(","), dtype=object)
+            cells = cells.reshape(num_rows, len(header))
+            arrays = {name: cells[:, index] for index, name in enumerate(header)}
+        return cls(header, arrays, num_rows, string_valued=True)
+
+    @classmethod
+    def from_records(cls, records: Any) -> Optional["ColumnarTable"]:
+        """
+        Builds a table from a list of dicts that all have the same keys in the
+        same order. Returns None for any other input.
+        """
+        if not isinstance(records, list) or not all(
+            isinstance(record, dict) for record in records
+        ):
+            return None
+        if not records:
+            return cls([], {}, 0)
+        columns = list(records[0].keys())
+        key_order = tuple(columns)
+        if any(tuple(record) != key_order for record in records):
+            return None
+        num_rows = len(records)
+        arrays = {
+            name: _object_array((record[name] for record in records), num_rows)
+            for name in columns
+        }
+        return cls(columns, arrays, num_rows)
+
+    def column(self, name: str) -> "np.ndarray":
+        """Returns the values of a column, one per row of this table."""
+        if self.row_index is None:
+            return self.arrays[name]
+        return self._derive(("rows", name), lambda: self.arrays[name][self.row_index])
+
+    def string_column(self, name: str) -> "np.ndarray":
+        """Returns the column with every value converted by str()."""
+        if self.string_valued:
+            return self.column(name)
+        return self._derive(
+            ("str", name),
+            lambda: _object_array(map(str, self.column(name)), self.num_rows),
+        )
+
+    def _derive(
+        self, key: Tuple[Any, ...], compute: Callable[[], "np.ndarray"]
+    ) -> "np.ndarray":
+        value = self._derived.get(key)
+        if value is None:
+            value = compute()
+            self._derived[key] = value
+        return value
+
+    def select(self, names: Sequence[str]) -> "ColumnarTable":
+        """Returns a table with only the given (existing) columns, in order."""
+        names = list(dict.fromkeys(names))
+        table = ColumnarTable(
+            names,
+            {name: self.arrays[name] for name in names},
+            self.num_rows,
+            self.string_valued,
+            self.row_index,
+        )
+        # Gathered and derived columns stay valid for the same rows.
+        table._derived = {
+            key: value for key, value in self._derived.items() if key[1] in names
+        }
+        return table
+
+    def slice(self, start: Optional[int], end: Optional[int]) -> "ColumnarTable":
+        """Returns rows[start:end] with Python slice semantics, without copying."""
+        num_rows = len(range(*slice(start, end).indices(self.num_rows)))
+        if self.row_index is not None:
+            return ColumnarTable(
+                self.columns,
+                self.arrays,
+                num_rows,
+                self.string_valued,
+                self.row_index[start:end],
+            )
+        return ColumnarTable(
+            self.columns,
+            {name: self.arrays[name][start:end] for name in self.columns},
+            num_rows,
+            self.string_valued,
+        )
+
+    def take(self, rows: "np.ndarray") -> "ColumnarTable":
+        """Returns the rows selected by a boolean mask or an index array."""
+        if rows.dtype == bool:
+            rows = np.flatnonzero(rows)
+        if self.row_index is not None:
+            rows = self.row_index[rows]
+        return ColumnarTable(
+            self.columns, self.arrays, len(rows), self.string_valued, rows
+        )
+
+    def sort_by(
+        self,
+        name: str,
+        key_func: Callable[[Any], Tuple[List[Any], bool]],
+        descending: bool = False,
+    ) -> "ColumnarTable":
+        """
+        Returns the rows stably sorted by a column, in the order
+        sorted(..., reverse=descending) would produce.
+
+        Args:
+            name: The column to sort by.
+            key_func: Maps the column to (sort keys, whether they are numeric).
+            descending: Sort in descending order.
+        """
+
+        def compute_order():
+            keys, numeric = key_func(self.column(name))
+            key_array = np.array(keys, dtype=float if numeric else object)
+            if not descending:
+                return np.argsort(key_array, kind="stable")
+            # Sorting the reversed keys keeps equal keys in their original order.
+            last = self.num_rows - 1
+            return last - np.argsort(key_array[::-1], kind="stable")[::-1]
+
+        return self.take(self._derive(("order", name, descending), compute_order))
+
+    def to_records(self) -> List[Dict[str, Any]]:
+        """Materializes the table as a list of dicts."""
+        if not self.columns:
+            return [{} for _ in range(self.num_rows)]
+        columns = self.columns
+        return [
+            dict(zip(columns, values))
+            for values in zip(*(self.column(name) for name in columns))
+        ]
+
+    def to_csv(self) -> str:
+        """
+        Serializes the table as CSV, exactly as the LIST_OF_DICTS to STRING
+        conversion would, without building a dict per row.
+        """
+        if not self.num_rows:
+            return ""
+        output_io = io.StringIO()
+        writer = csv.writer(output_io)
+        writer.writerow(self.columns)
+        writer.writerows(zip(*(self.column(name) for name in self.columns)))
+        return output_io.getvalue().strip("\r\n")
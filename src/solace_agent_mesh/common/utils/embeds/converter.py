@@ -303,6 +303,17 @@ def convert_data(
             elif target_format == DataFormat.JSON_OBJECT:
                 return current_data, DataFormat.JSON_OBJECT, None
 
+        elif current_format == DataFormat.COLUMNAR:
+            if target_format == DataFormat.STRING:
+                return current_data.to_csv(), DataFormat.STRING, None
+            elif target_format in (DataFormat.LIST_OF_DICTS, DataFormat.JSON_OBJECT):
+                log.debug(
+                    "%s Materializing %d columnar rows as a list of dicts.",
+                    log_id,
+                    current_data.num_rows,
+                )
+                return current_data.to_records(), target_format, None
+
         error_msg = f"Unsupported conversion requested: {current_format_name} -> {target_format.name}"
         log.warning("%s %s", log_id, error_msg)
         return current_data, current_format, error_msg
@@ -400,6 +411,8 @@ def serialize_data(
                 return f"[Serialization Error: {err_msg}]", err_msg
 
         elif target_fmt_lower == "csv":
+            if data_format == DataFormat.COLUMNAR:
+                return data.to_csv(), None
             list_of_dicts, _, error1 = convert_data(
                 data, data_format, DataFormat.LIST_OF_DICTS, log_id, original_mime_type
             )
@@ -12,6 +12,7 @@ from asteval import Interpreter
 import math, random
 
 from ....agent.utils.artifact_helpers import format_metadata_for_llm
+from ..artifact_cache import ArtifactCacheKey, load_artifact_cached
 from .constants import EMBED_CHAIN_DELIMITER
 
 
@@ -212,7 +213,8 @@ async def _evaluate_artifact_meta_embed(
             err_msg = f"Could not determine version for artifact_meta '{filename}'"
             return f"[Error: {err_msg}]", err_msg, 0
 
-        data_artifact_part = await artifact_service.load_artifact(
+        data_artifact_part, _ = await load_artifact_cached(
+            artifact_service,
             app_name=app_name,
             user_id=user_id,
             session_id=session_id,
@@ -234,7 +236,8 @@ async def _evaluate_artifact_meta_embed(
         custom_metadata_from_file = {}
         metadata_filename = f"{filename}.metadata.json"
         try:
-            companion_metadata_part = await artifact_service.load_artifact(
+            companion_metadata_part, _ = await load_artifact_cached(
+                artifact_service,
                 app_name=app_name,
                 user_id=user_id,
                 session_id=session_id,
@@ -279,32 +282,33 @@ async def _evaluate_artifact_meta_embed(
 
 async def _evaluate_artifact_content_embed(
     expression: str, context: Any, log_identifier: str, config: Optional[Dict] = None
-) -> Tuple[Optional[bytes], Optional[str], Optional[str]]:
+) -> Tuple[Optional[bytes], Optional[str], Optional[str], Optional[ArtifactCacheKey]]:
     """
     Evaluates an 'artifact_content' embed (late stage).
-    Loads the raw artifact content (bytes) and its mime type.
-    Returns (content_bytes, mime_type, None) on success,
-    or (None, None, error_message) on failure.
+    Loads the raw artifact content (bytes) and its mime type through the
+    process-wide artifact cache.
+    Returns (content_bytes, mime_type, None, cache_key) on success,
+    or (None, None, error_message, None) on failure.
     The 'expression' here should ONLY be the artifact specifier (filename[:version]).
     """
     if EMBED_CHAIN_DELIMITER in expression:
         err_msg = f"Internal Error: _evaluate_artifact_content_embed received expression containing chain delimiter ('{EMBED_CHAIN_DELIMITER}'). This indicates an upstream parsing issue. Expression: '{expression}'"
         log.error("%s %s", log_identifier, err_msg)
-        return None, None, err_msg
+        return None, None, err_msg, None
 
     if not isinstance(context, dict):
-        return None, None, "Invalid context for artifact_content embed"
+        return None, None, "Invalid context for artifact_content embed", None
 
     artifact_service = context.get("artifact_service")
     session_context = context.get("session_context")
     if not artifact_service or not session_context:
-        return None, None, "ArtifactService or session context not available"
+        return None, None, "ArtifactService or session context not available", None
 
     app_name = session_context.get("app_name")
     user_id = session_context.get("user_id")
     session_id = session_context.get("session_id")
     if not all([app_name, user_id, session_id]):
-        return None, None, "Missing required session identifiers in context"
+        return None, None, "Missing required session identifiers in context", None
 
     artifact_spec = expression.strip()
     parts = artifact_spec.split(":", 1)
@@ -313,7 +317,7 @@ async def _evaluate_artifact_content_embed(
     version_to_load: Optional[int] = None
 
     if not filename:
-        return None, None, "Filename missing for artifact_content"
+        return None, None, "Filename missing for artifact_content", None
 
     try:
         if version_str:
@@ -322,7 +326,7 @@ async def _evaluate_artifact_content_embed(
             except ValueError:
                 err_msg = f"Invalid version format in artifact specifier '{artifact_spec}'. Expected 'filename' or 'filename:integer_version'."
                 log.warning("%s %s", log_identifier, err_msg)
-                return None, None, err_msg
+                return None, None, err_msg, None
         else:
             versions = await artifact_service.list_versions(
                 app_name=app_name,
@@ -335,13 +339,20 @@ async def _evaluate_artifact_content_embed(
                     None,
                     None,
                     f"Artifact '{filename}' not found (no versions available)",
+                    None,
                 )
             version_to_load = max(versions)
 
         if version_to_load is None:
-            return None, None, f"Could not determine version for artifact '{filename}'"
+            return (
+                None,
+                None,
+                f"Could not determine version for artifact '{filename}'",
+                None,
+            )
 
-        artifact_part = await artifact_service.load_artifact(
+        artifact_part, cache_key = await load_artifact_cached(
+            artifact_service,
             app_name=app_name,
             user_id=user_id,
             session_id=session_id,
@@ -354,6 +365,7 @@ async def _evaluate_artifact_content_embed(
                 None,
                 None,
                 f"Artifact '{filename}' v{version_to_load} not found or empty",
+                None,
             )
 
         content_bytes = artifact_part.inline_data.data
@@ -365,12 +377,17 @@ async def _evaluate_artifact_content_embed(
         if limit_bytes >= 0 and len(content_bytes) > limit_bytes:
             error_msg = f"Artifact '{filename}' v{version_to_load} exceeds maximum size limit ({len(content_bytes)} > {limit_bytes} bytes)"
             log.warning("%s %s", log_identifier, error_msg)
-            return None, None, error_msg
+            return None, None, error_msg, None
 
-        return content_bytes, mime_type, None
+        return content_bytes, mime_type, None, cache_key
 
     except FileNotFoundError:
-        return None, None, f"Artifact '{filename}' v{version_str or 'latest'} not found"
+        return (
+            None,
+            None,
+            f"Artifact '{filename}' v{version_str or 'latest'} not found",
+            None,
+        )
     except Exception as e:
         log.exception(
             "%s Error loading artifact content for '%s' v%s: %s",
@@ -383,6 +400,7 @@ async def _evaluate_artifact_content_embed(
             None,
             None,
             f"Error loading artifact content for '{filename}' v{version_str or 'latest'}: {e}",
+            None,
         )
 
 
@@ -2,6 +2,7 @@
 Defines modifier implementation functions and their contracts.
 """
 
+import math
 import re
 from typing import Any, Callable, Dict, Optional, Tuple, List
 
@@ -25,7 +26,9 @@ except ImportError:
 
 from google.adk.artifacts import BaseArtifactService
 
+from .columnar import ColumnarTable
 from .types import DataFormat
+from ..artifact_cache import get_artifact_cache, load_artifact_cached
 
 
 def _apply_jsonpath(
@@ -59,7 +62,9 @@ def _apply_jsonpath(
         )
 
     try:
-        jsonpath_expr = jsonpath_parse(expression)
+        jsonpath_expr = get_artifact_cache().get_or_compile(
+            "jsonpath", expression, jsonpath_parse
+        )
         matches = [match.value for match in jsonpath_expr.find(current_data)]
         return matches, mime_type, None
     except Exception as e:
@@ -70,6 +75,57 @@ def _apply_jsonpath(
         )
 
 
+def _parse_filter_spec(
+    filter_spec: str,
+) -> Tuple[Optional[str], Optional[str], Optional[str]]:
+    """Parses 'column_name:value'. Returns (column, value, error_string)."""
+    parts = filter_spec.split(":", 1)
+    if len(parts) != 2:
+        return (
+            None,
+            None,
+            f"Invalid filter format '{filter_spec}'. Expected 'column_name:value'.",
+        )
+    return parts[0].strip(), parts[1].strip(), None
+
+
+def _parse_row_slice_spec(
+    slice_spec: str,
+) -> Tuple[int, Optional[int], Optional[str]]:
+    """Parses 'start:end'. Returns (start, end, error_string)."""
+    if ":" not in slice_spec:
+        return 0, None, f"Invalid slice format '{slice_spec}'. Expected 'start:end'."
+    start_str, end_str = (part.strip() for part in slice_spec.split(":", 1))
+    try:
+        start = int(start_str) if start_str else 0
+        end = int(end_str) if end_str else None
+    except (ValueError, TypeError) as e:
+        return 0, None, f"Invalid slice indices in '{slice_spec}': {e}"
+    return start, end, None
+
+
+def _parse_sort_spec(sort_spec: str) -> Tuple[str, bool]:
+    """Parses 'column_name[:asc|:desc]'. Returns (column, descending)."""
+    column, _, order = sort_spec.rpartition(":")
+    if column and order.strip().lower() in ("asc", "desc"):
+        return column.strip(), order.strip().lower() == "desc"
+    return sort_spec.strip(), False
+
+
+def _sort_keys(values: List[Any]) -> Tuple[List[Any], bool]:
+    """
+    Returns the keys that sort_rows orders a column by, and whether they are
+    numeric: floats if every value converts to a number, otherwise strings.
+    """
+    try:
+        numbers = [float(value) for value in values]
+    except (TypeError, ValueError, OverflowError):
+        numbers = None
+    if numbers is None or any(math.isnan(number) for number in numbers):
+        return [str(value) for value in values], False
+    return numbers, True
+
+
 def _apply_select_cols(
     current_data: List[Dict], cols_str: str, mime_type: Optional[str], log_id: str
 ) -> Tuple[Any, Optional[str], Optional[str]]:
@@ -150,14 +206,9 @@ def _apply_filter_rows_eq(
         return [], mime_type, None
 
     try:
-        parts = filter_spec.split(":", 1)
-        if len(parts) != 2:
-            return (
-                current_data,
-                mime_type,
-                f"Invalid filter format '{filter_spec}'. Expected 'column_name:value'.",
-            )
-        col_name, filter_value = parts[0].strip(), parts[1].strip()
+        col_name, filter_value, spec_error = _parse_filter_spec(filter_spec)
+        if spec_error:
+            return current_data, mime_type, spec_error
 
         header = list(current_data[0].keys())
         if col_name not in header:
@@ -201,26 +252,14 @@ def _apply_slice_rows(
         )
 
     try:
-        start_str, end_str = None, None
-        if ":" in slice_spec:
-            parts = slice_spec.split(":", 1)
-            start_str, end_str = parts[0].strip(), parts[1].strip()
-        else:
-            return (
-                current_data,
-                mime_type,
-                f"Invalid slice format '{slice_spec}'. Expected 'start:end'.",
-            )
-
-        start = int(start_str) if start_str else 0
-        end = int(end_str) if end_str else None
+        start, end, spec_error = _parse_row_slice_spec(slice_spec)
+        if spec_error:
+            return current_data, mime_type, spec_error
 
         sliced_data = current_data[start:end]
 
         return sliced_data, mime_type, None
 
-    except (ValueError, TypeError) as e:
-        return current_data, mime_type, f"Invalid slice indices in '{slice_spec}': {e}"
     except Exception as e:
         return current_data, mime_type, f"Error slicing rows '{slice_spec}': {e}"
 
@@ -432,6 +471,130 @@ def _apply_select_fields(
         return current_data, mime_type, f"Error selecting fields '{fields_str}': {e}"
 
 
+def _apply_sort_rows(
+    current_data: List[Dict], sort_spec: str, mime_type: Optional[str], log_id: str
+) -> Tuple[Any, Optional[str], Optional[str]]:
+    """
+    Sorts a list of dictionaries by a column. Values are compared as numbers
+    if every value in the column is numeric, otherwise as strings. The sort is
+    stable.
+
+    Args:
+        current_data: The input data (expected List[Dict]).
+        sort_spec: String in the format 'column_name[:asc|:desc]'.
+        mime_type: The original mime type (passed through).
+        log_id: Identifier for logging.
+
+    Returns:
+        Tuple: (result_data, original_mime_type, error_string)
+               result_data is List[Dict] containing the sorted rows.
+    """
+    if not isinstance(current_data, list) or (
+        current_data and not isinstance(current_data[0], dict)
+    ):
+        return (
+            current_data,
+            mime_type,
+            f"Input data for 'sort_rows' must be a list of dictionaries, got {type(current_data).__name__}.",
+        )
+
+    if not current_data:
+        return [], mime_type, None
+
+    try:
+        col_name, descending = _parse_sort_spec(sort_spec)
+        header = list(current_data[0].keys())
+        if col_name not in header:
+            return (
+                current_data,
+                mime_type,
+                f"Sort column '{col_name}' not found in data keys: {header}",
+            )
+
+        keys, _ = _sort_keys([row.get(col_name) for row in current_data])
+        order = sorted(
+            range(len(current_data)), key=keys.__getitem__, reverse=descending
+        )
+        return [current_data[i] for i in order], mime_type, None
+
+    except Exception as e:
+        return current_data, mime_type, f"Error sorting rows by '{sort_spec}': {e}"
+
+
+def _apply_select_cols_columnar(
+    current_data: ColumnarTable, cols_str: str, mime_type: Optional[str], log_id: str
+) -> Tuple[Any, Optional[str], Optional[str]]:
+    """Columnar implementation of `select_cols`."""
+    if not current_data.num_rows:
+        return current_data, mime_type, None
+    target_cols = [col.strip() for col in cols_str.split(",")]
+    for target_col in target_cols:
+        if target_col not in current_data.arrays:
+            return (
+                current_data,
+                mime_type,
+                f"Column '{target_col}' not found in data keys: {current_data.columns}",
+            )
+    return current_data.select(target_cols), mime_type, None
+
+
+def _apply_filter_rows_eq_columnar(
+    current_data: ColumnarTable,
+    filter_spec: str,
+    mime_type: Optional[str],
+    log_id: str,
+) -> Tuple[Any, Optional[str], Optional[str]]:
+    """Columnar implementation of `filter_rows_eq`."""
+    if not current_data.num_rows:
+        return current_data, mime_type, None
+    col_name, filter_value, spec_error = _parse_filter_spec(filter_spec)
+    if spec_error:
+        return current_data, mime_type, spec_error
+    if col_name not in current_data.arrays:
+        return (
+            current_data,
+            mime_type,
+            f"Filter column '{col_name}' not found in data keys: {current_data.columns}",
+        )
+    mask = current_data.string_column(col_name) == filter_value
+    return current_data.take(mask), mime_type, None
+
+
+def _apply_slice_rows_columnar(
+    current_data: ColumnarTable, slice_spec: str, mime_type: Optional[str], log_id: str
+) -> Tuple[Any, Optional[str], Optional[str]]:
+    """Columnar implementation of `slice_rows`."""
+    start, end, spec_error = _parse_row_slice_spec(slice_spec)
+    if spec_error:
+        return current_data, mime_type, spec_error
+    return current_data.slice(start, end), mime_type, None
+
+
+def _apply_select_fields_columnar(
+    current_data: ColumnarTable, fields_str: str, mime_type: Optional[str], log_id: str
+) -> Tuple[Any, Optional[str], Optional[str]]:
+    """Columnar implementation of `select_fields`."""
+    target_fields = [field.strip() for field in fields_str.split(",")]
+    present = [field for field in target_fields if field in current_data.arrays]
+    return current_data.select(present), mime_type, None
+
+
+def _apply_sort_rows_columnar(
+    current_data: ColumnarTable, sort_spec: str, mime_type: Optional[str], log_id: str
+) -> Tuple[Any, Optional[str], Optional[str]]:
+    """Columnar implementation of `sort_rows`."""
+    if not current_data.num_rows:
+        return current_data, mime_type, None
+    col_name, descending = _parse_sort_spec(sort_spec)
+    if col_name not in current_data.arrays:
+        return (
+            current_data,
+            mime_type,
+            f"Sort column '{col_name}' not found in data keys: {current_data.columns}",
+        )
+    return current_data.sort_by(col_name, _sort_keys, descending), mime_type, None
+
+
 async def _apply_template(
     current_data: Any,
     template_spec: str,
@@ -517,7 +680,8 @@ async def _apply_template(
                 )
             template_version = max(versions)
 
-        template_part = await artifact_service.load_artifact(
+        template_part, template_cache_key = await load_artifact_cached(
+            artifact_service,
             app_name=app_name,
             user_id=user_id,
             session_id=session_id,
@@ -627,9 +791,12 @@ async def _apply_template(
                 len(render_context["items"]),
             )
 
-        intermediate_rendered_string = pystache.render(
-            raw_template_string, render_context
-        )
+        artifact_cache = get_artifact_cache()
+        parsed_template = artifact_cache.get_parsed(template_cache_key, "mustache")
+        if parsed_template is None:
+            parsed_template = pystache.parse(raw_template_string)
+            artifact_cache.put_parsed(template_cache_key, "mustache", parsed_template)
+        intermediate_rendered_string = pystache.render(parsed_template, render_context)
         log.debug(
             "%s [apply_to_template] Intermediate rendered string: %s",
             log_id,
@@ -702,9 +869,12 @@ MODIFIER_IMPLEMENTATIONS: Dict[
     "head": _apply_head,
     "tail": _apply_tail,
     "select_fields": _apply_select_fields,
+    "sort_rows": _apply_sort_rows,
     "apply_to_template": _apply_template,
 }
 
+# Modifiers with a "columnar_function" run it instead of "function" when the
+# data is in DataFormat.COLUMNAR, and the result stays columnar.
 MODIFIER_DEFINITIONS: Dict[str, Dict[str, Any]] = {
     "jsonpath": {
         "function": _apply_jsonpath,
@@ -713,16 +883,19 @@ MODIFIER_DEFINITIONS: Dict[str, Dict[str, Any]] = {
     },
     "select_cols": {
         "function": _apply_select_cols,
+        "columnar_function": _apply_select_cols_columnar,
         "accepts": [DataFormat.LIST_OF_DICTS],
         "produces": DataFormat.LIST_OF_DICTS,
     },
     "filter_rows_eq": {
         "function": _apply_filter_rows_eq,
+        "columnar_function": _apply_filter_rows_eq_columnar,
         "accepts": [DataFormat.LIST_OF_DICTS],
         "produces": DataFormat.LIST_OF_DICTS,
     },
     "slice_rows": {
         "function": _apply_slice_rows,
+        "columnar_function": _apply_slice_rows_columnar,
         "accepts": [DataFormat.LIST_OF_DICTS],
         "produces": DataFormat.LIST_OF_DICTS,
     },
@@ -748,6 +921,13 @@ MODIFIER_DEFINITIONS: Dict[str, Dict[str, Any]] = {
     },
     "select_fields": {
         "function": _apply_select_fields,
+        "columnar_function": _apply_select_fields_columnar,
+        "accepts": [DataFormat.LIST_OF_DICTS],
+        "produces": DataFormat.LIST_OF_DICTS,
+    },
+    "sort_rows": {
+        "function": _apply_sort_rows,
+        "columnar_function": _apply_sort_rows_columnar,
         "accepts": [DataFormat.LIST_OF_DICTS],
         "produces": DataFormat.LIST_OF_DICTS,
     },
@@ -20,10 +20,16 @@ from .converter import (
     serialize_data,
     _parse_string_to_list_of_dicts,
 )
+from .streaming import (
+    can_stream_artifact,
+    stream_modifier_prefix,
+    stream_stops_early,
+)
+from .columnar import COLUMNAR_AVAILABLE, ColumnarTable
+from ..artifact_cache import ArtifactCacheKey, get_artifact_cache
 from .types import DataFormat
 from ..mime_helpers import is_text_based_mime_type
 
-
 try:
     import yaml
     from .converter import PYYAML_AVAILABLE
@@ -43,7 +49,7 @@ def _log_data_state(
     data_size = "N/A"
     data_preview = "N/A"
 
-    if isinstance(data, (bytes, str, list)):
+    if isinstance(data, (bytes, str, list, ColumnarTable)):
         data_size = str(len(data))
     elif isinstance(data, dict):
         data_size = f"{len(data)} keys"
@@ -61,6 +67,8 @@ def _log_data_state(
         data_preview = f"List[{len(data)} items]"
         if data and isinstance(data[0], dict):
             data_preview += f" (First item keys: {list(data[0].keys())[:5]}{'...' if len(data[0].keys()) > 5 else ''})"
+    elif isinstance(data, ColumnarTable):
+        data_preview = f"Columnar[{data.num_rows} rows] (Columns: {data.columns[:5]}{'...' if len(data.columns) > 5 else ''})"
     elif isinstance(data, dict):
         data_preview = f"Dict[{len(data)} keys: {list(data.keys())[:5]}{'...' if len(data.keys()) > 5 else ''}]"
     else:
@@ -78,6 +86,45 @@ def _log_data_state(
     )
 
 
+def _parse_with_cache(
+    cache_key: Optional[ArtifactCacheKey],
+    kind: str,
+    parse: Callable[[str], Any],
+    text: str,
+) -> Any:
+    """Parses artifact text, reusing the cached result for the same version."""
+    if cache_key is None:
+        return parse(text)
+    cache = get_artifact_cache()
+    parsed = cache.get_parsed(cache_key, kind)
+    if parsed is None:
+        parsed = parse(text)
+        cache.put_parsed(cache_key, kind, parsed)
+    return parsed
+
+
+_NOT_COLUMNAR = object()
+
+
+def _parse_columnar_with_cache(
+    cache_key: Optional[ArtifactCacheKey],
+    kind: str,
+    build: Callable[[Any], Optional[ColumnarTable]],
+    source: Any,
+) -> Optional[ColumnarTable]:
+    """
+    Builds the columnar form of artifact data, reusing the cached result for
+    the same version. Returns None (also cached) if the data is not uniform.
+    """
+
+    def build_or_mark(value: Any) -> Any:
+        table = build(value)
+        return _NOT_COLUMNAR if table is None else table
+
+    table = _parse_with_cache(cache_key, kind, build_or_mark, source)
+    return None if table is _NOT_COLUMNAR else table
+
+
 async def _evaluate_artifact_content_embed_with_chain(
     artifact_spec_from_directive: str,
     modifiers_from_directive: List[Tuple[str, str]],
@@ -101,7 +148,7 @@ async def _evaluate_artifact_content_embed_with_chain(
     visited_artifacts = visited_artifacts or set()
     parsed_artifact_spec = artifact_spec_from_directive
 
-    loaded_content_bytes, original_mime_type, load_error = (
+    loaded_content_bytes, original_mime_type, load_error, cache_key = (
         await _evaluate_artifact_content_embed(
             parsed_artifact_spec, context, log_identifier, config
         )
@@ -132,7 +179,50 @@ async def _evaluate_artifact_content_embed_with_chain(
         current_format,
         original_mime_type,
     )
-    if is_text_based_mime_type(original_mime_type):
+
+    streamed = None
+    modifiers_consumed = 0
+    recursion_allowed = current_depth + 1 < (config or {}).get(
+        "gateway_recursive_embed_depth", 12
+    )
+    # Content without embed directives is unchanged by recursive resolution,
+    # so structures parsed from it can be cached against the artifact version.
+    content_is_static = can_stream_artifact(
+        loaded_content_bytes, original_mime_type, recursion_allowed
+    )
+    parse_cache_key = cache_key if content_is_static else None
+    starts_with_columnar = (
+        COLUMNAR_AVAILABLE
+        and bool(modifiers_from_directive)
+        and "columnar_function"
+        in MODIFIER_DEFINITIONS.get(modifiers_from_directive[0][0], {})
+    )
+    # Row modifiers that read the whole table are faster on cached columns
+    # than streamed a row at a time; streaming still wins when it stops early.
+    prefer_columnar = starts_with_columnar and not stream_stops_early(
+        original_mime_type, modifiers_from_directive
+    )
+    if modifiers_from_directive and content_is_static and not prefer_columnar:
+        streamed = stream_modifier_prefix(
+            loaded_content_bytes,
+            original_mime_type,
+            modifiers_from_directive,
+            log_identifier,
+        )
+
+    if streamed is not None:
+        current_data, current_format, modifiers_consumed, stream_error = streamed
+        if stream_error:
+            log.warning("%s %s", log_identifier, stream_error)
+            return f"[Error: {stream_error}]", stream_error, 0
+        _log_data_state(
+            log_identifier,
+            f"[Depth:{current_depth}] After Streaming Modifiers",
+            current_data,
+            current_format,
+            original_mime_type,
+        )
+    elif is_text_based_mime_type(original_mime_type):
         try:
             decoded_content = loaded_content_bytes.decode("utf-8")
             log.debug(
@@ -203,7 +293,7 @@ async def _evaluate_artifact_content_embed_with_chain(
             original_mime_type,
         )
 
-    if current_format == DataFormat.STRING and original_mime_type:
+    if streamed is None and current_format == DataFormat.STRING and original_mime_type:
         normalized_mime_type = original_mime_type.lower()
         log.debug(
             "%s [Depth:%d] Pre-parsing string content with MIME type: %s",
@@ -213,7 +303,9 @@ async def _evaluate_artifact_content_embed_with_chain(
         )
         if "json" in normalized_mime_type:
             try:
-                current_data = json.loads(current_data)
+                current_data = _parse_with_cache(
+                    parse_cache_key, "json", json.loads, current_data
+                )
                 current_format = DataFormat.JSON_OBJECT
                 log.info(
                     "%s [Depth:%d] Pre-parsed string as JSON_OBJECT.",
@@ -230,7 +322,9 @@ async def _evaluate_artifact_content_embed_with_chain(
         elif "yaml" in normalized_mime_type or "yml" in normalized_mime_type:
             if PYYAML_AVAILABLE:
                 try:
-                    current_data = yaml.safe_load(current_data)
+                    current_data = _parse_with_cache(
+                        parse_cache_key, "yaml", yaml.safe_load, current_data
+                    )
                     current_format = DataFormat.JSON_OBJECT
                     log.info(
                         "%s [Depth:%d] Pre-parsed string as YAML (now JSON_OBJECT).",
@@ -252,24 +346,74 @@ async def _evaluate_artifact_content_embed_with_chain(
                     original_mime_type,
                 )
         elif "csv" in normalized_mime_type:
-            parsed_data, error_msg = _parse_string_to_list_of_dicts(
-                current_data, original_mime_type, log_identifier
+            table = (
+                _parse_columnar_with_cache(
+                    parse_cache_key,
+                    "columnar_csv",
+                    ColumnarTable.from_csv,
+                    current_data,
+                )
+                if starts_with_columnar
+                else None
             )
-            if error_msg is None and parsed_data is not None:
-                current_data = parsed_data
-                current_format = DataFormat.LIST_OF_DICTS
+            if table is not None:
+                current_data = table
+                current_format = DataFormat.COLUMNAR
                 log.info(
-                    "%s [Depth:%d] Pre-parsed string as LIST_OF_DICTS from CSV.",
+                    "%s [Depth:%d] Pre-parsed string as COLUMNAR from CSV.",
                     log_identifier,
                     current_depth,
                 )
             else:
-                log.warning(
-                    "%s [Depth:%d] Failed to pre-parse as CSV despite MIME type '%s': %s. Content will be treated as STRING.",
+                parsed_data = (
+                    get_artifact_cache().get_parsed(parse_cache_key, "csv")
+                    if parse_cache_key
+                    else None
+                )
+                error_msg = None
+                if parsed_data is None:
+                    parsed_data, error_msg = _parse_string_to_list_of_dicts(
+                        current_data, original_mime_type, log_identifier
+                    )
+                    if (
+                        parse_cache_key
+                        and error_msg is None
+                        and parsed_data is not None
+                    ):
+                        get_artifact_cache().put_parsed(
+                            parse_cache_key, "csv", parsed_data
+                        )
+                if error_msg is None and parsed_data is not None:
+                    current_data = parsed_data
+                    current_format = DataFormat.LIST_OF_DICTS
+                    log.info(
+                        "%s [Depth:%d] Pre-parsed string as LIST_OF_DICTS from CSV.",
+                        log_identifier,
+                        current_depth,
+                    )
+                else:
+                    log.warning(
+                        "%s [Depth:%d] Failed to pre-parse as CSV despite MIME type '%s': %s. Content will be treated as STRING.",
+                        log_identifier,
+                        current_depth,
+                        original_mime_type,
+                        error_msg,
+                    )
+
+        if starts_with_columnar and current_format == DataFormat.JSON_OBJECT:
+            table = _parse_columnar_with_cache(
+                parse_cache_key,
+                "columnar_records",
+                ColumnarTable.from_records,
+                current_data,
+            )
+            if table is not None:
+                current_data = table
+                current_format = DataFormat.COLUMNAR
+                log.info(
+                    "%s [Depth:%d] Converted uniform records to COLUMNAR.",
                     log_identifier,
                     current_depth,
-                    original_mime_type,
-                    error_msg,
                 )
 
         _log_data_state(
@@ -280,8 +424,8 @@ async def _evaluate_artifact_content_embed_with_chain(
             original_mime_type,
         )
 
-    modifier_index = 0
-    for prefix, value in modifiers_from_directive:
+    modifier_index = modifiers_consumed
+    for prefix, value in modifiers_from_directive[modifiers_consumed:]:
         modifier_index += 1
         modifier_step_id = f"Modifier {modifier_index} ({prefix})"
 
@@ -294,6 +438,13 @@ async def _evaluate_artifact_content_embed_with_chain(
         modifier_func = modifier_def["function"]
         accepts_formats: List[DataFormat] = modifier_def["accepts"]
         produces_format: DataFormat = modifier_def["produces"]
+        if (
+            current_format == DataFormat.COLUMNAR
+            and "columnar_function" in modifier_def
+        ):
+            modifier_func = modifier_def["columnar_function"]
+            accepts_formats = [DataFormat.COLUMNAR]
+            produces_format = DataFormat.COLUMNAR
 
         log.info(
             "%s [Depth:%d][%s] Applying modifier: %s:%s (Accepts: %s, Produces: %s)",
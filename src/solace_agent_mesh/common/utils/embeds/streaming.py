@@ -0,0 +1,365 @@
+"""
+Streaming evaluation of line- and row-oriented modifier chains.
+
+The regular chain executor decodes the whole artifact, parses it (e.g. CSV into
+a list of dicts) and only then applies modifiers. For a leading run of
+modifiers that only look at one line or row at a time, this module instead
+decodes the artifact in chunks and pipes it through generators, so `head` and
+`slice_*` stop reading early and `tail` keeps only N lines in memory.
+
+Row modifiers validate against the first row of their input, as the
+materialized modifiers do, so results are identical to the regular executor
+for everything the chain reads. The one difference is that invalid UTF-8 or a
+ragged CSV row beyond the point where reading stopped is not reported. Cases
+the streaming path does not cover (embedded directives, negative slice bounds,
+JSON/YAML input, decode or CSV errors) are left to the regular executor.
+"""
+
+import codecs
+import csv
+import io
+import itertools
+import re
+from collections import deque
+from typing import Any, Iterable, Iterator, List, Optional, Tuple
+
+from solace_ai_connector.common.log import log
+
+from .constants import EMBED_DELIMITER_OPEN
+from .types import DataFormat
+from ..mime_helpers import is_text_based_mime_type
+
+STREAM_CHUNK_SIZE = 64 * 1024
+
+# Line boundaries recognised by str.splitlines().
+_SPLITLINES_BOUNDARIES = frozenset("\n\r\x0b\x0c\x1c\x1d\x1e\x85\u2028\u2029")
+_EMBED_OPEN_BYTES = EMBED_DELIMITER_OPEN.encode("utf-8")
+
+LINE_MODIFIERS = frozenset({"head", "tail", "grep", "slice_lines"})
+ROW_MODIFIERS = frozenset(
+    {"slice_rows", "select_cols", "filter_rows_eq", "select_fields"}
+)
+
+
+class StreamingModifierError(Exception):
+    """A modifier rejected its arguments or input; carries the modifier's error."""
+
+
+class _StreamingFallback(Exception):
+    """The streamed chain cannot reproduce the materialized result."""
+
+
+def iter_decoded_chunks(
+    data: bytes, chunk_size: int = STREAM_CHUNK_SIZE
+) -> Iterator[str]:
+    """Decodes UTF-8 bytes incrementally, `chunk_size` bytes at a time."""
+    decoder = codecs.getincrementaldecoder("utf-8")()
+    view = memoryview(data)
+    for offset in range(0, len(view), chunk_size):
+        text = decoder.decode(view[offset : offset + chunk_size])
+        if text:
+            yield text
+    text = decoder.decode(b"", final=True)
+    if text:
+        yield text
+
+
+def iter_lines(chunks: Iterable[str], newline_only: bool = False) -> Iterator[str]:
+    """
+    Splits a stream of text chunks into lines, keeping line endings.
+
+    By default the result matches `"".join(chunks).splitlines(keepends=True)`;
+    with `newline_only` it matches iterating over `io.StringIO`, which is how
+    the csv module reads the materialized string.
+    """
+    pending = ""
+    for chunk in chunks:
+        buffer = pending + chunk
+        if newline_only:
+            lines = buffer.split("\n")
+            pending = lines.pop()
+            for line in lines:
+                yield line + "\n"
+            continue
+        lines = buffer.splitlines(True)
+        last = lines.pop()
+        # A trailing "\r" may be the first half of a "\r\n" split across chunks.
+        if last[-1] in _SPLITLINES_BOUNDARIES and last[-1] != "\r":
+            lines.append(last)
+            pending = ""
+        else:
+            pending = last
+        yield from lines
+    if pending:
+        yield pending
+
+
+def _parse_count(n_str: str, name: str) -> int:
+    try:
+        n = int(n_str.strip())
+    except (ValueError, TypeError) as e:
+        raise StreamingModifierError(
+            f"Invalid {name.lower()} count N '{n_str}': {e}"
+        ) from e
+    if n < 0:
+        raise StreamingModifierError(f"{name} count N cannot be negative.")
+    return n
+
+
+def _parse_slice(slice_spec: str) -> Tuple[int, Optional[int]]:
+    if ":" not in slice_spec:
+        raise StreamingModifierError(
+            f"Invalid slice format '{slice_spec}'. Expected 'start:end'."
+        )
+    start_str, end_str = (part.strip() for part in slice_spec.split(":", 1))
+    try:
+        start = int(start_str) if start_str else 0
+        end = int(end_str) if end_str else None
+    except (ValueError, TypeError) as e:
+        raise StreamingModifierError(
+            f"Invalid slice indices in '{slice_spec}': {e}"
+        ) from e
+    if start < 0 or (end is not None and end < 0):
+        raise _StreamingFallback("negative slice bounds need the full input")
+    return start, end
+
+
+def _slice(items: Iterator, slice_spec: str) -> Iterator:
+    start, end = _parse_slice(slice_spec)
+    return itertools.islice(items, start, end)
+
+
+def _head(lines: Iterator[str], n_str: str) -> Iterator[str]:
+    return itertools.islice(lines, _parse_count(n_str, "Head"))
+
+
+def _tail(lines: Iterator[str], n_str: str) -> Iterator[str]:
+    n = _parse_count(n_str, "Tail")
+
+    def generate():
+        if n:
+            yield from deque(lines, maxlen=n)
+
+    return generate()
+
+
+def _grep(lines: Iterator[str], pattern: str) -> Iterator[str]:
+    try:
+        regex = re.compile(pattern)
+    except re.error as e:
+        raise StreamingModifierError(f"Invalid regex pattern '{pattern}': {e}") from e
+    return filter(regex.search, lines)
+
+
+def _peek(rows: Iterator[dict]) -> Tuple[Optional[dict], Iterator[dict]]:
+    first = next(rows, None)
+    if first is None:
+        return None, iter(())
+    return first, itertools.chain((first,), rows)
+
+
+def _select_cols(rows: Iterator[dict], cols_str: str) -> Iterator[dict]:
+    first, all_rows = _peek(rows)
+    if first is None:
+        return all_rows
+    header = list(first.keys())
+    target_cols = [col.strip() for col in cols_str.split(",")]
+    for target_col in target_cols:
+        if target_col not in header:
+            raise StreamingModifierError(
+                f"Column '{target_col}' not found in data keys: {header}"
+            )
+    return ({col: row.get(col) for col in target_cols} for row in all_rows)
+
+
+def _filter_rows_eq(rows: Iterator[dict], filter_spec: str) -> Iterator[dict]:
+    first, all_rows = _peek(rows)
+    if first is None:
+        return all_rows
+    parts = filter_spec.split(":", 1)
+    if len(parts) != 2:
+        raise StreamingModifierError(
+            f"Invalid filter format '{filter_spec}'. Expected 'column_name:value'."
+        )
+    col_name, filter_value = parts[0].strip(), parts[1].strip()
+    header = list(first.keys())
+    if col_name not in header:
+        raise StreamingModifierError(
+            f"Filter column '{col_name}' not found in data keys: {header}"
+        )
+    return (row for row in all_rows if str(row.get(col_name)) == filter_value)
+
+
+def _select_fields(rows: Iterator[dict], fields_str: str) -> Iterator[dict]:
+    target_fields = [field.strip() for field in fields_str.split(",")]
+    return (
+        {field: row.get(field) for field in target_fields if field in row}
+        for row in rows
+    )
+
+
+_LINE_STEPS: dict = {
+    "head": _head,
+    "tail": _tail,
+    "grep": _grep,
+    "slice_lines": _slice,
+}
+_ROW_STEPS: dict = {
+    "slice_rows": _slice,
+    "select_cols": _select_cols,
+    "filter_rows_eq": _filter_rows_eq,
+    "select_fields": _select_fields,
+}
+
+
+def _iter_csv_text(rows: Iterator[dict]) -> Iterator[str]:
+    """
+    Re-serializes rows as CSV text in chunks, matching the LIST_OF_DICTS to
+    STRING conversion (header from the first row, outer CR/LF stripped).
+    """
+    first, all_rows = _peek(rows)
+    if first is None:
+        return
+    output_io = io.StringIO()
+    writer = csv.DictWriter(output_io, fieldnames=list(first.keys()))
+    writer.writeheader()
+    held = ""
+    for row in all_rows:
+        writer.writerow(row)
+        if output_io.tell() >= STREAM_CHUNK_SIZE:
+            text = held + output_io.getvalue()
+            output_io.seek(0)
+            output_io.truncate()
+            stripped = text.rstrip("\r\n")
+            held = text[len(stripped) :]
+            if stripped:
+                yield stripped
+    text = (held + output_io.getvalue()).rstrip("\r\n")
+    if text:
+        yield text
+
+
+def _streamable_prefix(
+    modifiers: List[Tuple[str, str]], rows_first: bool
+) -> List[Tuple[str, str]]:
+    prefix = []
+    in_rows = rows_first
+    for prefix_name, value in modifiers:
+        if in_rows and prefix_name in ROW_MODIFIERS:
+            prefix.append((prefix_name, value))
+        elif prefix_name in LINE_MODIFIERS:
+            in_rows = False
+            prefix.append((prefix_name, value))
+        else:
+            break
+    return prefix
+
+
+def stream_stops_early(
+    mime_type: Optional[str], modifiers: List[Tuple[str, str]]
+) -> bool:
+    """
+    True if the streamable prefix of the chain stops reading the artifact
+    before its end (`head`, or a slice with a non-negative end bound).
+    """
+    is_csv = "csv" in (mime_type or "").lower()
+    for name, value in _streamable_prefix(modifiers, rows_first=is_csv):
+        if name == "head":
+            return True
+        if name in ("slice_rows", "slice_lines"):
+            end_str = value.split(":", 1)[1].strip() if ":" in value else ""
+            if end_str.isdigit():
+                return True
+    return False
+
+
+def stream_modifier_prefix(
+    content: bytes,
+    mime_type: Optional[str],
+    modifiers: List[Tuple[str, str]],
+    log_identifier: str,
+) -> Optional[Tuple[Any, DataFormat, int, Optional[str]]]:
+    """
+    Applies the longest leading run of streamable modifiers to raw artifact bytes.
+
+    The caller must only use this when the artifact content would not be
+    changed by recursive embed resolution (see `can_stream_artifact`).
+
+    Returns:
+        None if the chain must be evaluated by the regular executor, otherwise
+        a tuple (data, data_format, modifiers_consumed, error). On error the
+        tuple carries the failing modifier's message, in the same form the
+        regular executor would report.
+    """
+    normalized_mime_type = (mime_type or "").lower()
+    if any(kind in normalized_mime_type for kind in ("json", "yaml", "yml")):
+        return None
+    is_csv = "csv" in normalized_mime_type
+
+    prefix = _streamable_prefix(modifiers, rows_first=is_csv)
+    if not prefix:
+        return None
+
+    name = None
+    try:
+        if is_csv:
+            stream: Iterator = csv.DictReader(
+                iter_lines(iter_decoded_chunks(content), newline_only=True)
+            )
+            stream_format = DataFormat.LIST_OF_DICTS
+        else:
+            stream = iter_lines(iter_decoded_chunks(content))
+            stream_format = DataFormat.STRING
+
+        for name, value in prefix:
+            if name in LINE_MODIFIERS:
+                if stream_format == DataFormat.LIST_OF_DICTS:
+                    stream = iter_lines(_iter_csv_text(stream))
+                    stream_format = DataFormat.STRING
+                step = _LINE_STEPS[name]
+            else:
+                step = _ROW_STEPS[name]
+            stream = step(stream, value)
+
+        if stream_format == DataFormat.STRING:
+            result: Any = "".join(stream)
+        else:
+            result = list(stream)
+    except StreamingModifierError as e:
+        return None, None, len(prefix), f"Error applying modifier '{name}': {e}"
+    except _StreamingFallback as e:
+        log.debug(
+            "%s Falling back to materialized modifier chain: %s", log_identifier, e
+        )
+        return None
+    except (UnicodeDecodeError, csv.Error, ValueError) as e:
+        log.debug(
+            "%s Streaming modifier chain failed (%s); falling back to materialized chain.",
+            log_identifier,
+            e,
+        )
+        return None
+
+    log.info(
+        "%s Streamed %d modifier(s) (%s) over %d bytes without materializing the artifact.",
+        log_identifier,
+        len(prefix),
+        ", ".join(name for name, _ in prefix),
+        len(content),
+    )
+    return result, stream_format, len(prefix), None
+
+
+def can_stream_artifact(
+    content: bytes, mime_type: Optional[str], recursion_allowed: bool
+) -> bool:
+    """
+    True if the chain executor may skip decoding and recursive resolution of an
+    artifact: it is text, contains no embed directives, and recursion would not
+    have hit the depth limit.
+    """
+    return (
+        recursion_allowed
+        and is_text_based_mime_type(mime_type)
+        and _EMBED_OPEN_BYTES not in content
+    )
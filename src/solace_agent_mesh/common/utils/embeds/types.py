@@ -12,3 +12,4 @@ class DataFormat(Enum):
     STRING = auto()
     JSON_OBJECT = auto()
     LIST_OF_DICTS = auto()
+    COLUMNAR = auto()
@@ -0,0 +1,746 @@
+"""
+A lightweight, dependency-free metrics registry for SAM agents and gateways.
+
+Counters, gauges and histograms are kept in a process-wide `MetricsRegistry`
+and can be rendered in the Prometheus text exposition format or as a plain
+dict for publication on the SAM events topic. Updating a metric is a dict
+lookup and a few additions under a lock, so instrumentation can stay enabled
+in production; values that are expensive to track on every change (active
+tasks, queue depths) are gauges read from a callback only when the metrics are
+collected.
+
+`ComponentMetrics` binds the standard SAM metrics to one component, and
+`monitor_event_loop_lag` samples how late a component's event loop runs its
+timers.
+"""
+
+import asyncio
+import bisect
+import functools
+import math
+import threading
+import time
+from contextlib import contextmanager
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import (
+    Any,
+    Callable,
+    Collection,
+    Dict,
+    Iterator,
+    List,
+    Optional,
+    Sequence,
+    Tuple,
+)
+
+from solace_ai_connector.common.log import log
+
+PROMETHEUS_CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+DEFAULT_LATENCY_BUCKETS: Tuple[float, ...] = (
+    0.001,
+    0.0025,
+    0.005,
+    0.01,
+    0.025,
+    0.05,
+    0.1,
+    0.25,
+    0.5,
+    1.0,
+    2.5,
+    5.0,
+    10.0,
+    30.0,
+    60.0,
+)
+TOKEN_RATE_BUCKETS: Tuple[float, ...] = (
+    1.0,
+    5.0,
+    10.0,
+    25.0,
+    50.0,
+    100.0,
+    200.0,
+    500.0,
+    1000.0,
+)
+
+
+def _format_value(value: float) -> str:
+    if math.isnan(value):
+        return "NaN"
+    if math.isinf(value):
+        return "+Inf" if value > 0 else "-Inf"
+    if float(value).is_integer():
+        return str(int(value))
+    return repr(float(value))
+
+
+def _escape_label_value(value: str) -> str:
+    return value.replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _format_labels(labels: Sequence[Tuple[str, str]]) -> str:
+    if not labels:
+        return ""
+    return (
+        "{"
+        + ",".join(f'{name}="{_escape_label_value(value)}"' for name, value in labels)
+        + "}"
+    )
+
+
+class _CounterChild:
+    def __init__(self, lock: threading.Lock):
+        self._lock = lock
+        self.value = 0.0
+
+    def inc(self, amount: float = 1.0) -> None:
+        if amount < 0:
+            raise ValueError("Counters can only be incremented.")
+        with self._lock:
+            self.value += amount
+
+
+class _GaugeChild:
+    def __init__(self, lock: threading.Lock):
+        self._lock = lock
+        self._value = 0.0
+        self._function: Optional[Callable[[], float]] = None
+
+    def set(self, value: float) -> None:
+        with self._lock:
+            self._value = value
+
+    def inc(self, amount: float = 1.0) -> None:
+        with self._lock:
+            self._value += amount
+
+    def dec(self, amount: float = 1.0) -> None:
+        with self._lock:
+            self._value -= amount
+
+    def set_function(self, function: Callable[[], float]) -> None:
+        """Reads the gauge's value from `function` whenever it is collected."""
+        self._function = function
+
+    @property
+    def value(self) -> float:
+        function = self._function
+        if function is not None:
+            try:
+                return float(function())
+            except Exception:
+                return math.nan
+        return self._value
+
+
+class _HistogramChild:
+    def __init__(self, lock: threading.Lock, buckets: Tuple[float, ...]):
+        self._lock = lock
+        self._buckets = buckets
+        # One count per bucket, plus the +Inf bucket; not cumulative.
+        self.bucket_counts = [0] * (len(buckets) + 1)
+        self.sum = 0.0
+        self.count = 0
+
+    def observe(self, value: float) -> None:
+        index = bisect.bisect_left(self._buckets, value)
+        with self._lock:
+            self.bucket_counts[index] += 1
+            self.sum += value
+            self.count += 1
+
+    @contextmanager
+    def time(self) -> Iterator[None]:
+        """Observes the wall-clock duration of the block, in seconds."""
+        started = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.observe(time.perf_counter() - started)
+
+
+class Metric:
+    """A named metric with zero or more labels; one child per label set."""
+
+    metric_type = "untyped"
+
+    def __init__(self, name: str, documentation: str, labelnames: Sequence[str] = ()):
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = tuple(labelnames)
+        self._lock = threading.Lock()
+        self._children: Dict[Tuple[str, ...], Any] = {}
+
+    def _new_child(self):
+        raise NotImplementedError
+
+    def labels(self, *values: Any, **kwargs: Any):
+        """Returns the child for a set of label values, creating it if needed."""
+        if kwargs:
+            if values:
+                raise ValueError("Pass label values positionally or by name, not both.")
+            values = tuple(kwargs[name] for name in self.labelnames)
+        if len(values) != len(self.labelnames):
+            raise ValueError(
+                f"Metric '{self.name}' expects labels {self.labelnames}, got {values}."
+            )
+        key = tuple(str(value) for value in values)
+        child = self._children.get(key)
+        if child is None:
+            with self._lock:
+                child = self._children.get(key)
+                if child is None:
+                    child = self._new_child()
+                    self._children[key] = child
+        return child
+
+    def remove_matching(
+        self, labels: Dict[str, str], keep: Collection[Tuple[str, ...]] = ()
+    ) -> None:
+        """
+        Removes every child whose labels include all of `labels`, except
+        those whose label values are in `keep`.
+        """
+        indexes = {
+            self.labelnames.index(name): str(value)
+            for name, value in labels.items()
+            if name in self.labelnames
+        }
+        if len(indexes) != len(labels):
+            return
+        with self._lock:
+            for key in list(self._children):
+                if key not in keep and all(
+                    key[index] == value for index, value in indexes.items()
+                ):
+                    del self._children[key]
+
+    def children(self) -> List[Tuple[Tuple[Tuple[str, str], ...], Any]]:
+        with self._lock:
+            items = list(self._children.items())
+        return [(tuple(zip(self.labelnames, key)), child) for key, child in items]
+
+
+class Counter(Metric):
+    """
+    A monotonically increasing value, such as bytes written. Rendered with a
+    `_total` suffix, so the name should not include one.
+    """
+
+    metric_type = "counter"
+
+    def _new_child(self) -> _CounterChild:
+        return _CounterChild(self._lock)
+
+
+class Gauge(Metric):
+    """A value that can go up and down, such as the number of active tasks."""
+
+    metric_type = "gauge"
+
+    def _new_child(self) -> _GaugeChild:
+        return _GaugeChild(self._lock)
+
+
+class Histogram(Metric):
+    """Counts observations, such as durations, in configurable buckets."""
+
+    metric_type = "histogram"
+
+    def __init__(
+        self,
+        name: str,
+        documentation: str,
+        labelnames: Sequence[str] = (),
+        buckets: Sequence[float] = DEFAULT_LATENCY_BUCKETS,
+    ):
+        super().__init__(name, documentation, labelnames)
+        self.buckets = tuple(sorted(buckets))
+
+    def _new_child(self) -> _HistogramChild:
+        return _HistogramChild(self._lock, self.buckets)
+
+
+class _StatsSource:
+    """Refreshes a gauge from a stats dict kept by some other object."""
+
+    def __init__(
+        self,
+        gauge: Gauge,
+        function: Callable[[], Dict[str, Any]],
+        labels: Optional[Dict[str, str]],
+        group_label: Optional[str],
+    ):
+        self.gauge = gauge
+        self.function = function
+        self.labels = {name: str(value) for name, value in (labels or {}).items()}
+        self.group_label = group_label
+
+    def collect(self) -> None:
+        try:
+            stats = self.function()
+        except Exception as e:
+            log.debug("[Metrics] Could not collect '%s': %s", self.gauge.name, e)
+            return
+        groups = stats.items() if self.group_label else [(None, stats)]
+        base = tuple(self.labels.values())
+        current = set()
+        for group, values in groups:
+            prefix = base + ((str(group),) if self.group_label else ())
+            for stat, value in values.items():
+                if isinstance(value, (int, float)):
+                    key = prefix + (str(stat),)
+                    self.gauge.labels(*key).set(value)
+                    current.add(key)
+        # Drop the samples of groups and stats that are no longer reported.
+        self.gauge.remove_matching(self.labels, keep=current)
+
+
+class MetricsRegistry:
+    """A set of metrics that can be rendered together."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._metrics: Dict[str, Metric] = {}
+        self._stats_sources: Dict[
+            Tuple[str, Tuple[Tuple[str, str], ...]], _StatsSource
+        ] = {}
+
+    def _get_or_create(self, metric_class, name: str, *args, **kwargs) -> Metric:
+        metric = self._metrics.get(name)
+        if metric is None:
+            with self._lock:
+                metric = self._metrics.get(name)
+                if metric is None:
+                    metric = metric_class(name, *args, **kwargs)
+                    self._metrics[name] = metric
+        if type(metric) is not metric_class:
+            raise ValueError(
+                f"Metric '{name}' is already registered as a {metric.metric_type}."
+            )
+        return metric
+
+    def counter(
+        self, name: str, documentation: str, labelnames: Sequence[str] = ()
+    ) -> Counter:
+        """Returns the counter named `name`, registering it on first use."""
+        return self._get_or_create(Counter, name, documentation, labelnames)
+
+    def gauge(
+        self, name: str, documentation: str, labelnames: Sequence[str] = ()
+    ) -> Gauge:
+        """Returns the gauge named `name`, registering it on first use."""
+        return self._get_or_create(Gauge, name, documentation, labelnames)
+
+    def histogram(
+        self,
+        name: str,
+        documentation: str,
+        labelnames: Sequence[str] = (),
+        buckets: Sequence[float] = DEFAULT_LATENCY_BUCKETS,
+    ) -> Histogram:
+        """Returns the histogram named `name`, registering it on first use."""
+        return self._get_or_create(
+            Histogram, name, documentation, labelnames, buckets=buckets
+        )
+
+    def register_stats(
+        self,
+        name: str,
+        documentation: str,
+        stats_function: Callable[[], Dict[str, Any]],
+        labels: Optional[Dict[str, str]] = None,
+        group_label: Optional[str] = None,
+    ) -> None:
+        """
+        Exports the numeric values of the dict returned by `stats_function`
+        as gauge `name`, one sample per key in a `stat` label. The function is
+        called only when the metrics are collected, so caches and queues that
+        already keep stats need no instrumentation on their hot path.
+
+        `labels` are added to every sample. With `group_label`, the function
+        returns one stats dict per group (e.g. per cache namespace) and the
+        group is reported in that label. Registering the same name and labels
+        again replaces the function.
+        """
+        source = _StatsSource(
+            self.gauge(
+                name,
+                documentation,
+                tuple(labels or ())
+                + ((group_label,) if group_label else ())
+                + ("stat",),
+            ),
+            stats_function,
+            labels,
+            group_label,
+        )
+        with self._lock:
+            self._stats_sources[(name, tuple(source.labels.items()))] = source
+
+    def _collect_stats(self) -> None:
+        with self._lock:
+            sources = list(self._stats_sources.values())
+        for source in sources:
+            source.collect()
+
+    def remove_labels(self, **labels: str) -> None:
+        """
+        Removes the children of every metric, and the stats sources, whose
+        labels match `labels`.
+        """
+        labels = {name: str(value) for name, value in labels.items()}
+        with self._lock:
+            metrics = list(self._metrics.values())
+            for key, source in list(self._stats_sources.items()):
+                if labels.items() <= source.labels.items():
+                    del self._stats_sources[key]
+        for metric in metrics:
+            metric.remove_matching(labels)
+
+    def _sorted_metrics(self) -> List[Metric]:
+        with self._lock:
+            return [self._metrics[name] for name in sorted(self._metrics)]
+
+    def render_prometheus(self) -> str:
+        """Renders all metrics in the Prometheus text exposition format."""
+        self._collect_stats()
+        lines: List[str] = []
+        for metric in self._sorted_metrics():
+            # Counter samples carry the `_total` suffix, and the text format
+            # expects the HELP and TYPE lines to name the samples.
+            family = (
+                f"{metric.name}_total" if isinstance(metric, Counter) else metric.name
+            )
+            lines.append(f"# HELP {family} {metric.documentation}")
+            lines.append(f"# TYPE {family} {metric.metric_type}")
+            for labels, child in metric.children():
+                if isinstance(metric, Histogram):
+                    with metric._lock:
+                        counts = list(child.bucket_counts)
+                        total, count = child.sum, child.count
+                    cumulative = 0
+                    for bound, bucket_count in zip(
+                        metric.buckets + (math.inf,), counts
+                    ):
+                        cumulative += bucket_count
+                        bucket_labels = labels + (("le", _format_value(bound)),)
+                        lines.append(
+                            f"{metric.name}_bucket{_format_labels(bucket_labels)} "
+                            f"{cumulative}"
+                        )
+                    lines.append(
+                        f"{metric.name}_sum{_format_labels(labels)} {_format_value(total)}"
+                    )
+                    lines.append(f"{metric.name}_count{_format_labels(labels)} {count}")
+                else:
+                    lines.append(
+                        f"{family}{_format_labels(labels)} "
+                        f"{_format_value(child.value)}"
+                    )
+        return "\n".join(lines) + "\n"
+
+    def snapshot(self, **label_filter: str) -> Dict[str, Any]:
+        """
+        Returns the current values as a JSON-serializable dict, optionally
+        restricted to children whose labels include `label_filter`.
+        Histograms are reported as count, sum and cumulative bucket counts.
+        """
+        self._collect_stats()
+        result: Dict[str, Any] = {}
+        for metric in self._sorted_metrics():
+            samples = []
+            for labels, child in metric.children():
+                label_dict = dict(labels)
+                if any(
+                    label_dict.get(name) != str(value)
+                    for name, value in label_filter.items()
+                ):
+                    continue
+                sample: Dict[str, Any] = {"labels": label_dict}
+                if isinstance(metric, Histogram):
+                    with metric._lock:
+                        counts = list(child.bucket_counts)
+                        sample["count"] = child.count
+                        sample["sum"] = child.sum
+                    cumulative, buckets = 0, {}
+                    for bound, bucket_count in zip(
+                        metric.buckets + (math.inf,), counts
+                    ):
+                        cumulative += bucket_count
+                        buckets[_format_value(bound)] = cumulative
+                    sample["buckets"] = buckets
+                else:
+                    value = child.value
+                    sample["value"] = None if math.isnan(value) else value
+                samples.append(sample)
+            if samples:
+                result[metric.name] = {"type": metric.metric_type, "samples": samples}
+        return result
+
+
+_metrics_registry: Optional[MetricsRegistry] = None
+_metrics_registry_lock = threading.Lock()
+
+
+def get_metrics_registry() -> MetricsRegistry:
+    """Returns the process-wide metrics registry, creating it on first use."""
+    global _metrics_registry
+    if _metrics_registry is None:
+        with _metrics_registry_lock:
+            if _metrics_registry is None:
+                _metrics_registry = MetricsRegistry()
+    return _metrics_registry
+
+
+def record_artifact_io(
+    component_name: str,
+    direction: str,
+    num_bytes: int,
+    duration_seconds: Optional[float] = None,
+    registry: Optional[MetricsRegistry] = None,
+) -> None:
+    """
+    Counts artifact bytes read or written ("read"/"write") by a component and,
+    if given, observes how long the artifact service call took.
+    """
+    registry = registry or get_metrics_registry()
+    registry.counter(
+        "sam_artifact_io_bytes",
+        "Bytes of artifact content read from or written to the artifact service.",
+        ("component", "direction"),
+    ).labels(component_name, direction).inc(num_bytes)
+    if duration_seconds is not None:
+        registry.histogram(
+            "sam_artifact_io_duration_seconds",
+            "Duration of artifact service loads and saves.",
+            ("component", "direction"),
+        ).labels(component_name, direction).observe(duration_seconds)
+
+
+class ComponentMetrics:
+    """The standard SAM metrics of one agent or gateway, labelled with its name."""
+
+    def __init__(self, component_name: str, registry: Optional[MetricsRegistry] = None):
+        self.component_name = component_name
+        self.registry = registry or get_metrics_registry()
+        registry = self.registry
+        self.event_loop_lag = registry.histogram(
+            "sam_event_loop_lag_seconds",
+            "How much later than scheduled the component's event loop ran a timer.",
+            ("component",),
+        ).labels(component_name)
+        self.active_tasks = registry.gauge(
+            "sam_active_tasks",
+            "Tasks currently being processed by the component.",
+            ("component",),
+        ).labels(component_name)
+        self._queue_depth = registry.gauge(
+            "sam_queue_depth",
+            "Messages waiting in a component queue.",
+            ("component", "queue"),
+        )
+        self._callback_duration = registry.histogram(
+            "sam_callback_duration_seconds",
+            "Time spent in agent callbacks and other hot-path operations.",
+            ("component", "callback"),
+        )
+        self._tool_duration = registry.histogram(
+            "sam_tool_duration_seconds",
+            "Tool execution time, from invocation to result.",
+            ("component", "tool", "status"),
+        )
+        self._llm_tokens = registry.counter(
+            "sam_llm_tokens",
+            "LLM tokens used, by type (prompt, completion, cached).",
+            ("component", "type"),
+        )
+        self.llm_output_token_rate = registry.histogram(
+            "sam_llm_output_tokens_per_second",
+            "Completion tokens per second of each LLM response.",
+            ("component",),
+            buckets=TOKEN_RATE_BUCKETS,
+        ).labels(component_name)
+        self._stream_flushes = registry.counter(
+            "sam_stream_flushes",
+            "Flushes of streamed LLM text into partial status updates, by reason.",
+            ("component", "reason"),
+        )
+        self._stream_messages_saved = registry.counter(
+            "sam_stream_messages_saved",
+            "Streamed text chunks coalesced into another chunk's status update.",
+            ("component",),
+        ).labels(component_name)
+
+    def queue_depth(self, queue_name: str):
+        return self._queue_depth.labels(self.component_name, queue_name)
+
+    def time_callback(self, callback_name: str):
+        """Context manager observing the duration of a callback or operation."""
+        return self._callback_duration.labels(self.component_name, callback_name).time()
+
+    def observe_callback(self, callback_name: str, seconds: float) -> None:
+        self._callback_duration.labels(self.component_name, callback_name).observe(
+            seconds
+        )
+
+    def observe_tool(self, tool_name: str, seconds: float, status: str) -> None:
+        self._tool_duration.labels(self.component_name, tool_name, status).observe(
+            seconds
+        )
+
+    def record_llm_usage(
+        self,
+        prompt_tokens: int,
+        completion_tokens: int,
+        cached_tokens: int = 0,
+        duration_seconds: Optional[float] = None,
+    ) -> None:
+        """Counts the tokens of one LLM response and observes its output rate."""
+        name = self.component_name
+        if prompt_tokens:
+            self._llm_tokens.labels(name, "prompt").inc(prompt_tokens)
+        if completion_tokens:
+            self._llm_tokens.labels(name, "completion").inc(completion_tokens)
+            if duration_seconds and duration_seconds > 0:
+                self.llm_output_token_rate.observe(completion_tokens / duration_seconds)
+        if cached_tokens:
+            self._llm_tokens.labels(name, "cached").inc(cached_tokens)
+
+    def record_stream_flush(self, reason: str, chunk_count: int) -> None:
+        """Counts a flush of `chunk_count` buffered stream chunks as one message."""
+        self._stream_flushes.labels(self.component_name, reason).inc()
+        if chunk_count > 1:
+            self._stream_messages_saved.inc(chunk_count - 1)
+
+    def record_artifact_io(
+        self,
+        direction: str,
+        num_bytes: int,
+        duration_seconds: Optional[float] = None,
+    ) -> None:
+        record_artifact_io(
+            self.component_name,
+            direction,
+            num_bytes,
+            duration_seconds,
+            registry=self.registry,
+        )
+
+    def register_stats(
+        self,
+        name: str,
+        documentation: str,
+        stats_function: Callable[[], Dict[str, Any]],
+        group_label: Optional[str] = None,
+    ) -> None:
+        """Exports a stats dict of this component; see `MetricsRegistry.register_stats`."""
+        self.registry.register_stats(
+            name,
+            documentation,
+            stats_function,
+            labels={"component": self.component_name},
+            group_label=group_label,
+        )
+
+    def snapshot(self) -> Dict[str, Any]:
+        """Returns this component's metrics as a JSON-serializable dict."""
+        return self.registry.snapshot(component=self.component_name)
+
+    def remove(self) -> None:
+        """Drops this component's metrics, e.g. when the component stops."""
+        self.registry.remove_labels(component=self.component_name)
+
+
+def timed_method(operation_name: str):
+    """
+    Decorates an async method of a component with a `metrics` attribute
+    (`ComponentMetrics`) so its duration is observed as `operation_name`.
+    """
+
+    def decorator(method):
+        @functools.wraps(method)
+        async def wrapper(self, *args, **kwargs):
+            started = time.perf_counter()
+            try:
+                return await method(self, *args, **kwargs)
+            finally:
+                self.metrics.observe_callback(
+                    operation_name, time.perf_counter() - started
+                )
+
+        return wrapper
+
+    return decorator
+
+
+async def monitor_event_loop_lag(
+    histogram_child: _HistogramChild, interval_seconds: float
+) -> None:
+    """
+    Runs on an event loop until cancelled, observing how much later than
+    scheduled a timer of `interval_seconds` fires. Lag is caused by callbacks
+    that block the loop.
+    """
+    loop = asyncio.get_running_loop()
+    while True:
+        started = loop.time()
+        await asyncio.sleep(interval_seconds)
+        histogram_child.observe(max(0.0, loop.time() - started - interval_seconds))
+
+
+class _MetricsRequestHandler(BaseHTTPRequestHandler):
+    registry: MetricsRegistry
+
+    def do_GET(self):
+        if self.path.split("?", 1)[0] != "/metrics":
+            self.send_error(404)
+            return
+        body = self.registry.render_prometheus().encode("utf-8")
+        self.send_response(200)
+        self.send_header("Content-Type", PROMETHEUS_CONTENT_TYPE)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        pass
+
+
+_metrics_servers: Dict[Tuple[str, int], ThreadingHTTPServer] = {}
+_metrics_servers_lock = threading.Lock()
+
+
+def start_metrics_http_server(
+    port: int, host: str = "127.0.0.1", registry: Optional[MetricsRegistry] = None
+) -> ThreadingHTTPServer:
+    """
+    Serves the registry at http://host:port/metrics on a daemon thread.
+    Components in the same process share one server per address. The endpoint
+    is unauthenticated, so it listens on the loopback interface unless
+    another `host` is given.
+    """
+    with _metrics_servers_lock:
+        server = _metrics_servers.get((host, port))
+        if server is None:
+            handler = type(
+                "MetricsRequestHandler",
+                (_MetricsRequestHandler,),
+                {"registry": registry or get_metrics_registry()},
+            )
+            server = ThreadingHTTPServer((host, port), handler)
+            server.daemon_threads = True
+            threading.Thread(
+                target=server.serve_forever, name="SamMetricsHTTPServer", daemon=True
+            ).start()
+            _metrics_servers[(host, port)] = server
+            log.info(
+                "[Metrics] Serving Prometheus metrics at http://%s:%d/metrics",
+                host,
+                server.server_address[1],
+            )
+    return server
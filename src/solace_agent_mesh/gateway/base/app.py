@@ -84,6 +84,43 @@ BASE_GATEWAY_APP_SCHEMA: Dict[str, List[Dict[str, Any]]] = {
             "default": 10_000_000,  # 10MB
             "description": "Maximum allowed message size in bytes for messages published by the gateway.",
         },
+        {
+            "name": "task_context_max_entries",
+            "required": False,
+            "type": "integer",
+            "default": 50_000,
+            "description": "Maximum number of task contexts (and stream buffers) kept in memory. The least recently used context is evicted beyond this limit.",
+        },
+        {
+            "name": "task_context_ttl_seconds",
+            "required": False,
+            "type": "integer",
+            "default": 86400,
+            "description": "Time after which the context of a task that never completed is discarded.",
+        },
+        {
+            "name": "message_processor_max_concurrency",
+            "required": False,
+            "type": "integer",
+            "default": 16,
+            "description": "Maximum number of inbound A2A messages processed concurrently. Messages for the same task are always processed in order; set to 1 to process all messages serially.",
+        },
+        {
+            "name": "metrics",
+            "required": False,
+            "type": "object",
+            "default": {},
+            "description": (
+                "Runtime metrics settings: 'enabled' (default true), "
+                "'event_loop_lag_interval_seconds' (default 0.5), "
+                "'publish_interval_seconds' (publish snapshots on the SAM events "
+                "topic; default 0, disabled), 'prometheus_port' (serve "
+                "Prometheus metrics at /metrics on this port), 'prometheus_host' "
+                "(interface for that port; default 127.0.0.1) and, for the Web UI "
+                "gateway, 'webui_endpoint_enabled' (also serve the unauthenticated "
+                "/metrics route on the Web UI server; default false)."
+            ),
+        },
         # --- Default User Identity Configuration ---
         {
             "name": "default_user_identity",
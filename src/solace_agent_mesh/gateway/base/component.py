@@ -3,6 +3,7 @@ Base Component class for Gateway implementations in the Solace AI Connector.
 """
 
 import asyncio
+import functools
 import queue
 import base64
 import uuid
@@ -20,6 +21,7 @@ from ...common.services.identity_service import (
     BaseIdentityService,
     create_identity_service,
 )
+from .ordered_dispatcher import OrderedTaskDispatcher
 from .task_context import TaskContextManager
 from ...common.a2a.types import ContentPart
 from a2a.types import (
@@ -81,6 +83,7 @@ class BaseGatewayComponent(SamComponentBase):
     """
 
     _RESOLVE_EMBEDS_IN_FINAL_RESPONSE = False
+    MESSAGE_PROCESSOR_SHUTDOWN_TIMEOUT_SECONDS = 5
 
     def get_config(self, key: str, default: Any = None) -> Any:
         """
@@ -143,8 +146,26 @@ class BaseGatewayComponent(SamComponentBase):
             initialize_artifact_service(self)
         )
 
-        self.task_context_manager: TaskContextManager = TaskContextManager()
+        self.task_context_manager: TaskContextManager = TaskContextManager(
+            max_entries=self.get_config("task_context_max_entries", 50_000),
+            ttl_seconds=self.get_config("task_context_ttl_seconds", 86400),
+        )
         self.internal_event_queue: queue.Queue = queue.Queue()
+        self.metrics.active_tasks.set_function(self.task_context_manager.count)
+        self.metrics.queue_depth("internal_events").set_function(
+            self.internal_event_queue.qsize
+        )
+        self.metrics.register_stats(
+            "sam_task_context_cache",
+            "Task context cache occupancy, hits, misses and evictions.",
+            self.task_context_manager.get_stats,
+            group_label="namespace",
+        )
+        self.message_processor_max_concurrency: int = self.get_config(
+            "message_processor_max_concurrency", 16
+        )
+        self._message_processor_wakeup = asyncio.Event()
+        self._message_processor_waiting = False
 
         identity_service_config = self.get_config("identity_service")
         self.identity_service: Optional[BaseIdentityService] = create_identity_service(
@@ -380,6 +401,7 @@ class BaseGatewayComponent(SamComponentBase):
                     "_original_broker_message": original_broker_message,
                 }
                 self.internal_event_queue.put_nowait(msg_data_for_processor)
+                self._wake_message_processor()
             except queue.Full:
                 log.error(
                     "%s Internal event queue full. Cannot bridge message. NACKing.",
@@ -1133,122 +1155,212 @@ class BaseGatewayComponent(SamComponentBase):
                 "%s Signaling _message_processor_loop to stop by putting sentinel on queue...",
                 self.log_identifier,
             )
-            # This unblocks the `self.internal_event_queue.get()` call in the loop
             self.internal_event_queue.put(None)
+            self._wake_message_processor()
+
+    def _build_topic_dispatcher(self) -> a2a.TopicDispatcher:
+        """Builds the dispatcher routing inbound topics to message handlers."""
+        dispatcher = a2a.TopicDispatcher()
+        dispatcher.add(a2a.get_discovery_topic(self.namespace), "discovery")
+        dispatcher.add(
+            a2a.get_gateway_response_subscription_topic(
+                self.namespace, self.gateway_id
+            ),
+            "agent_event",
+        )
+        dispatcher.add(
+            a2a.get_gateway_status_subscription_topic(self.namespace, self.gateway_id),
+            "agent_event",
+        )
+        return dispatcher
 
-    async def _message_processor_loop(self):
-        log.info("%s Starting message processor loop...", self.log_identifier)
+    def _wake_message_processor(self) -> None:
+        """Wakes the message processor loop if it is waiting for new items."""
+        if not self._message_processor_waiting:
+            return
         loop = self.get_async_loop()
+        if loop is None or loop.is_closed():
+            return
+        try:
+            loop.call_soon_threadsafe(self._message_processor_wakeup.set)
+        except RuntimeError:
+            pass
+
+    async def _wait_for_internal_events(self) -> None:
+        """Suspends the message processor until the internal queue has items."""
+        self._message_processor_waiting = True
+        self._message_processor_wakeup.clear()
+        try:
+            if self.internal_event_queue.empty():
+                await self._message_processor_wakeup.wait()
+        finally:
+            self._message_processor_waiting = False
 
-        while not self.stop_signal.is_set():
-            original_broker_message: Optional[SolaceMessage] = None
-            item = None
-            processed_successfully = False
-            topic = None
-
-            try:
-                item = await loop.run_in_executor(None, self.internal_event_queue.get)
-
-                if item is None:
-                    log.info(
-                        "%s Received shutdown sentinel. Exiting message processor loop.",
-                        self.log_identifier,
+    async def _process_internal_event(
+        self,
+        topic: str,
+        payload: Any,
+        route: Optional[a2a.TopicMatch],
+        original_broker_message: SolaceMessage,
+    ) -> None:
+        """Handles one bridged broker message, then ACKs or NACKs it."""
+        processed_successfully = False
+        try:
+            if route and route.handler == "discovery":
+                processed_successfully = await self._handle_discovery_message(payload)
+            elif route and route.handler == "agent_event":
+                task_id_from_topic: Optional[str] = route.task_id
+
+                if task_id_from_topic:
+                    processed_successfully = await self._handle_agent_event(
+                        topic, payload, task_id_from_topic
                     )
-                    break
-
-                topic = item.get("topic")
-                payload = item.get("payload")
-                original_broker_message = item.get("_original_broker_message")
-
-                if not topic or payload is None or not original_broker_message:
-                    log.warning(
-                        "%s Invalid item received from internal queue: %s",
+                else:
+                    log.error(
+                        "%s Could not extract task_id from topic %s for _handle_agent_event. Ignoring.",
                         self.log_identifier,
-                        item,
+                        topic,
                     )
                     processed_successfully = False
-                    continue
-
-                if a2a.topic_matches_subscription(
-                    topic, a2a.get_discovery_topic(self.namespace)
-                ):
-                    processed_successfully = await self._handle_discovery_message(
-                        payload
-                    )
-                elif a2a.topic_matches_subscription(
+            else:
+                log.warning(
+                    "%s Received message on unhandled topic: %s. Acknowledging.",
+                    self.log_identifier,
                     topic,
-                    a2a.get_gateway_response_subscription_topic(
-                        self.namespace, self.gateway_id
-                    ),
-                ) or a2a.topic_matches_subscription(
+                )
+                processed_successfully = True
+        except Exception as e:
+            log.exception(
+                "%s Unhandled error processing message on topic %s: %s",
+                self.log_identifier,
+                topic,
+                e,
+            )
+            processed_successfully = False
+        finally:
+            if processed_successfully:
+                original_broker_message.call_acknowledgements()
+            else:
+                original_broker_message.call_negative_acknowledgements()
+                log.warning(
+                    "%s NACKed SolaceMessage for topic: %s",
+                    self.log_identifier,
                     topic,
-                    a2a.get_gateway_status_subscription_topic(
-                        self.namespace, self.gateway_id
-                    ),
-                ):
-                    task_id_from_topic: Optional[str] = None
-                    response_sub = a2a.get_gateway_response_subscription_topic(
-                        self.namespace, self.gateway_id
-                    )
-                    status_sub = a2a.get_gateway_status_subscription_topic(
-                        self.namespace, self.gateway_id
-                    )
+                )
+            self.internal_event_queue.task_done()
 
-                    if a2a.topic_matches_subscription(topic, response_sub):
-                        task_id_from_topic = a2a.extract_task_id_from_topic(
-                            topic, response_sub, self.log_identifier
-                        )
-                    elif a2a.topic_matches_subscription(topic, status_sub):
-                        task_id_from_topic = a2a.extract_task_id_from_topic(
-                            topic, status_sub, self.log_identifier
-                        )
+    def _drop_internal_event(
+        self, topic: str, original_broker_message: SolaceMessage
+    ) -> None:
+        """NACKs a bridged broker message discarded on shutdown before processing."""
+        try:
+            original_broker_message.call_negative_acknowledgements()
+            log.warning(
+                "%s NACKed unprocessed SolaceMessage for topic %s on shutdown.",
+                self.log_identifier,
+                topic,
+            )
+        finally:
+            self.internal_event_queue.task_done()
 
-                    if task_id_from_topic:
-                        processed_successfully = await self._handle_agent_event(
-                            topic, payload, task_id_from_topic
-                        )
-                    else:
-                        log.error(
-                            "%s Could not extract task_id from topic %s for _handle_agent_event. Ignoring.",
+    async def _message_processor_loop(self):
+        """
+        Drains the internal event queue and dispatches each message.
+
+        Messages for different tasks are processed concurrently, up to
+        `message_processor_max_concurrency` at once, while messages for the
+        same task (and all discovery messages) are processed in arrival order.
+        Each broker message is ACKed as soon as its own processing finishes.
+        """
+        log.info("%s Starting message processor loop...", self.log_identifier)
+        topic_dispatcher = self._build_topic_dispatcher()
+        dispatcher = OrderedTaskDispatcher(
+            max_concurrency=self.message_processor_max_concurrency,
+            name=f"{self.log_identifier}[MessageDispatcher]",
+        )
+        self.metrics.register_stats(
+            "sam_message_dispatcher",
+            "Load of the dispatcher processing inbound messages concurrently.",
+            dispatcher.get_stats,
+        )
+        shutdown_timeout = self.MESSAGE_PROCESSOR_SHUTDOWN_TIMEOUT_SECONDS
+
+        try:
+            while not self.stop_signal.is_set():
+                original_broker_message: Optional[SolaceMessage] = None
+                # Set while a dequeued item has not been handed to the
+                # dispatcher, which marks it done once processed.
+                item_owned = False
+                try:
+                    try:
+                        item = self.internal_event_queue.get_nowait()
+                    except queue.Empty:
+                        await self._wait_for_internal_events()
+                        continue
+                    item_owned = True
+
+                    if item is None:
+                        log.info(
+                            "%s Received shutdown sentinel. Exiting message processor loop.",
                             self.log_identifier,
-                            topic,
                         )
-                        processed_successfully = False
-                else:
-                    log.warning(
-                        "%s Received message on unhandled topic: %s. Acknowledging.",
-                        self.log_identifier,
-                        topic,
-                    )
-                    processed_successfully = True
+                        break
 
-            except queue.Empty:
-                continue
-            except asyncio.CancelledError:
-                log.info("%s Message processor loop cancelled.", self.log_identifier)
-                break
-            except Exception as e:
-                log.exception(
-                    "%s Unhandled error in message processor loop: %s",
-                    self.log_identifier,
-                    e,
-                )
-                processed_successfully = False
-                await asyncio.sleep(1)
-            finally:
-                if original_broker_message:
-                    if processed_successfully:
-                        original_broker_message.call_acknowledgements()
-                    else:
-                        original_broker_message.call_negative_acknowledgements()
+                    topic = item.get("topic")
+                    payload = item.get("payload")
+                    original_broker_message = item.get("_original_broker_message")
+
+                    if not topic or payload is None or not original_broker_message:
                         log.warning(
-                            "%s NACKed SolaceMessage for topic: %s",
+                            "%s Invalid item received from internal queue: %s",
                             self.log_identifier,
-                            topic or "unknown",
+                            item,
                         )
+                        if original_broker_message:
+                            original_broker_message.call_negative_acknowledgements()
+                        continue
+
+                    route = topic_dispatcher.match(topic)
+                    if route and route.handler == "agent_event" and route.task_id:
+                        ordering_key = route.task_id
+                    elif route and route.handler == "discovery":
+                        ordering_key = "discovery"
+                    else:
+                        ordering_key = None
 
-                if item and item is not None:
-                    self.internal_event_queue.task_done()
+                    await dispatcher.submit(
+                        ordering_key,
+                        functools.partial(
+                            self._process_internal_event,
+                            topic,
+                            payload,
+                            route,
+                            original_broker_message,
+                        ),
+                        on_drop=functools.partial(
+                            self._drop_internal_event, topic, original_broker_message
+                        ),
+                    )
+                    item_owned = False
+                except asyncio.CancelledError:
+                    raise
+                except Exception as e:
+                    log.exception(
+                        "%s Unhandled error in message processor loop: %s",
+                        self.log_identifier,
+                        e,
+                    )
+                    if original_broker_message:
+                        original_broker_message.call_negative_acknowledgements()
+                    await asyncio.sleep(1)
+                finally:
+                    if item_owned:
+                        self.internal_event_queue.task_done()
+        except asyncio.CancelledError:
+            log.info("%s Message processor loop cancelled.", self.log_identifier)
+            shutdown_timeout = 0
+        finally:
+            await dispatcher.shutdown(timeout=shutdown_timeout)
 
         log.info("%s Message processor loop finished.", self.log_identifier)
 
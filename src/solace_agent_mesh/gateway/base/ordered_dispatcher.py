@@ -0,0 +1,195 @@
+"""
+Runs asyncio work concurrently across keys while preserving order per key.
+"""
+
+import asyncio
+from collections import deque
+from typing import Any, Awaitable, Callable, Deque, Dict, Hashable, Optional, Tuple
+
+from solace_ai_connector.common.log import log
+
+WorkFactory = Callable[[], Awaitable[Any]]
+DropCallback = Callable[[], None]
+# A unit of work and the callback to run if it is discarded without running.
+WorkItem = Tuple[WorkFactory, Optional[DropCallback]]
+
+
+class OrderedTaskDispatcher:
+    """
+    Dispatches units of work onto the running event loop.
+
+    Work submitted under the same key runs strictly one after another, in
+    submission order; work under different keys runs concurrently, with at
+    most `max_concurrency` units executing at once. Work submitted with a key
+    of None has no ordering constraint.
+
+    `submit` applies backpressure: it waits while `max_pending` units are
+    queued or running, so a burst of messages cannot grow memory unboundedly.
+    Units still queued when the dispatcher shuts down are discarded; each
+    unit's `on_drop` callback is called instead so its owner can release it.
+    Must be used from a single event loop.
+    """
+
+    def __init__(
+        self,
+        max_concurrency: int,
+        max_pending: Optional[int] = None,
+        name: str = "OrderedTaskDispatcher",
+    ):
+        if max_concurrency < 1:
+            raise ValueError("max_concurrency must be at least 1")
+        self._max_concurrency = max_concurrency
+        self._max_pending = max(max_pending or max_concurrency * 8, max_concurrency)
+        self._name = name
+        self._semaphore = asyncio.Semaphore(max_concurrency)
+        self._lanes: Dict[Hashable, Deque[WorkItem]] = {}
+        self._workers: Dict[
+            asyncio.Task, Tuple[Deque[WorkItem], Optional[Hashable]]
+        ] = {}
+        self._pending_slots = asyncio.Semaphore(self._max_pending)
+        self._pending = 0
+        self._idle = asyncio.Event()
+        self._idle.set()
+        self._completed = 0
+        self._failed = 0
+        self._dropped = 0
+
+    @property
+    def pending(self) -> int:
+        """The number of units queued or running."""
+        return self._pending
+
+    async def submit(
+        self,
+        key: Optional[Hashable],
+        work: WorkFactory,
+        on_drop: Optional[DropCallback] = None,
+    ) -> None:
+        """
+        Schedules `work()` to run after all earlier work with the same key.
+
+        Waits for capacity if `max_pending` units are already outstanding.
+        `on_drop` is called instead of `work` if the unit is discarded on
+        shutdown before it starts.
+        """
+        await self._pending_slots.acquire()
+        self._pending += 1
+        self._idle.clear()
+
+        item = (work, on_drop)
+        if key is None:
+            self._start_worker(deque([item]), None)
+            return
+
+        lane = self._lanes.get(key)
+        if lane is not None:
+            lane.append(item)
+            return
+        lane = deque([item])
+        self._lanes[key] = lane
+        self._start_worker(lane, key)
+
+    def _start_worker(self, lane: Deque[WorkItem], key: Optional[Hashable]):
+        worker = asyncio.create_task(self._run_lane(lane, key))
+        self._workers[worker] = (lane, key)
+        worker.add_done_callback(self._on_worker_done)
+
+    def _on_worker_done(self, worker: asyncio.Task):
+        lane, key = self._workers.pop(worker)
+        # A worker cancelled before its first step never ran its own cleanup.
+        self._discard_lane(lane, key)
+
+    async def _run_lane(self, lane: Deque[WorkItem], key: Optional[Hashable]):
+        try:
+            while lane:
+                work, on_drop = lane[0]
+                started = False
+                try:
+                    async with self._semaphore:
+                        started = True
+                        await work()
+                    self._completed += 1
+                except asyncio.CancelledError:
+                    raise
+                except Exception as e:
+                    self._failed += 1
+                    log.exception(
+                        "[%s] Unhandled error in work for key %s: %s",
+                        self._name,
+                        key,
+                        e,
+                    )
+                finally:
+                    lane.popleft()
+                    if not started:
+                        # Cancelled while waiting for a concurrency slot.
+                        self._drop(on_drop, key)
+                    self._release(1)
+        finally:
+            self._discard_lane(lane, key)
+
+    def _discard_lane(self, lane: Deque[WorkItem], key: Optional[Hashable]):
+        """Drops the work left in a lane whose worker was cancelled."""
+        if key is not None and self._lanes.get(key) is lane:
+            del self._lanes[key]
+        if lane:
+            count = len(lane)
+            for _, on_drop in lane:
+                self._drop(on_drop, key)
+            lane.clear()
+            self._release(count)
+
+    def _drop(self, on_drop: Optional[DropCallback], key: Optional[Hashable]):
+        self._dropped += 1
+        if on_drop is None:
+            return
+        try:
+            on_drop()
+        except Exception as e:
+            log.exception("[%s] Error dropping work for key %s: %s", self._name, key, e)
+
+    def _release(self, count: int):
+        self._pending -= count
+        for _ in range(count):
+            self._pending_slots.release()
+        if self._pending == 0:
+            self._idle.set()
+
+    async def join(self, timeout: Optional[float] = None) -> bool:
+        """
+        Waits until all submitted work has finished.
+
+        Returns:
+            True if the dispatcher became idle, False on timeout.
+        """
+        try:
+            await asyncio.wait_for(self._idle.wait(), timeout)
+            return True
+        except asyncio.TimeoutError:
+            return False
+
+    async def shutdown(self, timeout: Optional[float] = None) -> None:
+        """Waits up to `timeout` for outstanding work, then cancels the rest."""
+        if not await self.join(timeout):
+            log.warning(
+                "[%s] Cancelling %d outstanding work item(s) on shutdown.",
+                self._name,
+                self._pending,
+            )
+        workers = list(self._workers)
+        for worker in workers:
+            worker.cancel()
+        if workers:
+            await asyncio.gather(*workers, return_exceptions=True)
+
+    def get_stats(self) -> Dict[str, int]:
+        """Returns counters describing the dispatcher's current load."""
+        return {
+            "pending": self._pending,
+            "active_keys": len(self._lanes),
+            "max_concurrency": self._max_concurrency,
+            "max_pending": self._max_pending,
+            "completed": self._completed,
+            "failed": self._failed,
+            "dropped": self._dropped,
+        }
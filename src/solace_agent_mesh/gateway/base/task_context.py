@@ -2,11 +2,15 @@
 Manages context for tasks being processed by a gateway.
 """
 
-import threading
 from typing import Dict, Optional, Any
 
 from solace_ai_connector.common.log import log
 
+from ...common.utils.bounded_cache import BoundedTTLCache
+
+DEFAULT_MAX_TASK_CONTEXTS = 50_000
+DEFAULT_TASK_CONTEXT_TTL_SECONDS = 24 * 60 * 60
+
 
 class TaskContextManager:
     """
@@ -16,13 +20,23 @@ class TaskContextManager:
     (e.g., Slack channel/thread, HTTP session details) and is needed to
     route responses back correctly to the external system.
 
-    The manager is thread-safe.
+    The manager is thread-safe. Contexts are held in a bounded cache, so
+    contexts of tasks that never complete are eventually dropped: each expires
+    `ttl_seconds` after it was last stored, and the least recently used
+    context is evicted once `max_entries` is exceeded.
     """
 
-    def __init__(self):
+    def __init__(
+        self,
+        max_entries: int = DEFAULT_MAX_TASK_CONTEXTS,
+        ttl_seconds: Optional[float] = DEFAULT_TASK_CONTEXT_TTL_SECONDS,
+    ):
         """Initializes the TaskContextManager."""
-        self._contexts: Dict[str, Dict[str, Any]] = {}
-        self._lock = threading.Lock()
+        self._contexts = BoundedTTLCache(
+            max_entries=max_entries, name="TaskContextManager"
+        )
+        self._lock = self._contexts._lock
+        self._ttl_seconds = ttl_seconds
         log.debug("[TaskContextManager] Initialized.")
 
     def store_context(self, task_id: str, context_data: Dict[str, Any]) -> None:
@@ -33,8 +47,7 @@ class TaskContextManager:
             task_id: The unique identifier for the task.
             context_data: A dictionary containing the context to store.
         """
-        with self._lock:
-            self._contexts[task_id] = context_data
+        self._contexts.set(task_id, context_data, ttl=self._ttl_seconds)
         log.debug("[TaskContextManager] Stored context for task_id: %s", task_id)
 
     def get_context(self, task_id: str) -> Optional[Dict[str, Any]]:
@@ -47,8 +60,7 @@ class TaskContextManager:
         Returns:
             The context data dictionary if found, otherwise None.
         """
-        with self._lock:
-            context = self._contexts.get(task_id)
+        context = self._contexts.get(task_id)
         log.debug(
             "[TaskContextManager] Retrieved context for task_id: %s (Found: %s)",
             task_id,
@@ -58,8 +70,7 @@ class TaskContextManager:
 
     def remove_context(self, task_id: str) -> Optional[Dict[str, Any]]:
         """Removes and returns the context data for a given task ID."""
-        with self._lock:
-            context = self._contexts.pop(task_id, None)
+        context = self._contexts.pop(task_id)
         log.debug(
             "[TaskContextManager] Removed context for task_id: %s (Found: %s)",
             task_id,
@@ -67,8 +78,15 @@ class TaskContextManager:
         )
         return context
 
+    def count(self) -> int:
+        """Returns the number of stored task contexts."""
+        return len(self._contexts)
+
     def clear_all_contexts_for_testing(self) -> None:
         """Removes all stored contexts. For testing purposes."""
-        with self._lock:
-            self._contexts.clear()
+        self._contexts.clear()
         log.debug("[TaskContextManager] All contexts cleared for testing.")
+
+    def get_stats(self) -> Dict[str, Dict[str, int]]:
+        """Returns size, hit/miss and eviction counters of the context cache."""
+        return self._contexts.get_stats()
@@ -67,6 +67,27 @@ class WebUIBackendApp(BaseGatewayApp):
             "default": 200,
             "description": "Maximum size of the SSE connection queues. Adjust based on expected load.",
         },
+        {
+            "name": "sse_slow_consumer_policy",
+            "required": False,
+            "type": "string",
+            "default": "disconnect",
+            "description": "What to do when an SSE connection's queue is full: 'disconnect' closes the connection, 'drop_oldest' discards the oldest queued event, 'coalesce' discards the oldest queued status update.",
+        },
+        {
+            "name": "sse_buffer_max_total_bytes",
+            "required": False,
+            "type": "integer",
+            "default": 67108864,
+            "description": "Total size budget for SSE events buffered for tasks whose client has not connected yet. The oldest task buffers are evicted first when it is exceeded.",
+        },
+        {
+            "name": "max_upload_size_bytes",
+            "required": False,
+            "type": "integer",
+            "default": 1073741824,
+            "description": "Maximum size of a file uploaded as an artifact. Uploads are streamed to the artifact service and rejected with 413 once they exceed it.",
+        },
         {
             "name": "resolve_artifact_uris_in_gateway",
             "required": False,
@@ -121,13 +121,31 @@ class WebUIBackendComponent(BaseGatewayComponent):
 
         sse_max_queue_size = self.get_config("sse_max_queue_size", 200)
         sse_buffer_max_age_seconds = self.get_config("sse_buffer_max_age_seconds", 600)
+        sse_buffer_max_total_bytes = self.get_config(
+            "sse_buffer_max_total_bytes", 64 * 1024 * 1024
+        )
 
         self.sse_event_buffer = SSEEventBuffer(
             max_queue_size=sse_max_queue_size,
             max_age_seconds=sse_buffer_max_age_seconds,
+            max_total_bytes=sse_buffer_max_total_bytes,
         )
         self.sse_manager = SSEManager(
-            max_queue_size=sse_max_queue_size, event_buffer=self.sse_event_buffer
+            max_queue_size=sse_max_queue_size,
+            event_buffer=self.sse_event_buffer,
+            slow_consumer_policy=self.get_config(
+                "sse_slow_consumer_policy", "disconnect"
+            ),
+        )
+        self.metrics.register_stats(
+            "sam_sse_event_buffer",
+            "Events buffered for SSE clients that have not connected yet.",
+            self.sse_event_buffer.get_metrics,
+        )
+        self.metrics.register_stats(
+            "sam_sse_connections",
+            "Active SSE connections and their queue depths and dropped events.",
+            self.sse_manager.get_connection_stats,
         )
 
         self._sse_cleanup_timer_id = f"sse_cleanup_{self.gateway_id}"
@@ -150,9 +168,17 @@ class WebUIBackendComponent(BaseGatewayComponent):
                     "Please provide a database_url in the session_service configuration or use type 'memory'."
                 )
             self.database_url = database_url
+            # Pool settings and the optional async engine flag, e.g.
+            # {"async_engine": true, "pool_size": 10, "max_overflow": 20, "pool_pre_ping": true}
+            self.database_engine_options = {
+                key: value
+                for key, value in session_config.items()
+                if key not in ("type", "database_url", "default_behavior")
+            }
         else:
             # Memory storage or no explicit configuration - no persistence service needed
             self.database_url = None
+            self.database_engine_options = {}
 
         component_config = self.get_config("component_config", {})
         app_config = component_config.get("app_config", {})
@@ -917,7 +943,9 @@ class WebUIBackendComponent(BaseGatewayComponent):
 
             self.fastapi_app = fastapi_app_instance
 
-            setup_dependencies(self, self.database_url)
+            setup_dependencies(
+                self, self.database_url, self.database_engine_options
+            )
 
             port = (
                 self.fastapi_https_port
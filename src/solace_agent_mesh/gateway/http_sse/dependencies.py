@@ -3,13 +3,16 @@ Defines FastAPI dependency injectors to access shared resources
 managed by the WebUIBackendComponent.
 """
 
-from collections.abc import Callable, Generator
+import importlib.util
+from collections.abc import AsyncGenerator, Callable, Generator
 from contextlib import contextmanager
 from typing import TYPE_CHECKING, Any
 
 from fastapi import Depends, HTTPException, Request, status
 from solace_ai_connector.common.log import log
 from sqlalchemy import create_engine
+from sqlalchemy.engine import make_url
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
 from sqlalchemy.orm import Session, sessionmaker
 
 from ...common.agent_registry import AgentRegistry
@@ -23,7 +26,7 @@ from ...gateway.http_sse.services.task_service import TaskService
 from ...gateway.http_sse.session_manager import SessionManager
 from ...gateway.http_sse.sse_manager import SSEManager
 from .repository import Message, MessageRepository, SessionRepository
-from .services.session_service import SessionService
+from .services.session_service import AsyncSessionService, SessionService
 
 try:
     from google.adk.artifacts import BaseArtifactService
@@ -38,6 +41,15 @@ if TYPE_CHECKING:
 
 sac_component_instance: "WebUIBackendComponent" = None
 SessionLocal: sessionmaker = None
+AsyncSessionLocal: async_sessionmaker | None = None
+
+# Async DBAPI drivers used when the async engine is enabled, keyed by backend.
+ASYNC_DRIVERS = {
+    "postgresql": "asyncpg",
+    "mysql": "aiomysql",
+    "sqlite": "aiosqlite",
+}
+POOL_OPTION_KEYS = ("pool_size", "max_overflow", "pool_timeout", "pool_recycle")
 
 api_config: dict[str, Any] | None = None
 
@@ -52,17 +64,82 @@ def set_component_instance(component: "WebUIBackendComponent"):
         log.warning("[Dependencies] SAC Component instance already set.")
 
 
-def init_database(database_url: str):
-    """Initialize database with direct sessionmaker."""
+def _build_engine_kwargs(database_url: str, engine_options: dict[str, Any]) -> dict[str, Any]:
+    """
+    Translates session_service pool settings into create_engine keyword arguments.
+    SQLite uses a non-queue pool, so only pre-ping is applied there.
+    """
+    kwargs: dict[str, Any] = {}
+    if "pool_pre_ping" in engine_options:
+        kwargs["pool_pre_ping"] = bool(engine_options["pool_pre_ping"])
+
+    if make_url(database_url).get_backend_name() != "sqlite":
+        for key in POOL_OPTION_KEYS:
+            if engine_options.get(key) is not None:
+                kwargs[key] = engine_options[key]
+    return kwargs
+
+
+def _get_async_database_url(database_url: str) -> str | None:
+    """
+    Returns the async-driver variant of database_url, or None when no async
+    driver is available for the backend (the caller then stays on the sync path).
+    """
+    url = make_url(database_url)
+    backend = url.get_backend_name()
+    driver = ASYNC_DRIVERS.get(backend)
+    if driver is None or importlib.util.find_spec(driver) is None:
+        return None
+    return url.set(drivername=f"{backend}+{driver}").render_as_string(
+        hide_password=False
+    )
+
+
+def _init_async_database(database_url: str, engine_kwargs: dict[str, Any]) -> None:
+    global AsyncSessionLocal
+    async_url = _get_async_database_url(database_url)
+    if async_url is None:
+        log.warning(
+            "[Dependencies] Async database engine requested but no async driver is "
+            "installed for '%s'. Falling back to the synchronous engine.",
+            make_url(database_url).get_backend_name(),
+        )
+        return
+
+    async_engine = create_async_engine(async_url, **engine_kwargs)
+    AsyncSessionLocal = async_sessionmaker(
+        bind=async_engine, autoflush=False, expire_on_commit=False
+    )
+    log.info("[Dependencies] Async database engine initialized.")
+
+
+def init_database(database_url: str, engine_options: dict[str, Any] | None = None):
+    """
+    Initialize database with direct sessionmaker.
+
+    engine_options may contain pool settings (pool_size, max_overflow,
+    pool_timeout, pool_recycle, pool_pre_ping) and 'async_engine' to
+    additionally create an AsyncSession factory for the API routers.
+    """
     global SessionLocal
     if SessionLocal is None:
-        engine = create_engine(database_url)
+        engine_options = engine_options or {}
+        engine_kwargs = _build_engine_kwargs(database_url, engine_options)
+        engine = create_engine(database_url, **engine_kwargs)
         SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
         log.info("[Dependencies] Database initialized.")
+
+        if engine_options.get("async_engine", False):
+            _init_async_database(database_url, engine_kwargs)
     else:
         log.warning("[Dependencies] Database already initialized.")
 
 
+def is_async_database_enabled() -> bool:
+    """Returns True when the routers should use AsyncSession."""
+    return AsyncSessionLocal is not None
+
+
 def set_api_config(config: dict[str, Any]):
     """Called during startup to provide API configuration."""
     global api_config
@@ -376,9 +453,6 @@ def get_task_service(
     namespace: str = Depends(get_namespace),
     gateway_id: str = Depends(get_gateway_id),
     sse_manager: SSEManager = Depends(get_sse_manager),
-    task_context_manager: TaskContextManager = Depends(
-        get_task_context_manager_from_component
-    ),
     component: "WebUIBackendComponent" = Depends(get_sac_component),
 ) -> TaskService:
     """FastAPI dependency to get an instance of TaskService."""
@@ -390,8 +464,6 @@ def get_task_service(
         namespace=namespace,
         gateway_id=gateway_id,
         sse_manager=sse_manager,
-        task_context_map=task_context_manager._contexts,
-        task_context_lock=task_context_manager._lock,
         app_name=app_name,
     )
 
@@ -413,6 +485,48 @@ def get_db() -> Generator[Session, None, None]:
         db.close()
 
 
+async def get_session_db() -> AsyncGenerator[AsyncSession | Session, None]:
+    """
+    Yields an AsyncSession when the async engine is enabled, otherwise a
+    synchronous Session (the fallback used for SQLite without aiosqlite).
+    Pair with get_session_db_service so the service matches the session type.
+    """
+    if AsyncSessionLocal is not None:
+        async with AsyncSessionLocal() as async_db:
+            try:
+                yield async_db
+                await async_db.commit()
+            except Exception:
+                await async_db.rollback()
+                raise
+        return
+
+    if SessionLocal is None:
+        raise HTTPException(
+            status_code=status.HTTP_501_NOT_IMPLEMENTED,
+            detail="Session management requires database configuration.",
+        )
+    db = SessionLocal()
+    try:
+        yield db
+        db.commit()
+    except Exception:
+        db.rollback()
+        raise
+    finally:
+        db.close()
+
+
+def get_session_db_service(
+    component: "WebUIBackendComponent" = Depends(get_sac_component),
+) -> AsyncSessionService | SessionService:
+    """Returns the session service matching the session yielded by get_session_db."""
+    log.debug("[Dependencies] get_session_db_service called")
+    if AsyncSessionLocal is not None:
+        return AsyncSessionService(component=component)
+    return SessionService(component=component)
+
+
 def get_session_business_service(
     component: "WebUIBackendComponent" = Depends(get_sac_component),
 ) -> SessionService:
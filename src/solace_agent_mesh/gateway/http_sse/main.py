@@ -13,12 +13,13 @@ from fastapi import Request as FastAPIRequest
 from fastapi import status
 from fastapi.exceptions import RequestValidationError
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import JSONResponse
+from fastapi.responses import JSONResponse, PlainTextResponse
 from solace_ai_connector.common.log import log
 from starlette.middleware.sessions import SessionMiddleware
 from starlette.staticfiles import StaticFiles
 
 from ...common import a2a
+from ...common.utils.metrics import PROMETHEUS_CONTENT_TYPE, get_metrics_registry
 from ...gateway.http_sse import dependencies
 from ...gateway.http_sse.routers import (
     agent_cards,
@@ -369,12 +370,16 @@ def _run_enterprise_migrations(component: "WebUIBackendComponent", database_url:
         raise RuntimeError(f"Enterprise database migration failed: {e}") from e
 
 
-def _setup_database(component: "WebUIBackendComponent", database_url: str) -> None:
+def _setup_database(
+    component: "WebUIBackendComponent",
+    database_url: str,
+    engine_options: dict | None = None,
+) -> None:
     """
     Initialize database connection and run all required migrations.
     This sets up both community and enterprise database schemas.
     """
-    dependencies.init_database(database_url)
+    dependencies.init_database(database_url, engine_options)
     log.info("Persistence enabled - sessions will be stored in database")
     log.info("Running database migrations...")
 
@@ -414,17 +419,23 @@ def _create_api_config(app_config: dict, database_url: str) -> dict:
     }
 
 
-def setup_dependencies(component: "WebUIBackendComponent", database_url: str = None):
+def setup_dependencies(
+    component: "WebUIBackendComponent",
+    database_url: str = None,
+    database_engine_options: dict | None = None,
+):
     """
     This function initializes the simplified architecture while maintaining full
     backward compatibility with existing API contracts.
 
     If database_url is None, runs in compatibility mode with in-memory sessions.
+    database_engine_options carries pool settings and the 'async_engine' flag
+    from the session_service configuration.
     """
     dependencies.set_component_instance(component)
 
     if database_url:
-        _setup_database(component, database_url)
+        _setup_database(component, database_url, database_engine_options)
     else:
         log.warning(
             "No database URL provided - using in-memory session storage (data not persisted across restarts)"
@@ -439,9 +450,28 @@ def setup_dependencies(component: "WebUIBackendComponent", database_url: str = N
 
     _setup_middleware(component)
     _setup_routers()
+    _setup_metrics_endpoint(component)
     _setup_static_files()
 
 
+def _setup_metrics_endpoint(component: "WebUIBackendComponent") -> None:
+    # /metrics is outside /api and so not authenticated; serve it only on request.
+    metrics_config = component.get_config("metrics") or {}
+    if not (
+        component.metrics_enabled
+        and metrics_config.get("webui_endpoint_enabled", False)
+    ):
+        return
+    app.add_api_route(
+        "/metrics",
+        read_metrics,
+        methods=["GET"],
+        tags=["Health"],
+        response_class=PlainTextResponse,
+    )
+    log.info("Prometheus metrics endpoint '/metrics' enabled.")
+
+
 def _setup_middleware(component: "WebUIBackendComponent") -> None:
     allowed_origins = component.get_cors_origins()
     app.add_middleware(
@@ -450,6 +480,7 @@ def _setup_middleware(component: "WebUIBackendComponent") -> None:
         allow_credentials=True,
         allow_methods=["*"],
         allow_headers=["*"],
+        expose_headers=["X-Next-Cursor"],
     )
     log.info("CORSMiddleware added with origins: %s", allowed_origins)
 
@@ -631,3 +662,11 @@ async def read_root():
     """Basic health check endpoint."""
     log.debug("Health check endpoint '/health' called")
     return {"status": "A2A Web UI Backend is running"}
+
+
+async def read_metrics():
+    """Metrics of the components in this process, in Prometheus text format."""
+    return PlainTextResponse(
+        get_metrics_registry().render_prometheus(),
+        media_type=PROMETHEUS_CONTENT_TYPE,
+    )
@@ -3,11 +3,16 @@ Repository layer containing all data access logic organized by entity type.
 """
 
 # Interfaces
-from .interfaces import IMessageRepository, ISessionRepository
+from .interfaces import (
+    IAsyncMessageRepository,
+    IAsyncSessionRepository,
+    IMessageRepository,
+    ISessionRepository,
+)
 
 # Implementations
-from .message_repository import MessageRepository
-from .session_repository import SessionRepository
+from .message_repository import AsyncMessageRepository, MessageRepository
+from .session_repository import AsyncSessionRepository, SessionRepository
 
 # Entities (re-exported for convenience)
 from .entities.session import Session
@@ -21,9 +26,13 @@ from .models.message_model import MessageModel
 
 __all__ = [
     # Interfaces
+    "IAsyncMessageRepository",
+    "IAsyncSessionRepository",
     "IMessageRepository",
     "ISessionRepository",
     # Implementations
+    "AsyncMessageRepository",
+    "AsyncSessionRepository",
     "MessageRepository", 
     "SessionRepository",
     # Entities
@@ -13,4 +13,5 @@ class SessionHistory(BaseModel):
     
     session: Session
     messages: list[Message] = []
-    total_message_count: int = 0
\ No newline at end of file
+    total_message_count: int = 0
+    next_cursor: str | None = None
\ No newline at end of file
@@ -4,6 +4,7 @@ Repository interfaces defining contracts for data access.
 
 from abc import ABC, abstractmethod
 
+from ..shared.pagination import KeysetCursor
 from ..shared.types import PaginationInfo, SessionId, UserId
 from .entities import Message, Session
 
@@ -18,6 +19,17 @@ class ISessionRepository(ABC):
         """Find all sessions for a specific user."""
         pass
 
+    @abstractmethod
+    def find_by_user_page(
+        self,
+        user_id: UserId,
+        limit: int | None,
+        offset: int = 0,
+        after: KeysetCursor | None = None,
+    ) -> list[Session]:
+        """Find a page of a user's sessions by offset or after a keyset cursor."""
+        pass
+
     @abstractmethod
     def count_by_user(self, user_id: UserId) -> int:
         """Count total sessions for a specific user."""
@@ -42,7 +54,11 @@ class ISessionRepository(ABC):
 
     @abstractmethod
     def find_user_session_with_messages(
-        self, session_id: SessionId, user_id: UserId, pagination: PaginationInfo | None = None
+        self,
+        session_id: SessionId,
+        user_id: UserId,
+        pagination: PaginationInfo | None = None,
+        after: KeysetCursor | None = None,
     ) -> tuple[Session, list[Message]] | None:
         """Find a session with its messages."""
         pass
@@ -66,4 +82,79 @@ class IMessageRepository(ABC):
     @abstractmethod
     def delete_by_session(self, session_id: SessionId) -> bool:
         """Delete all messages in a session."""
-        pass
\ No newline at end of file
+        pass
+
+class IAsyncSessionRepository(ABC):
+    """Interface for async session data access operations."""
+
+    @abstractmethod
+    async def find_by_user(
+        self, user_id: UserId, pagination: PaginationInfo | None = None
+    ) -> list[Session]:
+        """Find all sessions for a specific user."""
+        pass
+
+    @abstractmethod
+    async def find_by_user_page(
+        self,
+        user_id: UserId,
+        limit: int | None,
+        offset: int = 0,
+        after: KeysetCursor | None = None,
+    ) -> list[Session]:
+        """Find a page of a user's sessions by offset or after a keyset cursor."""
+        pass
+
+    @abstractmethod
+    async def count_by_user(self, user_id: UserId) -> int:
+        """Count total sessions for a specific user."""
+        pass
+
+    @abstractmethod
+    async def find_user_session(
+        self, session_id: SessionId, user_id: UserId
+    ) -> Session | None:
+        """Find a specific session belonging to a user."""
+        pass
+
+    @abstractmethod
+    async def save(self, session: Session) -> Session:
+        """Save or update a session."""
+        pass
+
+    @abstractmethod
+    async def delete(self, session_id: SessionId, user_id: UserId) -> bool:
+        """Delete a session belonging to a user."""
+        pass
+
+    @abstractmethod
+    async def find_user_session_with_messages(
+        self,
+        session_id: SessionId,
+        user_id: UserId,
+        pagination: PaginationInfo | None = None,
+        after: KeysetCursor | None = None,
+    ) -> tuple[Session, list[Message]] | None:
+        """Find a session with its messages."""
+        pass
+
+
+class IAsyncMessageRepository(ABC):
+    """Interface for async message data access operations."""
+
+    @abstractmethod
+    async def find_by_session(
+        self, session_id: SessionId, pagination: PaginationInfo | None = None
+    ) -> list[Message]:
+        """Find all messages in a session."""
+        pass
+
+    @abstractmethod
+    async def save(self, message: Message) -> Message:
+        """Save or update a message."""
+        pass
+
+    @abstractmethod
+    async def delete_by_session(self, session_id: SessionId) -> bool:
+        """Delete all messages in a session."""
+        pass
@@ -2,13 +2,15 @@
 Message repository implementation using SQLAlchemy.
 """
 
+from sqlalchemy import delete, select
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session as DBSession
 
-from ..shared.base_repository import PaginatedRepository
+from ..shared.base_repository import AsyncPaginatedRepository, PaginatedRepository
 from ..shared.enums import MessageType, SenderType
 from ..shared.types import PaginationInfo, SessionId
 from .entities import Message
-from .interfaces import IMessageRepository
+from .interfaces import IAsyncMessageRepository, IMessageRepository
 from .models import MessageModel, CreateMessageModel, UpdateMessageModel
 
 
@@ -82,3 +84,64 @@ class MessageRepository(PaginatedRepository[MessageModel, Message], IMessageRepo
             message_type=MessageType.TEXT,  # Default for now
             created_time=model.created_time,
         )
+
+
+class AsyncMessageRepository(
+    AsyncPaginatedRepository[MessageModel, Message], IAsyncMessageRepository
+):
+    """SQLAlchemy AsyncSession implementation of the message repository."""
+
+    def __init__(self, db: AsyncSession):
+        super().__init__(MessageModel, Message)
+        self.db = db
+
+    @property
+    def entity_name(self) -> str:
+        """Return the entity name for error messages."""
+        return "message"
+
+    async def find_by_session(
+        self, session_id: SessionId, pagination: PaginationInfo | None = None
+    ) -> list[Message]:
+        """Find all messages in a session."""
+        stmt = (
+            select(MessageModel)
+            .where(MessageModel.session_id == session_id)
+            .order_by(MessageModel.created_time.asc())
+        )
+
+        if pagination:
+            offset = (pagination.page - 1) * pagination.page_size
+            stmt = stmt.offset(offset).limit(pagination.page_size)
+
+        result = await self.db.execute(stmt)
+        return [self._convert_model_to_entity(model) for model in result.scalars().all()]
+
+    async def save(self, message: Message) -> Message:
+        """Save or update a message."""
+        if await self.exists(self.db, message.id):
+            update_model = UpdateMessageModel(
+                message=message.message,
+                sender_type=message.sender_type.value,
+                sender_name=message.sender_name,
+            )
+            return await self.update(self.db, message.id, update_model.model_dump())
+
+        create_model = CreateMessageModel(
+            id=message.id,
+            session_id=message.session_id,
+            message=message.message,
+            sender_type=message.sender_type.value,
+            sender_name=message.sender_name,
+            created_time=message.created_time,
+        )
+        return await self.create(self.db, create_model.model_dump())
+
+    async def delete_by_session(self, session_id: SessionId) -> bool:
+        """Delete all messages in a session."""
+        result = await self.db.execute(
+            delete(MessageModel).where(MessageModel.session_id == session_id)
+        )
+        return result.rowcount > 0
+
+    _convert_model_to_entity = MessageRepository._convert_model_to_entity
@@ -2,12 +2,15 @@
 Session repository implementation using SQLAlchemy.
 """
 
+from sqlalchemy import func, select, tuple_
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session as DBSession
 
-from ..shared.base_repository import PaginatedRepository
+from ..shared.base_repository import AsyncPaginatedRepository, PaginatedRepository
+from ..shared.pagination import KeysetCursor
 from ..shared.types import PaginationInfo, SessionId, UserId
 from .entities import Message, Session
-from .interfaces import ISessionRepository
+from .interfaces import IAsyncSessionRepository, ISessionRepository
 from .models import (
     MessageModel,
     SessionModel,
@@ -16,6 +19,59 @@ from .models import (
 )
 
 
+def _user_sessions_stmt(
+    user_id: UserId,
+    limit: int | None = None,
+    offset: int = 0,
+    after: KeysetCursor | None = None,
+):
+    """
+    Sessions of a user, newest activity first. The (updated_time, id) ordering
+    is total, so keyset cursors taken from it never skip or repeat rows; the
+    range predicate is served by the (user_id, updated_time) index.
+    """
+    stmt = select(SessionModel).where(SessionModel.user_id == user_id)
+    if after is not None:
+        stmt = stmt.where(
+            tuple_(SessionModel.updated_time, SessionModel.id)
+            < tuple_(after.sort_value, after.item_id)
+        )
+    stmt = stmt.order_by(SessionModel.updated_time.desc(), SessionModel.id.desc())
+    if offset:
+        stmt = stmt.offset(offset)
+    if limit is not None:
+        stmt = stmt.limit(limit)
+    return stmt
+
+
+def _session_messages_stmt(
+    session_id: SessionId,
+    limit: int | None = None,
+    offset: int = 0,
+    after: KeysetCursor | None = None,
+):
+    """Messages of a session in (created_time, id) ascending order."""
+    stmt = select(MessageModel).where(MessageModel.session_id == session_id)
+    if after is not None:
+        stmt = stmt.where(
+            tuple_(MessageModel.created_time, MessageModel.id)
+            > tuple_(after.sort_value, after.item_id)
+        )
+    stmt = stmt.order_by(MessageModel.created_time.asc(), MessageModel.id.asc())
+    if offset:
+        stmt = stmt.offset(offset)
+    if limit is not None:
+        stmt = stmt.limit(limit)
+    return stmt
+
+
+def _pagination_window(pagination: PaginationInfo | None) -> tuple[int | None, int]:
+    """Translate PaginationInfo into (limit, offset)."""
+    if not pagination:
+        return None, 0
+    return pagination.page_size, (pagination.page - 1) * pagination.page_size
+
+
 class SessionRepository(PaginatedRepository[SessionModel, Session], ISessionRepository):
     """SQLAlchemy implementation of session repository using BaseRepository."""
 
@@ -32,14 +88,20 @@ class SessionRepository(PaginatedRepository[SessionModel, Session], ISessionRepo
         self, user_id: UserId, pagination: PaginationInfo | None = None
     ) -> list[Session]:
         """Find all sessions for a specific user."""
-        query = self.db.query(SessionModel).filter(SessionModel.user_id == user_id)
-        query = query.order_by(SessionModel.updated_time.desc())
+        limit, offset = _pagination_window(pagination)
+        return self.find_by_user_page(user_id, limit=limit, offset=offset)
 
-        if pagination:
-            offset = (pagination.page - 1) * pagination.page_size
-            query = query.offset(offset).limit(pagination.page_size)
-
-        models = query.all()
+    def find_by_user_page(
+        self,
+        user_id: UserId,
+        limit: int | None,
+        offset: int = 0,
+        after: KeysetCursor | None = None,
+    ) -> list[Session]:
+        """Find a page of a user's sessions by offset or after a keyset cursor."""
+        models = self.db.execute(
+            _user_sessions_stmt(user_id, limit=limit, offset=offset, after=after)
+        ).scalars()
         return [Session.model_validate(model) for model in models]
 
     def count_by_user(self, user_id: UserId) -> int:
@@ -102,8 +164,9 @@ class SessionRepository(PaginatedRepository[SessionModel, Session], ISessionRepo
         session_id: SessionId,
         user_id: UserId,
         pagination: PaginationInfo | None = None,
+        after: KeysetCursor | None = None,
     ) -> tuple[Session, list[Message]] | None:
-        """Find a session with its messages."""
+        """Find a session with its messages, optionally after a keyset cursor."""
         session_model = (
             self.db.query(SessionModel)
             .filter(
@@ -116,15 +179,10 @@ class SessionRepository(PaginatedRepository[SessionModel, Session], ISessionRepo
         if not session_model:
             return None
 
-        message_query = self.db.query(MessageModel).filter(
-            MessageModel.session_id == session_id
-        )
-
-        if pagination:
-            offset = (pagination.page - 1) * pagination.page_size
-            message_query = message_query.offset(offset).limit(pagination.page_size)
-
-        message_models = message_query.order_by(MessageModel.created_time.asc()).all()
+        limit, offset = _pagination_window(pagination)
+        message_models = self.db.execute(
+            _session_messages_stmt(session_id, limit=limit, offset=offset, after=after)
+        ).scalars()
 
         session = Session.model_validate(session_model)
         messages = [self._message_model_to_entity(model) for model in message_models]
@@ -145,3 +203,121 @@ class SessionRepository(PaginatedRepository[SessionModel, Session], ISessionRepo
             message_type=MessageType.TEXT,  # Default for now
             created_time=model.created_time,
         )
+
+
+class AsyncSessionRepository(
+    AsyncPaginatedRepository[SessionModel, Session], IAsyncSessionRepository
+):
+    """SQLAlchemy AsyncSession implementation of the session repository."""
+
+    def __init__(self, db: AsyncSession):
+        super().__init__(SessionModel, Session)
+        self.db = db
+
+    @property
+    def entity_name(self) -> str:
+        """Return the entity name for error messages."""
+        return "session"
+
+    def _user_session_stmt(self, session_id: SessionId, user_id: UserId):
+        return select(SessionModel).where(
+            SessionModel.id == session_id,
+            SessionModel.user_id == user_id,
+        )
+
+    async def find_by_user(
+        self, user_id: UserId, pagination: PaginationInfo | None = None
+    ) -> list[Session]:
+        """Find all sessions for a specific user."""
+        limit, offset = _pagination_window(pagination)
+        return await self.find_by_user_page(user_id, limit=limit, offset=offset)
+
+    async def find_by_user_page(
+        self,
+        user_id: UserId,
+        limit: int | None,
+        offset: int = 0,
+        after: KeysetCursor | None = None,
+    ) -> list[Session]:
+        """Find a page of a user's sessions by offset or after a keyset cursor."""
+        result = await self.db.execute(
+            _user_sessions_stmt(user_id, limit=limit, offset=offset, after=after)
+        )
+        return [Session.model_validate(model) for model in result.scalars().all()]
+
+    async def count_by_user(self, user_id: UserId) -> int:
+        """Count total sessions for a specific user."""
+        result = await self.db.execute(
+            select(func.count())
+            .select_from(SessionModel)
+            .where(SessionModel.user_id == user_id)
+        )
+        return result.scalar_one()
+
+    async def find_user_session(
+        self, session_id: SessionId, user_id: UserId
+    ) -> Session | None:
+        """Find a specific session belonging to a user."""
+        result = await self.db.execute(self._user_session_stmt(session_id, user_id))
+        model = result.scalars().first()
+        return Session.model_validate(model) if model else None
+
+    async def save(self, session: Session) -> Session:
+        """Save or update a session."""
+        if await self.exists(self.db, session.id):
+            update_model = UpdateSessionModel(
+                name=session.name,
+                agent_id=session.agent_id,
+                updated_time=session.updated_time,
+            )
+            return await self.update(
+                self.db, session.id, update_model.model_dump(exclude_none=True)
+            )
+
+        create_model = CreateSessionModel(
+            id=session.id,
+            name=session.name,
+            user_id=session.user_id,
+            agent_id=session.agent_id,
+            created_time=session.created_time,
+            updated_time=session.updated_time,
+        )
+        return await self.create(self.db, create_model.model_dump())
+
+    async def delete(self, session_id: SessionId, user_id: UserId) -> bool:
+        """Delete a session belonging to a user."""
+        result = await self.db.execute(self._user_session_stmt(session_id, user_id))
+        if not result.scalars().first():
+            return False
+
+        await super().delete(self.db, session_id)
+        return True
+
+    async def find_user_session_with_messages(
+        self,
+        session_id: SessionId,
+        user_id: UserId,
+        pagination: PaginationInfo | None = None,
+        after: KeysetCursor | None = None,
+    ) -> tuple[Session, list[Message]] | None:
+        """Find a session with its messages, optionally after a keyset cursor."""
+        result = await self.db.execute(self._user_session_stmt(session_id, user_id))
+        session_model = result.scalars().first()
+
+        if not session_model:
+            return None
+
+        limit, offset = _pagination_window(pagination)
+        message_result = await self.db.execute(
+            _session_messages_stmt(session_id, limit=limit, offset=offset, after=after)
+        )
+
+        session = Session.model_validate(session_model)
+        messages = [
+            self._message_model_to_entity(model)
+            for model in message_result.scalars().all()
+        ]
+
+        return session, messages
+
+    _message_model_to_entity = SessionRepository._message_model_to_entity
@@ -2,7 +2,7 @@
 FastAPI router for managing session-specific artifacts via REST endpoints.
 """
 
-from collections.abc import Callable
+from collections.abc import AsyncIterator, Callable
 from typing import TYPE_CHECKING, Any
 
 from fastapi import (
@@ -29,6 +29,7 @@ except ImportError:
 
 import io
 import json
+import time
 from datetime import datetime, timezone
 from urllib.parse import parse_qs, quote, urlparse
 
@@ -54,21 +55,32 @@ from ..dependencies import (
 )
 
 if TYPE_CHECKING:
+    from ....common.utils.metrics import ComponentMetrics
     from ....gateway.http_sse.component import WebUIBackendComponent
 
 from ..session_manager import SessionManager
 from ..services.session_service import SessionService
 from sqlalchemy.orm import Session
 
+from ....agent.adk.artifacts.streaming import (
+    ArtifactStream,
+    ArtifactTooLargeError,
+    open_artifact_stream,
+)
 from ....agent.utils.artifact_helpers import (
     DEFAULT_SCHEMA_MAX_KEYS,
     format_artifact_uri,
     get_artifact_info_list,
-    load_artifact_content_or_metadata,
-    save_artifact_with_metadata,
+    save_artifact_stream_with_metadata,
 )
 
 
+# Artifact versions do not change once written, but a version number is
+# reused if the artifact is deleted and saved again, so caching is bounded.
+ARTIFACT_VERSION_CACHE_CONTROL = "private, max-age=3600"
+LATEST_ARTIFACT_CACHE_CONTROL = "private, no-cache"
+
+
 class ArtifactUploadResponse(BaseModel):
     """Response model for artifact upload with camelCase fields."""
     uri: str
@@ -84,6 +96,28 @@ class ArtifactUploadResponse(BaseModel):
 
 router = APIRouter()
 
+UPLOAD_CHUNK_SIZE = 1024 * 1024
+DEFAULT_MAX_UPLOAD_SIZE_BYTES = 1024 * 1024 * 1024
+
+
+def _max_upload_size_bytes(component: "WebUIBackendComponent") -> int:
+    return component.get_config("max_upload_size_bytes", DEFAULT_MAX_UPLOAD_SIZE_BYTES)
+
+
+def _reject_oversized_upload(upload_file: UploadFile, max_size_bytes: int) -> None:
+    """Rejects an upload whose size is known to exceed the limit before reading it."""
+    if upload_file.size is not None and upload_file.size > max_size_bytes:
+        raise HTTPException(
+            status_code=status.HTTP_413_REQUEST_ENTITY_TOO_LARGE,
+            detail=f"File exceeds the maximum upload size of {max_size_bytes} bytes.",
+        )
+
+
+async def _iter_upload_chunks(upload_file: UploadFile, first_chunk: bytes):
+    yield first_chunk
+    while chunk := await upload_file.read(UPLOAD_CHUNK_SIZE):
+        yield chunk
+
 
 @router.post(
     "/upload",
@@ -182,10 +216,13 @@ async def upload_artifact_with_session(
 
     log.info("%sUploading file '%s' to session '%s'", log_prefix, filename.strip(), effective_session_id)
 
+    max_size_bytes = _max_upload_size_bytes(component)
+    _reject_oversized_upload(upload_file, max_size_bytes)
+
     try:
-        # Read and validate file content
-        content_bytes = await upload_file.read()
-        if not content_bytes:
+        # Read the first chunk to reject empty files; the rest is streamed.
+        first_chunk = await upload_file.read(UPLOAD_CHUNK_SIZE)
+        if not first_chunk:
             raise HTTPException(
                 status_code=status.HTTP_400_BAD_REQUEST,
                 detail="File is empty.",
@@ -194,7 +231,7 @@ async def upload_artifact_with_session(
         mime_type = upload_file.content_type or "application/octet-stream"
         filename_clean = filename.strip()
 
-        log.debug("%sProcessing file: %s (%d bytes, %s)", log_prefix, filename_clean, len(content_bytes), mime_type)
+        log.debug("%sProcessing file: %s (%s bytes, %s)", log_prefix, filename_clean, upload_file.size, mime_type)
 
         # Parse and validate metadata
         metadata = {}
@@ -208,34 +245,58 @@ async def upload_artifact_with_session(
                 raise HTTPException(
                     status_code=status.HTTP_400_BAD_REQUEST,
                     detail=f"Invalid JSON in metadata field: {str(e)}",
-                )
+                ) from e
 
         app_name = component.get_config("name", "A2A_WebUI_App")
 
-        # Store the artifact using the service
-        artifact_uri = await artifact_service.store(
+        # Stream the upload into the artifact service
+        save_result = await save_artifact_stream_with_metadata(
+            artifact_service=artifact_service,
             app_name=app_name,
             user_id=user_id,
             session_id=effective_session_id,
             filename=filename_clean,
-            content_bytes=content_bytes,
+            chunks=_iter_upload_chunks(upload_file, first_chunk),
             mime_type=mime_type,
-            metadata=metadata,
+            metadata_dict=metadata,
+            timestamp=datetime.now(timezone.utc),
+            max_size_bytes=max_size_bytes,
+            schema_max_keys=component.get_config(
+                "schema_max_keys", DEFAULT_SCHEMA_MAX_KEYS
+            ),
+        )
+        if save_result["status"] == "error":
+            raise HTTPException(
+                status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+                detail=save_result.get("message", "Failed to store artifact."),
+            )
+
+        artifact_uri = format_artifact_uri(
+            app_name=app_name,
+            user_id=user_id,
+            session_id=effective_session_id,
+            filename=filename_clean,
+            version=save_result["data_version"],
         )
 
-        log.info("%sArtifact stored successfully: %s (%d bytes)", log_prefix, artifact_uri, len(content_bytes))
+        log.info("%sArtifact stored successfully: %s (%d bytes)", log_prefix, artifact_uri, save_result["size_bytes"])
 
         # Return standardized response using Pydantic model (ensures camelCase conversion)
         return ArtifactUploadResponse(
             uri=artifact_uri,
             session_id=effective_session_id,  # Will be returned as "sessionId" due to alias
             filename=filename_clean,
-            size=len(content_bytes),
+            size=save_result["size_bytes"],
             mime_type=mime_type,  # Will be returned as "mimeType" due to alias
             metadata=metadata,
             created_at=datetime.now(timezone.utc).isoformat(),  # Will be returned as "createdAt" due to alias
         )
 
+    except ArtifactTooLargeError as e:
+        log.warning("%sUpload rejected: %s", log_prefix, e)
+        raise HTTPException(
+            status_code=status.HTTP_413_REQUEST_ENTITY_TOO_LARGE, detail=str(e)
+        ) from e
     except HTTPException:
         # Re-raise HTTP exceptions as-is
         raise
@@ -244,7 +305,7 @@ async def upload_artifact_with_session(
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail="Failed to store artifact due to an internal error.",
-        )
+        ) from e
     finally:
         # Ensure file is properly closed
         try:
@@ -315,18 +376,18 @@ async def list_artifact_versions(
         )
         log.info("%s Found versions: %s", log_prefix, versions)
         return versions
-    except FileNotFoundError:
+    except FileNotFoundError as e:
         log.warning("%s Artifact not found.", log_prefix)
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail=f"Artifact '{filename}' not found for this session.",
-        )
+        ) from e
     except Exception as e:
         log.exception("%s Error listing artifact versions: %s", log_prefix, e)
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail=f"Failed to list artifact versions: {str(e)}",
-        )
+        ) from e
 
 
 @router.get(
@@ -402,8 +463,252 @@ async def list_artifacts(
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail=f"Failed to retrieve artifact details: {str(e)}",
+        ) from e
+
+
+class _RangeNotSatisfiable(Exception):
+    """The Range header selects no bytes of the artifact."""
+
+
+def _parse_range_header(range_header: str | None, size: int) -> tuple[int, int] | None:
+    """
+    Parses a single `bytes=` range into [start, end) offsets.
+
+    Returns None when the whole artifact should be served: no header, a
+    malformed header or several ranges (which servers may ignore).
+
+    Raises:
+        _RangeNotSatisfiable: If the range starts beyond the end of the artifact.
+    """
+    if not range_header:
+        return None
+    unit, _, ranges = range_header.strip().partition("=")
+    if unit.strip().lower() != "bytes" or "," in ranges:
+        return None
+    first, dash, last = ranges.strip().partition("-")
+    if not dash:
+        return None
+    try:
+        if not first:
+            suffix_length = int(last)
+            if suffix_length < 0:
+                return None
+            if suffix_length == 0 or size == 0:
+                raise _RangeNotSatisfiable()
+            return max(0, size - suffix_length), size
+        start = int(first)
+        end = int(last) + 1 if last else None
+    except ValueError:
+        return None
+    if start < 0 or (end is not None and end <= start):
+        return None
+    if start >= size:
+        raise _RangeNotSatisfiable()
+    return start, size if end is None else min(end, size)
+
+
+def _if_none_match(header: str | None, etag: str) -> bool:
+    """Weak comparison of an If-None-Match header against an entity tag."""
+    if not header:
+        return False
+    if header.strip() == "*":
+        return True
+    return any(
+        candidate.strip().removeprefix("W/") == etag for candidate in header.split(",")
+    )
+
+
+def _content_disposition(filename: str) -> str:
+    return f"attachment; filename*=UTF-8''{quote(filename)}"
+
+
+async def _count_read_bytes(
+    chunks: AsyncIterator[bytes], metrics: "ComponentMetrics"
+) -> AsyncIterator[bytes]:
+    # Only bytes are recorded: the time to stream a download depends on the
+    # client, so it would skew the artifact load duration histogram.
+    num_bytes = 0
+    try:
+        async for chunk in chunks:
+            num_bytes += len(chunk)
+            yield chunk
+    finally:
+        metrics.record_artifact_io("read", num_bytes)
+
+
+def _artifact_stream_response(
+    request: FastAPIRequest,
+    stream: ArtifactStream,
+    cache_control: str,
+    metrics: "ComponentMetrics",
+) -> Response:
+    """
+    Serves an artifact version straight from storage, honouring conditional
+    (If-None-Match, If-Range) and single-range requests. The bytes served are
+    recorded as an artifact read in `metrics`.
+    """
+    etag = stream.etag
+    if _if_none_match(request.headers.get("if-none-match"), etag):
+        return Response(
+            status_code=status.HTTP_304_NOT_MODIFIED,
+            headers={"ETag": etag, "Cache-Control": cache_control},
+        )
+
+    headers = {
+        "Content-Disposition": _content_disposition(stream.filename),
+        "ETag": etag,
+        "Cache-Control": cache_control,
+        "Accept-Ranges": "bytes",
+    }
+    byte_range = None
+    if_range = request.headers.get("if-range")
+    if if_range is None or if_range.strip() == etag:
+        try:
+            byte_range = _parse_range_header(
+                request.headers.get("range"), stream.size_bytes
+            )
+        except _RangeNotSatisfiable:
+            return Response(
+                status_code=status.HTTP_416_REQUESTED_RANGE_NOT_SATISFIABLE,
+                headers={**headers, "Content-Range": f"bytes */{stream.size_bytes}"},
+            )
+
+    if byte_range is None:
+        start, end = 0, stream.size_bytes
+        status_code = status.HTTP_200_OK
+    else:
+        start, end = byte_range
+        status_code = status.HTTP_206_PARTIAL_CONTENT
+        headers["Content-Range"] = f"bytes {start}-{end - 1}/{stream.size_bytes}"
+    headers["Content-Length"] = str(end - start)
+
+    return StreamingResponse(
+        _count_read_bytes(stream.iter_bytes(start, end), metrics),
+        status_code=status_code,
+        media_type=stream.mime_type,
+        headers=headers,
+    )
+
+
+async def _resolve_embeds_for_download(
+    data_bytes: bytes,
+    artifact_service: BaseArtifactService,
+    component: "WebUIBackendComponent",
+    user_id: str,
+    session_id: str,
+    log_prefix: str,
+) -> bytes:
+    """
+    Resolves late embeds in a text artifact being downloaded. The original
+    content is returned if it cannot be decoded or resolution fails.
+    """
+    log.info(
+        "%s Artifact is text-based. Attempting recursive embed resolution.",
+        log_prefix,
+    )
+    try:
+        original_content_string = data_bytes.decode("utf-8")
+
+        context_for_resolver = {
+            "artifact_service": artifact_service,
+            "session_context": {
+                "app_name": component.gateway_id,
+                "user_id": user_id,
+                "session_id": session_id,
+            },
+        }
+        config_for_resolver = {
+            "gateway_max_artifact_resolve_size_bytes": component.gateway_max_artifact_resolve_size_bytes,
+            "gateway_recursive_embed_depth": component.gateway_recursive_embed_depth,
+        }
+
+        resolved_content_string = await resolve_embeds_recursively_in_string(
+            text=original_content_string,
+            context=context_for_resolver,
+            resolver_func=evaluate_embed,
+            types_to_resolve=LATE_EMBED_TYPES,
+            log_identifier=f"{log_prefix}[RecursiveResolve]",
+            config=config_for_resolver,
+            max_depth=component.gateway_recursive_embed_depth,
+            max_total_size=component.gateway_max_artifact_resolve_size_bytes,
+        )
+        data_bytes = resolved_content_string.encode("utf-8")
+        log.info(
+            "%s Recursive embed resolution complete. New size: %d bytes.",
+            log_prefix,
+            len(data_bytes),
+        )
+    except UnicodeDecodeError as ude:
+        log.warning(
+            "%s Failed to decode artifact for recursive resolution: %s. Serving original content.",
+            log_prefix,
+            ude,
+        )
+    except Exception as resolve_err:
+        log.exception(
+            "%s Error during recursive embed resolution: %s. Serving original content.",
+            log_prefix,
+            resolve_err,
+        )
+    return data_bytes
+
+
+async def _artifact_download_response(
+    request: FastAPIRequest,
+    stream: ArtifactStream,
+    artifact_service: BaseArtifactService,
+    component: "WebUIBackendComponent",
+    user_id: str,
+    session_id: str,
+    cache_control: str,
+    log_prefix: str,
+) -> Response:
+    """
+    Builds the download response for an opened artifact version.
+
+    Text artifacts with embed resolution enabled are loaded and resolved, and
+    served without an entity tag since their content depends on other
+    artifacts. Everything else, including text artifacts larger than
+    gateway_max_artifact_resolve_size_bytes, is streamed from storage.
+    """
+    max_resolve_bytes = component.gateway_max_artifact_resolve_size_bytes
+    if is_text_based_mime_type(stream.mime_type) and component.enable_embed_resolution:
+        if stream.size_bytes <= max_resolve_bytes:
+            load_started = time.perf_counter()
+            data_bytes = await stream.read()
+            component.metrics.record_artifact_io(
+                "read", len(data_bytes), time.perf_counter() - load_started
+            )
+            data_bytes = await _resolve_embeds_for_download(
+                data_bytes,
+                artifact_service,
+                component,
+                user_id,
+                session_id,
+                log_prefix,
+            )
+            return StreamingResponse(
+                io.BytesIO(data_bytes),
+                media_type=stream.mime_type,
+                headers={"Content-Disposition": _content_disposition(stream.filename)},
+            )
+
+        log.info(
+            "%s Artifact size %d exceeds the embed resolution limit of %d bytes. Streaming original content.",
+            log_prefix,
+            stream.size_bytes,
+            max_resolve_bytes,
+        )
+    else:
+        log.info(
+            "%s Artifact is not text-based or embed resolution is disabled. Streaming original content.",
+            log_prefix,
         )
 
+    return _artifact_stream_response(
+        request, stream, cache_control, component.metrics
+    )
+
 
 @router.get(
     "/{session_id}/{filename}",
@@ -411,6 +716,7 @@ async def list_artifacts(
     description="Retrieves the content of the latest version of a specific artifact.",
 )
 async def get_latest_artifact(
+    request: FastAPIRequest,
     session_id: str = Path(
         ..., title="Session ID", description="The session ID to get artifacts from"
     ),
@@ -423,7 +729,8 @@ async def get_latest_artifact(
 ):
     """
     Retrieves the content of the latest version of the specified artifact
-    associated with the current user and session ID.
+    associated with the current user and session ID. Supports Range requests
+    and conditional requests with If-None-Match.
     """
     log_prefix = (
         f"[ArtifactRouter:GetLatest:{filename}] User={user_id}, Session={session_id} -"
@@ -439,105 +746,53 @@ async def get_latest_artifact(
 
     try:
         app_name = component.get_config("name", "A2A_WebUI_App")
-        artifact_part = await artifact_service.load_artifact(
+        stream = await open_artifact_stream(
+            artifact_service,
             app_name=app_name,
             user_id=user_id,
             session_id=session_id,
             filename=filename,
         )
 
-        if artifact_part is None or artifact_part.inline_data is None:
+        if stream is None:
             log.warning("%s Artifact not found or has no data.", log_prefix)
             raise HTTPException(
                 status_code=status.HTTP_404_NOT_FOUND,
                 detail=f"Artifact '{filename}' not found or is empty.",
             )
 
-        data_bytes = artifact_part.inline_data.data
-        mime_type = artifact_part.inline_data.mime_type or "application/octet-stream"
         log.info(
-            "%s Artifact loaded successfully (%d bytes, %s).",
+            "%s Artifact version %d opened (%d bytes, %s).",
             log_prefix,
-            len(data_bytes),
-            mime_type,
+            stream.version,
+            stream.size_bytes,
+            stream.mime_type,
         )
-
-        if is_text_based_mime_type(mime_type) and component.enable_embed_resolution:
-            log.info(
-                "%s Artifact is text-based. Attempting recursive embed resolution.",
-                log_prefix,
-            )
-            try:
-                original_content_string = data_bytes.decode("utf-8")
-
-                context_for_resolver = {
-                    "artifact_service": artifact_service,
-                    "session_context": {
-                        "app_name": component.gateway_id,
-                        "user_id": user_id,
-                        "session_id": session_id,
-                    },
-                }
-                config_for_resolver = {
-                    "gateway_max_artifact_resolve_size_bytes": component.gateway_max_artifact_resolve_size_bytes,
-                    "gateway_recursive_embed_depth": component.gateway_recursive_embed_depth,
-                }
-
-                resolved_content_string = await resolve_embeds_recursively_in_string(
-                    text=original_content_string,
-                    context=context_for_resolver,
-                    resolver_func=evaluate_embed,
-                    types_to_resolve=LATE_EMBED_TYPES,
-                    log_identifier=f"{log_prefix}[RecursiveResolve]",
-                    config=config_for_resolver,
-                    max_depth=component.gateway_recursive_embed_depth,
-                    max_total_size=component.gateway_max_artifact_resolve_size_bytes,
-                )
-                data_bytes = resolved_content_string.encode("utf-8")
-                log.info(
-                    "%s Recursive embed resolution complete. New size: %d bytes.",
-                    log_prefix,
-                    len(data_bytes),
-                )
-            except UnicodeDecodeError as ude:
-                log.warning(
-                    "%s Failed to decode artifact for recursive resolution: %s. Serving original content.",
-                    log_prefix,
-                    ude,
-                )
-            except Exception as resolve_err:
-                log.exception(
-                    "%s Error during recursive embed resolution: %s. Serving original content.",
-                    log_prefix,
-                    resolve_err,
-                )
-        else:
-            log.info(
-                "%s Artifact is not text-based or embed resolution is disabled. Serving original content.",
-                log_prefix,
-            )
-
-        filename_encoded = quote(filename)
-        return StreamingResponse(
-            io.BytesIO(data_bytes),
-            media_type=mime_type,
-            headers={
-                "Content-Disposition": f"attachment; filename*=UTF-8''{filename_encoded}"
-            },
+        return await _artifact_download_response(
+            request,
+            stream,
+            artifact_service,
+            component,
+            user_id,
+            session_id,
+            LATEST_ARTIFACT_CACHE_CONTROL,
+            log_prefix,
         )
 
-    except FileNotFoundError:
+    except HTTPException:
+        raise
+    except FileNotFoundError as e:
         log.warning("%s Artifact not found by service.", log_prefix)
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail=f"Artifact '{filename}' not found.",
-        )
+        ) from e
     except Exception as e:
         log.exception("%s Error loading artifact: %s", log_prefix, e)
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail=f"Failed to load artifact: {str(e)}",
-        )
+        ) from e
 
 
 @router.get(
@@ -546,6 +801,7 @@ async def get_latest_artifact(
     description="Retrieves the content of a specific version of an artifact.",
 )
 async def get_specific_artifact_version(
+    request: FastAPIRequest,
     session_id: str = Path(
         ..., title="Session ID", description="The session ID to get artifacts from"
     ),
@@ -563,7 +819,8 @@ async def get_specific_artifact_version(
 ):
     """
     Retrieves the content of a specific version of the specified artifact
-    associated with the current user and session ID.
+    associated with the current user and session ID. Supports Range requests
+    and conditional requests with If-None-Match.
     """
     log_prefix = f"[ArtifactRouter:GetVersion:{filename} v{version}] User={user_id}, Session={session_id} -"
     log.info("%s Request received.", log_prefix)
@@ -586,142 +843,78 @@ async def get_specific_artifact_version(
     try:
         app_name = component.get_config("name", "A2A_WebUI_App")
 
-        load_result = await load_artifact_content_or_metadata(
-            artifact_service=artifact_service,
+        if isinstance(version, str) and version.lower() == "latest":
+            requested_version = None
+            cache_control = LATEST_ARTIFACT_CACHE_CONTROL
+        else:
+            try:
+                requested_version = int(version)
+            except ValueError as e:
+                raise ValueError(
+                    f"Invalid version specified: '{version}'. Must be a positive integer string or 'latest'."
+                ) from e
+            if requested_version < 0:
+                raise ValueError(
+                    f"Version number must be a positive integer. Got: {requested_version}"
+                )
+            cache_control = ARTIFACT_VERSION_CACHE_CONTROL
+
+        stream = await open_artifact_stream(
+            artifact_service,
             app_name=app_name,
             user_id=user_id,
             session_id=session_id,
             filename=filename,
-            version=version,
-            load_metadata_only=False,
-            return_raw_bytes=True,
-            log_identifier_prefix="[ArtifactRouter:GetVersion]",
+            version=requested_version,
         )
 
-        if load_result.get("status") != "success":
-            error_message = load_result.get(
-                "message", f"Failed to load artifact '{filename}' version '{version}'."
-            )
-            log.warning("%s %s", log_prefix, error_message)
-            if (
-                "not found" in error_message.lower()
-                or "no versions available" in error_message.lower()
-            ):
-                status_code = status.HTTP_404_NOT_FOUND
-            elif "invalid version" in error_message.lower():
-                status_code = status.HTTP_400_BAD_REQUEST
-            else:
-                status_code = status.HTTP_500_INTERNAL_SERVER_ERROR
-            raise HTTPException(status_code=status_code, detail=error_message)
-
-        data_bytes = load_result.get("raw_bytes")
-        mime_type = load_result.get("mime_type", "application/octet-stream")
-        resolved_version_from_helper = load_result.get("version")
-        if data_bytes is None:
-            log.error(
-                "%s Helper (with return_raw_bytes=True) returned success but no raw_bytes for '%s' v%s (resolved to %s).",
-                log_prefix,
-                filename,
-                version,
-                resolved_version_from_helper,
-            )
+        if stream is None:
+            log.warning("%s Artifact version not found.", log_prefix)
             raise HTTPException(
-                status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-                detail="Internal error retrieving artifact content.",
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail=f"Artifact '{filename}' version {version} not found.",
             )
 
         log.info(
-            "%s Artifact '%s' version %s (resolved to %s) loaded successfully (%d bytes, %s). Streaming content.",
+            "%s Artifact '%s' version %s (resolved to %d) opened (%d bytes, %s).",
             log_prefix,
             filename,
             version,
-            resolved_version_from_helper,
-            len(data_bytes),
-            mime_type,
+            stream.version,
+            stream.size_bytes,
+            stream.mime_type,
         )
-
-        if is_text_based_mime_type(mime_type) and component.enable_embed_resolution:
-            log.info(
-                "%s Artifact is text-based. Attempting recursive embed resolution.",
-                log_prefix,
-            )
-            try:
-                original_content_string = data_bytes.decode("utf-8")
-
-                context_for_resolver = {
-                    "artifact_service": artifact_service,
-                    "session_context": {
-                        "app_name": component.gateway_id,
-                        "user_id": user_id,
-                        "session_id": session_id,
-                    },
-                }
-                config_for_resolver = {
-                    "gateway_max_artifact_resolve_size_bytes": component.gateway_max_artifact_resolve_size_bytes,
-                    "gateway_recursive_embed_depth": component.gateway_recursive_embed_depth,
-                }
-
-                resolved_content_string = await resolve_embeds_recursively_in_string(
-                    text=original_content_string,
-                    context=context_for_resolver,
-                    resolver_func=evaluate_embed,
-                    types_to_resolve=LATE_EMBED_TYPES,
-                    log_identifier=f"{log_prefix}[RecursiveResolve]",
-                    config=config_for_resolver,
-                    max_depth=component.gateway_recursive_embed_depth,
-                    max_total_size=component.gateway_max_artifact_resolve_size_bytes,
-                )
-                data_bytes = resolved_content_string.encode("utf-8")
-                log.info(
-                    "%s Recursive embed resolution complete. New size: %d bytes.",
-                    log_prefix,
-                    len(data_bytes),
-                )
-            except UnicodeDecodeError as ude:
-                log.warning(
-                    "%s Failed to decode artifact for recursive resolution: %s. Serving original content.",
-                    log_prefix,
-                    ude,
-                )
-            except Exception as resolve_err:
-                log.exception(
-                    "%s Error during recursive embed resolution: %s. Serving original content.",
-                    log_prefix,
-                    resolve_err,
-                )
-        else:
-            log.info(
-                "%s Artifact is not text-based or embed resolution is disabled. Serving original content.",
-                log_prefix,
-            )
-
-        filename_encoded = quote(filename)
-        return StreamingResponse(
-            io.BytesIO(data_bytes),
-            media_type=mime_type,
-            headers={
-                "Content-Disposition": f"attachment; filename*=UTF-8''{filename_encoded}"
-            },
+        return await _artifact_download_response(
+            request,
+            stream,
+            artifact_service,
+            component,
+            user_id,
+            session_id,
+            cache_control,
+            log_prefix,
         )
 
-    except FileNotFoundError:
+    except HTTPException:
+        raise
+    except FileNotFoundError as e:
         log.warning("%s Artifact version not found by service.", log_prefix)
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail=f"Artifact '{filename}' version {version} not found.",
-        )
+        ) from e
     except ValueError as ve:
         log.warning("%s Invalid request (e.g., version format): %s", log_prefix, ve)
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail=f"Invalid request: {str(ve)}",
-        )
+        ) from ve
     except Exception as e:
         log.exception("%s Error loading artifact version: %s", log_prefix, e)
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail=f"Failed to load artifact version: {str(e)}",
-        )
+        ) from e
 
 
 @router.get(
@@ -731,6 +924,7 @@ async def get_specific_artifact_version(
     description="Resolves a formal artifact:// URI and streams its content. This endpoint is secure and validates that the requesting user is authorized to access the specified artifact.",
 )
 async def get_artifact_by_uri(
+    request: FastAPIRequest,
     uri: str,
     requesting_user_id: str = Depends(get_user_id),
     component: "WebUIBackendComponent" = Depends(get_sac_component),
@@ -792,40 +986,36 @@ async def get_artifact_by_uri(
             requesting_user_id,
         )
 
-        loaded_artifact = await load_artifact_content_or_metadata(
-            artifact_service=artifact_service,
+        stream = await open_artifact_stream(
+            artifact_service,
             app_name=app_name,
             user_id=owner_user_id,
             session_id=session_id,
             filename=filename,
             version=int(version),
-            return_raw_bytes=True,
-            log_identifier_prefix=log_id_prefix,
-            component=component,
         )
 
-        if loaded_artifact.get("status") != "success":
-            raise HTTPException(status_code=404, detail=loaded_artifact.get("message"))
-
-        content_bytes = loaded_artifact.get("raw_bytes")
-        mime_type = loaded_artifact.get("mime_type", "application/octet-stream")
+        if stream is None:
+            raise HTTPException(
+                status_code=404,
+                detail=f"Artifact '{filename}' version {version} not found.",
+            )
 
-        filename_encoded = quote(filename)
-        return StreamingResponse(
-            io.BytesIO(content_bytes),
-            media_type=mime_type,
-            headers={
-                "Content-Disposition": f"attachment; filename*=UTF-8''{filename_encoded}"
-            },
+        return _artifact_stream_response(
+            request, stream, ARTIFACT_VERSION_CACHE_CONTROL, component.metrics
         )
 
+    except HTTPException:
+        raise
     except (ValueError, IndexError) as e:
-        raise HTTPException(status_code=400, detail=f"Invalid artifact URI: {e}")
+        raise HTTPException(
+            status_code=400, detail=f"Invalid artifact URI: {e}"
+        ) from e
     except Exception as e:
         log.exception("%s Error fetching artifact by URI: %s", log_id_prefix, e)
         raise HTTPException(
             status_code=500, detail="Internal server error fetching artifact by URI"
-        )
+        ) from e
 
 
 @router.post(
@@ -881,9 +1071,13 @@ async def upload_artifact(
             detail="Artifact service is not configured.",
         )
 
+    max_size_bytes = _max_upload_size_bytes(component)
+    _reject_oversized_upload(upload_file, max_size_bytes)
+
     try:
-        content_bytes = await upload_file.read()
-        if not content_bytes:
+        # Read the first chunk to reject empty files; the rest is streamed.
+        first_chunk = await upload_file.read(UPLOAD_CHUNK_SIZE)
+        if not first_chunk:
             log.warning("%s Uploaded file is empty.", log_prefix)
             raise HTTPException(
                 status_code=status.HTTP_400_BAD_REQUEST,
@@ -912,16 +1106,17 @@ async def upload_artifact(
         app_name = component.get_config("name", "A2A_WebUI_App")
         current_timestamp = datetime.now(timezone.utc)
 
-        save_result = await save_artifact_with_metadata(
+        save_result = await save_artifact_stream_with_metadata(
             artifact_service=artifact_service,
             app_name=app_name,
             user_id=user_id,
             session_id=session_id,
             filename=filename,
-            content_bytes=content_bytes,
+            chunks=_iter_upload_chunks(upload_file, first_chunk),
             mime_type=mime_type,
             metadata_dict=parsed_metadata,
             timestamp=current_timestamp,
+            max_size_bytes=max_size_bytes,
             schema_max_keys=component.get_config(
                 "schema_max_keys", DEFAULT_SCHEMA_MAX_KEYS
             ),
@@ -953,7 +1148,7 @@ async def upload_artifact(
                 "data_version": saved_version,
                 "metadata_version": save_result.get("metadata_version"),
                 "mime_type": mime_type,
-                "size": len(content_bytes),
+                "size": save_result["size_bytes"],
                 "message": save_result.get("message"),
                 "status": save_result["status"],
                 "uri": artifact_uri,
@@ -973,12 +1168,17 @@ async def upload_artifact(
 
     except HTTPException:
         raise
+    except ArtifactTooLargeError as e:
+        log.warning("%s Upload rejected: %s", log_prefix, e)
+        raise HTTPException(
+            status_code=status.HTTP_413_REQUEST_ENTITY_TOO_LARGE, detail=str(e)
+        ) from e
     except Exception as e:
         log.exception("%s Error saving artifact: %s", log_prefix, e)
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail=f"Failed to save artifact: {str(e)}",
-        )
+        ) from e
     finally:
         await upload_file.close()
         log.debug("%s Upload file closed.", log_prefix)
@@ -1045,4 +1245,4 @@ async def delete_artifact(
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail=f"Failed to delete artifact: {str(e)}",
-        )
+        ) from e
@@ -1,11 +1,20 @@
-from fastapi import APIRouter, Body, Depends, HTTPException, Query, status
+from typing import Any, Callable
+
+from fastapi import APIRouter, Body, Depends, HTTPException, Query, Response, status
 from solace_ai_connector.common.log import log
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
 
-from ..dependencies import get_session_business_service, get_db
-from ..services.session_service import SessionService
+from ..dependencies import get_session_db, get_session_db_service
+from ..services.session_service import AsyncSessionService, SessionService
 from ..shared.auth_utils import get_current_user
-from ..shared.pagination import DataResponse, PaginatedResponse, PaginationParams
+from ..shared.pagination import (
+    MAX_PAGE_SIZE,
+    DataResponse,
+    PaginatedResponse,
+    PaginationParams,
+)
+from ..shared.types import PaginationInfo
 from ..shared.response_utils import create_data_response
 from .dto.requests.session_requests import (
     GetSessionHistoryRequest,
@@ -16,22 +25,51 @@ from .dto.responses.session_responses import MessageResponse, SessionResponse
 
 router = APIRouter()
 
+NEXT_CURSOR_HEADER = "X-Next-Cursor"
+
+
+async def _call(method: Callable[..., Any], *args: Any, **kwargs: Any) -> Any:
+    """
+    Calls a method of the service returned by get_session_db_service, awaiting
+    it when that service is the AsyncSessionService.
+    """
+    if isinstance(method.__self__, AsyncSessionService):
+        return await method(*args, **kwargs)
+    return method(*args, **kwargs)
 
 
 @router.get("/sessions", response_model=PaginatedResponse[SessionResponse])
 async def get_all_sessions(
     page_number: int = Query(default=1, ge=1, alias="pageNumber"),
     page_size: int = Query(default=20, ge=1, le=100, alias="pageSize"),
-    db: Session = Depends(get_db),
+    cursor: str | None = Query(
+        default=None,
+        description="Opaque keyset cursor (meta.pagination.nextCursor of the previous page). Overrides pageNumber.",
+    ),
+    include_total: bool = Query(
+        default=True,
+        alias="includeTotal",
+        description="Set to false to skip computing count/totalPages.",
+    ),
+    db: AsyncSession | Session = Depends(get_session_db),
     user: dict = Depends(get_current_user),
-    session_service: SessionService = Depends(get_session_business_service),
+    session_service: AsyncSessionService | SessionService = Depends(
+        get_session_db_service
+    ),
 ):
     user_id = user.get("id")
     log.info(f"User '{user_id}' is listing sessions with pagination (page={page_number}, size={page_size})")
 
     try:
         pagination = PaginationParams(page_number=page_number, page_size=page_size)
-        paginated_response = session_service.get_user_sessions(db, user_id, pagination)
+        paginated_response = await _call(
+            session_service.get_user_sessions,
+            db,
+            user_id,
+            pagination,
+            cursor=cursor,
+            include_total=include_total,
+        )
 
         session_responses = []
         for session_domain in paginated_response.data:
@@ -47,20 +85,25 @@ async def get_all_sessions(
 
         return PaginatedResponse(data=session_responses, meta=paginated_response.meta)
 
+    except ValueError as e:
+        log.warning("Invalid session list request for user %s: %s", user_id, e)
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e)) from e
     except Exception as e:
         log.error("Error fetching sessions for user %s: %s", user_id, e)
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail="Failed to retrieve sessions",
-        )
+        ) from e
 
 
 @router.get("/sessions/{session_id}", response_model=DataResponse[SessionResponse])
 async def get_session(
     session_id: str,
-    db: Session = Depends(get_db),
+    db: AsyncSession | Session = Depends(get_session_db),
     user: dict = Depends(get_current_user),
-    session_service: SessionService = Depends(get_session_business_service),
+    session_service: AsyncSessionService | SessionService = Depends(
+        get_session_db_service
+    ),
 ):
     user_id = user.get("id")
     log.info("User %s attempting to fetch session_id: %s", user_id, session_id)
@@ -77,8 +120,11 @@ async def get_session(
 
         request_dto = GetSessionRequest(session_id=session_id, user_id=user_id)
 
-        session_domain = session_service.get_session_details(
-            db=db, session_id=request_dto.session_id, user_id=request_dto.user_id
+        session_domain = await _call(
+            session_service.get_session_details,
+            db=db,
+            session_id=request_dto.session_id,
+            user_id=request_dto.user_id,
         )
 
         if not session_domain:
@@ -111,15 +157,29 @@ async def get_session(
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail="Failed to retrieve session",
-        )
+        ) from e
 
 
 @router.get("/sessions/{session_id}/messages")
 async def get_session_history(
     session_id: str,
-    db: Session = Depends(get_db),
+    response: Response,
+    page_size: int | None = Query(
+        default=None,
+        ge=1,
+        le=MAX_PAGE_SIZE,
+        alias="pageSize",
+        description="Return at most this many messages. Without it (and without a cursor) the full history is returned.",
+    ),
+    cursor: str | None = Query(
+        default=None,
+        description=f"Opaque keyset cursor taken from the {NEXT_CURSOR_HEADER} response header.",
+    ),
+    db: AsyncSession | Session = Depends(get_session_db),
     user: dict = Depends(get_current_user),
-    session_service: SessionService = Depends(get_session_business_service),
+    session_service: AsyncSessionService | SessionService = Depends(
+        get_session_db_service
+    ),
 ):
     user_id = user.get("id")
     log.info(
@@ -136,13 +196,27 @@ async def get_session_history(
                 status_code=status.HTTP_404_NOT_FOUND, detail="Session not found."
             )
 
-        request_dto = GetSessionHistoryRequest(session_id=session_id, user_id=user_id)
+        pagination = None
+        if page_size is not None:
+            pagination = PaginationInfo(
+                page=1,
+                page_size=page_size,
+                total_items=0,
+                total_pages=0,
+                has_next=False,
+                has_previous=False,
+            )
+        request_dto = GetSessionHistoryRequest(
+            session_id=session_id, user_id=user_id, pagination=pagination
+        )
 
-        history_domain = session_service.get_session_history(
+        history_domain = await _call(
+            session_service.get_session_history,
             db=db,
             session_id=request_dto.session_id,
             user_id=request_dto.user_id,
             pagination=request_dto.pagination,
+            cursor=cursor,
         )
 
         if not history_domain:
@@ -169,10 +243,16 @@ async def get_session_history(
             )
             message_responses.append(message_response)
 
+        if history_domain.next_cursor:
+            response.headers[NEXT_CURSOR_HEADER] = history_domain.next_cursor
+
         return message_responses
 
     except HTTPException:
         raise
+    except ValueError as e:
+        log.warning("Invalid history request for session %s: %s", session_id, e)
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e)) from e
     except Exception as e:
         log.error(
             "Error fetching history for session %s for user %s: %s",
@@ -183,16 +263,18 @@ async def get_session_history(
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail="Failed to retrieve session history",
-        )
+        ) from e
 
 
 @router.patch("/sessions/{session_id}", response_model=SessionResponse)
 async def update_session_name(
     session_id: str,
     name: str = Body(..., embed=True),
-    db: Session = Depends(get_db),
+    db: AsyncSession | Session = Depends(get_session_db),
     user: dict = Depends(get_current_user),
-    session_service: SessionService = Depends(get_session_business_service),
+    session_service: AsyncSessionService | SessionService = Depends(
+        get_session_db_service
+    ),
 ):
     user_id = user.get("id")
     log.info("User %s attempting to update session %s", user_id, session_id)
@@ -211,7 +293,8 @@ async def update_session_name(
             session_id=session_id, user_id=user_id, name=name
         )
 
-        updated_domain = session_service.update_session_name(
+        updated_domain = await _call(
+            session_service.update_session_name,
             db=db,
             session_id=request_dto.session_id,
             user_id=request_dto.user_id,
@@ -240,7 +323,7 @@ async def update_session_name(
         log.warning("Validation error updating session %s: %s", session_id, e)
         raise HTTPException(
             status_code=status.HTTP_422_UNPROCESSABLE_ENTITY, detail=str(e)
-        )
+        ) from e
     except Exception as e:
         log.error(
             "Error updating session %s for user %s: %s",
@@ -251,22 +334,27 @@ async def update_session_name(
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail="Failed to update session",
-        )
+        ) from e
 
 
 @router.delete("/sessions/{session_id}", status_code=status.HTTP_204_NO_CONTENT)
 async def delete_session(
     session_id: str,
-    db: Session = Depends(get_db),
+    db: AsyncSession | Session = Depends(get_session_db),
     user: dict = Depends(get_current_user),
-    session_service: SessionService = Depends(get_session_business_service),
+    session_service: AsyncSessionService | SessionService = Depends(
+        get_session_db_service
+    ),
 ):
     user_id = user.get("id")
     log.info("User %s attempting to delete session %s", user_id, session_id)
 
     try:
-        deleted = session_service.delete_session_with_notifications(
-            db=db, session_id=session_id, user_id=user_id
+        deleted = await _call(
+            session_service.delete_session_with_notifications,
+            db=db,
+            session_id=session_id,
+            user_id=user_id,
         )
 
         if not deleted:
@@ -278,7 +366,7 @@ async def delete_session(
 
     except ValueError as e:
         log.warning("Validation error deleting session %s: %s", session_id, e)
-        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e)) from e
     except Exception as e:
         log.error(
             "Error deleting session %s for user %s: %s",
@@ -289,4 +377,4 @@ async def delete_session(
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail="Failed to delete session",
-        )
+        ) from e
@@ -2,6 +2,8 @@ import uuid
 from typing import TYPE_CHECKING, Optional
 
 from solace_ai_connector.common.log import log
+from sqlalchemy import event
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session as DbSession
 
 from ..repository import (
@@ -14,19 +16,303 @@ from ..repository import (
 from ..shared.enums import MessageType, SenderType
 from ..shared.types import PaginationInfo, SessionId, UserId
 from ..shared import now_epoch_ms
-from ..shared.pagination import PaginationParams, PaginatedResponse, get_pagination_or_default
+from ..shared.pagination import (
+    DEFAULT_PAGE_SIZE,
+    CountCache,
+    PaginationParams,
+    PaginatedResponse,
+    decode_cursor,
+    encode_cursor,
+    get_pagination_or_default,
+)
 
 if TYPE_CHECKING:
     from ..component import WebUIBackendComponent
 
+# Per-user session totals shared by all requests in this process. Entries are
+# invalidated when a local create/delete commits and expire after the TTL otherwise.
+_user_session_counts = CountCache(ttl_seconds=30.0)
+
+
+def _invalidate_count_on_commit(db: DbSession | AsyncSession, user_id: UserId) -> None:
+    """
+    Drops the user's cached session total once db commits. Invalidating before
+    the commit would let a concurrent request re-cache the old total.
+    """
+    sync_session = db.sync_session if isinstance(db, AsyncSession) else db
+    event.listen(
+        sync_session,
+        "after_commit",
+        lambda _session: _user_session_counts.invalidate(user_id),
+        once=True,
+    )
+
+
+class BaseSessionService:
+    """Validation and notification logic shared by the sync and async services."""
 
-class SessionService:
     def __init__(
         self,
         component: "WebUIBackendComponent" = None,
     ):
         self.component = component
 
+    def is_persistence_enabled(self) -> bool:
+        """Checks if the service is configured with a persistent backend."""
+        return self.component and self.component.database_url is not None
+
+    def _validate_user_id(self, user_id: UserId) -> None:
+        if not user_id or user_id.strip() == "":
+            raise ValueError("User ID cannot be empty")
+
+    def _validate_session_name(self, session_id: SessionId, name: str) -> None:
+        if not self._is_valid_session_id(session_id):
+            raise ValueError("Invalid session ID")
+
+        if not name or len(name.strip()) == 0:
+            raise ValueError("Session name cannot be empty")
+
+        if len(name.strip()) > 255:
+            raise ValueError("Session name cannot exceed 255 characters")
+
+    def _validate_new_message(self, session_id: SessionId, message: str) -> None:
+        if not self._is_valid_session_id(session_id):
+            raise ValueError("Invalid session ID")
+
+        if not message or message.strip() == "":
+            raise ValueError("Message cannot be empty")
+
+    def _sessions_window(
+        self,
+        user_id: UserId,
+        pagination: PaginationParams | None,
+        cursor: str | None,
+    ) -> tuple[PaginationParams, tuple | None, int]:
+        """Validates a session list request and returns (pagination, after, offset)."""
+        self._validate_user_id(user_id)
+        pagination = get_pagination_or_default(pagination)
+        after = decode_cursor(cursor) if cursor else None
+        offset = 0 if after else (pagination.page_number - 1) * pagination.page_size
+        return pagination, after, offset
+
+    @staticmethod
+    def _history_window(
+        pagination: PaginationInfo | None, cursor: str | None
+    ) -> tuple[PaginationInfo | None, tuple | None, int | None]:
+        """Returns (pagination, after, page_size) for a history request."""
+        after = decode_cursor(cursor) if cursor else None
+        page_size = None
+        if after is not None or (pagination is not None and pagination.page == 1):
+            page_size = pagination.page_size if pagination else DEFAULT_PAGE_SIZE
+            # Keyset scan from the cursor, with one look-ahead row.
+            pagination = PaginationInfo(
+                page=1,
+                page_size=page_size + 1,
+                total_items=0,
+                total_pages=0,
+                has_next=False,
+                has_previous=False,
+            )
+        return pagination, after, page_size
+
+    def _prepare_new_session(
+        self,
+        user_id: UserId,
+        session_id: str | None,
+        name: str | None,
+        agent_id: str | None,
+    ) -> Session | None:
+        """Returns the session to save, or None when persistence is disabled."""
+        if not self.is_persistence_enabled():
+            log.debug("Persistence is not enabled. Skipping session creation in DB.")
+            return None
+
+        self._validate_user_id(user_id)
+        return self._new_session_entity(user_id, session_id, name, agent_id)
+
+    @staticmethod
+    def _session_created(
+        db: DbSession | AsyncSession,
+        session: Session,
+        created_session: Session | None,
+        user_id: UserId,
+    ) -> Session:
+        if not created_session:
+            raise ValueError(f"Failed to save session for {session.id}")
+
+        log.info("Created new session %s for user %s", created_session.id, user_id)
+        _invalidate_count_on_commit(db, user_id)
+        return created_session
+
+    @staticmethod
+    def _can_delete(
+        session: Session | None, session_id: SessionId, user_id: UserId
+    ) -> bool:
+        if not session:
+            log.warning(
+                "Attempted to delete non-existent session %s by user %s",
+                session_id,
+                user_id,
+            )
+            return False
+
+        if not session.can_be_deleted_by_user(user_id):
+            log.warning(
+                "User %s not authorized to delete session %s", user_id, session_id
+            )
+            return False
+
+        return True
+
+    def _session_deleted(
+        self,
+        db: DbSession | AsyncSession,
+        session_id: SessionId,
+        user_id: UserId,
+        agent_id: str | None,
+    ) -> None:
+        _invalidate_count_on_commit(db, user_id)
+
+        log.info("Session %s deleted successfully by user %s", session_id, user_id)
+
+        if agent_id and self.component:
+            self._notify_agent_of_session_deletion(session_id, user_id, agent_id)
+
+    @staticmethod
+    def _build_sessions_page(
+        sessions: list[Session],
+        total_count: int | None,
+        pagination: PaginationParams,
+        keyset: bool,
+    ) -> PaginatedResponse[Session]:
+        """Trims the look-ahead row and derives the next keyset cursor."""
+        has_more = len(sessions) > pagination.page_size
+        sessions = sessions[: pagination.page_size]
+        next_cursor = None
+        if has_more and sessions:
+            last = sessions[-1]
+            next_cursor = encode_cursor(last.updated_time, last.id)
+        return PaginatedResponse.create(
+            sessions,
+            total_count,
+            pagination,
+            next_cursor=next_cursor,
+            has_more=has_more,
+            keyset=keyset,
+        )
+
+    @staticmethod
+    def _build_history(
+        session: Session, messages: list[Message], page_size: int | None
+    ) -> SessionHistory:
+        next_cursor = None
+        if page_size is not None and len(messages) > page_size:
+            messages = messages[:page_size]
+            last = messages[-1]
+            next_cursor = encode_cursor(last.created_time, last.id)
+        return SessionHistory(
+            session=session,
+            messages=messages,
+            total_message_count=len(messages),
+            next_cursor=next_cursor,
+        )
+
+    @staticmethod
+    def _to_pagination_info(pagination: PaginationParams) -> PaginationInfo:
+        return PaginationInfo(
+            page=pagination.page_number,
+            page_size=pagination.page_size,
+            total_items=0,
+            total_pages=0,
+            has_next=False,
+            has_previous=False,
+        )
+
+    @staticmethod
+    def _new_session_entity(
+        user_id: UserId,
+        session_id: str | None,
+        name: str | None,
+        agent_id: str | None,
+    ) -> Session:
+        now_ms = now_epoch_ms()
+        return Session(
+            id=session_id or str(uuid.uuid4()),
+            user_id=user_id,
+            name=name,
+            agent_id=agent_id,
+            created_time=now_ms,
+            updated_time=now_ms,
+        )
+
+    @staticmethod
+    def _new_message_entity(
+        session_id: SessionId,
+        message: str,
+        sender_type: SenderType,
+        sender_name: str,
+        message_type: MessageType,
+    ) -> Message:
+        return Message(
+            id=str(uuid.uuid4()),
+            session_id=session_id,
+            message=message.strip(),
+            sender_type=sender_type,
+            sender_name=sender_name,
+            message_type=message_type,
+            created_time=now_epoch_ms(),
+        )
+
+    def _is_valid_session_id(self, session_id: SessionId) -> bool:
+        return (
+            session_id is not None
+            and session_id.strip() != ""
+            and session_id not in ["null", "undefined"]
+        )
+
+    def _notify_agent_of_session_deletion(
+        self, session_id: SessionId, user_id: UserId, agent_id: str
+    ) -> None:
+        try:
+            log.info(
+                "Publishing session deletion event for session %s (agent %s, user %s)",
+                session_id,
+                agent_id,
+                user_id,
+            )
+
+            if hasattr(self.component, "sam_events"):
+                success = self.component.sam_events.publish_session_deleted(
+                    session_id=session_id,
+                    user_id=user_id,
+                    agent_id=agent_id,
+                    gateway_id=self.component.gateway_id,
+                )
+
+                if success:
+                    log.info(
+                        "Successfully published session deletion event for session %s",
+                        session_id,
+                    )
+                else:
+                    log.warning(
+                        "Failed to publish session deletion event for session %s",
+                        session_id,
+                    )
+            else:
+                log.warning(
+                    "SAM Events not available for session deletion notification"
+                )
+
+        except Exception as e:
+            log.warning(
+                "Failed to publish session deletion event to agent %s: %s",
+                agent_id,
+                e,
+            )
+
+
+class SessionService(BaseSessionService):
     def _get_repositories(self, db: DbSession):
         """Create repositories for the given database session."""
         from ..repository import SessionRepository, MessageRepository
@@ -34,41 +320,42 @@ class SessionService:
         message_repository = MessageRepository(db)
         return session_repository, message_repository
 
-    def is_persistence_enabled(self) -> bool:
-        """Checks if the service is configured with a persistent backend."""
-        return self.component and self.component.database_url is not None
-
     def get_user_sessions(
         self,
         db: DbSession,
         user_id: UserId,
-        pagination: PaginationParams | None = None
+        pagination: PaginationParams | None = None,
+        cursor: str | None = None,
+        include_total: bool = True,
     ) -> PaginatedResponse[Session]:
         """
         Get paginated sessions for a user with full metadata.
 
         Uses default pagination if none provided (page 1, size 20).
-        Returns paginated response with pageNumber, pageSize, nextPage, totalPages, totalCount.
-        """
-        if not user_id or user_id.strip() == "":
-            raise ValueError("User ID cannot be empty")
+        Returns paginated response with pageNumber, pageSize, nextPage, totalPages, totalCount
+        and a nextCursor. When cursor is given the page starts right after it
+        (keyset pagination) and pageNumber is ignored. The total is served from a
+        short-lived per-user cache and skipped entirely when include_total is False.
 
-        pagination = get_pagination_or_default(pagination)
+        Raises:
+            ValueError: If the user ID or cursor is invalid
+        """
+        pagination, after, offset = self._sessions_window(user_id, pagination, cursor)
         session_repository, _ = self._get_repositories(db)
 
-        pagination_info = PaginationInfo(
-            page=pagination.page_number,
-            page_size=pagination.page_size,
-            total_items=0,
-            total_pages=0,
-            has_next=False,
-            has_previous=False,
+        # Fetch one extra row to learn whether another page exists without counting.
+        sessions = session_repository.find_by_user_page(
+            user_id, limit=pagination.page_size + 1, offset=offset, after=after
         )
+        total_count = None
+        if include_total:
+            total_count = _user_session_counts.get_or_compute(
+                user_id, lambda: session_repository.count_by_user(user_id)
+            )
 
-        sessions = session_repository.find_by_user(user_id, pagination_info)
-        total_count = session_repository.count_by_user(user_id)
-
-        return PaginatedResponse.create(sessions, total_count, pagination)
+        return self._build_sessions_page(
+            sessions, total_count, pagination, keyset=after is not None
+        )
 
     def get_session_details(
         self, db: DbSession, session_id: SessionId, user_id: UserId
@@ -85,23 +372,29 @@ class SessionService:
         session_id: SessionId,
         user_id: UserId,
         pagination: PaginationInfo | None = None,
+        cursor: str | None = None,
     ) -> SessionHistory | None:
+        """
+        Get a session's messages. With a cursor (or a pagination page size) the
+        messages after the cursor are returned one page at a time and the
+        history carries the cursor of the next page.
+
+        Raises:
+            ValueError: If the cursor is invalid
+        """
         if not self._is_valid_session_id(session_id):
             return None
 
+        pagination, after, page_size = self._history_window(pagination, cursor)
         session_repository, _ = self._get_repositories(db)
         result = session_repository.find_user_session_with_messages(
-            session_id, user_id, pagination
+            session_id, user_id, pagination, after=after
         )
         if not result:
             return None
 
         session, messages = result
-        return SessionHistory(
-            session=session,
-            messages=messages,
-            total_message_count=len(messages),
-        )
+        return self._build_history(session, messages, page_size)
 
     def create_session(
         self,
@@ -111,46 +404,18 @@ class SessionService:
         agent_id: str | None = None,
         session_id: str | None = None,
     ) -> Optional[Session]:
-        if not self.is_persistence_enabled():
-            log.debug("Persistence is not enabled. Skipping session creation in DB.")
+        session = self._prepare_new_session(user_id, session_id, name, agent_id)
+        if session is None:
             return None
 
-        if not user_id or user_id.strip() == "":
-            raise ValueError("User ID cannot be empty")
-
-        if not session_id:
-            session_id = str(uuid.uuid4())
-
-        now_ms = now_epoch_ms()
-        session = Session(
-            id=session_id,
-            user_id=user_id,
-            name=name,
-            agent_id=agent_id,
-            created_time=now_ms,
-            updated_time=now_ms,
-        )
-
         session_repository, _ = self._get_repositories(db)
         created_session = session_repository.save(session)
-        log.info("Created new session %s for user %s", created_session.id, user_id)
-
-        if not created_session:
-            raise ValueError(f"Failed to save session for {session_id}")
-
-        return created_session
+        return self._session_created(db, session, created_session, user_id)
 
     def update_session_name(
         self, db: DbSession, session_id: SessionId, user_id: UserId, name: str
     ) -> Session | None:
-        if not self._is_valid_session_id(session_id):
-            raise ValueError("Invalid session ID")
-
-        if not name or len(name.strip()) == 0:
-            raise ValueError("Session name cannot be empty")
-
-        if len(name.strip()) > 255:
-            raise ValueError("Session name cannot exceed 255 characters")
+        self._validate_session_name(session_id, name)
 
         session_repository, _ = self._get_repositories(db)
         session = session_repository.find_user_session(session_id, user_id)
@@ -171,31 +436,13 @@ class SessionService:
 
         session_repository, _ = self._get_repositories(db)
         session = session_repository.find_user_session(session_id, user_id)
-        if not session:
-            log.warning(
-                "Attempted to delete non-existent session %s by user %s",
-                session_id,
-                user_id,
-            )
+        if not self._can_delete(session, session_id, user_id):
             return False
 
-        agent_id = session.agent_id
-
-        if not session.can_be_deleted_by_user(user_id):
-            log.warning(
-                "User %s not authorized to delete session %s", user_id, session_id
-            )
-            return False
-
-        deleted = session_repository.delete(session_id, user_id)
-        if not deleted:
+        if not session_repository.delete(session_id, user_id):
             return False
 
-        log.info("Session %s deleted successfully by user %s", session_id, user_id)
-
-        if agent_id and self.component:
-            self._notify_agent_of_session_deletion(session_id, user_id, agent_id)
-
+        self._session_deleted(db, session_id, user_id, session.agent_id)
         return True
 
     def add_message_to_session(
@@ -209,11 +456,7 @@ class SessionService:
         agent_id: str | None = None,
         message_type: MessageType = MessageType.TEXT,
     ) -> Message:
-        if not self._is_valid_session_id(session_id):
-            raise ValueError("Invalid session ID")
-
-        if not message or message.strip() == "":
-            raise ValueError("Message cannot be empty")
+        self._validate_new_message(session_id, message)
 
         session_repository, message_repository = self._get_repositories(db)
         session = session_repository.find_user_session(session_id, user_id)
@@ -225,14 +468,8 @@ class SessionService:
                 session_id=session_id,
             )
 
-        message_entity = Message(
-            id=str(uuid.uuid4()),
-            session_id=session_id,
-            message=message.strip(),
-            sender_type=sender_type,
-            sender_name=sender_name,
-            message_type=message_type,
-            created_time=now_epoch_ms(),
+        message_entity = self._new_message_entity(
+            session_id, message, sender_type, sender_name, message_type
         )
 
         saved_message = message_repository.save(message_entity)
@@ -243,50 +480,158 @@ class SessionService:
         log.info("Added message to session %s from %s", session_id, sender_name)
         return saved_message
 
-    def _is_valid_session_id(self, session_id: SessionId) -> bool:
-        return (
-            session_id is not None
-            and session_id.strip() != ""
-            and session_id not in ["null", "undefined"]
+
+class AsyncSessionService(BaseSessionService):
+    """
+    SessionService counterpart that runs on an SQLAlchemy AsyncSession, so
+    database round trips never block the FastAPI event loop.
+    """
+
+    def _get_repositories(self, db: AsyncSession):
+        """Create repositories for the given database session."""
+        from ..repository import AsyncSessionRepository, AsyncMessageRepository
+        session_repository = AsyncSessionRepository(db)
+        message_repository = AsyncMessageRepository(db)
+        return session_repository, message_repository
+
+    async def get_user_sessions(
+        self,
+        db: AsyncSession,
+        user_id: UserId,
+        pagination: PaginationParams | None = None,
+        cursor: str | None = None,
+        include_total: bool = True,
+    ) -> PaginatedResponse[Session]:
+        """Async form of SessionService.get_user_sessions."""
+        pagination, after, offset = self._sessions_window(user_id, pagination, cursor)
+        session_repository, _ = self._get_repositories(db)
+
+        # Fetch one extra row to learn whether another page exists without counting.
+        sessions = await session_repository.find_by_user_page(
+            user_id, limit=pagination.page_size + 1, offset=offset, after=after
         )
+        total_count = None
+        if include_total:
+            total_count = await _user_session_counts.get_or_compute_async(
+                user_id, lambda: session_repository.count_by_user(user_id)
+            )
 
-    def _notify_agent_of_session_deletion(
-        self, session_id: SessionId, user_id: UserId, agent_id: str
-    ) -> None:
-        try:
-            log.info(
-                "Publishing session deletion event for session %s (agent %s, user %s)",
-                session_id,
-                agent_id,
-                user_id,
+        return self._build_sessions_page(
+            sessions, total_count, pagination, keyset=after is not None
+        )
+
+    async def get_session_details(
+        self, db: AsyncSession, session_id: SessionId, user_id: UserId
+    ) -> Session | None:
+        if not self._is_valid_session_id(session_id):
+            return None
+
+        session_repository, _ = self._get_repositories(db)
+        return await session_repository.find_user_session(session_id, user_id)
+
+    async def get_session_history(
+        self,
+        db: AsyncSession,
+        session_id: SessionId,
+        user_id: UserId,
+        pagination: PaginationInfo | None = None,
+        cursor: str | None = None,
+    ) -> SessionHistory | None:
+        """Async form of SessionService.get_session_history."""
+        if not self._is_valid_session_id(session_id):
+            return None
+
+        pagination, after, page_size = self._history_window(pagination, cursor)
+        session_repository, _ = self._get_repositories(db)
+        result = await session_repository.find_user_session_with_messages(
+            session_id, user_id, pagination, after=after
+        )
+        if not result:
+            return None
+
+        session, messages = result
+        return self._build_history(session, messages, page_size)
+
+    async def create_session(
+        self,
+        db: AsyncSession,
+        user_id: UserId,
+        name: str | None = None,
+        agent_id: str | None = None,
+        session_id: str | None = None,
+    ) -> Optional[Session]:
+        session = self._prepare_new_session(user_id, session_id, name, agent_id)
+        if session is None:
+            return None
+
+        session_repository, _ = self._get_repositories(db)
+        created_session = await session_repository.save(session)
+        return self._session_created(db, session, created_session, user_id)
+
+    async def update_session_name(
+        self, db: AsyncSession, session_id: SessionId, user_id: UserId, name: str
+    ) -> Session | None:
+        self._validate_session_name(session_id, name)
+
+        session_repository, _ = self._get_repositories(db)
+        session = await session_repository.find_user_session(session_id, user_id)
+        if not session:
+            return None
+
+        session.update_name(name)
+        updated_session = await session_repository.save(session)
+
+        log.info("Updated session %s name to '%s'", session_id, name)
+        return updated_session
+
+    async def delete_session_with_notifications(
+        self, db: AsyncSession, session_id: SessionId, user_id: UserId
+    ) -> bool:
+        if not self._is_valid_session_id(session_id):
+            raise ValueError("Invalid session ID")
+
+        session_repository, _ = self._get_repositories(db)
+        session = await session_repository.find_user_session(session_id, user_id)
+        if not self._can_delete(session, session_id, user_id):
+            return False
+
+        if not await session_repository.delete(session_id, user_id):
+            return False
+
+        self._session_deleted(db, session_id, user_id, session.agent_id)
+        return True
+
+    async def add_message_to_session(
+        self,
+        db: AsyncSession,
+        session_id: SessionId,
+        user_id: UserId,
+        message: str,
+        sender_type: SenderType,
+        sender_name: str,
+        agent_id: str | None = None,
+        message_type: MessageType = MessageType.TEXT,
+    ) -> Message:
+        self._validate_new_message(session_id, message)
+
+        session_repository, message_repository = self._get_repositories(db)
+        session = await session_repository.find_user_session(session_id, user_id)
+        if not session:
+            session = await self.create_session(
+                db=db,
+                user_id=user_id,
+                agent_id=agent_id,
+                session_id=session_id,
             )
 
-            if hasattr(self.component, "sam_events"):
-                success = self.component.sam_events.publish_session_deleted(
-                    session_id=session_id,
-                    user_id=user_id,
-                    agent_id=agent_id,
-                    gateway_id=self.component.gateway_id,
-                )
+        message_entity = self._new_message_entity(
+            session_id, message, sender_type, sender_name, message_type
+        )
 
-                if success:
-                    log.info(
-                        "Successfully published session deletion event for session %s",
-                        session_id,
-                    )
-                else:
-                    log.warning(
-                        "Failed to publish session deletion event for session %s",
-                        session_id,
-                    )
-            else:
-                log.warning(
-                    "SAM Events not available for session deletion notification"
-                )
+        saved_message = await message_repository.save(message_entity)
 
-        except Exception as e:
-            log.warning(
-                "Failed to publish session deletion event to agent %s: %s",
-                agent_id,
-                e,
-            )
\ No newline at end of file
+        session.mark_activity()
+        await session_repository.save(session)
+
+        log.info("Added message to session %s from %s", session_id, sender_name)
+        return saved_message
@@ -3,7 +3,6 @@ Service layer for handling A2A task submissions and cancellations.
 Uses CoreA2AService for logic and a provided function for publishing.
 """
 
-import threading
 from typing import Callable, Dict, Optional
 
 from solace_ai_connector.common.log import log
@@ -29,8 +28,6 @@ class TaskService:
         namespace: str,
         gateway_id: str,
         sse_manager: SSEManager,
-        task_context_map: Dict[str, Dict],
-        task_context_lock: threading.Lock,
         app_name: str,
     ):
         """
@@ -44,8 +41,6 @@ class TaskService:
             namespace: The namespace string.
             gateway_id: The unique ID of this gateway instance.
             sse_manager: An instance of the SSEManager.
-            task_context_map: Shared dictionary to store task context.
-            task_context_lock: Lock for accessing the task context map.
             app_name: The name of the SAC application (used for artifact context).
         """
         if not isinstance(core_a2a_service, CoreA2AService):
@@ -60,8 +55,6 @@ class TaskService:
         self._namespace = namespace
         self._gateway_id = gateway_id
         self._sse_manager = sse_manager
-        self._task_context_map = task_context_map
-        self._task_context_lock = task_context_lock
         self._app_name = app_name
         log.info(
             "[TaskService] Initialized with Gateway ID: %s, App Name: %s",
@@ -44,6 +44,8 @@ from .exception_handlers import (
 
 # Repository base classes
 from .base_repository import (
+    AsyncBaseRepository,
+    AsyncPaginatedRepository,
     BaseRepository,
     PaginatedRepository,
     ValidationMixin,
@@ -51,6 +53,9 @@ from .base_repository import (
 
 # Pagination utilities
 from .pagination import (
+    KeysetCursor,
+    decode_cursor,
+    encode_cursor,
     PaginationParams,
     PaginatedResponse,
     DataResponse,
@@ -116,11 +121,16 @@ __all__ = [
     "webui_backend_exception_handler",
 
     # Repository base classes
+    "AsyncBaseRepository",
+    "AsyncPaginatedRepository",
     "BaseRepository",
     "PaginatedRepository",
     "ValidationMixin",
 
     # Pagination utilities
+    "KeysetCursor",
+    "decode_cursor",
+    "encode_cursor",
     "PaginationParams",
     "PaginatedResponse",
     "DataResponse",
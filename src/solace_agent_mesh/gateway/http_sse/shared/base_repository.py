@@ -7,6 +7,8 @@ for database session management and transaction handling.
 
 from abc import ABC, abstractmethod
 from typing import Dict, Any, List, Optional, TypeVar, Generic, Type
+from sqlalchemy import func, select
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
 from sqlalchemy.exc import NoResultFound
 from .exceptions import EntityNotFoundError, ValidationError
@@ -248,6 +250,193 @@ class PaginatedRepository(BaseRepository[ModelType, EntityType]):
         return entities, updated_pagination
 
 
+class AsyncBaseRepository(ABC, Generic[ModelType, EntityType]):
+    """
+    Async counterpart of BaseRepository for use with SQLAlchemy AsyncSession.
+
+    Queries are expressed with 2.0-style ``select()`` statements because the
+    legacy ``Session.query`` API is not available on AsyncSession. As with the
+    synchronous base class, transactions are handled by the caller.
+    """
+
+    def __init__(self, model_class: Type[ModelType], entity_class: Type[EntityType]):
+        """
+        Initialize repository with model and entity classes.
+
+        Args:
+            model_class: SQLAlchemy model class
+            entity_class: Pydantic entity class
+        """
+        self.model_class = model_class
+        self.entity_class = entity_class
+
+    @property
+    @abstractmethod
+    def entity_name(self) -> str:
+        """Return the entity name for error messages."""
+        pass
+
+    async def _get_model(self, session: AsyncSession, entity_id: Any) -> Optional[ModelType]:
+        """Load a single model instance by ID, or None if it does not exist."""
+        result = await session.execute(
+            select(self.model_class).where(self.model_class.id == str(entity_id))
+        )
+        return result.scalars().first()
+
+    async def create(self, session: AsyncSession, create_data: Dict[str, Any]) -> EntityType:
+        """
+        Create a new entity.
+
+        Args:
+            session: Async database session (managed externally)
+            create_data: Data for creating the entity
+
+        Returns:
+            Created entity
+
+        Note:
+            This method does NOT commit the transaction.
+        """
+        model_instance = self.model_class(**create_data)
+
+        session.add(model_instance)
+        await session.flush()
+        await session.refresh(model_instance)
+
+        return self.entity_class.model_validate(model_instance)
+
+    async def get_by_id(self, session: AsyncSession, entity_id: Any) -> EntityType:
+        """
+        Get entity by ID.
+
+        Raises:
+            EntityNotFoundError: If entity not found
+        """
+        model_instance = await self._get_model(session, entity_id)
+
+        if not model_instance:
+            raise EntityNotFoundError(self.entity_name, entity_id)
+
+        return self.entity_class.model_validate(model_instance)
+
+    async def get_all(self, session: AsyncSession, limit: Optional[int] = None, offset: Optional[int] = None) -> List[EntityType]:
+        """
+        Get all entities with optional pagination.
+
+        Args:
+            session: Async database session
+            limit: Maximum number of results
+            offset: Number of results to skip
+
+        Returns:
+            List of entities
+        """
+        stmt = select(self.model_class)
+
+        if offset:
+            stmt = stmt.offset(offset)
+        if limit:
+            stmt = stmt.limit(limit)
+
+        result = await session.execute(stmt)
+        return [self.entity_class.model_validate(instance) for instance in result.scalars().all()]
+
+    async def update(self, session: AsyncSession, entity_id: Any, update_data: Dict[str, Any]) -> EntityType:
+        """
+        Update an entity.
+
+        Raises:
+            EntityNotFoundError: If entity not found
+        """
+        model_instance = await self._get_model(session, entity_id)
+
+        if not model_instance:
+            raise EntityNotFoundError(self.entity_name, entity_id)
+
+        for key, value in update_data.items():
+            if value is not None and hasattr(model_instance, key):
+                setattr(model_instance, key, value)
+
+        await session.flush()
+        await session.refresh(model_instance)
+
+        return self.entity_class.model_validate(model_instance)
+
+    async def delete(self, session: AsyncSession, entity_id: Any) -> None:
+        """
+        Delete an entity.
+
+        Raises:
+            EntityNotFoundError: If entity not found
+        """
+        model_instance = await self._get_model(session, entity_id)
+
+        if not model_instance:
+            raise EntityNotFoundError(self.entity_name, entity_id)
+
+        await session.delete(model_instance)
+        await session.flush()
+
+    async def exists(self, session: AsyncSession, entity_id: Any) -> bool:
+        """Check if an entity exists."""
+        return await self._get_model(session, entity_id) is not None
+
+    async def count(self, session: AsyncSession) -> int:
+        """Get total count of entities."""
+        result = await session.execute(select(func.count()).select_from(self.model_class))
+        return result.scalar_one()
+
+
+class AsyncPaginatedRepository(AsyncBaseRepository[ModelType, EntityType]):
+    """
+    Async base repository with enhanced pagination support.
+    """
+
+    async def get_paginated(self, session: AsyncSession, page_number: int, page_size: int) -> tuple[List[EntityType], int]:
+        """
+        Get paginated results.
+
+        Args:
+            session: Async database session
+            page_number: Page number (1-based)
+            page_size: Number of items per page
+
+        Returns:
+            Tuple of (entities, total_count)
+        """
+        offset = (page_number - 1) * page_size
+
+        total_count = await self.count(session)
+
+        entities = await self.get_all(session, limit=page_size, offset=offset)
+
+        return entities, total_count
+
+    async def get_paginated_with_info(self, session: AsyncSession, pagination: PaginationInfo) -> tuple[List[EntityType], PaginationInfo]:
+        """
+        Get paginated results with complete pagination info.
+
+        Args:
+            session: Async database session
+            pagination: Pagination parameters
+
+        Returns:
+            Tuple of (entities, updated_pagination_info)
+        """
+        entities, total_count = await self.get_paginated(session, pagination.page, pagination.page_size)
+
+        updated_pagination = PaginationInfo(
+            page=pagination.page,
+            page_size=pagination.page_size,
+            total_items=total_count,
+            total_pages=(total_count + pagination.page_size - 1) // pagination.page_size,
+            has_next=pagination.page * pagination.page_size < total_count,
+            has_previous=pagination.page > 1
+        )
+
+        return entities, updated_pagination
+
+
 class ValidationMixin:
     """
     Mixin for repositories that need validation logic.
@@ -7,10 +7,18 @@ Default pagination settings:
 - Page number: 1
 - Page size: 20
 - Max page size: 100
+
+Besides page-number (OFFSET) pagination, list endpoints can page with opaque
+keyset cursors. A cursor encodes the (sort value, id) of the last item on a
+page, so the next page is an index range scan regardless of scroll depth.
 """
 
+import base64
+import json
+import threading
+import time
 from pydantic import BaseModel, Field
-from typing import TypeVar, Generic
+from typing import Awaitable, Callable, Generic, NamedTuple, TypeVar
 
 T = TypeVar("T")
 
@@ -61,13 +69,113 @@ def get_pagination_or_default(pagination: PaginationParams | None = None) -> Pag
     return pagination
 
 
+class KeysetCursor(NamedTuple):
+    """Position of the last item returned: its sort column value and its id."""
+    sort_value: int
+    item_id: str
+
+
+def encode_cursor(sort_value: int, item_id: str) -> str:
+    """Encode a keyset position as an opaque, URL-safe cursor string."""
+    raw = json.dumps([sort_value, item_id], separators=(",", ":")).encode("utf-8")
+    return base64.urlsafe_b64encode(raw).decode("ascii").rstrip("=")
+
+
+def decode_cursor(cursor: str) -> KeysetCursor:
+    """
+    Decode a cursor produced by encode_cursor.
+
+    Raises:
+        ValueError: If the cursor is malformed
+    """
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        sort_value, item_id = json.loads(base64.urlsafe_b64decode(padded))
+    except (ValueError, TypeError) as e:
+        raise ValueError("Invalid pagination cursor") from e
+    # bool is a subclass of int, but JSON true/false is never a valid position.
+    if (
+        isinstance(sort_value, bool)
+        or not isinstance(sort_value, int)
+        or not isinstance(item_id, str)
+    ):
+        raise ValueError("Invalid pagination cursor")
+    return KeysetCursor(sort_value, item_id)
+
+
+class CountCache:
+    """
+    Small TTL cache for per-key total counts (e.g. sessions per user), so
+    scrolling through pages does not issue a COUNT(*) for every request.
+    Counts may be stale by up to ttl_seconds for writes made by other processes.
+    """
+
+    def __init__(self, ttl_seconds: float = 30.0, max_entries: int = 10000):
+        self.ttl_seconds = ttl_seconds
+        self.max_entries = max_entries
+        self._entries: dict[str, tuple[float, int]] = {}
+        self._lock = threading.Lock()
+
+    def get(self, key: str) -> int | None:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            expires_at, value = entry
+            if expires_at < time.monotonic():
+                del self._entries[key]
+                return None
+            return value
+
+    def set(self, key: str, value: int) -> None:
+        with self._lock:
+            if len(self._entries) >= self.max_entries and key not in self._entries:
+                # Drop the entry closest to expiry to stay bounded.
+                oldest_key = min(self._entries, key=lambda k: self._entries[k][0])
+                del self._entries[oldest_key]
+            self._entries[key] = (time.monotonic() + self.ttl_seconds, value)
+
+    def invalidate(self, key: str) -> None:
+        with self._lock:
+            self._entries.pop(key, None)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+    def get_or_compute(self, key: str, compute: Callable[[], int]) -> int:
+        value = self.get(key)
+        if value is None:
+            value = compute()
+            self.set(key, value)
+        return value
+
+    async def get_or_compute_async(
+        self, key: str, compute: Callable[[], Awaitable[int]]
+    ) -> int:
+        """get_or_compute for counts that are queried asynchronously."""
+        value = self.get(key)
+        if value is None:
+            value = await compute()
+            self.set(key, value)
+        return value
+
+
 class PaginationMeta(BaseModel):
-    """Pagination metadata for API responses."""
+    """
+    Pagination metadata for API responses.
+
+    count and totalPages are null when the caller opted out of total counts.
+    nextCursor can be passed back as the cursor query parameter to fetch the
+    following page with keyset pagination. Pages fetched with a cursor have no
+    page number to advance, so their nextPage is null.
+    """
     page_number: int = Field(..., alias="pageNumber")
-    count: int
+    count: int | None
     page_size: int = Field(..., alias="pageSize")
     next_page: int | None = Field(..., alias="nextPage")
-    total_pages: int = Field(..., alias="totalPages")
+    total_pages: int | None = Field(..., alias="totalPages")
+    next_cursor: str | None = Field(default=None, alias="nextCursor")
 
     model_config = {"populate_by_name": True}
 
@@ -84,21 +192,34 @@ class PaginatedResponse(BaseModel, Generic[T]):
 
     @classmethod
     def create(
-        cls, data: list[T], total_count: int, pagination: PaginationParams
+        cls,
+        data: list[T],
+        total_count: int | None,
+        pagination: PaginationParams,
+        next_cursor: str | None = None,
+        has_more: bool | None = None,
+        keyset: bool = False,
     ) -> "PaginatedResponse[T]":
         """
         Create a paginated response from data and pagination parameters.
 
         Args:
             data: List of items for current page
-            total_count: Total number of items across all pages
+            total_count: Total number of items across all pages, or None if not computed
             pagination: Pagination parameters used for the request
+            next_cursor: Keyset cursor for the following page, if any
+            has_more: Whether another page exists; derived from total_count when None
+            keyset: Whether the page was fetched with a cursor rather than a page number
 
         Returns:
             PaginatedResponse with data and calculated metadata
         """
-        total_pages = (total_count + pagination.page_size - 1) // pagination.page_size
-        next_page = pagination.page_number + 1 if pagination.page_number < total_pages else None
+        total_pages = None
+        if total_count is not None:
+            total_pages = (total_count + pagination.page_size - 1) // pagination.page_size
+            if has_more is None:
+                has_more = pagination.page_number < total_pages
+        next_page = pagination.page_number + 1 if has_more and not keyset else None
 
         pagination_meta = PaginationMeta(
             page_number=pagination.page_number,
@@ -106,6 +227,7 @@ class PaginatedResponse(BaseModel, Generic[T]):
             page_size=pagination.page_size,
             next_page=next_page,
             total_pages=total_pages,
+            next_cursor=next_cursor,
         )
 
         return cls(
@@ -127,6 +249,10 @@ class DataResponse(BaseModel, Generic[T]):
 
 
 __all__ = [
+    "CountCache",
+    "KeysetCursor",
+    "decode_cursor",
+    "encode_cursor",
     "PaginationParams",
     "PaginationMeta",
     "PaginatedResponse",
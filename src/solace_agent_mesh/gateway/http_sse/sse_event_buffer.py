@@ -2,67 +2,151 @@
 A thread-safe buffer for holding early SSE events before a client connects.
 """
 
-import datetime
 import threading
-from typing import Any, Dict, List, Optional, Tuple
+import time
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, List, Optional
 
 from solace_ai_connector.common.log import log
 
 
+def _event_size(event: Dict[str, Any]) -> int:
+    """Size in bytes of the UTF-8 encoded string fields of an SSE payload."""
+    # isascii() is constant-time for CPython strings, so only non-ASCII
+    # payloads pay for an encode.
+    return sum(
+        len(v) if v.isascii() else len(v.encode("utf-8"))
+        for v in event.values()
+        if isinstance(v, str)
+    )
+
+
+@dataclass
+class _TaskBuffer:
+    created_at: float
+    events: List[Dict[str, Any]] = field(default_factory=list)
+    size_bytes: int = 0
+
+
 class SSEEventBuffer:
-    """Manages buffering and cleanup of SSE events for tasks without active listeners."""
+    """Manages buffering and cleanup of SSE events for tasks without active listeners.
+
+    Buffers are kept in creation order, which on a monotonic clock is also
+    expiry order, so cleanup only touches the buffers that have expired. The
+    buffer is bounded per task by `max_queue_size` events and globally by
+    `max_total_bytes`; when the byte budget is exceeded the oldest task
+    buffers are evicted first.
+    """
 
-    def __init__(self, max_queue_size: int, max_age_seconds: int):
-        self._pending_events: Dict[
-            str, Tuple[datetime.datetime, List[Dict[str, Any]]]
-        ] = {}
+    def __init__(
+        self,
+        max_queue_size: int,
+        max_age_seconds: int,
+        max_total_bytes: Optional[int] = None,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        self._pending_events: "OrderedDict[str, _TaskBuffer]" = OrderedDict()
         self._lock = threading.Lock()
         self._max_queue_size = max_queue_size
         self._max_age_seconds = max_age_seconds
+        self._max_total_bytes = max_total_bytes
+        self._clock = clock
+        self._total_bytes = 0
+        self._total_events = 0
+        self._dropped_events = 0
+        self._evicted_events = 0
+        self._expired_events = 0
+        self._flushed_events = 0
         self.log_identifier = "[SSEEventBuffer]"
         log.debug(
-            "%s Initialized with max_age:%ds, max_size:%d",
+            "%s Initialized with max_age:%ds, max_size:%d, max_total_bytes:%s",
             self.log_identifier,
             self._max_age_seconds,
             self._max_queue_size,
+            self._max_total_bytes,
         )
 
+    def _pop_locked(self, task_id: str) -> Optional[_TaskBuffer]:
+        buffer = self._pending_events.pop(task_id, None)
+        if buffer is not None:
+            self._total_bytes -= buffer.size_bytes
+            self._total_events -= len(buffer.events)
+        return buffer
+
+    def _evict_for_budget_locked(self, needed_bytes: int, keep_task_id: str) -> bool:
+        """Evicts the oldest task buffers until `needed_bytes` more fit."""
+        while self._total_bytes + needed_bytes > self._max_total_bytes:
+            oldest_task_id = next(
+                (t for t in self._pending_events if t != keep_task_id), None
+            )
+            if oldest_task_id is None:
+                return False
+            evicted = self._pop_locked(oldest_task_id)
+            self._evicted_events += len(evicted.events)
+            log.warning(
+                "%s Buffer byte budget exceeded. Evicted %d events of Task ID: %s.",
+                self.log_identifier,
+                len(evicted.events),
+                oldest_task_id,
+            )
+        return True
+
     def buffer_event(self, task_id: str, event: Dict[str, Any]):
         """Buffers an event for a given task ID."""
+        size = _event_size(event)
         with self._lock:
-            if task_id not in self._pending_events:
-                self._pending_events[task_id] = (
-                    datetime.datetime.now(datetime.timezone.utc),
-                    [],
+            buffer = self._pending_events.get(task_id)
+            if buffer is not None and len(buffer.events) >= self._max_queue_size:
+                self._dropped_events += 1
+                log.warning(
+                    "%s Buffer full for Task ID: %s. Event dropped.",
+                    self.log_identifier,
+                    task_id,
                 )
+                return
 
-            if len(self._pending_events[task_id][1]) < self._max_queue_size:
-                self._pending_events[task_id][1].append(event)
-            else:
+            if self._max_total_bytes is not None and (
+                size > self._max_total_bytes
+                or not self._evict_for_budget_locked(size, task_id)
+            ):
+                self._dropped_events += 1
                 log.warning(
-                    "%s Buffer full for Task ID: %s. Event dropped.",
+                    "%s Event of %d bytes for Task ID: %s exceeds the buffer byte budget. Event dropped.",
                     self.log_identifier,
+                    size,
                     task_id,
                 )
+                return
+
+            if buffer is None:
+                buffer = self._pending_events[task_id] = _TaskBuffer(
+                    created_at=self._clock()
+                )
+            buffer.events.append(event)
+            buffer.size_bytes += size
+            self._total_bytes += size
+            self._total_events += 1
 
     def get_and_remove_buffer(self, task_id: str) -> Optional[List[Dict[str, Any]]]:
         """Atomically retrieves and removes the event buffer for a task."""
         with self._lock:
-            buffer_tuple = self._pending_events.pop(task_id, None)
-            if buffer_tuple:
+            buffer = self._pop_locked(task_id)
+            if buffer:
+                self._flushed_events += len(buffer.events)
                 log.debug(
                     "%s Flushing %d events for Task ID: %s",
                     self.log_identifier,
-                    len(buffer_tuple[1]),
+                    len(buffer.events),
                     task_id,
                 )
-                return buffer_tuple[1]
+                return buffer.events
             return None
 
     def remove_buffer(self, task_id: str):
         """Explicitly removes a buffer for a task, e.g., on finalization."""
         with self._lock:
-            if self._pending_events.pop(task_id, None):
+            if self._pop_locked(task_id):
                 log.debug(
                     "%s Removed buffer for task %s.", self.log_identifier, task_id
                 )
@@ -70,18 +154,32 @@ class SSEEventBuffer:
     def cleanup_stale_buffers(self):
         """Removes all pending event buffers older than the max age."""
         with self._lock:
-            now = datetime.datetime.now(datetime.timezone.utc)
-            stale_tasks = [
-                task_id
-                for task_id, (timestamp, _) in self._pending_events.items()
-                if (now - timestamp).total_seconds() > self._max_age_seconds
-            ]
-
-            if stale_tasks:
+            deadline = self._clock() - self._max_age_seconds
+            stale_count = 0
+            while self._pending_events:
+                task_id, buffer = next(iter(self._pending_events.items()))
+                if buffer.created_at >= deadline:
+                    break
+                self._pop_locked(task_id)
+                self._expired_events += len(buffer.events)
+                stale_count += 1
+
+            if stale_count:
                 log.debug(
-                    "%s Cleaning up %d stale event buffers.",
+                    "%s Cleaned up %d stale event buffers.",
                     self.log_identifier,
-                    len(stale_tasks),
+                    stale_count,
                 )
-                for task_id in stale_tasks:
-                    del self._pending_events[task_id]
+
+    def get_metrics(self) -> Dict[str, int]:
+        """Returns current buffer occupancy and cumulative event counters."""
+        with self._lock:
+            return {
+                "buffered_tasks": len(self._pending_events),
+                "buffered_events": self._total_events,
+                "buffered_bytes": self._total_bytes,
+                "dropped_events": self._dropped_events,
+                "evicted_events": self._evicted_events,
+                "expired_events": self._expired_events,
+                "flushed_events": self._flushed_events,
+            }
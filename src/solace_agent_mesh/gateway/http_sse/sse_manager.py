@@ -3,8 +3,9 @@ Manages Server-Sent Event (SSE) connections for streaming task updates.
 """
 
 import asyncio
-import threading
-from typing import Dict, List, Any
+import time
+from dataclasses import dataclass, field
+from typing import Dict, List, Any, Optional
 import json
 import datetime
 import math
@@ -13,59 +14,235 @@ from solace_ai_connector.common.log import log
 
 from .sse_event_buffer import SSEEventBuffer
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+SLOW_CONSUMER_DISCONNECT = "disconnect"
+SLOW_CONSUMER_DROP_OLDEST = "drop_oldest"
+SLOW_CONSUMER_COALESCE = "coalesce"
+SLOW_CONSUMER_POLICIES = (
+    SLOW_CONSUMER_DISCONNECT,
+    SLOW_CONSUMER_DROP_OLDEST,
+    SLOW_CONSUMER_COALESCE,
+)
+
+# Event types that the "coalesce" policy may discard to make room for newer
+# events. Artifact updates and other event types are never discarded.
+COALESCIBLE_EVENT_TYPES = frozenset({"status_update"})
+
+
+def _json_default(obj):
+    if isinstance(obj, (datetime.datetime, datetime.date)):
+        return obj.isoformat()
+    return str(obj)
+
+
+def _sanitize_json(obj):
+    if isinstance(obj, dict):
+        return {k: _sanitize_json(v) for k, v in obj.items()}
+    elif isinstance(obj, list):
+        return [_sanitize_json(v) for v in obj]
+    elif isinstance(obj, (float, int)):
+        if math.isnan(obj) or math.isinf(obj):
+            return None
+        return obj
+    elif isinstance(obj, (str, bool, type(None))):
+        return obj
+    elif isinstance(obj, (datetime.datetime, datetime.date)):
+        return obj.isoformat()
+    else:
+        return str(obj)
+
+
+def serialize_event_data(event_data: Any) -> str:
+    """
+    Serializes an event payload to a JSON string for the SSE 'data' field.
+
+    The payload is serialized directly (with orjson when installed). Only if
+    that fails, e.g. because of NaN/Infinity values or non-string keys, is it
+    walked by the sanitizer and serialized again.
+    """
+    try:
+        if orjson is not None:
+            return orjson.dumps(
+                event_data,
+                default=_json_default,
+                option=orjson.OPT_PASSTHROUGH_DATETIME,
+            ).decode("utf-8")
+        return json.dumps(event_data, allow_nan=False, default=_json_default)
+    except (TypeError, ValueError, OverflowError):
+        return json.dumps(_sanitize_json(event_data), allow_nan=False)
+
+
+@dataclass
+class _ConnectionStats:
+    """Delivery counters for a single SSE connection queue."""
+
+    task_id: str
+    created_at: float = field(default_factory=time.monotonic)
+    enqueued: int = 0
+    dropped: int = 0
+    high_watermark: int = 0
+
 
 class SSEManager:
     """
     Manages active SSE connections and distributes events based on task ID.
     Uses asyncio Queues for buffering events per connection.
+
+    All bookkeeping happens synchronously between awaits on the event loop and
+    events are handed to connections with `put_nowait`, so no lock is needed
+    and a slow connection never delays delivery to other connections or tasks.
+    When a connection's queue is full, `slow_consumer_policy` decides what
+    happens:
+
+    - "disconnect": the connection is removed and signalled to close.
+    - "drop_oldest": the oldest queued event is discarded.
+    - "coalesce": the oldest queued status update is discarded; if only
+      non-status events are queued the connection is disconnected.
     """
 
-    def __init__(self, max_queue_size: int, event_buffer: SSEEventBuffer):
+    def __init__(
+        self,
+        max_queue_size: int,
+        event_buffer: SSEEventBuffer,
+        slow_consumer_policy: str = SLOW_CONSUMER_DISCONNECT,
+    ):
+        if slow_consumer_policy not in SLOW_CONSUMER_POLICIES:
+            raise ValueError(
+                f"Invalid slow_consumer_policy '{slow_consumer_policy}'. "
+                f"Must be one of {SLOW_CONSUMER_POLICIES}."
+            )
         self._connections: Dict[str, List[asyncio.Queue]] = {}
+        self._stats: Dict[asyncio.Queue, _ConnectionStats] = {}
         self._event_buffer = event_buffer
-        self._locks: Dict[asyncio.AbstractEventLoop, asyncio.Lock] = {}
-        self._locks_lock = threading.Lock()
         self.log_identifier = "[SSEManager]"
         self._max_queue_size = max_queue_size
+        self._slow_consumer_policy = slow_consumer_policy
+
+    def _discard_queued(self, queue: asyncio.Queue, event_types=None) -> bool:
+        """
+        Discards the oldest queued event (optionally restricted to the given
+        event types) to make room on a full queue. Returns True if an event
+        was discarded.
+        """
+        if event_types is None:
+            try:
+                queue.get_nowait()
+            except asyncio.QueueEmpty:
+                return False
+            queue.task_done()
+            return True
 
-    def _get_lock(self) -> asyncio.Lock:
-        """Get or create a lock for the current event loop."""
+        pending = []
+        discarded = False
+        while True:
+            try:
+                item = queue.get_nowait()
+            except asyncio.QueueEmpty:
+                break
+            queue.task_done()
+            if (
+                not discarded
+                and item is not None
+                and item.get("event") in event_types
+            ):
+                discarded = True
+                continue
+            pending.append(item)
+        for item in pending:
+            queue.put_nowait(item)
+        return discarded
+
+    def _put_close_signal(self, task_id: str, queue: asyncio.Queue):
+        """Puts the None close signal on a queue, making room if it is full."""
         try:
-            current_loop = asyncio.get_running_loop()
-        except RuntimeError:
-            log.error(
-                "%s _get_lock must be called from within an async context.",
+            queue.put_nowait(None)
+            return
+        except asyncio.QueueFull:
+            pass
+        log.warning(
+            "%s SSE connection queue full for Task ID: %s. Discarding oldest event to deliver close signal.",
+            self.log_identifier,
+            task_id,
+        )
+        self._discard_queued(queue)
+        try:
+            queue.put_nowait(None)
+        except asyncio.QueueFull:
+            log.warning(
+                "%s Could not put None (close signal) on queue for Task ID: %s. Connection might not close cleanly.",
                 self.log_identifier,
+                task_id,
             )
-            raise RuntimeError(
-                "SSEManager methods must be called from within an async context"
+
+    def _detach_connection(self, task_id: str, connection_queue: asyncio.Queue):
+        queues = self._connections.get(task_id)
+        if queues is None:
+            return
+        try:
+            queues.remove(connection_queue)
+        except ValueError:
+            return
+        if not queues:
+            del self._connections[task_id]
+            log.debug(
+                "%s Removed Task ID entry: %s as no connections remain.",
+                self.log_identifier,
+                task_id,
             )
 
-        with self._locks_lock:
-            if current_loop not in self._locks:
-                self._locks[current_loop] = asyncio.Lock()
-                log.debug(
-                    "%s Created new lock for event loop %s",
+    def _enqueue(
+        self, task_id: str, connection_queue: asyncio.Queue, sse_payload: Dict
+    ) -> bool:
+        """
+        Enqueues a payload without blocking, applying the slow-consumer policy
+        if the queue is full. Returns False if the connection was disconnected.
+        """
+        stats = self._stats.get(connection_queue)
+        try:
+            connection_queue.put_nowait(sse_payload)
+        except asyncio.QueueFull:
+            policy = self._slow_consumer_policy
+            if policy == SLOW_CONSUMER_DROP_OLDEST:
+                made_room = self._discard_queued(connection_queue)
+            elif policy == SLOW_CONSUMER_COALESCE:
+                made_room = self._discard_queued(
+                    connection_queue, COALESCIBLE_EVENT_TYPES
+                )
+            else:
+                made_room = False
+
+            if not made_room:
+                log.warning(
+                    "%s SSE connection queue full for Task ID: %s. Disconnecting slow consumer.",
                     self.log_identifier,
-                    id(current_loop),
+                    task_id,
                 )
-            return self._locks[current_loop]
-
-    def _sanitize_json(self, obj):
-        if isinstance(obj, dict):
-            return {k: self._sanitize_json(v) for k, v in obj.items()}
-        elif isinstance(obj, list):
-            return [self._sanitize_json(v) for v in obj]
-        elif isinstance(obj, (float, int)):
-            if math.isnan(obj) or math.isinf(obj):
-                return None
-            return obj
-        elif isinstance(obj, (str, bool, type(None))):
-            return obj
-        elif isinstance(obj, (datetime.datetime, datetime.date)):
-            return obj.isoformat()
-        else:
-            return str(obj)
+                if stats:
+                    stats.dropped += 1
+                self._detach_connection(task_id, connection_queue)
+                self._put_close_signal(task_id, connection_queue)
+                self._stats.pop(connection_queue, None)
+                return False
+
+            log.debug(
+                "%s SSE connection queue full for Task ID: %s. Discarded one queued event (policy: %s).",
+                self.log_identifier,
+                task_id,
+                policy,
+            )
+            if stats:
+                stats.dropped += 1
+            connection_queue.put_nowait(sse_payload)
+
+        if stats:
+            stats.enqueued += 1
+            stats.high_watermark = max(stats.high_watermark, connection_queue.qsize())
+        return True
 
     async def create_sse_connection(self, task_id: str) -> asyncio.Queue:
         """
@@ -77,27 +254,24 @@ class SSEManager:
         Returns:
             An asyncio.Queue that the SSE endpoint can consume from.
         """
-        lock = self._get_lock()
-        async with lock:
-            if task_id not in self._connections:
-                self._connections[task_id] = []
+        connection_queue = asyncio.Queue(maxsize=self._max_queue_size)
+        self._stats[connection_queue] = _ConnectionStats(task_id=task_id)
+        self._connections.setdefault(task_id, []).append(connection_queue)
 
-            connection_queue = asyncio.Queue(maxsize=self._max_queue_size)
+        # Flush any pending events from the buffer to the new connection
+        buffered_events = self._event_buffer.get_and_remove_buffer(task_id)
+        if buffered_events:
+            for event in buffered_events:
+                if not self._enqueue(task_id, connection_queue, event):
+                    break
 
-            # Flush any pending events from the buffer to the new connection
-            buffered_events = self._event_buffer.get_and_remove_buffer(task_id)
-            if buffered_events:
-                for event in buffered_events:
-                    await connection_queue.put(event)
-
-            self._connections[task_id].append(connection_queue)
-            log.debug(
-                "%s Created SSE connection queue for Task ID: %s. Total queues for task: %d",
-                self.log_identifier,
-                task_id,
-                len(self._connections[task_id]),
-            )
-            return connection_queue
+        log.debug(
+            "%s Created SSE connection queue for Task ID: %s. Total queues for task: %d",
+            self.log_identifier,
+            task_id,
+            len(self._connections.get(task_id, [])),
+        )
+        return connection_queue
 
     async def remove_sse_connection(
         self, task_id: str, connection_queue: asyncio.Queue
@@ -109,138 +283,74 @@ class SSEManager:
             task_id: The ID of the task.
             connection_queue: The specific queue instance to remove.
         """
-        lock = self._get_lock()
-        async with lock:
-            if task_id in self._connections:
-                try:
-                    self._connections[task_id].remove(connection_queue)
-                    log.debug(
-                        "%s Removed SSE connection queue for Task ID: %s. Remaining queues: %d",
-                        self.log_identifier,
-                        task_id,
-                        len(self._connections[task_id]),
-                    )
-                    if not self._connections[task_id]:
-                        del self._connections[task_id]
-                        log.debug(
-                            "%s Removed Task ID entry: %s as no connections remain.",
-                            self.log_identifier,
-                            task_id,
-                        )
-                except ValueError:
-                    log.debug(
-                        "%s Attempted to remove an already removed queue for Task ID: %s.",
-                        self.log_identifier,
-                        task_id,
-                    )
+        self._stats.pop(connection_queue, None)
+        if task_id in self._connections:
+            if connection_queue in self._connections[task_id]:
+                self._detach_connection(task_id, connection_queue)
+                log.debug(
+                    "%s Removed SSE connection queue for Task ID: %s. Remaining queues: %d",
+                    self.log_identifier,
+                    task_id,
+                    len(self._connections.get(task_id, [])),
+                )
             else:
-                log.warning(
-                    "%s Attempted to remove queue for non-existent Task ID: %s.",
+                log.debug(
+                    "%s Attempted to remove an already removed queue for Task ID: %s.",
                     self.log_identifier,
                     task_id,
                 )
+        else:
+            log.debug(
+                "%s Attempted to remove queue for non-existent Task ID: %s.",
+                self.log_identifier,
+                task_id,
+            )
 
     async def send_event(
         self, task_id: str, event_data: Dict[str, Any], event_type: str = "message"
     ):
         """
         Sends an event (as a dictionary) to all active SSE connections for a specific task.
-        The event_data dictionary will be JSON serialized for the SSE 'data' field.
+        The event_data dictionary is JSON serialized once for the SSE 'data' field
+        and the same payload is shared by every connection.
 
         Args:
             task_id: The ID of the task the event belongs to.
             event_data: The dictionary representing the A2A event (e.g., TaskStatusUpdateEvent).
             event_type: The type of the SSE event (default: "message").
         """
-        lock = self._get_lock()
-        async with lock:
-            queues = self._connections.get(task_id)
-
-            try:
-                serialized_data = json.dumps(
-                    self._sanitize_json(event_data), allow_nan=False
-                )
-            except Exception as json_err:
-                log.error(
-                    "%s Failed to JSON serialize event data for Task ID %s: %s",
-                    self.log_identifier,
-                    task_id,
-                    json_err,
-                )
-                return
-
-            sse_payload = {"event": event_type, "data": serialized_data}
+        try:
+            serialized_data = serialize_event_data(event_data)
+        except Exception as json_err:
+            log.error(
+                "%s Failed to JSON serialize event data for Task ID %s: %s",
+                self.log_identifier,
+                task_id,
+                json_err,
+            )
+            return
 
-            if not queues:
-                log.debug(
-                    "%s No active SSE connections for Task ID: %s. Buffering event.",
-                    self.log_identifier,
-                    task_id,
-                )
-                self._event_buffer.buffer_event(task_id, sse_payload)
-                return
+        sse_payload = {"event": event_type, "data": serialized_data}
 
+        queues = self._connections.get(task_id)
+        if not queues:
             log.debug(
-                "%s Prepared SSE payload for Task ID %s: %s",
+                "%s No active SSE connections for Task ID: %s. Buffering event.",
                 self.log_identifier,
                 task_id,
-                sse_payload,
             )
+            self._event_buffer.buffer_event(task_id, sse_payload)
+            return
 
-            queues_to_remove = []
-            for connection_queue in list(self._connections.get(task_id, [])):
-                try:
-                    await asyncio.wait_for(
-                        connection_queue.put(sse_payload), timeout=0.1
-                    )
-                    log.debug(
-                        "%s Queued event for Task ID: %s to one connection.",
-                        self.log_identifier,
-                        task_id,
-                    )
-                except asyncio.QueueFull:
-                    log.warning(
-                        "%s SSE connection queue full for Task ID: %s. Event dropped for one connection.",
-                        self.log_identifier,
-                        task_id,
-                    )
-                    queues_to_remove.append(connection_queue)
-                except asyncio.TimeoutError:
-                    log.warning(
-                        "%s Timeout putting event onto SSE queue for Task ID: %s. Event dropped for one connection.",
-                        self.log_identifier,
-                        task_id,
-                    )
-                    queues_to_remove.append(connection_queue)
-                except Exception as e:
-                    log.error(
-                        "%s Error putting event onto queue for Task ID %s: %s",
-                        self.log_identifier,
-                        task_id,
-                        e,
-                    )
-                    queues_to_remove.append(connection_queue)
-
-            if queues_to_remove and task_id in self._connections:
-                current_queues = self._connections[task_id]
-                for q in queues_to_remove:
-                    try:
-                        current_queues.remove(q)
-                        log.warning(
-                            "%s Removed potentially broken/full SSE queue for Task ID: %s",
-                            self.log_identifier,
-                            task_id,
-                        )
-                    except ValueError:
-                        pass
-
-                if not current_queues:
-                    del self._connections[task_id]
-                    log.debug(
-                        "%s Removed Task ID entry: %s after cleaning queues.",
-                        self.log_identifier,
-                        task_id,
-                    )
+        log.debug(
+            "%s Prepared SSE payload for Task ID %s: %s",
+            self.log_identifier,
+            task_id,
+            sse_payload,
+        )
+
+        for connection_queue in list(queues):
+            self._enqueue(task_id, connection_queue, sse_payload)
 
     async def close_connection(self, task_id: str, connection_queue: asyncio.Queue):
         """
@@ -253,119 +363,106 @@ class SSEManager:
             task_id,
         )
         try:
-            await asyncio.wait_for(connection_queue.put(None), timeout=0.1)
-        except asyncio.QueueFull:
-            log.warning(
-                "%s Could not put None (close signal) on full queue for Task ID: %s. Connection might not close cleanly.",
+            self._put_close_signal(task_id, connection_queue)
+        finally:
+            await self.remove_sse_connection(task_id, connection_queue)
+
+    async def close_all_for_task(self, task_id: str):
+        """
+        Closes all SSE connections associated with a specific task.
+        If a connection existed, it also cleans up the event buffer.
+        If no connection ever existed, the buffer is left for a late-connecting client.
+        """
+        if task_id in self._connections:
+            # This is the "normal" case: a client is or was connected.
+            # It's safe to clean up everything.
+            queues_to_close = self._connections.pop(task_id)
+            log.debug(
+                "%s Closing %d SSE connections for Task ID: %s and cleaning up buffer.",
                 self.log_identifier,
+                len(queues_to_close),
                 task_id,
             )
-        except asyncio.TimeoutError:
-            log.warning(
-                "%s Timeout putting None (close signal) on queue for Task ID: %s.",
+            for q in queues_to_close:
+                self._stats.pop(q, None)
+                self._put_close_signal(task_id, q)
+
+            # Since a connection existed, the buffer is no longer needed.
+            self._event_buffer.remove_buffer(task_id)
+            log.debug(
+                "%s Removed Task ID entry: %s and signaled queues to close.",
                 self.log_identifier,
                 task_id,
             )
-        except Exception as e:
-            log.error(
-                "%s Error putting None (close signal) on queue for Task ID %s: %s",
+        else:
+            # This is the "race condition" case: no client has connected yet.
+            # We MUST leave the buffer intact for the late-connecting client.
+            log.debug(
+                "%s No active connections found for Task ID: %s. Leaving event buffer intact.",
                 self.log_identifier,
                 task_id,
-                e,
             )
-        finally:
-            await self.remove_sse_connection(task_id, connection_queue)
 
-    async def close_all_for_task(self, task_id: str):
+    def get_connection_metrics(
+        self, task_id: Optional[str] = None
+    ) -> List[Dict[str, Any]]:
         """
-        Closes all SSE connections associated with a specific task.
-        If a connection existed, it also cleans up the event buffer.
-        If no connection ever existed, the buffer is left for a late-connecting client.
+        Returns queue-depth and delivery metrics for each active connection,
+        optionally restricted to a single task.
         """
-        lock = self._get_lock()
-        async with lock:
-            if task_id in self._connections:
-                # This is the "normal" case: a client is or was connected.
-                # It's safe to clean up everything.
-                queues_to_close = self._connections.pop(task_id)
-                log.debug(
-                    "%s Closing %d SSE connections for Task ID: %s and cleaning up buffer.",
-                    self.log_identifier,
-                    len(queues_to_close),
-                    task_id,
-                )
-                for q in queues_to_close:
-                    try:
-                        await asyncio.wait_for(q.put(None), timeout=0.1)
-                    except asyncio.QueueFull:
-                        log.warning(
-                            "%s Could not put None (close signal) on full queue during close_all for Task ID: %s.",
-                            self.log_identifier,
-                            task_id,
-                        )
-                    except asyncio.TimeoutError:
-                        log.warning(
-                            "%s Timeout putting None (close signal) on queue during close_all for Task ID: %s.",
-                            self.log_identifier,
-                            task_id,
-                        )
-                    except Exception as e:
-                        log.error(
-                            "%s Error putting None (close signal) on queue during close_all for Task ID %s: %s",
-                            self.log_identifier,
-                            task_id,
-                            e,
-                        )
-
-                # Since a connection existed, the buffer is no longer needed.
-                self._event_buffer.remove_buffer(task_id)
-                log.debug(
-                    "%s Removed Task ID entry: %s and signaled queues to close.",
-                    self.log_identifier,
-                    task_id,
-                )
-            else:
-                # This is the "race condition" case: no client has connected yet.
-                # We MUST leave the buffer intact for the late-connecting client.
-                log.debug(
-                    "%s No active connections found for Task ID: %s. Leaving event buffer intact.",
-                    self.log_identifier,
-                    task_id,
-                )
+        now = time.monotonic()
+        metrics = []
+        for queue, stats in list(self._stats.items()):
+            if task_id is not None and stats.task_id != task_id:
+                continue
+            metrics.append(
+                {
+                    "task_id": stats.task_id,
+                    "queue_depth": queue.qsize(),
+                    "max_queue_size": self._max_queue_size,
+                    "high_watermark": stats.high_watermark,
+                    "enqueued_events": stats.enqueued,
+                    "dropped_events": stats.dropped,
+                    "age_seconds": now - stats.created_at,
+                }
+            )
+        return metrics
 
-    def cleanup_old_locks(self):
-        """Remove locks for closed event loops to prevent memory leaks."""
-        with self._locks_lock:
-            closed_loops = [loop for loop in self._locks if loop.is_closed()]
-            for loop in closed_loops:
-                del self._locks[loop]
-                log.debug(
-                    "%s Cleaned up lock for closed event loop %s",
-                    self.log_identifier,
-                    id(loop),
-                )
+    def get_connection_stats(self) -> Dict[str, int]:
+        """
+        Aggregates the metrics of all active connections. Exported as gauges,
+        since per-connection labels would grow with the number of tasks.
+        """
+        metrics = self.get_connection_metrics()
+        return {
+            "connections": len(metrics),
+            "tasks": len({m["task_id"] for m in metrics}),
+            "queued_events": sum(m["queue_depth"] for m in metrics),
+            "max_queue_depth": max((m["queue_depth"] for m in metrics), default=0),
+            "max_high_watermark": max(
+                (m["high_watermark"] for m in metrics), default=0
+            ),
+            "dropped_events": sum(m["dropped_events"] for m in metrics),
+        }
 
     async def close_all(self):
         """Closes all active SSE connections managed by this instance."""
-        self.cleanup_old_locks()
-        lock = self._get_lock()
-        async with lock:
-            log.debug("%s Closing all active SSE connections...", self.log_identifier)
-            all_task_ids = list(self._connections.keys())
-            closed_count = 0
-            for task_id in all_task_ids:
-                if task_id in self._connections:
-                    queues = self._connections.pop(task_id)
-                    closed_count += len(queues)
-                    for q in queues:
-                        try:
-                            await asyncio.wait_for(q.put(None), timeout=0.1)
-                        except Exception:
-                            pass
-            log.debug(
-                "%s Closed %d connections for tasks: %s",
-                self.log_identifier,
-                closed_count,
-                all_task_ids,
-            )
-            self._connections.clear()
+        log.debug("%s Closing all active SSE connections...", self.log_identifier)
+        all_task_ids = list(self._connections.keys())
+        closed_count = 0
+        for task_id in all_task_ids:
+            queues = self._connections.pop(task_id, [])
+            closed_count += len(queues)
+            for q in queues:
+                try:
+                    self._put_close_signal(task_id, q)
+                except Exception:
+                    pass
+        log.debug(
+            "%s Closed %d connections for tasks: %s",
+            self.log_identifier,
+            closed_count,
+            all_task_ids,
+        )
+        self._connections.clear()
+        self._stats.clear()
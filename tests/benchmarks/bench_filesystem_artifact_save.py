@@ -0,0 +1,75 @@
+"""
+Benchmark: FilesystemArtifactService save latency and durability modes.
+
+Measures per-save latency as an artifact accumulates versions (the version
+index keeps this flat) and the throughput of concurrent saves across many
+artifacts with per-save fsync versus group commit.
+
+Run from the repository root:
+
+    python tests/benchmarks/bench_filesystem_artifact_save.py [--versions 2000]
+"""
+
+import argparse
+import asyncio
+import statistics
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[2] / "src"))
+
+from google.genai import types as adk_types  # noqa: E402
+
+from solace_agent_mesh.agent.adk.artifacts.filesystem_artifact_service import (  # noqa: E402
+    FilesystemArtifactService,
+)
+
+SCOPE = {"app_name": "bench", "user_id": "user", "session_id": "session"}
+PART = adk_types.Part.from_bytes(data=b"x" * 1024, mime_type="text/plain")
+
+
+async def _version_growth(base_path: str, num_versions: int):
+    service = FilesystemArtifactService(base_path=base_path)
+    print(f"{'versions':>10} {'median save ms':>16}")
+    window = []
+    for i in range(num_versions):
+        start = time.perf_counter()
+        await service.save_artifact(**SCOPE, filename="progress.json", artifact=PART)
+        window.append(time.perf_counter() - start)
+        if (i + 1) % (num_versions // 5) == 0:
+            print(f"{i + 1:>10} {statistics.median(window) * 1000:>16.3f}")
+            window = []
+
+
+async def _concurrent(base_path: str, durability: str, num_saves: int) -> float:
+    service = FilesystemArtifactService(base_path=base_path, durability=durability)
+    start = time.perf_counter()
+    await asyncio.gather(
+        *(
+            service.save_artifact(**SCOPE, filename=f"file-{i}.txt", artifact=PART)
+            for i in range(num_saves)
+        )
+    )
+    return num_saves / (time.perf_counter() - start)
+
+
+async def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--versions", type=int, default=2000)
+    parser.add_argument("--concurrent", type=int, default=200)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        await _version_growth(tmp, args.versions)
+
+    print(f"\n{args.concurrent} concurrent saves:")
+    for durability in ("fsync", "group_commit"):
+        with tempfile.TemporaryDirectory() as tmp:
+            rate = await _concurrent(tmp, durability, args.concurrent)
+        print(f"  {durability:<14}{rate:10.0f} saves/s")
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,182 @@
+"""
+Benchmark: per-call request assembly overhead in the LiteLlm wrapper.
+
+Simulates an agent loop in which every LLM call resends the growing history
+and the full tool list. As in ADK, the history is deep-copied for every call
+and function tools rebuild their declarations, while dynamic, MCP and peer
+tools reuse their parameter schemas. Compares converting everything from
+scratch and building the debug request log on every call (the previous
+behaviour) with the memoized `_get_completion_inputs`.
+
+Run from the repository root:
+
+    python tests/benchmarks/bench_lite_llm_request_assembly.py [--turns 20] [--tools 60]
+"""
+
+import argparse
+import copy
+import os
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[2] / "src"))
+
+from google.adk.models.llm_request import LlmRequest  # noqa: E402
+from google.genai import types  # noqa: E402
+
+from solace_agent_mesh.agent.adk.models import lite_llm  # noqa: E402
+
+REPEATS = 20
+
+
+def _schema(i: int) -> types.Schema:
+    return types.Schema(
+        type="OBJECT",
+        properties={
+            "filename": types.Schema(type="STRING", description=f"File for tool {i}."),
+            "count": types.Schema(type="INTEGER", description="How many items."),
+            "tags": types.Schema(type="ARRAY", items=types.Schema(type="STRING")),
+            "options": types.Schema(
+                type="OBJECT",
+                properties={
+                    "overwrite": types.Schema(type="BOOLEAN"),
+                    "ratio": types.Schema(type="NUMBER"),
+                },
+            ),
+        },
+        required=["filename"],
+    )
+
+
+class _Tools:
+    """Declarations as ADK produces them: a third keep their schema object."""
+
+    def __init__(self, count: int):
+        self.count = count
+        self.stable_schemas = {i: _schema(i) for i in range(0, count, 3)}
+
+    def declarations(self):
+        return [
+            types.FunctionDeclaration(
+                name=f"tool_{i}",
+                description=f"Performs operation {i} on an artifact. " * 4,
+                parameters=self.stable_schemas.get(i) or _schema(i),
+            )
+            for i in range(self.count)
+        ]
+
+
+def _turn(i: int, image: bytes):
+    user_parts = [types.Part(text=f"Step {i}: please continue with the analysis.")]
+    if i == 0 and image:
+        user_parts.append(types.Part.from_bytes(data=image, mime_type="image/png"))
+    return [
+        types.Content(role="user", parts=user_parts),
+        types.Content(
+            role="model",
+            parts=[
+                types.Part(
+                    function_call=types.FunctionCall(
+                        id=f"call-{i}",
+                        name=f"tool_{i}",
+                        args={"filename": f"data_{i}.csv", "count": i},
+                    )
+                )
+            ],
+        ),
+        types.Content(
+            role="user",
+            parts=[
+                types.Part(
+                    function_response=types.FunctionResponse(
+                        id=f"call-{i}",
+                        name=f"tool_{i}",
+                        response={
+                            "rows": [{"id": n, "value": "x" * 40} for n in range(30)]
+                        },
+                    )
+                )
+            ],
+        ),
+        types.Content(
+            role="model", parts=[types.Part(text=f"Result {i} looks fine. " * 10)]
+        ),
+    ]
+
+
+def _request(history, tools: _Tools) -> LlmRequest:
+    return LlmRequest(
+        contents=copy.deepcopy(history),
+        config=types.GenerateContentConfig(
+            system_instruction="You are a helpful agent. " * 200,
+            tools=[types.Tool(function_declarations=tools.declarations())],
+            temperature=0.2,
+            max_output_tokens=4096,
+        ),
+    )
+
+
+def _previous_assembly(request: LlmRequest):
+    lite_llm._build_request_log(request)
+    messages = [lite_llm._content_to_message_param(c) for c in request.contents]
+    tools = [
+        lite_llm._function_declaration_to_tool_param(d)
+        for d in request.config.tools[0].function_declarations
+    ]
+    request.config.model_dump(exclude_none=True)
+    return messages, tools
+
+
+def _memoized_assembly(request: LlmRequest):
+    return lite_llm._get_completion_inputs(request)
+
+
+def _time_per_call(assemble, requests) -> float:
+    start = time.perf_counter()
+    for request in requests:
+        assemble(request)
+    return (time.perf_counter() - start) / len(requests)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--turns", type=int, default=20)
+    parser.add_argument("--tools", type=int, default=60)
+    parser.add_argument("--image-kb", type=int, default=256)
+    args = parser.parse_args()
+
+    tools = _Tools(args.tools)
+    image = os.urandom(args.image_kb * 1024)
+    history = []
+    print(
+        f"{args.tools} tools, {args.image_kb} KiB image in the first turn, "
+        f"{REPEATS} calls per row"
+    )
+    print(
+        f"{'turn':>5} {'contents':>9} {'previous ms':>12} {'memoized ms':>12} {'speedup':>8}"
+    )
+    for turn in range(args.turns):
+        history.extend(_turn(turn, image))
+        # Build requests up front so deep copies are not timed, as in ADK.
+        previous = _time_per_call(
+            _previous_assembly, [_request(history, tools) for _ in range(REPEATS)]
+        )
+        memoized = _time_per_call(
+            _memoized_assembly, [_request(history, tools) for _ in range(REPEATS)]
+        )
+        if turn in (0, 1) or (turn + 1) % 5 == 0:
+            print(
+                f"{turn + 1:>5} {len(history):>9} {previous * 1000:>12.2f} "
+                f"{memoized * 1000:>12.2f} {previous / memoized:>7.1f}x"
+            )
+
+    messages = lite_llm._conversion_cache.get_stats().get("messages", {})
+    print(
+        f"history cache: {messages.get('hits', 0)} hits, "
+        f"{messages.get('misses', 0)} misses"
+    )
+
+
+if __name__ == "__main__":
+    main()
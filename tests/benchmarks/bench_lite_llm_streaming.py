@@ -0,0 +1,153 @@
+"""
+Benchmark: streamed response aggregation in the LiteLlm wrapper.
+
+Replays synthetic chunk streams (a large tool call carrying generated code and
+a long text answer) through `_model_response_to_chunk` and
+`LiteLlm.generate_content_async`, and compares the incremental JSON buffer
+against re-parsing the accumulated arguments on every chunk.
+
+Run from the repository root:
+
+    python tests/benchmarks/bench_lite_llm_streaming.py [--kb 256]
+"""
+
+import argparse
+import asyncio
+import json
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[2] / "src"))
+
+from google.adk.models.llm_request import LlmRequest  # noqa: E402
+from google.genai import types  # noqa: E402
+from litellm import ModelResponseStream  # noqa: E402
+
+from solace_agent_mesh.agent.adk.models.lite_llm import (  # noqa: E402
+    FunctionChunk,
+    LiteLlm,
+    _model_response_to_chunk,
+    _StreamedJsonBuffer,
+)
+
+CHUNK_CHARS = 16
+
+
+def _tool_call_stream(kb: int):
+    code = "".join(
+        f"def handler_{i}(event):\n    return {{'id': {i}, 'ok': True}}\n"
+        for i in range(kb * 1024 // 48)
+    )
+    args = json.dumps({"filename": "generated.py", "content": code})
+    chunks = [
+        ModelResponseStream(
+            choices=[
+                {
+                    "delta": {
+                        "tool_calls": [
+                            {
+                                "index": 0,
+                                "id": "call-1" if i == 0 else None,
+                                "type": "function",
+                                "function": {
+                                    "name": "create_artifact" if i == 0 else None,
+                                    "arguments": args[i : i + CHUNK_CHARS],
+                                },
+                            }
+                        ]
+                    }
+                }
+            ]
+        )
+        for i in range(0, len(args), CHUNK_CHARS)
+    ]
+    chunks.append(ModelResponseStream(choices=[{"delta": {}, "finish_reason": "tool_calls"}]))
+    return chunks, len(args)
+
+
+def _text_stream(kb: int):
+    text = "lorem ipsum dolor sit amet " * (kb * 1024 // 27)
+    chunks = [
+        ModelResponseStream(choices=[{"delta": {"content": text[i : i + CHUNK_CHARS]}}])
+        for i in range(0, len(text), CHUNK_CHARS)
+    ]
+    chunks.append(ModelResponseStream(choices=[{"delta": {}, "finish_reason": "stop"}]))
+    return chunks, len(text)
+
+
+def _fragments(chunks):
+    return [
+        chunk.args
+        for part in chunks
+        for chunk, _ in _model_response_to_chunk(part)
+        if isinstance(chunk, FunctionChunk) and chunk.args
+    ]
+
+
+def _reparse_every_chunk(fragments):
+    args = ""
+    for fragment in fragments:
+        args += fragment
+        try:
+            json.loads(args)
+        except json.JSONDecodeError:
+            pass
+
+
+def _incremental(fragments):
+    buffer = _StreamedJsonBuffer()
+    for fragment in fragments:
+        buffer.append(fragment)
+
+
+class _ReplayClient:
+    def __init__(self, chunks):
+        self.chunks = chunks
+
+    async def acompletion(self, **kwargs):
+        async def _stream():
+            for chunk in self.chunks:
+                yield chunk
+
+        return _stream()
+
+
+async def _replay(chunks) -> float:
+    llm = LiteLlm(model="openai/replay")
+    llm.llm_client = _ReplayClient(chunks)
+    request = LlmRequest(
+        contents=[types.Content(role="user", parts=[types.Part(text="go")])],
+        config=types.GenerateContentConfig(),
+    )
+    start = time.perf_counter()
+    async for _ in llm.generate_content_async(request, stream=True):
+        pass
+    return time.perf_counter() - start
+
+
+def _timed(fn, *args) -> float:
+    start = time.perf_counter()
+    fn(*args)
+    return time.perf_counter() - start
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--kb", type=int, default=256)
+    args = parser.parse_args()
+
+    tool_chunks, tool_size = _tool_call_stream(args.kb)
+    fragments = _fragments(tool_chunks)
+    print(f"tool-call arguments: {tool_size / 1024:.0f} KiB in {len(fragments)} fragments")
+    print(f"  re-parse every chunk   {_timed(_reparse_every_chunk, fragments) * 1000:10.1f} ms")
+    print(f"  incremental buffer     {_timed(_incremental, fragments) * 1000:10.1f} ms")
+    print(f"  full replay            {asyncio.run(_replay(tool_chunks)) * 1000:10.1f} ms")
+
+    text_chunks, text_size = _text_stream(args.kb)
+    print(f"\ntext answer: {text_size / 1024:.0f} KiB in {len(text_chunks)} chunks")
+    print(f"  full replay            {asyncio.run(_replay(text_chunks)) * 1000:10.1f} ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,142 @@
+"""
+Benchmark: OFFSET vs keyset pagination of the session list on SQLite.
+
+Seeds a file-backed SQLite database (with the same composite indexes the
+Alembic migrations create) with 100k sessions for one user and times page
+fetches at increasing depths, plus COUNT(*) against the cached count.
+
+Run from the repository root:
+
+    python tests/benchmarks/bench_session_pagination.py [--sessions 100000]
+"""
+
+import argparse
+import os
+import statistics
+import sys
+import tempfile
+import time
+from pathlib import Path
+from unittest.mock import Mock
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[2] / "src"))
+
+from sqlalchemy import Index, create_engine, insert  # noqa: E402
+from sqlalchemy.orm import sessionmaker  # noqa: E402
+
+from solace_agent_mesh.gateway.http_sse.repository import (  # noqa: E402
+    Base,
+    SessionModel,
+    SessionRepository,
+)
+from solace_agent_mesh.gateway.http_sse.services.session_service import (  # noqa: E402
+    SessionService,
+)
+from solace_agent_mesh.gateway.http_sse.shared.pagination import (  # noqa: E402
+    PaginationParams,
+    encode_cursor,
+)
+
+USER_ID = "bench-user"
+PAGE_SIZE = 20
+
+
+def _seed(db_path: str, num_sessions: int):
+    engine = create_engine(f"sqlite:///{db_path}")
+    Base.metadata.create_all(engine)
+    Index(
+        "ix_sessions_user_id_updated_time",
+        SessionModel.user_id,
+        SessionModel.updated_time,
+    ).create(engine)
+
+    rows = [
+        {
+            "id": f"web-session-{i:08d}",
+            "user_id": USER_ID if i % 10 else "someone-else",
+            "created_time": 1_700_000_000_000 + i,
+            "updated_time": 1_700_000_000_000 + i * 7 % num_sessions,
+        }
+        for i in range(num_sessions)
+    ]
+    with engine.begin() as conn:
+        conn.execute(insert(SessionModel), rows)
+    return engine
+
+
+def _time(fn, repeat: int = 5) -> float:
+    samples = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        samples.append(time.perf_counter() - start)
+    return statistics.median(samples) * 1000
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--sessions", type=int, default=100_000)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        db_path = os.path.join(tmp, "bench.db")
+        print(f"Seeding {args.sessions} sessions...")
+        engine = _seed(db_path, args.sessions)
+        db = sessionmaker(bind=engine)()
+        repo = SessionRepository(db)
+        component = Mock()
+        component.database_url = f"sqlite:///{db_path}"
+        service = SessionService(component=component)
+
+        total = repo.count_by_user(USER_ID)
+        last_page = total // PAGE_SIZE
+        print(f"User has {total} sessions ({last_page} pages of {PAGE_SIZE})\n")
+        print(f"{'page':>8} {'offset ms':>12} {'keyset ms':>12}")
+
+        for page in (1, 10, 100, 1000, last_page):
+            offset = (page - 1) * PAGE_SIZE
+            anchor = repo.find_by_user_page(USER_ID, limit=1, offset=max(offset - 1, 0))
+            cursor_page = PaginationParams(page_number=1, page_size=PAGE_SIZE)
+            cursor = (
+                encode_cursor(anchor[0].updated_time, anchor[0].id)
+                if page > 1 and anchor
+                else None
+            )
+
+            offset_ms = _time(
+                lambda page=page: service.get_user_sessions(
+                    db,
+                    USER_ID,
+                    PaginationParams(page_number=page, page_size=PAGE_SIZE),
+                    include_total=False,
+                )
+            )
+            keyset_ms = _time(
+                lambda cursor_page=cursor_page, cursor=cursor: (
+                    service.get_user_sessions(
+                        db, USER_ID, cursor_page, cursor=cursor, include_total=False
+                    )
+                )
+            )
+            print(f"{page:>8} {offset_ms:>12.2f} {keyset_ms:>12.2f}")
+
+        count_ms = _time(lambda: repo.count_by_user(USER_ID))
+        service.get_user_sessions(db, USER_ID, PaginationParams())
+        cached_ms = _time(
+            lambda: service.get_user_sessions(db, USER_ID, PaginationParams())
+        )
+        uncounted_ms = _time(
+            lambda: service.get_user_sessions(
+                db, USER_ID, PaginationParams(), include_total=False
+            )
+        )
+        print(f"\n{'COUNT(*) per request:':<34}{count_ms:8.2f} ms")
+        print(f"{'first page, cached total:':<34}{cached_ms:8.2f} ms")
+        print(f"{'first page, includeTotal=false:':<34}{uncounted_ms:8.2f} ms")
+
+        db.close()
+        engine.dispose()
+
+
+if __name__ == "__main__":
+    main()
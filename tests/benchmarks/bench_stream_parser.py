@@ -0,0 +1,71 @@
+"""
+Benchmark: FencedBlockStreamParser throughput in MB/s of streamed text.
+
+Streams synthetic LLM output through the parser in token-sized chunks for
+three profiles: plain prose with no delimiters, prose interleaved with fenced
+save_artifact blocks, and one large fenced block of generated content.
+
+Run from the repository root:
+
+    python tests/benchmarks/bench_stream_parser.py [--mb 4] [--chunk 16]
+"""
+
+import argparse
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[2] / "src"))
+
+from solace_agent_mesh.agent.adk.stream_parser import (  # noqa: E402
+    ARTIFACT_BLOCK_DELIMITER_CLOSE,
+    BLOCK_START_SEQUENCE,
+    FencedBlockStreamParser,
+)
+
+PROSE = (
+    "The quarterly report shows steady growth across all regions, with the "
+    "strongest gains in the services segment. Costs remained flat.\n"
+)
+
+
+def _block(body: str) -> str:
+    return (
+        f'{BLOCK_START_SEQUENCE} filename="report.md" mime_type="text/markdown"\n'
+        f"{body}{ARTIFACT_BLOCK_DELIMITER_CLOSE}\n"
+    )
+
+
+def _profiles(size: int):
+    prose = (PROSE * (size // len(PROSE) + 1))[:size]
+    section = PROSE * 20 + _block("| col | value |\n|---|---|\n| a | 1 |\n" * 40)
+    mixed = (section * (size // len(section) + 1))[:size]
+    code = "def f(x):\n    return x * 2\n"
+    large_block = _block(code * (size // len(code)))
+    return {"plain prose": prose, "prose + blocks": mixed, "one large block": large_block}
+
+
+def _throughput(text: str, chunk_size: int) -> float:
+    chunks = [text[i : i + chunk_size] for i in range(0, len(text), chunk_size)]
+    parser = FencedBlockStreamParser(progress_update_interval_bytes=250)
+    start = time.perf_counter()
+    for chunk in chunks:
+        parser.process_chunk(chunk)
+    parser.finalize()
+    elapsed = time.perf_counter() - start
+    return len(text.encode("utf-8")) / elapsed / 1_000_000
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--mb", type=float, default=4)
+    parser.add_argument("--chunk", type=int, default=16, help="characters per chunk")
+    args = parser.parse_args()
+
+    print(f"{'profile':<18} {'MB/s':>10}")
+    for name, text in _profiles(int(args.mb * 1_000_000)).items():
+        print(f"{name:<18} {_throughput(text, args.chunk):>10.1f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,119 @@
+"""
+Benchmark: routing inbound A2A topics with per-call regexes vs TopicDispatcher.
+
+Replays the gateway's routing decision (discovery, response and status
+subscriptions, plus task ID extraction) for a stream of topics. The baseline
+rebuilds each subscription regex on every check, as the message processor
+loop used to; the dispatcher walks a precompiled trie once per topic.
+
+Run from the repository root:
+
+    python tests/benchmarks/bench_topic_dispatch.py [--messages 200000]
+"""
+
+import argparse
+import re
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[2] / "src"))
+
+from solace_agent_mesh.common import a2a  # noqa: E402
+from solace_agent_mesh.common.a2a import subscription_to_regex  # noqa: E402
+
+NAMESPACE = "acme/prod"
+GATEWAY_ID = "webui-gw"
+
+
+def _regex_matches(topic: str, subscription: str) -> bool:
+    return re.fullmatch(subscription_to_regex(subscription), topic) is not None
+
+
+def _regex_extract(topic: str, subscription: str):
+    base_regex_str = subscription_to_regex(subscription).replace(r".*", "")
+    match = re.match(base_regex_str, topic)
+    if match:
+        return topic[match.end() :].lstrip("/") or None
+    return None
+
+
+def route_with_regex(topic: str):
+    discovery = a2a.get_discovery_topic(NAMESPACE)
+    response_sub = a2a.get_gateway_response_subscription_topic(NAMESPACE, GATEWAY_ID)
+    status_sub = a2a.get_gateway_status_subscription_topic(NAMESPACE, GATEWAY_ID)
+    if _regex_matches(topic, discovery):
+        return "discovery", None
+    if _regex_matches(topic, response_sub) or _regex_matches(topic, status_sub):
+        if _regex_matches(topic, response_sub):
+            return "agent_event", _regex_extract(topic, response_sub)
+        return "agent_event", _regex_extract(topic, status_sub)
+    return None, None
+
+
+def build_dispatcher() -> a2a.TopicDispatcher:
+    dispatcher = a2a.TopicDispatcher()
+    dispatcher.add(a2a.get_discovery_topic(NAMESPACE), "discovery")
+    dispatcher.add(
+        a2a.get_gateway_response_subscription_topic(NAMESPACE, GATEWAY_ID),
+        "agent_event",
+    )
+    dispatcher.add(
+        a2a.get_gateway_status_subscription_topic(NAMESPACE, GATEWAY_ID),
+        "agent_event",
+    )
+    return dispatcher
+
+
+def _topics(count: int):
+    topics = []
+    for i in range(count):
+        kind = i % 10
+        if kind == 0:
+            topics.append(a2a.get_discovery_topic(NAMESPACE))
+        elif kind < 8:
+            topics.append(a2a.get_gateway_status_topic(NAMESPACE, GATEWAY_ID, f"task-{i}"))
+        elif kind < 9:
+            topics.append(
+                a2a.get_gateway_response_topic(NAMESPACE, GATEWAY_ID, f"task-{i}")
+            )
+        else:
+            topics.append(f"{NAMESPACE}/a2a/v1/gateway/status/other-gw/task-{i}")
+    return topics
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--messages", type=int, default=200_000)
+    args = parser.parse_args()
+
+    topics = _topics(args.messages)
+    dispatcher = build_dispatcher()
+
+    for topic in topics[:1000]:
+        route = dispatcher.match(topic)
+        expected = route_with_regex(topic)
+        actual = (route.handler, route.task_id) if route else (None, None)
+        assert actual == expected, (topic, actual, expected)
+
+    start = time.perf_counter()
+    for topic in topics:
+        route_with_regex(topic)
+    regex_s = time.perf_counter() - start
+
+    start = time.perf_counter()
+    for topic in topics:
+        dispatcher.match(topic)
+    trie_s = time.perf_counter() - start
+
+    print(f"{'router':<22}{'msgs/s':>14}{'us/msg':>10}")
+    for name, elapsed in (("regex per call", regex_s), ("TopicDispatcher", trie_s)):
+        print(
+            f"{name:<22}{len(topics) / elapsed:>14,.0f}"
+            f"{elapsed / len(topics) * 1e6:>10.2f}"
+        )
+    print(f"\nspeedup: {regex_s / trie_s:.1f}x")
+
+
+if __name__ == "__main__":
+    main()
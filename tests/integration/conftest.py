@@ -19,6 +19,7 @@ from solace_ai_connector.solace_ai_connector import SolaceAiConnector
 from solace_agent_mesh.agent.sac.app import SamAgentApp
 from solace_agent_mesh.agent.sac.component import SamAgentComponent
 from solace_agent_mesh.agent.tools.registry import tool_registry
+from solace_agent_mesh.common.utils.artifact_cache import get_artifact_cache
 from sam_test_infrastructure.gateway_interface.app import TestGatewayApp
 from sam_test_infrastructure.gateway_interface.component import (
     TestGatewayComponent,
@@ -55,6 +56,44 @@ from a2a.types import (
 from solace_ai_connector.solace_ai_connector import SolaceAiConnector
 
 
+def pytest_addoption(parser):
+    group = parser.getgroup("load benchmark")
+    group.addoption(
+        "--load-benchmark",
+        action="store",
+        default=None,
+        metavar="PATH",
+        help="Run the load benchmark and write its JSON results to PATH.",
+    )
+    group.addoption(
+        "--load-benchmark-clients",
+        action="store",
+        default="1,4,16",
+        help="Comma-separated numbers of concurrent clients to run.",
+    )
+    group.addoption(
+        "--load-benchmark-tasks",
+        action="store",
+        type=int,
+        default=8,
+        help="Tasks each client submits per load level.",
+    )
+    group.addoption(
+        "--load-benchmark-llm-latency",
+        action="store",
+        type=float,
+        default=0.05,
+        help="Seconds the test LLM waits before responding to each request.",
+    )
+    group.addoption(
+        "--load-benchmark-token-rate",
+        action="store",
+        type=float,
+        default=50.0,
+        help="Tokens per second the test LLM streams content at.",
+    )
+
+
 def find_free_port() -> int:
     """Finds and returns an available TCP port."""
     with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as s:
@@ -319,6 +358,7 @@ async def clear_test_artifact_service_between_tests(
     """
     yield
     await test_artifact_service_instance.clear_all_artifacts()
+    get_artifact_cache().clear()
 
 
 @pytest.fixture(scope="session")
@@ -0,0 +1,126 @@
+"""
+Load benchmark for the gateway and agents.
+
+Drives concurrent clients through the test gateway into TestAgent with a mix
+of plain text, tool call, peer delegation and artifact creation tasks, and
+writes throughput, latency, time-to-first-token, event-loop lag and RSS
+growth for each load level to a JSON file so runs can be compared across
+commits. Everything runs in-process against the test LLM server, so no
+network access is needed.
+
+The benchmark is skipped unless a results path is given:
+
+    pytest tests/integration/scenarios_programmatic/test_load_benchmark.py \\
+        --load-benchmark=load.json --load-benchmark-clients=1,8,32
+"""
+
+import json
+import platform
+import subprocess
+from datetime import datetime, timezone
+from pathlib import Path
+
+import pytest
+
+from sam_test_infrastructure.gateway_interface.component import (
+    TestGatewayComponent,
+)
+from sam_test_infrastructure.llm_server.server import TestLLMServer
+from sam_test_infrastructure.load_generator import (
+    DEFAULT_LOAD_PROFILES,
+    LoadGenerator,
+    load_levels,
+)
+from solace_agent_mesh.agent.sac.component import SamAgentComponent
+
+pytestmark = [pytest.mark.asyncio, pytest.mark.benchmark]
+
+
+def _git_commit() -> str:
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "HEAD"],
+            capture_output=True,
+            text=True,
+            check=True,
+            cwd=Path(__file__).parent,
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return "unknown"
+
+
+async def test_load_benchmark(
+    request: pytest.FixtureRequest,
+    test_gateway_app_instance: TestGatewayComponent,
+    test_llm_server: TestLLMServer,
+    main_agent_component: SamAgentComponent,
+    peer_a_component: SamAgentComponent,
+):
+    """Runs each configured load level and writes the results as JSON."""
+    output_path = request.config.getoption("--load-benchmark")
+    if not output_path:
+        pytest.skip("Pass --load-benchmark=PATH to run the load benchmark.")
+
+    clients = load_levels(request.config.getoption("--load-benchmark-clients"))
+    tasks_per_client = request.config.getoption("--load-benchmark-tasks")
+    llm_latency = request.config.getoption("--load-benchmark-llm-latency")
+    token_rate = request.config.getoption("--load-benchmark-token-rate")
+
+    generator = LoadGenerator(
+        gateway=test_gateway_app_instance,
+        llm_server=test_llm_server,
+        monitored_loops={
+            "gateway": test_gateway_app_instance.get_async_loop(),
+            "TestAgent": main_agent_component.get_async_loop(),
+            "TestPeerAgentA": peer_a_component.get_async_loop(),
+        },
+    )
+
+    original_delay = test_llm_server.response_delay_seconds
+    test_llm_server.set_response_delay(llm_latency)
+    test_llm_server.set_token_rate(token_rate)
+    try:
+        # One task per profile first, so one-off startup costs (first LLM
+        # client, first session) are not attributed to the first load level.
+        warmup = await generator.run(
+            clients=1, tasks_per_client=len(DEFAULT_LOAD_PROFILES)
+        )
+        assert warmup["failed"] == 0, f"Warm-up tasks failed: {warmup['errors']}"
+
+        runs = []
+        for level in clients:
+            result = await generator.run(
+                clients=level, tasks_per_client=tasks_per_client
+            )
+            runs.append(result)
+            print(
+                f"\n{level} clients: {result['throughput_tasks_per_second']} tasks/s, "
+                f"p50 {result['latency_ms'].get('p50')} ms, "
+                f"p99 {result['latency_ms'].get('p99')} ms, "
+                f"{result['failed']} failed"
+            )
+    finally:
+        test_llm_server.set_response_delay(original_delay)
+        test_llm_server.set_token_rate(None)
+
+    report = {
+        "benchmark": "gateway_agent_load",
+        "git_commit": _git_commit(),
+        "created_at": datetime.now(timezone.utc).isoformat(),
+        "python_version": platform.python_version(),
+        "config": {
+            "clients": clients,
+            "tasks_per_client": tasks_per_client,
+            "llm_response_delay_seconds": llm_latency,
+            "llm_tokens_per_second": token_rate,
+            "profiles": [profile.id for profile in generator.profiles],
+        },
+        "runs": runs,
+    }
+    Path(output_path).write_text(json.dumps(report, indent=2))
+    print(f"Load benchmark results written to {output_path}")
+
+    failed = sum(run["failed"] for run in runs)
+    assert failed == 0, f"{failed} benchmark tasks failed: " + "; ".join(
+        error for run in runs for error in run["errors"]
+    )
@@ -36,6 +36,7 @@ from solace_agent_mesh.agent.sac.component import SamAgentComponent
 from solace_agent_mesh.common.utils.in_memory_cache import InMemoryCache
 from solace_ai_connector.solace_ai_connector import SolaceAiConnector
 from sam_test_infrastructure.memory_monitor import MemoryMonitor
+from sam_test_infrastructure.load_generator import compile_stateful_responses
 from .test_helpers import (
     create_gateway_input_data,
     submit_test_input,
@@ -170,55 +171,6 @@ TASK_PROFILES: List[Dict[str, Any]] = [
 ]
 
 
-def _precompile_llm_responses(
-    responses: List[Dict[str, Any]], scenario_id: str
-) -> List[Dict[str, Any]]:
-    """
-    Recursively walks LLM responses to replace _sub_task_definitions with
-    stateful test case directives.
-    """
-    compiled_responses = []
-    for response in responses:
-        compiled_response = response.copy()
-        if "_sub_task_definitions" in compiled_response:
-            sub_task_defs = compiled_response.pop("_sub_task_definitions")
-            tool_calls = (
-                compiled_response.get("choices", [{}])[0]
-                .get("message", {})
-                .get("tool_calls", [])
-            )
-
-            for tool_call in tool_calls:
-                tool_call_id = tool_call.get("id")
-                if tool_call_id in sub_task_defs:
-                    sub_task_def = sub_task_defs[tool_call_id]
-
-                    compiled_sub_responses = _precompile_llm_responses(
-                        sub_task_def["llm_responses"], f"{scenario_id}_{tool_call_id}"
-                    )
-
-                    sub_task_id = f"{scenario_id}-{tool_call_id}-{uuid.uuid4().hex[:8]}"
-                    sub_responses_json = json.dumps(compiled_sub_responses)
-                    sub_responses_b64 = base64.b64encode(
-                        sub_responses_json.encode("utf-8")
-                    ).decode("utf-8")
-
-                    arguments_str = tool_call.get("function", {}).get("arguments", "{}")
-                    arguments_dict = json.loads(arguments_str)
-
-                    for key, value in arguments_dict.items():
-                        if isinstance(value, str):
-                            arguments_dict[key] = value.format(
-                                sub_task_id=sub_task_id,
-                                sub_task_responses_b64=sub_responses_b64,
-                            )
-
-                    tool_call["function"]["arguments"] = json.dumps(arguments_dict)
-
-        compiled_responses.append(compiled_response)
-    return compiled_responses
-
-
 async def _run_task_from_profile(
     gateway_component: TestGatewayComponent,
     llm_server: TestLLMServer,
@@ -228,7 +180,7 @@ async def _run_task_from_profile(
     """Runs a single, complete task using the stateful LLM protocol."""
     scenario_id = f"stress-{profile['id']}-{task_num}"
 
-    compiled_responses = _precompile_llm_responses(
+    compiled_responses = compile_stateful_responses(
         profile["llm_responses"], scenario_id
     )
 
@@ -7,6 +7,7 @@ and captures A2A responses from the agent under test.
 import asyncio
 import base64
 import threading
+import time
 from collections import defaultdict
 from typing import Any, Dict, List, Union, Optional, Tuple
 
@@ -53,6 +54,8 @@ class TestGatewayComponent(BaseGatewayComponent):
                 ]
             ],
         ] = defaultdict(asyncio.Queue)
+        # time.monotonic() at which each captured output arrived, in queue order.
+        self._output_arrival_times: Dict[str, List[float]] = defaultdict(list)
         self.captured_cancel_calls: List[str] = []
         self.context_lock = threading.Lock()
         log.info("%s TestGatewayComponent initialized.", self.log_identifier)
@@ -212,6 +215,7 @@ class TestGatewayComponent(BaseGatewayComponent):
             task_id,
             type(event_data).__name__,
         )
+        self._output_arrival_times[task_id].append(time.monotonic())
         await self._captured_outputs[task_id].put(event_data)
 
     async def _send_final_response_to_external(
@@ -221,6 +225,7 @@ class TestGatewayComponent(BaseGatewayComponent):
         log.debug(
             "%s Capturing A2A final response for task %s", self.log_identifier, task_id
         )
+        self._output_arrival_times[task_id].append(time.monotonic())
         await self._captured_outputs[task_id].put(task_data)
 
     async def _send_error_to_external(
@@ -237,6 +242,7 @@ class TestGatewayComponent(BaseGatewayComponent):
             error_data.message,
         )
         if task_id:
+            self._output_arrival_times[task_id].append(time.monotonic())
             await self._captured_outputs[task_id].put(error_data)
         else:
             await self._captured_outputs["__unassigned_errors__"].put(error_data)
@@ -435,6 +441,14 @@ class TestGatewayComponent(BaseGatewayComponent):
                 break
         return outputs
 
+    def get_output_arrival_times(self, task_id: str) -> List[float]:
+        """
+        Returns the time.monotonic() at which each output for a task was
+        captured, in the order the outputs are returned by
+        get_next_captured_output.
+        """
+        return list(self._output_arrival_times.get(task_id, []))
+
     def clear_all_captured_cancel_calls(self) -> None:
         """Clears the list of captured cancellation calls."""
         self.captured_cancel_calls = []
@@ -468,6 +482,7 @@ class TestGatewayComponent(BaseGatewayComponent):
                         self.log_identifier,
                         task_id,
                     )
+                self._output_arrival_times.pop(task_id, None)
             else:
                 for tid in list(self._captured_outputs.keys()):
                     q = self._captured_outputs[tid]
@@ -479,6 +494,7 @@ class TestGatewayComponent(BaseGatewayComponent):
                             break
                 self._captured_outputs.clear()
                 self._captured_outputs = defaultdict(asyncio.Queue)
+                self._output_arrival_times.clear()
                 log.debug(
                     "%s TestGatewayComponent: Cleared all captured outputs.",
                     self.log_identifier,
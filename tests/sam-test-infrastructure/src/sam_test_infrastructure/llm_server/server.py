@@ -113,6 +113,10 @@ class TestLLMServer:
         self._app = app # Keep a reference to the FastAPI app
         self._uvicorn_server: Optional[uvicorn.Server] = None # To store the server instance
         self.response_delay_seconds: float = 0.01
+        # When set, streamed content is split into tokens of `chars_per_token`
+        # characters and emitted at this rate instead of in three chunks.
+        self.tokens_per_second: Optional[float] = None
+        self.chars_per_token: int = 4
         self._setup_logger()
         self._setup_routes()
         self._stateful_responses_cache: Dict[str, List[Any]] = {}
@@ -372,7 +376,25 @@ class TestLLMServer:
                 await asyncio.sleep(0.01)
 
             full_content = full_response.choices[0].message.content
-            if isinstance(full_content, str) and full_content:
+            if (
+                isinstance(full_content, str)
+                and full_content
+                and self.tokens_per_second
+            ):
+                token_interval = 1.0 / self.tokens_per_second
+                for start_idx in range(0, len(full_content), self.chars_per_token):
+                    content_delta = full_content[
+                        start_idx : start_idx + self.chars_per_token
+                    ]
+                    content_chunk_obj = ChatCompletionChunk(
+                        model=request_model,
+                        choices=[
+                            StreamingChoice(delta=DeltaMessage(content=content_delta))
+                        ],
+                    )
+                    yield f"data: {content_chunk_obj.model_dump_json()}\n\n"
+                    await asyncio.sleep(token_interval)
+            elif isinstance(full_content, str) and full_content:
                 num_chunks = 3
                 content_len = len(full_content)
                 if content_len == 0:
@@ -702,6 +724,25 @@ class TestLLMServer:
         self.response_delay_seconds = seconds
         self.logger.info(f"LLM server response delay set to {seconds} seconds.")
 
+    def set_token_rate(
+        self, tokens_per_second: Optional[float], chars_per_token: int = 4
+    ):
+        """
+        Sets the rate at which streamed content is emitted, in tokens of
+        `chars_per_token` characters per second. None restores the default of
+        three content chunks per response.
+        """
+        if tokens_per_second is not None and tokens_per_second <= 0:
+            raise ValueError("tokens_per_second must be positive.")
+        if chars_per_token <= 0:
+            raise ValueError("chars_per_token must be positive.")
+        self.tokens_per_second = tokens_per_second
+        self.chars_per_token = chars_per_token
+        self.logger.info(
+            f"Streaming token rate set to {tokens_per_second} tokens/s "
+            f"({chars_per_token} chars/token)."
+        )
+
     def clear_all_configurations(self):
         """Clears primed responses, the global static response, and captured requests."""
         with self._primed_response_lock:
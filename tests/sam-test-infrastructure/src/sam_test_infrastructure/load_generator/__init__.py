@@ -0,0 +1,33 @@
+"""
+This package contains the load generator used by the load benchmark to drive
+concurrent clients through the test gateway and measure latency, event-loop
+lag and memory growth.
+"""
+
+from .load_generator import (
+    DEFAULT_LOAD_PROFILES,
+    EventLoopLagProbe,
+    LoadGenerator,
+    LoadProfile,
+    RssSampler,
+    TaskMeasurement,
+    build_stateful_prompt,
+    compile_stateful_responses,
+    load_levels,
+    percentile,
+    summarize_samples,
+)
+
+__all__ = [
+    "DEFAULT_LOAD_PROFILES",
+    "EventLoopLagProbe",
+    "LoadGenerator",
+    "LoadProfile",
+    "RssSampler",
+    "TaskMeasurement",
+    "build_stateful_prompt",
+    "compile_stateful_responses",
+    "load_levels",
+    "percentile",
+    "summarize_samples",
+]
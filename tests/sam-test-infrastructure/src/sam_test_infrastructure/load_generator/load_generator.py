@@ -0,0 +1,494 @@
+"""
+Drives concurrent clients through the TestGatewayComponent into the agents
+under test and measures how the system behaves under load.
+
+Each client submits tasks one after another, cycling through a set of
+`LoadProfile`s (plain text, tool calls, peer delegation, artifact creation).
+The TestLLMServer serves each task's responses through its stateful
+`[test_case_id=...]` protocol, so concurrent tasks never consume each other's
+responses. A run reports throughput, end-to-end latency and time-to-first-token
+percentiles, event-loop lag of the component loops and RSS growth of the
+process as a JSON-serializable dict.
+"""
+
+import asyncio
+import base64
+import json
+import threading
+import time
+import uuid
+from dataclasses import dataclass, field
+from typing import Any, Dict, List, Optional, Sequence
+
+from a2a.types import JSONRPCError, Task, TaskStatusUpdateEvent, TextPart
+
+try:
+    import psutil
+except ImportError:
+    psutil = None
+
+from ..gateway_interface.component import TestGatewayComponent
+from ..llm_server.server import TestLLMServer
+
+
+@dataclass
+class LoadProfile:
+    """A kind of task a client submits, with the LLM responses it needs."""
+
+    id: str
+    prompt: str
+    llm_responses: List[Dict[str, Any]]
+    target_agent: str = "TestAgent"
+
+
+def _text_response(text: str) -> Dict[str, Any]:
+    return {"choices": [{"message": {"role": "assistant", "content": text}}]}
+
+
+def _tool_call_response(call_id: str, name: str, arguments: str) -> Dict[str, Any]:
+    return {
+        "choices": [
+            {
+                "message": {
+                    "role": "assistant",
+                    "tool_calls": [
+                        {
+                            "id": call_id,
+                            "type": "function",
+                            "function": {"name": name, "arguments": arguments},
+                        }
+                    ],
+                }
+            }
+        ]
+    }
+
+
+def _peer_delegation_response() -> Dict[str, Any]:
+    response = _tool_call_response(
+        "call_peer_a_1",
+        "peer_TestPeerAgentA",
+        json.dumps(
+            {
+                "task_description": "Summarize the request. [test_case_id={sub_task_id}] [responses_json={sub_task_responses_b64}]",
+                "user_query": "Delegate a task.",
+            }
+        ),
+    )
+    response["_sub_task_definitions"] = {
+        "call_peer_a_1": {
+            "llm_responses": [
+                _text_response(
+                    "Peer A summarized the request: the caller asked for a short "
+                    "summary and this is it."
+                )
+            ]
+        }
+    }
+    return response
+
+
+DEFAULT_LOAD_PROFILES: List[LoadProfile] = [
+    LoadProfile(
+        id="simple_text",
+        prompt="Respond with a short paragraph.",
+        llm_responses=[
+            _text_response(
+                "This is a short paragraph streamed back by the test LLM so that "
+                "time-to-first-token and streaming throughput can be measured."
+            )
+        ],
+    ),
+    LoadProfile(
+        id="tool_call",
+        prompt="What is the weather in London?",
+        llm_responses=[
+            _tool_call_response(
+                "call_weather_1", "get_weather_tool", '{"location": "London"}'
+            ),
+            _text_response("The weather in London is sunny with a light breeze."),
+        ],
+    ),
+    LoadProfile(
+        id="peer_delegation",
+        prompt="Please delegate a task to Peer A.",
+        llm_responses=[
+            _peer_delegation_response(),
+            _text_response("Peer A has responded with a summary."),
+        ],
+    ),
+    LoadProfile(
+        id="artifact_creation",
+        prompt="Create a CSV report.",
+        llm_responses=[
+            _text_response(
+                "Creating the report.\n"
+                '«««save_artifact: filename="report.csv" mime_type="text/csv" '
+                'description="Load test report"\n'
+                "region,value\nnorth,1\nsouth,2\neast,3\nwest,4\n"
+                "»»»\n"
+            ),
+            _text_response("The report has been saved as report.csv."),
+        ],
+    ),
+]
+
+
+def compile_stateful_responses(
+    responses: List[Dict[str, Any]], scenario_id: str
+) -> List[Dict[str, Any]]:
+    """
+    Recursively walks LLM responses to replace _sub_task_definitions with
+    stateful test case directives in the peer tool call arguments.
+    """
+    compiled_responses = []
+    for response in responses:
+        compiled_response = json.loads(json.dumps(response))
+        if "_sub_task_definitions" in compiled_response:
+            sub_task_defs = compiled_response.pop("_sub_task_definitions")
+            tool_calls = (
+                compiled_response.get("choices", [{}])[0]
+                .get("message", {})
+                .get("tool_calls", [])
+            )
+
+            for tool_call in tool_calls:
+                tool_call_id = tool_call.get("id")
+                if tool_call_id in sub_task_defs:
+                    sub_task_def = sub_task_defs[tool_call_id]
+
+                    compiled_sub_responses = compile_stateful_responses(
+                        sub_task_def["llm_responses"], f"{scenario_id}_{tool_call_id}"
+                    )
+
+                    sub_task_id = f"{scenario_id}-{tool_call_id}-{uuid.uuid4().hex[:8]}"
+                    sub_responses_b64 = base64.b64encode(
+                        json.dumps(compiled_sub_responses).encode("utf-8")
+                    ).decode("utf-8")
+
+                    arguments_str = tool_call.get("function", {}).get("arguments", "{}")
+                    arguments_dict = json.loads(arguments_str)
+
+                    for key, value in arguments_dict.items():
+                        if isinstance(value, str):
+                            arguments_dict[key] = value.format(
+                                sub_task_id=sub_task_id,
+                                sub_task_responses_b64=sub_responses_b64,
+                            )
+
+                    tool_call["function"]["arguments"] = json.dumps(arguments_dict)
+
+        compiled_responses.append(compiled_response)
+    return compiled_responses
+
+
+def build_stateful_prompt(
+    prompt: str, responses: List[Dict[str, Any]], case_id: str
+) -> str:
+    """Appends the directives that make the TestLLMServer serve `responses`."""
+    responses_b64 = base64.b64encode(json.dumps(responses).encode("utf-8")).decode(
+        "utf-8"
+    )
+    return f"{prompt} [test_case_id={case_id}] [responses_json={responses_b64}]"
+
+
+def percentile(sorted_values: Sequence[float], pct: float) -> float:
+    """Linearly interpolated percentile of an already sorted sequence."""
+    if not sorted_values:
+        raise ValueError("percentile() requires at least one value.")
+    rank = (len(sorted_values) - 1) * pct / 100.0
+    lower = int(rank)
+    upper = min(lower + 1, len(sorted_values) - 1)
+    fraction = rank - lower
+    return (
+        sorted_values[lower] + (sorted_values[upper] - sorted_values[lower]) * fraction
+    )
+
+
+def summarize_samples(samples_seconds: Sequence[float]) -> Dict[str, Any]:
+    """Summarizes durations in seconds as count, mean and percentiles in ms."""
+    if not samples_seconds:
+        return {"count": 0}
+    values = sorted(sample * 1000.0 for sample in samples_seconds)
+    return {
+        "count": len(values),
+        "mean": round(sum(values) / len(values), 3),
+        "min": round(values[0], 3),
+        "p50": round(percentile(values, 50), 3),
+        "p95": round(percentile(values, 95), 3),
+        "p99": round(percentile(values, 99), 3),
+        "max": round(values[-1], 3),
+    }
+
+
+class EventLoopLagProbe:
+    """
+    Measures how late an event loop runs a timer: a coroutine on the loop
+    repeatedly sleeps for `interval_seconds` and records how much longer than
+    that the sleep took. Lag comes from callbacks that block the loop.
+    """
+
+    def __init__(self, loop: asyncio.AbstractEventLoop, interval_seconds: float = 0.05):
+        self.loop = loop
+        self.interval_seconds = interval_seconds
+        self.samples: List[float] = []
+        self._stopped = threading.Event()
+        self._future = None
+
+    async def _probe(self):
+        while not self._stopped.is_set():
+            started = self.loop.time()
+            await asyncio.sleep(self.interval_seconds)
+            self.samples.append(
+                max(0.0, self.loop.time() - started - self.interval_seconds)
+            )
+
+    def start(self) -> None:
+        self._future = asyncio.run_coroutine_threadsafe(self._probe(), self.loop)
+
+    def stop(self) -> List[float]:
+        self._stopped.set()
+        if self._future is not None:
+            try:
+                self._future.result(timeout=self.interval_seconds * 4 + 5)
+            except Exception:
+                self._future.cancel()
+        return self.samples
+
+
+class RssSampler:
+    """Samples the resident set size of this process on a background thread."""
+
+    def __init__(self, interval_seconds: float = 0.1):
+        self.interval_seconds = interval_seconds
+        self.start_bytes: Optional[int] = None
+        self.peak_bytes: Optional[int] = None
+        self._stopped = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+        self._process = psutil.Process() if psutil is not None else None
+
+    def _rss(self) -> Optional[int]:
+        if self._process is None:
+            return None
+        return self._process.memory_info().rss
+
+    def _run(self):
+        while not self._stopped.wait(self.interval_seconds):
+            self.peak_bytes = max(self.peak_bytes or 0, self._rss() or 0)
+
+    def start(self) -> None:
+        self.start_bytes = self.peak_bytes = self._rss()
+        if self._process is not None:
+            self._thread = threading.Thread(target=self._run, daemon=True)
+            self._thread.start()
+
+    def stop(self) -> Dict[str, Optional[int]]:
+        self._stopped.set()
+        if self._thread is not None:
+            self._thread.join()
+        end_bytes = self._rss()
+        if end_bytes is None:
+            return {"start": None, "end": None, "peak": None, "growth": None}
+        return {
+            "start": self.start_bytes,
+            "end": end_bytes,
+            "peak": max(self.peak_bytes or 0, end_bytes),
+            "growth": end_bytes - self.start_bytes,
+        }
+
+
+@dataclass
+class TaskMeasurement:
+    """Timings of one task, in seconds relative to its submission."""
+
+    profile_id: str
+    ok: bool
+    latency: Optional[float] = None
+    time_to_first_token: Optional[float] = None
+    error: Optional[str] = None
+
+
+def _has_text(event: Any) -> bool:
+    if not isinstance(event, TaskStatusUpdateEvent) or not event.status.message:
+        return False
+    return any(
+        isinstance(part.root, TextPart) and part.root.text
+        for part in event.status.message.parts
+    )
+
+
+@dataclass
+class LoadGenerator:
+    """
+    Runs closed-loop load: `clients` concurrent clients each submit
+    `tasks_per_client` tasks in sequence, waiting for each to finish.
+
+    Args:
+        gateway: The gateway the clients submit tasks through.
+        llm_server: The LLM server serving the profiles' responses.
+        profiles: Task profiles, assigned round-robin across all tasks.
+        monitored_loops: Event loops to measure lag on, by name.
+        task_timeout_seconds: Time a task may take before it counts as failed.
+    """
+
+    gateway: TestGatewayComponent
+    llm_server: TestLLMServer
+    profiles: List[LoadProfile] = field(
+        default_factory=lambda: list(DEFAULT_LOAD_PROFILES)
+    )
+    monitored_loops: Dict[str, asyncio.AbstractEventLoop] = field(default_factory=dict)
+    task_timeout_seconds: float = 60.0
+
+    async def _run_task(
+        self, profile: LoadProfile, client_id: int, task_num: int
+    ) -> TaskMeasurement:
+        scenario_id = f"load-{profile.id}-{client_id}-{task_num}"
+        case_id = f"{scenario_id}-{uuid.uuid4().hex}"
+        prompt = build_stateful_prompt(
+            profile.prompt,
+            compile_stateful_responses(profile.llm_responses, scenario_id),
+            case_id,
+        )
+        input_data = {
+            "target_agent_name": profile.target_agent,
+            "user_identity": f"load_user_{client_id}@example.com",
+            "a2a_parts": [{"type": "text", "text": prompt}],
+            "external_context_override": {
+                "a2a_session_id": f"load_session_{client_id}_{task_num}"
+            },
+        }
+
+        task_id = None
+        submitted_at = time.monotonic()
+        try:
+            task_id = await self.gateway.send_test_input(input_data)
+            deadline = submitted_at + self.task_timeout_seconds
+            events = []
+            while time.monotonic() < deadline:
+                event = await self.gateway.get_next_captured_output(
+                    task_id, timeout=0.05
+                )
+                if event is None:
+                    continue
+                events.append(event)
+                if isinstance(event, (Task, JSONRPCError)):
+                    break
+            else:
+                return TaskMeasurement(
+                    profile.id,
+                    ok=False,
+                    error=f"No terminal event within {self.task_timeout_seconds}s",
+                )
+
+            arrival_times = self.gateway.get_output_arrival_times(task_id)
+            first_token = next(
+                (
+                    arrived - submitted_at
+                    for event, arrived in zip(events, arrival_times)
+                    if _has_text(event)
+                ),
+                None,
+            )
+            latency = arrival_times[len(events) - 1] - submitted_at
+            if isinstance(events[-1], JSONRPCError):
+                return TaskMeasurement(
+                    profile.id, ok=False, latency=latency, error=events[-1].message
+                )
+            return TaskMeasurement(
+                profile.id,
+                ok=True,
+                latency=latency,
+                time_to_first_token=first_token,
+            )
+        except Exception as e:
+            return TaskMeasurement(
+                profile.id, ok=False, error=f"{type(e).__name__}: {e}"
+            )
+        finally:
+            self.llm_server.clear_stateful_cache_for_id(case_id)
+            if task_id:
+                self.gateway.clear_captured_outputs(task_id)
+
+    async def _run_client(
+        self, client_id: int, tasks_per_client: int, clients: int
+    ) -> List[TaskMeasurement]:
+        measurements = []
+        for task_num in range(tasks_per_client):
+            profile = self.profiles[
+                (task_num * clients + client_id) % len(self.profiles)
+            ]
+            measurements.append(await self._run_task(profile, client_id, task_num))
+        return measurements
+
+    async def run(self, clients: int, tasks_per_client: int) -> Dict[str, Any]:
+        """Runs one load level and returns its measurements."""
+        probes = {
+            name: EventLoopLagProbe(loop) for name, loop in self.monitored_loops.items()
+        }
+        rss = RssSampler()
+        rss.start()
+        for probe in probes.values():
+            probe.start()
+
+        started = time.monotonic()
+        per_client = await asyncio.gather(
+            *(
+                self._run_client(client_id, tasks_per_client, clients)
+                for client_id in range(clients)
+            )
+        )
+        duration = time.monotonic() - started
+
+        lag = {name: probe.stop() for name, probe in probes.items()}
+        rss_bytes = rss.stop()
+
+        measurements = [m for client in per_client for m in client]
+        succeeded = [m for m in measurements if m.ok]
+        per_profile: Dict[str, Dict[str, Any]] = {}
+        for profile in self.profiles:
+            profile_ok = [m for m in succeeded if m.profile_id == profile.id]
+            per_profile[profile.id] = {
+                "failed": sum(
+                    1 for m in measurements if m.profile_id == profile.id and not m.ok
+                ),
+                "latency_ms": summarize_samples([m.latency for m in profile_ok]),
+                "time_to_first_token_ms": summarize_samples(
+                    [
+                        m.time_to_first_token
+                        for m in profile_ok
+                        if m.time_to_first_token is not None
+                    ]
+                ),
+            }
+
+        return {
+            "clients": clients,
+            "tasks_per_client": tasks_per_client,
+            "total_tasks": len(measurements),
+            "succeeded": len(succeeded),
+            "failed": len(measurements) - len(succeeded),
+            "errors": sorted({m.error for m in measurements if m.error}),
+            "duration_seconds": round(duration, 3),
+            "throughput_tasks_per_second": round(len(succeeded) / duration, 3),
+            "latency_ms": summarize_samples([m.latency for m in succeeded]),
+            "time_to_first_token_ms": summarize_samples(
+                [
+                    m.time_to_first_token
+                    for m in succeeded
+                    if m.time_to_first_token is not None
+                ]
+            ),
+            "per_profile": per_profile,
+            "event_loop_lag_ms": {
+                name: summarize_samples(samples) for name, samples in lag.items()
+            },
+            "rss_bytes": rss_bytes,
+        }
+
+
+def load_levels(value: str) -> List[int]:
+    """Parses a comma-separated list of client counts, e.g. "1,8,32"."""
+    levels = [int(level) for level in value.split(",") if level.strip()]
+    if not levels or any(level <= 0 for level in levels):
+        raise ValueError(f"Invalid client counts: {value!r}")
+    return levels
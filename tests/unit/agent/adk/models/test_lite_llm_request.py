@@ -0,0 +1,312 @@
+"""
+Unit tests for request assembly and prompt caching in the LiteLlm wrapper.
+"""
+
+import copy
+import logging
+
+import pytest
+from google.adk.models.llm_request import LlmRequest
+from google.genai import types
+from litellm import ModelResponse
+
+from solace_agent_mesh.agent.adk.models import lite_llm
+from solace_agent_mesh.agent.adk.models.lite_llm import (
+    LiteLlm,
+    _content_to_message_param,
+    _function_declaration_to_tool_param,
+    _get_completion_inputs,
+    _model_response_to_chunk,
+    _model_response_to_generate_content_response,
+    append_request_context,
+)
+from solace_agent_mesh.common.utils.bounded_cache import BoundedTTLCache
+
+HISTORY = [
+    types.Content(role="user", parts=[types.Part(text="Describe this image.")]),
+    types.Content(
+        role="user",
+        parts=[
+            types.Part(text="Here it is:"),
+            types.Part.from_bytes(data=b"\x89PNG fake", mime_type="image/png"),
+        ],
+    ),
+    types.Content(
+        role="model",
+        parts=[
+            types.Part(text="Let me check."),
+            types.Part(
+                function_call=types.FunctionCall(
+                    id="call-1", name="lookup", args={"q": "cats"}
+                )
+            ),
+        ],
+    ),
+    types.Content(
+        role="user",
+        parts=[
+            types.Part(
+                function_response=types.FunctionResponse(
+                    id="call-1", name="lookup", response={"result": "found"}
+                )
+            ),
+            types.Part(
+                function_response=types.FunctionResponse(
+                    id="call-2", name="lookup", response={"result": "none"}
+                )
+            ),
+        ],
+    ),
+]
+
+
+def _declaration(parameters=None):
+    return types.FunctionDeclaration(
+        name="lookup",
+        description="Looks things up.",
+        parameters=parameters
+        or types.Schema(
+            type="OBJECT",
+            properties={
+                "q": types.Schema(type="STRING"),
+                "tags": types.Schema(type="ARRAY", items=types.Schema(type="STRING")),
+            },
+        ),
+    )
+
+
+def _request(contents, declarations=(), **config):
+    return LlmRequest(
+        contents=contents,
+        config=types.GenerateContentConfig(
+            tools=(
+                [types.Tool(function_declarations=list(declarations))]
+                if declarations
+                else None
+            ),
+            **config,
+        ),
+    )
+
+
+def _hits(namespace):
+    return lite_llm._conversion_cache.get_stats().get(namespace, {}).get("hits", 0)
+
+
+@pytest.fixture(autouse=True)
+def conversion_cache(monkeypatch):
+    monkeypatch.setattr(lite_llm, "_conversion_cache", BoundedTTLCache())
+
+
+def test_history_conversion_is_memoized_by_content():
+    expected = [_content_to_message_param(content) for content in HISTORY]
+
+    first, _, _, _ = _get_completion_inputs(_request(HISTORY))
+    # ADK deep-copies the history for every call.
+    second, _, _, _ = _get_completion_inputs(_request(copy.deepcopy(HISTORY)))
+
+    flattened = []
+    for message in expected:
+        flattened.extend(message if isinstance(message, list) else [message])
+    assert first == flattened
+    assert second == flattened
+    # The item with an image is converted again rather than cached.
+    assert _hits("messages") == len(HISTORY) - 1
+    assert lite_llm._conversion_cache.size("messages") == len(HISTORY) - 1
+    assert 0 < lite_llm._conversion_cache.get_stats()["messages"]["bytes"] < 1000
+
+
+def test_changed_history_items_are_converted_again():
+    _get_completion_inputs(_request(HISTORY))
+    edited = copy.deepcopy(HISTORY)
+    edited[2].parts[1].function_call.args = {"q": "dogs"}
+
+    messages, _, _, _ = _get_completion_inputs(_request(edited))
+
+    assert messages[2]["tool_calls"][0]["function"]["arguments"] == '{"q": "dogs"}'
+
+
+def test_cached_messages_and_tools_are_copied():
+    declaration = _declaration()
+    messages, tools, _, _ = _get_completion_inputs(_request(HISTORY, [declaration]))
+    messages[1]["content"][0]["text"] = "mutated"
+    tools[0]["function"]["parameters"]["properties"]["q"]["type"] = "mutated"
+
+    messages, tools, _, _ = _get_completion_inputs(_request(HISTORY, [declaration]))
+
+    assert messages[1]["content"][0]["text"] == "Here it is:"
+    assert tools[0] == _function_declaration_to_tool_param(declaration)
+
+
+def test_tool_declarations_are_reused_for_the_same_parameter_schema(monkeypatch):
+    converted = []
+
+    def _convert(declaration):
+        converted.append(declaration.name)
+        return _function_declaration_to_tool_param(declaration)
+
+    monkeypatch.setattr(lite_llm, "_function_declaration_to_tool_param", _convert)
+    schema = _declaration().parameters
+    _get_completion_inputs(_request(HISTORY, [_declaration(schema)]))
+    _get_completion_inputs(_request(HISTORY, [_declaration(schema)]))
+    assert converted == ["lookup"]
+
+    rebuilt = _declaration(
+        types.Schema(type="OBJECT", properties={"other": types.Schema(type="STRING")})
+    )
+    _, tools, _, _ = _get_completion_inputs(_request(HISTORY, [rebuilt]))
+
+    assert converted == ["lookup", "lookup"]
+    assert list(tools[0]["function"]["parameters"]["properties"]) == ["other"]
+
+
+def test_generation_params_are_read_without_dumping_the_config():
+    _, _, _, params = _get_completion_inputs(
+        _request(HISTORY, max_output_tokens=100, stop_sequences=["END"])
+    )
+    assert params == {"max_completion_tokens": 100, "stop": ["END"]}
+
+    _, _, _, params = _get_completion_inputs(_request(HISTORY))
+    assert params is None
+
+
+class _FakeClient:
+    def __init__(self):
+        self.calls = []
+
+    async def acompletion(self, **kwargs):
+        self.calls.append(kwargs)
+        return ModelResponse(
+            choices=[{"message": {"role": "assistant", "content": "hi"}}]
+        )
+
+
+async def test_request_log_is_only_built_when_debug_logging_is_enabled(
+    monkeypatch, caplog
+):
+    built = []
+    monkeypatch.setattr(
+        lite_llm, "_build_request_log", lambda request: built.append(request) or ""
+    )
+    llm = LiteLlm(model="openai/test")
+    llm.llm_client = _FakeClient()
+
+    caplog.set_level(logging.INFO, logger=lite_llm.logger.name)
+    async for _ in llm.generate_content_async(_request(copy.deepcopy(HISTORY[:1]))):
+        pass
+    assert built == []
+
+    caplog.set_level(logging.DEBUG, logger=lite_llm.logger.name)
+    async for _ in llm.generate_content_async(_request(copy.deepcopy(HISTORY[:1]))):
+        pass
+    assert len(built) == 1
+
+
+CACHE_CONTROL = {"type": "ephemeral"}
+
+
+def _request_with_context(contents):
+    request = _request(contents, [_declaration()], system_instruction="Be helpful.")
+    append_request_context(request, "Current time Monday.")
+    append_request_context(request, "Inquiring User Profile:\nAda")
+    return request
+
+
+def test_request_context_is_collected_after_the_system_instruction():
+    request = _request_with_context(HISTORY)
+
+    assert request.config.system_instruction == (
+        "Be helpful.\n\n---\n\nRequest Context:\n"
+        "Current time Monday.\n\nInquiring User Profile:\nAda"
+    )
+
+    # Without prompt caching the request is sent unchanged.
+    messages, tools, _, _ = _get_completion_inputs(request)
+    assert messages[0]["content"] == request.config.system_instruction
+    assert "cache_control" not in tools[0]
+    assert not any("cache_control" in message for message in messages)
+
+
+def test_prompt_caching_moves_request_context_after_the_cached_prefix():
+    messages, tools, _, _ = _get_completion_inputs(
+        _request_with_context(HISTORY), prompt_caching=True
+    )
+
+    assert tools[-1]["cache_control"] == CACHE_CONTROL
+    assert messages[0] == {
+        "role": "developer",
+        "content": [
+            {"type": "text", "text": "Be helpful.", "cache_control": CACHE_CONTROL}
+        ],
+    }
+    # The last history item holds two tool messages; the breakpoint goes on the
+    # last one, before the request context.
+    assert messages[-2]["role"] == "tool"
+    assert messages[-2]["cache_control"] == CACHE_CONTROL
+    assert "cache_control" not in messages[-3]
+    assert messages[-1] == {
+        "role": "user",
+        "content": (
+            "Request Context:\nCurrent time Monday.\n\nInquiring User Profile:\nAda"
+        ),
+    }
+
+
+def test_prompt_caching_does_not_mark_cached_conversions():
+    _get_completion_inputs(_request_with_context(HISTORY[:2]), prompt_caching=True)
+
+    messages, tools, _, _ = _get_completion_inputs(_request_with_context(HISTORY[:2]))
+
+    assert "cache_control" not in tools[-1]
+    assert messages[-1]["content"][-1] == {
+        "type": "image_url",
+        "image_url": messages[-1]["content"][-1]["image_url"],
+    }
+
+
+def test_request_context_alone_is_not_sent_as_a_system_message():
+    request = _request(HISTORY[:1])
+    append_request_context(request, "Current time Monday.")
+
+    messages, _, _, _ = _get_completion_inputs(request, prompt_caching=True)
+
+    assert [message["role"] for message in messages] == ["user", "user"]
+    assert messages[0]["cache_control"] == CACHE_CONTROL
+    assert messages[1]["content"] == "Request Context:\nCurrent time Monday."
+
+
+async def test_prompt_caching_option_is_not_passed_to_litellm():
+    llm = LiteLlm(model="anthropic/test", prompt_caching=True, temperature=0)
+    llm.llm_client = _FakeClient()
+
+    async for _ in llm.generate_content_async(
+        _request_with_context(copy.deepcopy(HISTORY[:1]))
+    ):
+        pass
+
+    (call,) = llm.llm_client.calls
+    assert "prompt_caching" not in call
+    assert call["temperature"] == 0
+    assert call["tools"][-1]["cache_control"] == CACHE_CONTROL
+
+
+@pytest.mark.parametrize(
+    "usage, cached_tokens",
+    [
+        ({"prompt_tokens_details": {"cached_tokens": 80}}, 80),
+        ({"cache_read_input_tokens": 70}, 70),
+        ({}, 0),
+    ],
+)
+def test_cached_prompt_tokens_are_reported(usage, cached_tokens):
+    response = ModelResponse(
+        choices=[{"message": {"role": "assistant", "content": "hi"}}],
+        usage={"prompt_tokens": 100, "completion_tokens": 5, "total_tokens": 105}
+        | usage,
+    )
+
+    llm_response = _model_response_to_generate_content_response(response)
+    chunks = [chunk for chunk, _ in _model_response_to_chunk(response)]
+
+    assert llm_response.usage_metadata.cached_content_token_count == cached_tokens
+    assert chunks[-1].cached_tokens == cached_tokens
@@ -0,0 +1,127 @@
+"""
+Unit tests for streamed tool-call and text aggregation in the LiteLlm wrapper.
+"""
+
+import json
+import random
+
+import pytest
+from google.adk.models.llm_request import LlmRequest
+from google.genai import types
+from litellm import ModelResponseStream
+
+from solace_agent_mesh.agent.adk.models.lite_llm import LiteLlm, _StreamedJsonBuffer
+
+JSON_SAMPLES = [
+    '{"path": "a.py", "content": "def f():\\n    return {\\"x\\": [1, 2]}\\n"}',
+    '{"nested": {"list": [{"a": "}"}, {"b": "\\\\"}], "esc": "\\"{[\\u00e9"}}',
+    '  [1, 2, {"k": "]"}]  ',
+    '{"a": }',
+    '{} {}',
+    '{"unterminated": "abc',
+    '42',
+    '"just a string"',
+    "",
+]
+
+
+def _random_split(text, rng):
+    cuts = []
+    if len(text) > 1:
+        cuts = sorted(rng.sample(range(1, len(text)), min(len(text) - 1, rng.randint(0, 12))))
+    bounds = [0, *cuts, len(text)]
+    return [text[a:b] for a, b in zip(bounds, bounds[1:]) if b > a]
+
+
+def _is_json(text):
+    try:
+        json.loads(text)
+        return True
+    except json.JSONDecodeError:
+        return False
+
+
+@pytest.mark.parametrize("sample", JSON_SAMPLES)
+def test_buffer_matches_json_loads_for_every_prefix(sample):
+    rng = random.Random(sample)
+    for _ in range(50):
+        buffer = _StreamedJsonBuffer()
+        accumulated = ""
+        for fragment in _random_split(sample, rng) + [" ", "\n"]:
+            accumulated += fragment
+            assert buffer.append(fragment) == _is_json(accumulated), repr(accumulated)
+            assert buffer.getvalue() == accumulated
+
+
+class _FakeClient:
+    def __init__(self, chunks):
+        self.chunks = chunks
+
+    async def acompletion(self, **kwargs):
+        async def _stream():
+            for chunk in self.chunks:
+                yield chunk
+
+        return _stream()
+
+
+def _tool_delta(index, args, name=None, call_id=None):
+    return ModelResponseStream(
+        choices=[
+            {
+                "delta": {
+                    "tool_calls": [
+                        {
+                            "index": index,
+                            "id": call_id,
+                            "type": "function",
+                            "function": {"name": name, "arguments": args},
+                        }
+                    ]
+                }
+            }
+        ]
+    )
+
+
+def _finish(reason):
+    return ModelResponseStream(choices=[{"delta": {}, "finish_reason": reason}])
+
+
+async def _run(chunks):
+    llm = LiteLlm(model="openai/test")
+    llm.llm_client = _FakeClient(chunks)
+    request = LlmRequest(
+        contents=[types.Content(role="user", parts=[types.Part(text="hi")])],
+        config=types.GenerateContentConfig(),
+    )
+    return [r async for r in llm.generate_content_async(request, stream=True)]
+
+
+async def test_streamed_tool_calls_are_split_on_completed_arguments():
+    # Both calls arrive with index 0; completion of the first call's JSON
+    # arguments moves the second onto the next fallback index.
+    first = json.dumps({"code": "x = {'a': [1, 2]}\n" * 50})
+    second = json.dumps({"q": "b"})
+    chunks = [_tool_delta(0, "", name="write", call_id="call-1")]
+    chunks += [_tool_delta(0, first[i : i + 7]) for i in range(0, len(first), 7)]
+    chunks += [_tool_delta(0, second, name="read", call_id="call-2"), _finish("tool_calls")]
+
+    responses = await _run(chunks)
+
+    calls = [p.function_call for p in responses[-1].content.parts if p.function_call]
+    assert [(c.name, c.args) for c in calls] == [
+        ("write", json.loads(first)),
+        ("read", json.loads(second)),
+    ]
+
+
+async def test_streamed_text_is_aggregated_on_stop():
+    words = [f"word{i} " for i in range(200)]
+    chunks = [ModelResponseStream(choices=[{"delta": {"content": w}}]) for w in words]
+    chunks.append(_finish("stop"))
+
+    responses = await _run(chunks)
+
+    assert [r.partial for r in responses[:-1]] == [True] * len(words)
+    assert responses[-1].content.parts[0].text == "".join(words)
@@ -0,0 +1,115 @@
+"""
+Unit tests for bulk artifact listing with metadata.
+"""
+
+import json
+from unittest.mock import MagicMock
+
+from google.adk.artifacts import InMemoryArtifactService
+from google.genai import types as adk_types
+
+from solace_agent_mesh.agent.adk.artifacts.filesystem_artifact_service import (
+    FilesystemArtifactService,
+)
+from solace_agent_mesh.agent.adk.artifacts.listing import (
+    list_artifacts_with_metadata,
+)
+from solace_agent_mesh.agent.adk.artifacts.s3_artifact_service import (
+    S3ArtifactService,
+)
+
+SCOPE = {"app_name": "app", "user_id": "user-a", "session_id": "s1"}
+
+
+async def _save(service, filename, data, metadata=None):
+    await service.save_artifact(
+        **SCOPE,
+        filename=filename,
+        artifact=adk_types.Part.from_bytes(data=data, mime_type="text/plain"),
+    )
+    if metadata is not None:
+        await service.save_artifact(
+            **SCOPE,
+            filename=f"{filename}.metadata.json",
+            artifact=adk_types.Part.from_bytes(
+                data=json.dumps(metadata).encode(), mime_type="application/json"
+            ),
+        )
+
+
+async def _populate(service):
+    await _save(service, "a.txt", b"v0", {"description": "first", "size_bytes": 2})
+    await _save(service, "a.txt", b"v1!", {"description": "second", "size_bytes": 3})
+    await _save(service, "no_meta.txt", b"x")
+    await _save(service, "user:profile.txt", b"p", {"description": "user scoped"})
+    await service.save_artifact(
+        **SCOPE,
+        filename="broken.txt",
+        artifact=adk_types.Part.from_bytes(data=b"b", mime_type="text/plain"),
+    )
+    await service.save_artifact(
+        **SCOPE,
+        filename="broken.txt.metadata.json",
+        artifact=adk_types.Part.from_bytes(data=b"{not json", mime_type="application/json"),
+    )
+
+
+def _assert_listings(listings):
+    by_name = {listing.filename: listing for listing in listings}
+    assert sorted(by_name) == ["a.txt", "broken.txt", "no_meta.txt", "user:profile.txt"]
+
+    assert by_name["a.txt"].versions == [0, 1]
+    assert by_name["a.txt"].metadata["description"] == "second"
+    assert by_name["no_meta.txt"].has_metadata_file is False
+    assert by_name["no_meta.txt"].metadata is None
+    assert by_name["user:profile.txt"].metadata == {"description": "user scoped"}
+    assert by_name["broken.txt"].metadata is None
+    assert by_name["broken.txt"].metadata_error.startswith("Failed to parse metadata")
+
+
+async def test_filesystem_listing(tmp_path):
+    service = FilesystemArtifactService(base_path=str(tmp_path))
+    await _populate(service)
+
+    _assert_listings(await service.list_artifacts_with_metadata(**SCOPE, max_concurrency=2))
+
+
+async def test_generic_listing_for_services_without_bulk_support():
+    service = InMemoryArtifactService()
+    await _populate(service)
+
+    _assert_listings(await list_artifacts_with_metadata(service, **SCOPE))
+
+
+async def test_s3_listing_uses_one_list_per_prefix():
+    objects = {}
+    client = MagicMock()
+
+    def put_object(Bucket, Key, Body, ContentType, Metadata):
+        objects[Key] = Body
+
+    def paginate(Bucket, Prefix):
+        return [{"Contents": [{"Key": k} for k in objects if k.startswith(Prefix)]}]
+
+    def get_object(Bucket, Key):
+        body = MagicMock()
+        body.read.return_value = objects[Key]
+        return {"Body": body, "ContentType": "application/json"}
+
+    client.put_object.side_effect = put_object
+    client.get_object.side_effect = get_object
+    client.get_paginator.return_value.paginate.side_effect = paginate
+    service = S3ArtifactService(bucket_name="bucket", s3_client=client)
+    await _populate(service)
+    client.get_paginator.return_value.paginate.reset_mock()
+
+    _assert_listings(await service.list_artifacts_with_metadata(**SCOPE))
+    assert client.get_paginator.return_value.paginate.call_count == 2
+
+
+async def test_listing_empty_scope(tmp_path):
+    service = FilesystemArtifactService(base_path=str(tmp_path))
+    listings = await service.list_artifacts_with_metadata(
+        app_name="app", user_id="nobody", session_id="none"
+    )
+    assert listings == []
@@ -0,0 +1,358 @@
+"""
+Unit tests for chunked, ranged artifact reads and streaming artifact writes.
+"""
+
+import asyncio
+import hashlib
+import io
+import os
+import time
+from datetime import datetime, timezone
+from unittest.mock import MagicMock
+
+import pytest
+from botocore.exceptions import ClientError
+from google.adk.artifacts import InMemoryArtifactService
+from google.genai import types as adk_types
+
+from solace_agent_mesh.agent.adk.artifacts.filesystem_artifact_service import (
+    FilesystemArtifactService,
+)
+from solace_agent_mesh.agent.adk.artifacts.s3_artifact_service import (
+    S3ArtifactService,
+)
+from solace_agent_mesh.agent.adk.artifacts.streaming import (
+    ArtifactTooLargeError,
+    open_artifact_stream,
+    save_artifact_stream,
+)
+from solace_agent_mesh.agent.utils.artifact_helpers import (
+    load_artifact_content_or_metadata,
+    save_artifact_stream_with_metadata,
+)
+
+SCOPE = {"app_name": "app", "user_id": "user-a", "session_id": "s1"}
+DATA = bytes(range(256)) * 40
+
+
+async def _save(service, filename, data, mime_type="audio/wav"):
+    return await service.save_artifact(
+        **SCOPE,
+        filename=filename,
+        artifact=adk_types.Part.from_bytes(data=data, mime_type=mime_type),
+    )
+
+
+async def _chunks(data, chunk_size=1000):
+    for offset in range(0, len(data), chunk_size):
+        yield data[offset : offset + chunk_size]
+
+
+async def _collect(stream, start=0, end=None, chunk_size=1000):
+    chunks = [chunk async for chunk in stream.iter_bytes(start, end, chunk_size)]
+    assert all(len(chunk) <= chunk_size for chunk in chunks)
+    return b"".join(chunks)
+
+
+async def _assert_ranged_reads(service):
+    await _save(service, "clip.wav", b"old")
+    await _save(service, "clip.wav", DATA)
+
+    latest = await open_artifact_stream(service, **SCOPE, filename="clip.wav")
+    assert latest.version == 1
+    assert latest.size_bytes == len(DATA)
+    assert latest.mime_type == "audio/wav"
+    assert await _collect(latest) == DATA
+    assert await _collect(latest, 100, 2600) == DATA[100:2600]
+    assert await _collect(latest, len(DATA) - 5) == DATA[-5:]
+    assert await _collect(latest, 10, 10) == b""
+
+    first = await open_artifact_stream(service, **SCOPE, filename="clip.wav", version=0)
+    assert await first.read() == b"old"
+    assert first.etag != latest.etag
+
+    assert (
+        await open_artifact_stream(service, **SCOPE, filename="clip.wav", version=7)
+        is None
+    )
+    assert await open_artifact_stream(service, **SCOPE, filename="missing") is None
+
+
+async def test_filesystem_ranged_reads(tmp_path):
+    service = FilesystemArtifactService(base_path=str(tmp_path))
+    await _assert_ranged_reads(service)
+
+
+async def test_generic_ranged_reads_for_services_without_streaming():
+    await _assert_ranged_reads(InMemoryArtifactService())
+
+
+async def test_s3_ranged_reads_use_range_requests():
+    objects = {}
+    client = MagicMock()
+
+    def put_object(Bucket, Key, Body, ContentType, Metadata):
+        objects[Key] = (Body, ContentType)
+
+    def paginate(Bucket, Prefix):
+        return [{"Contents": [{"Key": k} for k in objects if k.startswith(Prefix)]}]
+
+    def head_object(Bucket, Key):
+        if Key not in objects:
+            raise ClientError({"Error": {"Code": "404"}}, "HeadObject")
+        body, content_type = objects[Key]
+        return {
+            "ContentLength": len(body),
+            "ContentType": content_type,
+            "ETag": f'"{hash(body)}"',
+        }
+
+    def get_object(Bucket, Key, Range, IfMatch):
+        body, _ = objects[Key]
+        first, last = Range.removeprefix("bytes=").split("-")
+        return {"Body": io.BytesIO(body[int(first) : int(last) + 1])}
+
+    client.put_object.side_effect = put_object
+    client.head_object.side_effect = head_object
+    client.get_object.side_effect = get_object
+    client.get_paginator.return_value.paginate.side_effect = paginate
+    service = S3ArtifactService(bucket_name="bucket", s3_client=client)
+
+    await _save(service, "clip.wav", DATA)
+    stream = await open_artifact_stream(
+        service, **SCOPE, filename="clip.wav", version=0
+    )
+
+    assert await _collect(stream, 100, 2600) == DATA[100:2600]
+    assert client.get_object.call_args.kwargs["Range"] == "bytes=100-2599"
+    assert await open_artifact_stream(service, **SCOPE, filename="missing") is None
+
+
+async def _assert_streamed_saves(service):
+    saved = await save_artifact_stream(
+        service,
+        **SCOPE,
+        filename="clip.wav",
+        chunks=_chunks(DATA),
+        mime_type="audio/wav",
+    )
+    assert saved.version == 0
+    assert saved.size_bytes == len(DATA)
+    assert saved.sha256 == hashlib.sha256(DATA).hexdigest()
+
+    with pytest.raises(ArtifactTooLargeError):
+        await save_artifact_stream(
+            service,
+            **SCOPE,
+            filename="clip.wav",
+            chunks=_chunks(DATA),
+            mime_type="audio/wav",
+            max_size_bytes=len(DATA) - 1,
+        )
+
+    assert await service.list_versions(**SCOPE, filename="clip.wav") == [0]
+    stream = await open_artifact_stream(service, **SCOPE, filename="clip.wav")
+    assert await stream.read() == DATA
+
+
+async def test_filesystem_streamed_save_leaves_no_spool_files(tmp_path):
+    service = FilesystemArtifactService(base_path=str(tmp_path))
+    await _assert_streamed_saves(service)
+
+    assert os.listdir(tmp_path / ".uploads") == []
+
+
+async def test_generic_streamed_save_for_services_without_streaming():
+    await _assert_streamed_saves(InMemoryArtifactService())
+
+
+@pytest.fixture
+def multipart_client():
+    client = MagicMock()
+    client.get_paginator.return_value.paginate.return_value = [{}]
+    client.create_multipart_upload.return_value = {"UploadId": "upload-1"}
+    client.state = {"parts": {}, "active": 0, "max_active": 0}
+
+    def upload_part(Bucket, Key, UploadId, PartNumber, Body):
+        state = client.state
+        state["active"] += 1
+        state["max_active"] = max(state["max_active"], state["active"])
+        # Let other part uploads start while this one is in flight.
+        time.sleep(0.02)
+        state["active"] -= 1
+        state["parts"][PartNumber] = Body
+        return {"ETag": f'"etag-{PartNumber}"'}
+
+    client.upload_part.side_effect = upload_part
+    return client
+
+
+async def test_s3_streamed_save_uploads_parts_concurrently(multipart_client):
+    service = S3ArtifactService(
+        bucket_name="bucket",
+        s3_client=multipart_client,
+        multipart_part_size=1000,
+        multipart_concurrency=2,
+    )
+
+    saved = await save_artifact_stream(
+        service,
+        **SCOPE,
+        filename="clip.wav",
+        chunks=_chunks(DATA, 700),
+        mime_type="audio/wav",
+    )
+
+    parts = multipart_client.state["parts"]
+    assert saved.size_bytes == len(DATA)
+    assert len(parts) == 11
+    assert b"".join(parts[number] for number in sorted(parts)) == DATA
+    assert 1 < multipart_client.state["max_active"] <= 2
+    completed = multipart_client.complete_multipart_upload.call_args.kwargs
+    assert [
+        part["PartNumber"] for part in completed["MultipartUpload"]["Parts"]
+    ] == list(range(1, 12))
+    multipart_client.put_object.assert_not_called()
+
+
+async def test_s3_streamed_save_aborts_on_failure(multipart_client):
+    multipart_client.upload_part.side_effect = ClientError(
+        {"Error": {"Code": "500"}}, "UploadPart"
+    )
+    service = S3ArtifactService(
+        bucket_name="bucket", s3_client=multipart_client, multipart_part_size=1000
+    )
+
+    with pytest.raises(OSError):
+        await save_artifact_stream(
+            service,
+            **SCOPE,
+            filename="clip.wav",
+            chunks=_chunks(DATA),
+            mime_type="audio/wav",
+        )
+
+    multipart_client.abort_multipart_upload.assert_called_once()
+    multipart_client.complete_multipart_upload.assert_not_called()
+
+
+def _record_abort(client):
+    def abort_multipart_upload(Bucket, Key, UploadId):
+        client.state["parts_at_abort"] = dict(client.state["parts"])
+        client.state["active_at_abort"] = client.state["active"]
+
+    client.abort_multipart_upload.side_effect = abort_multipart_upload
+
+
+async def test_s3_streamed_save_aborts_after_running_parts_finish(multipart_client):
+    upload_part = multipart_client.upload_part.side_effect
+
+    def failing_first_part(**kwargs):
+        if kwargs["PartNumber"] == 1:
+            raise ClientError({"Error": {"Code": "500"}}, "UploadPart")
+        multipart_client.state["active"] += 1
+        time.sleep(0.1)
+        multipart_client.state["active"] -= 1
+        return upload_part(**kwargs)
+
+    multipart_client.upload_part.side_effect = failing_first_part
+    _record_abort(multipart_client)
+    service = S3ArtifactService(
+        bucket_name="bucket",
+        s3_client=multipart_client,
+        multipart_part_size=1000,
+        multipart_concurrency=4,
+    )
+
+    with pytest.raises(OSError):
+        await save_artifact_stream(
+            service,
+            **SCOPE,
+            filename="clip.wav",
+            chunks=_chunks(DATA, 700),
+            mime_type="audio/wav",
+        )
+
+    state = multipart_client.state
+    assert state["active_at_abort"] == 0
+    assert state["parts_at_abort"] == state["parts"]
+    # Parts queued after the failure are never uploaded.
+    assert multipart_client.upload_part.call_count < 11
+
+
+async def test_s3_streamed_save_cancelled_mid_upload_aborts_last(multipart_client):
+    _record_abort(multipart_client)
+    service = S3ArtifactService(
+        bucket_name="bucket",
+        s3_client=multipart_client,
+        multipart_part_size=1000,
+        multipart_concurrency=2,
+    )
+
+    async def slow_chunks():
+        yield DATA[:2500]
+        await asyncio.sleep(1)
+        yield DATA[2500:]
+
+    save = asyncio.create_task(
+        save_artifact_stream(
+            service,
+            **SCOPE,
+            filename="clip.wav",
+            chunks=slow_chunks(),
+            mime_type="audio/wav",
+        )
+    )
+    while not multipart_client.state["active"]:
+        await asyncio.sleep(0.001)
+    save.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await save
+
+    state = multipart_client.state
+    assert state["active_at_abort"] == 0
+    assert state["parts_at_abort"] == state["parts"]
+    multipart_client.complete_multipart_upload.assert_not_called()
+
+
+async def test_s3_streamed_save_of_small_content_uses_single_put(multipart_client):
+    service = S3ArtifactService(bucket_name="bucket", s3_client=multipart_client)
+
+    saved = await save_artifact_stream(
+        service,
+        **SCOPE,
+        filename="note.txt",
+        chunks=_chunks(b"hello"),
+        mime_type="text/plain",
+    )
+
+    assert saved.size_bytes == 5
+    assert multipart_client.put_object.call_args.kwargs["Body"] == b"hello"
+    multipart_client.create_multipart_upload.assert_not_called()
+
+
+async def test_streamed_save_with_metadata_records_size_and_schema():
+    service = InMemoryArtifactService()
+    content = b'{"rows": [{"id": 1}, {"id": 2}]}'
+
+    result = await save_artifact_stream_with_metadata(
+        service,
+        SCOPE["app_name"],
+        SCOPE["user_id"],
+        SCOPE["session_id"],
+        "rows.json",
+        _chunks(content, 8),
+        "application/json",
+        {"description": "rows"},
+        datetime.now(timezone.utc),
+        max_size_bytes=1000,
+    )
+
+    assert result["status"] == "success"
+    assert result["size_bytes"] == len(content)
+    assert result["sha256"] == hashlib.sha256(content).hexdigest()
+    metadata = await load_artifact_content_or_metadata(
+        service, **SCOPE, filename="rows.json", version=0, load_metadata_only=True
+    )
+    assert metadata["metadata"]["size_bytes"] == len(content)
+    assert metadata["metadata"]["schema"]["inferred"] is True
@@ -0,0 +1,180 @@
+"""
+Unit tests for the filesystem artifact service's version index and durability modes.
+"""
+
+import asyncio
+import json
+import os
+from unittest.mock import patch
+
+import pytest
+from google.genai import types as adk_types
+
+from solace_agent_mesh.agent.adk.artifacts import filesystem_artifact_service
+from solace_agent_mesh.agent.adk.artifacts.filesystem_artifact_service import (
+    INDEX_FILE_NAME,
+    VERSION_LOG_FILE_NAME,
+    FilesystemArtifactService,
+)
+
+SCOPE = {"app_name": "app", "user_id": "user-a", "session_id": "s1"}
+
+
+def _part(data: bytes, mime_type: str = "text/plain") -> adk_types.Part:
+    return adk_types.Part.from_bytes(data=data, mime_type=mime_type)
+
+
+def _read_index(service, filename):
+    artifact_dir = service._get_artifact_dir(filename=filename, **SCOPE)
+    with open(os.path.join(artifact_dir, INDEX_FILE_NAME)) as f:
+        return json.load(f)
+
+
+async def test_save_maintains_index(tmp_path):
+    service = FilesystemArtifactService(base_path=str(tmp_path))
+
+    assert await service.save_artifact(**SCOPE, filename="a.txt", artifact=_part(b"one")) == 0
+    assert await service.save_artifact(
+        **SCOPE, filename="a.txt", artifact=_part(b"{}", "application/json")
+    ) == 1
+
+    assert _read_index(service, "a.txt") == {
+        "latest": 1,
+        "size_bytes": 2,
+        "mime_type": "application/json",
+    }
+    assert await service.list_versions(**SCOPE, filename="a.txt") == [0, 1]
+    loaded = await service.load_artifact(**SCOPE, filename="a.txt")
+    assert loaded.inline_data.data == b"{}"
+
+
+async def test_save_does_not_list_directory_when_index_is_current(tmp_path):
+    service = FilesystemArtifactService(base_path=str(tmp_path))
+    await service.save_artifact(**SCOPE, filename="a.txt", artifact=_part(b"x"))
+
+    with patch.object(service, "_scan_artifact_dir", side_effect=AssertionError):
+        assert await service.save_artifact(**SCOPE, filename="a.txt", artifact=_part(b"y")) == 1
+        assert await service.list_versions(**SCOPE, filename="a.txt") == [0, 1]
+
+
+async def test_legacy_and_stale_directories_are_reindexed(tmp_path):
+    service = FilesystemArtifactService(base_path=str(tmp_path))
+    for data in (b"a", b"b"):
+        await service.save_artifact(**SCOPE, filename="a.txt", artifact=_part(data))
+    artifact_dir = service._get_artifact_dir(filename="a.txt", **SCOPE)
+    index_path = os.path.join(artifact_dir, INDEX_FILE_NAME)
+    stale_index = open(index_path).read()
+
+    # Directory written before the index existed.
+    os.remove(index_path)
+    assert await service.list_versions(**SCOPE, filename="a.txt") == [0, 1]
+    assert await service.save_artifact(**SCOPE, filename="a.txt", artifact=_part(b"c")) == 2
+
+    # Index lagging behind the files on disk must not cause a version to be reused.
+    with open(index_path, "w") as f:
+        f.write(stale_index)
+    assert await service.save_artifact(**SCOPE, filename="a.txt", artifact=_part(b"d")) == 3
+    assert _read_index(service, "a.txt")["latest"] == 3
+
+
+async def test_legacy_directory_with_gaps_keeps_explicit_versions(tmp_path):
+    service = FilesystemArtifactService(base_path=str(tmp_path))
+    for data in (b"a", b"b", b"c"):
+        await service.save_artifact(**SCOPE, filename="a.txt", artifact=_part(data))
+    artifact_dir = service._get_artifact_dir(filename="a.txt", **SCOPE)
+    os.remove(os.path.join(artifact_dir, INDEX_FILE_NAME))
+    os.remove(os.path.join(artifact_dir, "1"))
+
+    assert await service.save_artifact(**SCOPE, filename="a.txt", artifact=_part(b"d")) == 3
+    assert await service.list_versions(**SCOPE, filename="a.txt") == [0, 2, 3]
+
+
+async def test_concurrent_saves_get_distinct_versions(tmp_path):
+    service = FilesystemArtifactService(base_path=str(tmp_path))
+    versions = await asyncio.gather(
+        *(
+            service.save_artifact(**SCOPE, filename="a.txt", artifact=_part(b"%d" % i))
+            for i in range(10)
+        )
+    )
+    assert sorted(versions) == list(range(10))
+
+
+async def test_group_commit_batches_fsyncs(tmp_path):
+    service = FilesystemArtifactService(base_path=str(tmp_path), durability="group_commit")
+    batches = []
+    original = filesystem_artifact_service._fsync_paths
+
+    def recording_fsync(paths):
+        batches.append(len(paths))
+        original(paths)
+
+    with patch.object(filesystem_artifact_service, "_fsync_paths", recording_fsync):
+        versions = await asyncio.gather(
+            *(
+                service.save_artifact(**SCOPE, filename=f"f{i}.txt", artifact=_part(b"x"))
+                for i in range(8)
+            )
+        )
+
+    assert versions == [0] * 8
+    assert sum(batches) == 16
+    assert len(batches) < 8
+    for i in range(8):
+        assert await service.list_versions(**SCOPE, filename=f"f{i}.txt") == [0]
+
+
+def test_invalid_durability_mode(tmp_path):
+    with pytest.raises(ValueError):
+        FilesystemArtifactService(base_path=str(tmp_path), durability="never")
+
+
+async def test_delete_removes_index(tmp_path):
+    service = FilesystemArtifactService(base_path=str(tmp_path))
+    await service.save_artifact(**SCOPE, filename="a.txt", artifact=_part(b"x"))
+    await service.delete_artifact(**SCOPE, filename="a.txt")
+    assert await service.list_versions(**SCOPE, filename="a.txt") == []
+    assert await service.save_artifact(**SCOPE, filename="a.txt", artifact=_part(b"y")) == 0
+
+
+async def test_older_versions_are_opened_from_version_log(tmp_path):
+    service = FilesystemArtifactService(base_path=str(tmp_path))
+    await service.save_artifact(**SCOPE, filename="a.txt", artifact=_part(b"one"))
+    await service.save_artifact(
+        **SCOPE, filename="a.txt", artifact=_part(b"{}", "application/json")
+    )
+
+    with patch.object(service, "_read_version_entry", side_effect=AssertionError):
+        stream = await service.open_artifact_stream(**SCOPE, filename="a.txt", version=0)
+    assert (stream.size_bytes, stream.mime_type) == (3, "text/plain")
+    assert await stream.read() == b"one"
+
+    # Versions saved before the log existed are described from their files.
+    artifact_dir = service._get_artifact_dir(filename="a.txt", **SCOPE)
+    os.remove(os.path.join(artifact_dir, VERSION_LOG_FILE_NAME))
+    stream = await service.open_artifact_stream(**SCOPE, filename="a.txt", version=1)
+    assert (stream.size_bytes, stream.mime_type) == (2, "application/json")
+    assert await service.open_artifact_stream(**SCOPE, filename="a.txt", version=5) is None
+
+
+async def test_group_commit_does_not_hold_artifact_lock(tmp_path):
+    service = FilesystemArtifactService(base_path=str(tmp_path), durability="group_commit")
+    committer = service._get_committer()
+    original_commit = committer.commit
+    lock_states = []
+
+    async def recording_commit(paths):
+        artifact_dir = os.path.dirname(paths[0])
+        lock_states.append(service._get_artifact_lock(artifact_dir).locked())
+        await original_commit(paths)
+
+    with patch.object(committer, "commit", recording_commit):
+        versions = await asyncio.gather(
+            *(
+                service.save_artifact(**SCOPE, filename="a.txt", artifact=_part(b"x"))
+                for _ in range(4)
+            )
+        )
+
+    assert sorted(versions) == [0, 1, 2, 3]
+    assert lock_states == [False] * 4
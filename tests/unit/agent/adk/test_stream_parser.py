@@ -0,0 +1,167 @@
+"""
+Equivalence tests for the FencedBlockStreamParser scanning fast path.
+
+The reference below is the original character-by-character state machine; the
+production parser must emit exactly the same user text and events for every
+chunking of every input.
+"""
+
+from typing import Any, Dict, List
+
+from hypothesis import given, settings
+from hypothesis import strategies as st
+
+from solace_agent_mesh.agent.adk.stream_parser import (
+    ARTIFACT_BLOCK_DELIMITER_CLOSE,
+    BLOCK_START_SEQUENCE,
+    PARAMS_REGEX,
+    BlockCompletedEvent,
+    BlockInvalidatedEvent,
+    BlockProgressedEvent,
+    BlockStartedEvent,
+    FencedBlockStreamParser,
+    ParserEvent,
+    ParserResult,
+    ParserState,
+)
+
+
+class ReferenceParser:
+    """The per-character parser the fast path replaced."""
+
+    def __init__(self, progress_update_interval_bytes: int = 4096):
+        self._progress_update_interval = progress_update_interval_bytes
+        self._reset_state()
+
+    def _reset_state(self):
+        self._state = ParserState.IDLE
+        self._speculative_buffer = ""
+        self._artifact_buffer = ""
+        self._block_params: Dict[str, Any] = {}
+        self._last_progress_update_size = 0
+
+    def process_chunk(self, text_chunk: str) -> ParserResult:
+        user_text_parts: List[str] = []
+        events: List[ParserEvent] = []
+        for char in text_chunk:
+            if self._state == ParserState.IDLE:
+                if char == BLOCK_START_SEQUENCE[0]:
+                    self._state = ParserState.POTENTIAL_BLOCK
+                    self._speculative_buffer += char
+                else:
+                    user_text_parts.append(char)
+            elif self._state == ParserState.POTENTIAL_BLOCK:
+                self._process_potential(char, user_text_parts, events)
+            else:
+                self._process_in_block(char, events)
+        return ParserResult("".join(user_text_parts), events)
+
+    def finalize(self) -> ParserResult:
+        user_text_parts: List[str] = []
+        events: List[ParserEvent] = []
+        if self._state == ParserState.POTENTIAL_BLOCK:
+            user_text_parts.append(self._speculative_buffer)
+            events.append(BlockInvalidatedEvent(rolled_back_text=self._speculative_buffer))
+        elif self._state == ParserState.IN_BLOCK:
+            events.append(
+                BlockCompletedEvent(params=self._block_params, content=self._artifact_buffer)
+            )
+        self._reset_state()
+        return ParserResult("".join(user_text_parts), events)
+
+    def _process_potential(self, char, user_text_parts, events):
+        self._speculative_buffer += char
+        if self._speculative_buffer.startswith(BLOCK_START_SEQUENCE):
+            if char == "\n":
+                self._state = ParserState.IN_BLOCK
+                params_str = self._speculative_buffer[len(BLOCK_START_SEQUENCE) : -1]
+                self._block_params = dict(PARAMS_REGEX.findall(params_str))
+                events.append(BlockStartedEvent(params=self._block_params))
+                self._speculative_buffer = ""
+            return
+        if BLOCK_START_SEQUENCE.startswith(self._speculative_buffer):
+            return
+        rolled_back_text = self._speculative_buffer
+        user_text_parts.append(rolled_back_text)
+        events.append(BlockInvalidatedEvent(rolled_back_text=rolled_back_text))
+        self._reset_state()
+
+    def _process_in_block(self, char, events):
+        self._artifact_buffer += char
+        if self._artifact_buffer.endswith(ARTIFACT_BLOCK_DELIMITER_CLOSE):
+            final_content = self._artifact_buffer[: -len(ARTIFACT_BLOCK_DELIMITER_CLOSE)]
+            events.append(BlockCompletedEvent(params=self._block_params, content=final_content))
+            self._reset_state()
+        else:
+            current_size = len(self._artifact_buffer.encode("utf-8"))
+            if current_size - self._last_progress_update_size >= self._progress_update_interval:
+                new_chunk = self._artifact_buffer[self._last_progress_update_size : current_size]
+                events.append(BlockProgressedEvent(buffered_size=current_size, chunk=new_chunk))
+                self._last_progress_update_size = current_size
+
+
+TOKENS = st.sampled_from(
+    [
+        "«",
+        "»",
+        "«««",
+        "»»»",
+        "»»",
+        BLOCK_START_SEQUENCE,
+        'filename="a.md" mime_type="text/markdown"',
+        "save_artifact:",
+        "\n",
+        " ",
+        "hello world",
+        "x" * 40,
+        "é",
+        "漢字",
+        "🙂",
+    ]
+)
+DOCUMENTS = st.lists(TOKENS, max_size=60).map("".join)
+
+
+def _chunk(text: str, cuts: List[int]) -> List[str]:
+    bounds = sorted({0, len(text), *(c % (len(text) + 1) for c in cuts)})
+    return [text[a:b] for a, b in zip(bounds, bounds[1:])]
+
+
+def _run(parser, chunks):
+    return [parser.process_chunk(chunk) for chunk in chunks] + [parser.finalize()]
+
+
+@settings(max_examples=400, deadline=None)
+@given(
+    text=DOCUMENTS,
+    cuts=st.lists(st.integers(min_value=0, max_value=10_000), max_size=20),
+    interval=st.integers(min_value=0, max_value=64),
+)
+def test_fast_path_matches_reference(text, cuts, interval):
+    chunks = _chunk(text, cuts)
+    assert _run(FencedBlockStreamParser(interval), chunks) == _run(
+        ReferenceParser(interval), chunks
+    )
+
+
+@settings(max_examples=100, deadline=None)
+@given(text=DOCUMENTS, interval=st.integers(min_value=0, max_value=16))
+def test_single_character_chunks_match_reference(text, interval):
+    chunks = list(text)
+    assert _run(FencedBlockStreamParser(interval), chunks) == _run(
+        ReferenceParser(interval), chunks
+    )
+
+
+def test_block_split_across_chunks():
+    parser = FencedBlockStreamParser(progress_update_interval_bytes=4)
+    results = _run(
+        parser,
+        ["Intro «««save_", 'artifact: filename="r.md"\nbody ', "text»", "»» outro"],
+    )
+
+    assert "".join(r.user_facing_text for r in results) == "Intro  outro"
+    events = [e for r in results for e in r.events]
+    assert events[0] == BlockStartedEvent(params={"filename": "r.md"})
+    assert events[-1] == BlockCompletedEvent(params={"filename": "r.md"}, content="body text")
+    assert [e.buffered_size for e in events if isinstance(e, BlockProgressedEvent)] == [4, 8, 13]
@@ -0,0 +1,191 @@
+"""
+Unit tests for concurrent loading of configured tools in load_adk_tools.
+"""
+
+import asyncio
+import time
+from unittest.mock import patch
+
+import pytest
+
+from solace_agent_mesh.agent.adk import setup
+
+
+class FakeComponent:
+    log_identifier = "[test]"
+
+    def __init__(self, tools, **config):
+        self.config = {"tools": tools, **config}
+
+    def get_config(self, key, default=None):
+        return self.config.get(key, default)
+
+
+def _builtin(name, **extra):
+    return {"tool_type": "builtin", "tool_name": name, **extra}
+
+
+def _fake_loader(delays, started=None, cleaned_up=None):
+    async def load(component, tool_config):
+        name = tool_config["tool_name"]
+        if started is not None:
+            started.append(name)
+        await asyncio.sleep(delays.get(name, 0))
+
+        def tool():
+            pass
+
+        tool.__name__ = name.split("#")[0]
+
+        async def cleanup():
+            if cleaned_up is not None:
+                cleaned_up.append(name)
+
+        cleanup.__name__ = f"cleanup_{name}"
+        return [tool], [], [cleanup]
+
+    return load
+
+
+async def _load(component, delays):
+    with (
+        patch.object(setup, "_load_builtin_tool", _fake_loader(delays)),
+        patch.object(setup, "_load_internal_tools", return_value=([], [], [])),
+    ):
+        return await setup.load_adk_tools(component)
+
+
+async def test_tools_load_concurrently_and_register_in_config_order():
+    delays = {"a": 0.3, "b": 0.2, "c": 0.1}
+    component = FakeComponent([_builtin(name) for name in delays])
+
+    start = time.perf_counter()
+    tools, _, cleanups = await _load(component, delays)
+    elapsed = time.perf_counter() - start
+
+    assert elapsed < sum(delays.values())
+    assert [tool.__name__ for tool in tools] == ["a", "b", "c"]
+    assert [hook.__name__ for hook in cleanups] == [
+        "cleanup_c",
+        "cleanup_b",
+        "cleanup_a",
+    ]
+    timings = component.tool_startup_timings["tools"]
+    assert [timing["tool"] for timing in timings] == [
+        "builtin:a",
+        "builtin:b",
+        "builtin:c",
+    ]
+    assert all(timing["status"] == "ok" for timing in timings)
+    assert timings[0]["duration_ms"] >= 250
+
+
+async def test_concurrency_of_one_loads_sequentially():
+    started = []
+    component = FakeComponent(
+        [_builtin("a"), _builtin("b")], tool_loading_concurrency=1
+    )
+    with (
+        patch.object(setup, "_load_builtin_tool", _fake_loader({"a": 0.1}, started)),
+        patch.object(setup, "_load_internal_tools", return_value=([], [], [])),
+    ):
+        start = time.perf_counter()
+        await setup.load_adk_tools(component)
+    assert started == ["a", "b"]
+    assert time.perf_counter() - start >= 0.1
+
+
+async def test_duplicate_name_is_reported_for_the_later_config_entry():
+    # The second entry finishes first but is still the one rejected.
+    component = FakeComponent([_builtin("dup#1"), _builtin("dup#2")])
+    with pytest.raises(ValueError, match="Duplicate tool name 'dup'"):
+        await _load(component, {"dup#1": 0.2})
+
+
+async def test_tool_exceeding_its_timeout_fails_startup():
+    component = FakeComponent(
+        [_builtin("fast"), _builtin("slow", load_timeout_seconds=0.05)],
+        tool_load_timeout_seconds=10,
+    )
+    with pytest.raises(TimeoutError, match="builtin:slow"):
+        await _load(component, {"slow": 5})
+
+    statuses = [t["status"] for t in component.tool_startup_timings["tools"]]
+    assert statuses == ["ok", "timeout"]
+
+
+async def test_failed_startup_cleans_up_every_loaded_entry():
+    cleaned_up = []
+    component = FakeComponent(
+        [_builtin("a"), _builtin("slow", load_timeout_seconds=0.05), _builtin("c")]
+    )
+    with (
+        patch.object(
+            setup,
+            "_load_builtin_tool",
+            _fake_loader({"slow": 5}, cleaned_up=cleaned_up),
+        ),
+        patch.object(setup, "_load_internal_tools", return_value=([], [], [])),
+    ):
+        with pytest.raises(TimeoutError):
+            await setup.load_adk_tools(component)
+
+    # "c" is after the failing entry but was loaded concurrently.
+    assert cleaned_up == ["c", "a"]
+
+
+class FakeMCPToolset:
+    def __init__(self, discovery_delay, events):
+        self.discovery_delay = discovery_delay
+        self.events = events
+
+    async def get_tools(self):
+        self.events.append("connected")
+        await asyncio.sleep(self.discovery_delay)
+        return []
+
+    async def close(self):
+        self.events.append("closed")
+
+
+async def test_timed_out_mcp_entry_is_released():
+    events = []
+
+    async def load_mcp(component, tool_config):
+        async def cleanup():
+            events.append("cleanup")
+
+        return [FakeMCPToolset(5, events)], [], [cleanup]
+
+    component = FakeComponent(
+        [{"tool_type": "mcp", "connection_params": {}, "load_timeout_seconds": 0.05}]
+    )
+    with (
+        patch.object(setup, "EmbedResolvingMCPToolset", FakeMCPToolset),
+        patch.object(setup, "_load_mcp_tool", load_mcp),
+        patch.object(setup, "_load_internal_tools", return_value=([], [], [])),
+    ):
+        with pytest.raises(TimeoutError):
+            await setup.load_adk_tools(component)
+
+    assert events == ["connected", "cleanup", "closed"]
+
+
+async def test_cancelled_entry_releases_the_loaded_entries():
+    cleaned_up = []
+    loader = _fake_loader({}, cleaned_up=cleaned_up)
+
+    async def load(component, tool_config):
+        if tool_config["tool_name"] == "cancelled":
+            raise asyncio.CancelledError()
+        return await loader(component, tool_config)
+
+    component = FakeComponent([_builtin("a"), _builtin("cancelled")])
+    with (
+        patch.object(setup, "_load_builtin_tool", load),
+        patch.object(setup, "_load_internal_tools", return_value=([], [], [])),
+    ):
+        with pytest.raises(asyncio.CancelledError):
+            await setup.load_adk_tools(component)
+
+    assert cleaned_up == ["a"]
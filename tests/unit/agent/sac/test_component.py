@@ -3,9 +3,14 @@
 Unit tests for the SamAgentComponent class
 """
 
+import asyncio
+import concurrent.futures
+
 import pytest
 from unittest.mock import Mock
+from solace_ai_connector.common.event import EventType
 
+from src.solace_agent_mesh.agent.sac import component as component_module
 from src.solace_agent_mesh.agent.sac.component import SamAgentComponent
 
 
@@ -54,3 +59,44 @@ class TestExtractToolOrigin:
 
         result = SamAgentComponent._extract_tool_origin(tool)
         assert result == "unknown"
+
+
+class TestProcessEventWhenReady:
+    """Test cases for gating event processing on async initialization."""
+
+    async def test_events_wait_for_async_init(self, monkeypatch):
+        """Events arriving before the runner is built are processed after it."""
+        processed = []
+
+        async def fake_process_event(component, event):
+            processed.append(component.runner)
+
+        monkeypatch.setattr(component_module, "process_event", fake_process_event)
+        component = Mock(runner=None, log_identifier="[test]")
+        component._async_init_future = concurrent.futures.Future()
+        event = Mock(event_type=EventType.MESSAGE)
+
+        task = asyncio.ensure_future(
+            SamAgentComponent._process_event_when_ready(component, event)
+        )
+        await asyncio.sleep(0)
+        assert processed == []
+
+        component.runner = "runner"
+        component._async_init_future.set_result(True)
+        await task
+        assert processed == ["runner"]
+
+    async def test_messages_are_nacked_when_async_init_failed(self, monkeypatch):
+        """Messages are NACKed rather than processed without a runner."""
+        process_event = Mock()
+        monkeypatch.setattr(component_module, "process_event", process_event)
+        component = Mock(runner=None, log_identifier="[test]")
+        component._async_init_future = concurrent.futures.Future()
+        component._async_init_future.set_exception(RuntimeError("tools failed"))
+        event = Mock(event_type=EventType.MESSAGE)
+
+        await SamAgentComponent._process_event_when_ready(component, event)
+
+        event.data.call_negative_acknowledgements.assert_called_once()
+        process_event.assert_not_called()
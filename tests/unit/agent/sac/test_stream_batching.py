@@ -0,0 +1,170 @@
+"""
+Unit tests for the size- and time-based batching of streamed LLM text.
+"""
+
+import asyncio
+import threading
+from unittest.mock import AsyncMock
+
+import pytest
+from google.adk.events import Event as ADKEvent
+from google.genai import types as adk_types
+
+from solace_agent_mesh.agent.sac.component import SamAgentComponent
+from solace_agent_mesh.agent.sac.task_execution_context import TaskExecutionContext
+from solace_agent_mesh.common.utils.metrics import ComponentMetrics, MetricsRegistry
+
+A2A_CONTEXT = {"logical_task_id": "task-1"}
+
+
+def _component(threshold_bytes: int, max_latency_ms: int) -> SamAgentComponent:
+    component = SamAgentComponent.__new__(SamAgentComponent)
+    component.log_identifier = "[test]"
+    component.stream_batching_threshold_bytes = threshold_bytes
+    component.stream_batching_max_latency_ms = max_latency_ms
+    component.metrics = ComponentMetrics("agent-a", registry=MetricsRegistry())
+    component.active_tasks_lock = threading.Lock()
+    component.active_tasks = {"task-1": TaskExecutionContext("task-1", A2A_CONTEXT)}
+    component._resolve_early_embeds_and_handle_signals = AsyncMock(
+        side_effect=lambda text, context: (text, [], "")
+    )
+    component._publish_text_as_partial_a2a_status_update = AsyncMock()
+    return component
+
+
+def _partial(text: str) -> ADKEvent:
+    return ADKEvent(
+        author="agent",
+        partial=True,
+        content=adk_types.Content(role="model", parts=[adk_types.Part(text=text)]),
+    )
+
+
+def _published(component):
+    return [
+        call.args[0]
+        for call in component._publish_text_as_partial_a2a_status_update.call_args_list
+    ]
+
+
+def _flushes(component):
+    snapshot = component.metrics.snapshot()
+    flushes = {
+        sample["labels"]["reason"]: sample["value"]
+        for sample in snapshot["sam_stream_flushes"]["samples"]
+    }
+    saved = snapshot["sam_stream_messages_saved"]["samples"][0]["value"]
+    return flushes, saved
+
+
+def test_buffer_tracks_utf8_size_and_chunks():
+    context = TaskExecutionContext("task-1", A2A_CONTEXT)
+    context.append_to_streaming_buffer("héllo ")
+    context.append_to_streaming_buffer("wörld")
+
+    assert context.get_streaming_buffer_size_bytes() == 13
+    assert context.get_streaming_buffer_chunk_count() == 2
+    assert context.get_streaming_buffer_content() == "héllo wörld"
+    assert context.flush_streaming_buffer() == "héllo wörld"
+    assert context.get_streaming_buffer_size_bytes() == 0
+    assert context.get_streaming_buffer_age_seconds() == 0.0
+
+
+async def test_chunks_are_coalesced_until_the_byte_threshold():
+    component = _component(threshold_bytes=10, max_latency_ms=0)
+
+    for text in ("abc", "def", "ghij", "k"):
+        await component.process_and_publish_adk_event(_partial(text), A2A_CONTEXT)
+
+    assert _published(component) == ["abcdefghij"]
+    assert _flushes(component) == ({"bytes": 1}, 2)
+
+
+async def test_buffered_text_is_flushed_after_the_max_latency():
+    component = _component(threshold_bytes=1000, max_latency_ms=20)
+
+    await component.process_and_publish_adk_event(_partial("Hel"), A2A_CONTEXT)
+    await component.process_and_publish_adk_event(_partial("lo"), A2A_CONTEXT)
+    assert _published(component) == []
+
+    await asyncio.sleep(0.1)
+
+    assert _published(component) == ["Hello"]
+    assert _flushes(component) == ({"latency": 1}, 1)
+
+
+async def test_unbatched_streams_publish_every_chunk():
+    component = _component(threshold_bytes=0, max_latency_ms=50)
+
+    for text in ("a", "b"):
+        await component.process_and_publish_adk_event(_partial(text), A2A_CONTEXT)
+
+    assert _published(component) == ["a", "b"]
+    assert _flushes(component) == ({"unbatched": 2}, 0)
+
+
+@pytest.mark.parametrize("max_latency_ms", [0, 20])
+async def test_final_event_flushes_remaining_text(max_latency_ms, monkeypatch):
+    component = _component(threshold_bytes=1000, max_latency_ms=max_latency_ms)
+    component._filter_text_from_final_streaming_event = AsyncMock(return_value=None)
+    component._handle_artifact_return_signals = AsyncMock()
+
+    await component.process_and_publish_adk_event(_partial("partial "), A2A_CONTEXT)
+    monkeypatch.setattr(
+        "solace_agent_mesh.agent.sac.component.format_and_route_adk_event",
+        AsyncMock(return_value=(None, None, None, None)),
+    )
+    await component.process_and_publish_adk_event(
+        ADKEvent(author="agent", partial=False), A2A_CONTEXT
+    )
+    await asyncio.sleep(0.05)
+
+    assert _published(component) == ["partial "]
+    assert _flushes(component)[0] == {"final": 1}
+
+
+async def test_status_update_flush_waits_for_an_in_progress_flush():
+    component = _component(threshold_bytes=1000, max_latency_ms=0)
+    context = component.active_tasks["task-1"]
+    context.append_to_streaming_buffer("before tool call")
+
+    async with context.streaming_flush_lock:
+        flush = asyncio.create_task(component._flush_buffer_if_needed(A2A_CONTEXT))
+        await asyncio.sleep(0.01)
+        assert not flush.done()
+        assert _published(component) == []
+
+    assert await flush is True
+    assert _published(component) == ["before tool call"]
+
+
+async def test_status_signals_found_while_flushing_skip_the_buffer_flush():
+    component = _component(threshold_bytes=1000, max_latency_ms=0)
+    component.agent_name = "agent"
+    component._resolve_early_embeds_and_handle_signals = AsyncMock(
+        return_value=("text", [(0, (None, "SIGNAL_STATUS_UPDATE", "Working"))], "")
+    )
+    component._publish_status_update_with_buffer_flush = AsyncMock()
+    component.active_tasks["task-1"].append_to_streaming_buffer("text")
+
+    assert await asyncio.wait_for(
+        component._flush_buffer_if_needed({**A2A_CONTEXT, "contextId": "ctx"}),
+        timeout=1,
+    )
+
+    (call,) = component._publish_status_update_with_buffer_flush.call_args_list
+    assert call.kwargs["skip_buffer_flush"] is True
+
+
+async def test_cancel_streaming_flush_cancels_the_pending_latency_flush():
+    component = _component(threshold_bytes=1000, max_latency_ms=20)
+    context = component.active_tasks["task-1"]
+
+    await component.process_and_publish_adk_event(_partial("pending"), A2A_CONTEXT)
+    flush_task = context.streaming_flush_task
+    context.cancel_streaming_flush()
+    await asyncio.sleep(0.05)
+
+    assert flush_task.cancelled()
+    assert context.streaming_flush_task is None
+    assert _published(component) == []
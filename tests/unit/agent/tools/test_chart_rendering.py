@@ -0,0 +1,187 @@
+"""
+Unit tests for chart rendering in a warm worker pool and the rendered-chart
+cache of create_chart_from_plotly_config.
+"""
+
+import asyncio
+import json
+from types import SimpleNamespace
+from unittest.mock import patch
+
+import pytest
+from google.adk.artifacts import InMemoryArtifactService
+
+from solace_agent_mesh.agent.tools import builtin_data_analysis_tools
+from solace_agent_mesh.common.utils import chart_rendering
+from solace_agent_mesh.common.utils.bounded_cache import BoundedTTLCache
+from solace_agent_mesh.common.utils.chart_rendering import (
+    ChartRenderBusyError,
+    ChartRenderer,
+    figure_content_hash,
+)
+
+FIGURE = {"data": [{"type": "bar", "x": [1, 2], "y": [3, 4]}], "layout": {}}
+
+
+def test_content_hash_ignores_key_order_but_not_format():
+    reordered = {"layout": {}, "data": [{"y": [3, 4], "x": [1, 2], "type": "bar"}]}
+    assert figure_content_hash(FIGURE, "png") == figure_content_hash(reordered, "PNG")
+    assert figure_content_hash(FIGURE, "png") != figure_content_hash(FIGURE, "svg")
+
+
+class FakeRenderer:
+    def __init__(self):
+        self.calls = 0
+
+    async def render(self, figure_config, output_format):
+        self.calls += 1
+        return b"image-%d" % self.calls
+
+
+def _tool_context(artifact_service):
+    invocation_context = SimpleNamespace(
+        artifact_service=artifact_service,
+        app_name="app",
+        user_id="user",
+        session=SimpleNamespace(id="session"),
+        agent=SimpleNamespace(),
+    )
+    return SimpleNamespace(
+        _invocation_context=invocation_context,
+        actions=SimpleNamespace(artifact_delta={}),
+    )
+
+
+async def test_identical_configs_reuse_the_existing_chart_artifact():
+    renderer = FakeRenderer()
+    artifact_service = InMemoryArtifactService()
+    tool_context = _tool_context(artifact_service)
+
+    async def create(config_content, config_format, filename):
+        return await builtin_data_analysis_tools.create_chart_from_plotly_config(
+            config_content=config_content,
+            config_format=config_format,
+            output_filename=filename,
+            tool_context=tool_context,
+        )
+
+    with (
+        patch.object(
+            builtin_data_analysis_tools, "get_chart_renderer", return_value=renderer
+        ),
+        patch.object(
+            builtin_data_analysis_tools, "_rendered_chart_cache", BoundedTTLCache()
+        ),
+    ):
+        first = await create(json.dumps(FIGURE), "json", "sales.png")
+        again = await create(
+            "layout: {}\ndata:\n- {type: bar, x: [1, 2], y: [3, 4]}\n",
+            "yaml",
+            "sales_copy.png",
+        )
+        assert first["status"] == again["status"] == "success"
+        assert renderer.calls == 1
+        assert (again["output_filename"], again["output_version"]) == ("sales.png", 0)
+
+        # Once the artifact is gone the chart is rendered again.
+        await artifact_service.delete_artifact(
+            app_name="app", user_id="user", session_id="session", filename="sales.png"
+        )
+        rerendered = await create(json.dumps(FIGURE), "json", "sales.png")
+        assert renderer.calls == 2
+        assert rerendered["output_filename"] == "sales.png"
+
+
+@pytest.fixture
+def kaleido_renderer():
+    pytest.importorskip("plotly")
+    pytest.importorskip("kaleido")
+    renderer = ChartRenderer(max_workers=1, queue_limit=0, timeout_seconds=120)
+    yield renderer
+    renderer.shutdown()
+
+
+async def test_renderer_renders_in_worker_and_bounds_its_queue(kaleido_renderer):
+    rendering = asyncio.ensure_future(kaleido_renderer.render(FIGURE, "png"))
+    await asyncio.sleep(0)
+    with pytest.raises(ChartRenderBusyError):
+        await kaleido_renderer.render(FIGURE, "svg")
+    assert (await rendering).startswith(b"\x89PNG")
+
+    with pytest.raises(ValueError, match="Failed to create Plotly figure"):
+        await kaleido_renderer.render({"data": [{"type": "no-such-trace"}]}, "png")
+
+
+async def test_renderer_restarts_workers_after_a_timeout(kaleido_renderer):
+    await kaleido_renderer.render(FIGURE, "png")
+    kaleido_renderer.timeout_seconds = 0.001
+    with pytest.raises(TimeoutError):
+        await kaleido_renderer.render(FIGURE, "png")
+
+    kaleido_renderer.timeout_seconds = 120
+    assert (await kaleido_renderer.render(FIGURE, "svg")).lstrip().startswith(b"<svg")
+
+
+async def test_timeout_does_not_break_other_renders_on_the_pool():
+    pytest.importorskip("plotly")
+    pytest.importorskip("kaleido")
+    renderer = ChartRenderer(max_workers=2, queue_limit=0, timeout_seconds=120)
+    heavy = {
+        "data": [{"type": "scatter", "x": list(range(200000)), "y": list(range(200000))}]
+    }
+    try:
+        await renderer.render(FIGURE, "png")
+        slow = asyncio.ensure_future(renderer.render(heavy, "png"))
+        await asyncio.sleep(0.05)
+        renderer.timeout_seconds = 0.001
+        with pytest.raises(TimeoutError):
+            await renderer.render(FIGURE, "png")
+
+        assert (await slow).startswith(b"\x89PNG")
+    finally:
+        renderer.shutdown()
+
+
+def test_renderers_are_shared_by_settings_and_stopped_by_their_last_user():
+    with (
+        patch.dict(chart_rendering._chart_renderers, clear=True),
+        patch.dict(chart_rendering._chart_renderer_users, clear=True),
+        patch.object(chart_rendering.log, "warning") as warning,
+        patch.object(ChartRenderer, "shutdown", autospec=True) as shutdown,
+    ):
+        first = chart_rendering.acquire_chart_renderer({"render_workers": 1})
+        assert chart_rendering.acquire_chart_renderer({"render_workers": 1}) is first
+        assert chart_rendering.get_chart_renderer({"render_workers": 1}) is first
+        assert first._executor is None
+        warning.assert_not_called()
+
+        other = chart_rendering.acquire_chart_renderer({"render_workers": 3})
+        assert other is not first and other.max_workers == 3
+        warning.assert_called_once()
+
+        chart_rendering.release_chart_renderer({"render_workers": 1})
+        shutdown.assert_not_called()
+        # Releasing settings nobody acquired must not stop a shared renderer.
+        chart_rendering.release_chart_renderer({"render_workers": 5})
+        shutdown.assert_not_called()
+        chart_rendering.release_chart_renderer({"render_workers": 1})
+        shutdown.assert_called_once_with(first)
+        assert chart_rendering.get_chart_renderer({"render_workers": 3}) is other
+
+
+async def test_chart_tool_group_acquires_and_releases_the_renderer():
+    from solace_agent_mesh.agent.adk import setup
+
+    component = SimpleNamespace(log_identifier="[test]")
+    config = {"tool_type": "builtin-group", "group_name": "data_analysis"}
+
+    with (
+        patch.object(builtin_data_analysis_tools, "acquire_chart_renderer") as acquire,
+        patch.object(builtin_data_analysis_tools, "release_chart_renderer") as release,
+    ):
+        _, _, cleanup_hooks = await setup._load_builtin_group_tool(component, config)
+        acquire.assert_called_once()
+        assert len(cleanup_hooks) == 1
+        await cleanup_hooks[0]()
+
+    release.assert_called_once_with(acquire.call_args.args[0])
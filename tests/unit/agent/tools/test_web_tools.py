@@ -0,0 +1,91 @@
+"""
+Unit tests for how web_request saves responses as artifacts.
+"""
+
+from types import SimpleNamespace
+
+import httpx
+import pytest
+from google.adk.artifacts import InMemoryArtifactService
+
+from solace_agent_mesh.agent.tools import web_tools
+
+PDF_BYTES = b"%PDF-1.7 " + bytes(range(256)) * 64
+
+
+def _handler(request: httpx.Request) -> httpx.Response:
+    if request.url.path == "/report.pdf":
+        return httpx.Response(
+            200,
+            headers={"content-type": "application/pdf"},
+            stream=httpx.ByteStream(PDF_BYTES),
+        )
+    return httpx.Response(
+        200,
+        headers={"content-type": "text/html; charset=utf-8"},
+        content=b"<html><body><h1>Title</h1><img src='x.png'></body></html>",
+    )
+
+
+@pytest.fixture
+def tool_context(monkeypatch):
+    transport = httpx.MockTransport(_handler)
+    real_client = httpx.AsyncClient
+    monkeypatch.setattr(web_tools, "_is_safe_url", lambda url: True)
+    monkeypatch.setattr(
+        web_tools.httpx,
+        "AsyncClient",
+        lambda **kwargs: real_client(transport=transport, **kwargs),
+    )
+    invocation_context = SimpleNamespace(
+        app_name="agent",
+        user_id="user-1",
+        session=SimpleNamespace(id="session-1"),
+        artifact_service=InMemoryArtifactService(),
+    )
+    return SimpleNamespace(_invocation_context=invocation_context)
+
+
+async def _load(tool_context, filename):
+    context = tool_context._invocation_context
+    return await context.artifact_service.load_artifact(
+        app_name="agent",
+        user_id="user-1",
+        session_id="session-1",
+        filename=filename,
+    )
+
+
+async def test_binary_response_is_streamed_into_artifact(tool_context, monkeypatch):
+    saved_with_bytes = []
+    monkeypatch.setattr(
+        web_tools,
+        "save_artifact_with_metadata",
+        lambda *args, **kwargs: saved_with_bytes.append(kwargs),
+    )
+
+    result = await web_tools.web_request(
+        "https://example.com/report.pdf",
+        output_artifact_filename="report",
+        tool_context=tool_context,
+    )
+
+    assert result["status"] == "success", result
+    assert result["output_filename"] == "report.pdf"
+    assert saved_with_bytes == []
+    part = await _load(tool_context, "report.pdf")
+    assert part.inline_data.data == PDF_BYTES
+    assert part.inline_data.mime_type == "application/pdf"
+
+
+async def test_html_response_is_converted_to_markdown(tool_context):
+    result = await web_tools.web_request(
+        "https://example.com/page",
+        output_artifact_filename="page",
+        tool_context=tool_context,
+    )
+
+    assert result["status"] == "success", result
+    part = await _load(tool_context, "page.md")
+    assert part.inline_data.data.decode("utf-8").strip() == "# Title"
+    assert "# Title" in result["result_preview"]
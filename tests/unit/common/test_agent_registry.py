@@ -0,0 +1,101 @@
+"""
+Unit tests for the versioned, indexed AgentRegistry.
+"""
+
+from unittest.mock import patch
+
+from a2a.types import AgentCapabilities, AgentCard, AgentSkill
+
+from solace_agent_mesh.common import agent_registry as agent_registry_module
+from solace_agent_mesh.common.agent_registry import AgentRegistry
+
+
+def _card(name: str, description: str = "An agent", skills=()):
+    return AgentCard(
+        name=name,
+        description=description,
+        url=f"solace:{name}",
+        version="1.0",
+        capabilities=AgentCapabilities(),
+        default_input_modes=["text"],
+        default_output_modes=["text"],
+        skills=list(skills),
+    )
+
+
+def _skill(skill_id: str, tags):
+    return AgentSkill(id=skill_id, name=skill_id, description="", tags=list(tags))
+
+
+def test_version_changes_only_when_cards_change():
+    registry = AgentRegistry()
+    assert registry.add_or_update_agent(_card("B")) is True
+    assert registry.add_or_update_agent(_card("A")) is True
+    version = registry.version
+
+    assert registry.add_or_update_agent(_card("A")) is False
+    assert registry.version == version
+
+    registry.add_or_update_agent(_card("A", description="changed"))
+    assert registry.version == version + 1
+    assert registry.get_agent_names() == ["A", "B"]
+    assert registry.get_agent("A").description == "changed"
+
+
+def test_snapshot_is_immutable_and_stable():
+    registry = AgentRegistry()
+    registry.add_or_update_agent(_card("A"))
+    snapshot = registry.snapshot()
+
+    registry.add_or_update_agent(_card("B"))
+
+    assert list(snapshot.agents) == ["A"]
+    assert snapshot.names == ("A",)
+    assert registry.snapshot().names == ("A", "B")
+    assert registry.snapshot() is registry.snapshot()
+
+
+def test_skill_and_tag_indexes_follow_updates():
+    registry = AgentRegistry()
+    registry.add_or_update_agent(
+        _card("A", skills=[_skill("charts", ["viz", "data"])])
+    )
+    registry.add_or_update_agent(_card("B", skills=[_skill("sql", ["data"])]))
+
+    assert registry.find_agents_by_skill("charts") == {"A"}
+    assert registry.find_agents_by_tag("data") == {"A", "B"}
+
+    registry.add_or_update_agent(_card("A", skills=[_skill("maps", ["geo"])]))
+    assert registry.find_agents_by_skill("charts") == frozenset()
+    assert registry.find_agents_by_tag("data") == {"B"}
+
+    registry.remove_agent("B")
+    assert registry.find_agents_by_tag("data") == frozenset()
+
+
+def test_agents_expire_after_ttl():
+    now = [1000.0]
+    registry = AgentRegistry(ttl_seconds=30)
+    with patch.object(agent_registry_module.time, "monotonic", lambda: now[0]):
+        registry.add_or_update_agent(_card("A"))
+        now[0] += 20
+        registry.add_or_update_agent(_card("B"))
+        now[0] += 20
+        registry.add_or_update_agent(_card("B"))
+
+        assert registry.get_agent_names() == ["B"]
+        now[0] += 31
+        assert registry.get_agent("B") is None
+
+
+def test_subscribers_receive_snapshots():
+    registry = AgentRegistry()
+    received = []
+    unsubscribe = registry.subscribe(received.append)
+
+    registry.add_or_update_agent(_card("A"))
+    registry.add_or_update_agent(_card("A"))
+    unsubscribe()
+    registry.add_or_update_agent(_card("B"))
+
+    assert [s.names for s in received] == [("A",)]
@@ -0,0 +1,97 @@
+"""
+Unit tests for the trie-based TopicDispatcher.
+"""
+
+import re
+
+import pytest
+from hypothesis import given, strategies as st
+
+from solace_agent_mesh.common import a2a
+from solace_agent_mesh.common.a2a import TopicDispatcher, subscription_to_regex
+
+NAMESPACE = "acme/prod"
+
+
+def _reference_match(topic, subscription):
+    return re.fullmatch(subscription_to_regex(subscription), topic) is not None
+
+
+@pytest.fixture
+def gateway_dispatcher():
+    dispatcher = TopicDispatcher()
+    dispatcher.add(a2a.get_discovery_topic(NAMESPACE), "discovery")
+    dispatcher.add(
+        a2a.get_gateway_response_subscription_topic(NAMESPACE, "gw1"), "response"
+    )
+    dispatcher.add(a2a.get_gateway_status_subscription_topic(NAMESPACE, "gw1"), "status")
+    return dispatcher
+
+
+def test_routes_and_extracts_task_id(gateway_dispatcher):
+    match = gateway_dispatcher.match(
+        a2a.get_gateway_status_topic(NAMESPACE, "gw1", "task-42")
+    )
+    assert match.handler == "status"
+    assert match.task_id == "task-42"
+
+    match = gateway_dispatcher.match(a2a.get_discovery_topic(NAMESPACE))
+    assert match.handler == "discovery"
+    assert match.task_id is None
+
+
+@pytest.mark.parametrize(
+    "topic",
+    [
+        "acme/prod/a2a/v1/gateway/status/gw2/task-1",
+        "acme/prod/a2a/v1/gateway/status/gw1",
+        "acme/prod/a2a/v1/discovery/agentcards/extra",
+        "acme/prod/a2a/v1/discovery",
+    ],
+)
+def test_non_matching_topics(gateway_dispatcher, topic):
+    assert gateway_dispatcher.match(topic) is None
+
+
+def test_trailing_separator_has_no_task_id(gateway_dispatcher):
+    match = gateway_dispatcher.match("acme/prod/a2a/v1/gateway/response/gw1/")
+    assert match.handler == "response"
+    assert match.task_id is None
+
+
+def test_first_added_subscription_wins():
+    dispatcher = TopicDispatcher()
+    dispatcher.add("a/*/c", "star")
+    dispatcher.add("a/b/>", "multi")
+    dispatcher.add("a/b/c", "exact")
+
+    assert dispatcher.match("a/b/c").handler == "star"
+    assert dispatcher.match("a/b/c/d").handler == "multi"
+    assert dispatcher.match("a/b/c/d").task_id == "c/d"
+
+
+def test_extract_task_id_from_topic_compat():
+    sub = a2a.get_agent_response_subscription_topic(NAMESPACE, "AgentA")
+    topic = a2a.get_agent_response_topic(NAMESPACE, "AgentA", "a2a_subtask_1")
+    assert a2a.extract_task_id_from_topic(topic, sub, "[test]") == "a2a_subtask_1"
+    assert a2a.extract_task_id_from_topic("other/topic", sub, "[test]") is None
+
+
+_level = st.sampled_from(["a", "b", "ab", "abc", ""])
+_sub_level = st.sampled_from(["a", "b", "ab", "*", "a*"])
+
+
+@given(
+    subscription=st.lists(_sub_level, min_size=1, max_size=4).flatmap(
+        lambda levels: st.sampled_from(
+            ["/".join(levels), "/".join(levels) + "/>"]
+        )
+    ),
+    topic=st.lists(_level, min_size=1, max_size=6).map("/".join),
+)
+def test_matches_agree_with_regex_semantics(subscription, topic):
+    dispatcher = TopicDispatcher()
+    dispatcher.add(subscription, "handler")
+    assert (dispatcher.match(topic) is not None) == _reference_match(
+        topic, subscription
+    )
@@ -0,0 +1,190 @@
+"""
+Unit tests for the process-wide ArtifactCache.
+"""
+
+import asyncio
+
+import pytest
+from google.genai import types as adk_types
+
+from solace_agent_mesh.common.utils import artifact_cache as artifact_cache_module
+from solace_agent_mesh.common.utils.artifact_cache import (
+    ArtifactCache,
+    get_artifact_cache,
+    load_artifact_cached,
+)
+from solace_agent_mesh.common.utils.embeds import evaluate_embed
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+def _part(data: bytes, mime_type: str = "text/plain"):
+    return adk_types.Part(inline_data=adk_types.Blob(data=data, mime_type=mime_type))
+
+
+class _Service:
+    pass
+
+
+class CountingArtifactService:
+    def __init__(self, artifacts):
+        self.artifacts = artifacts
+        self.loads = 0
+
+    async def list_versions(self, *, filename, **kwargs):
+        return [0] if filename in self.artifacts else []
+
+    async def load_artifact(self, *, filename, version, **kwargs):
+        self.loads += 1
+        return self.artifacts.get(filename)
+
+
+@pytest.fixture(autouse=True)
+def fresh_cache(monkeypatch):
+    monkeypatch.setattr(artifact_cache_module, "_artifact_cache", None)
+    yield
+    monkeypatch.setattr(artifact_cache_module, "_artifact_cache", None)
+
+
+def _key(cache, service, filename, version=0):
+    return cache.make_key(service, "app", "user", "session", filename, version)
+
+
+def test_lru_eviction_by_size_and_stats():
+    cache = ArtifactCache(max_bytes=100, max_entry_bytes=100)
+    service = _Service()
+    keys = [_key(cache, service, f"f{i}") for i in range(3)]
+    cache.put_part(keys[0], _part(b"a" * 40))
+    cache.put_part(keys[1], _part(b"b" * 40))
+    assert cache.get_part(keys[0]) is not None
+    cache.put_part(keys[2], _part(b"c" * 40))
+
+    assert cache.get_part(keys[1]) is None
+    assert cache.get_part(keys[0]) is not None
+    stats = cache.get_stats()
+    assert stats["evictions"] == 1
+    assert stats["total_bytes"] == 80
+    assert stats["raw_hit_rate"] == pytest.approx(2 / 3)
+
+
+def test_oversized_entries_and_parsed_forms_are_not_cached():
+    cache = ArtifactCache(max_bytes=1000, max_entry_bytes=100)
+    service = _Service()
+    big, small = _key(cache, service, "big"), _key(cache, service, "small")
+    cache.put_part(big, _part(b"x" * 101))
+    cache.put_part(small, _part(b"x" * 30))
+    cache.put_parsed(small, "json", {"parsed": True})
+
+    assert cache.get_part(big) is None
+    assert cache.get_parsed(small, "json") is None
+    assert cache.get_stats()["total_bytes"] == 30
+
+
+def test_parsed_forms_follow_their_version():
+    cache = ArtifactCache(max_bytes=1000)
+    key = _key(cache, _Service(), "data.json")
+    cache.put_parsed(key, "json", {"a": 1})
+    assert cache.get_parsed(key, "json") is None
+
+    cache.put_part(key, _part(b'{"a": 1}'))
+    cache.put_parsed(key, "json", {"a": 1})
+    assert cache.get_parsed(key, "json") == {"a": 1}
+
+    assert cache.invalidate(key[:-1]) == 1
+    assert cache.get_parsed(key, "json") is None
+
+
+def test_entries_expire_after_ttl():
+    clock = FakeClock()
+    cache = ArtifactCache(ttl_seconds=10, clock=clock)
+    key = _key(cache, _Service(), "f")
+    cache.put_part(key, _part(b"data"))
+    clock.now = 9.9
+    assert cache.get_part(key) is not None
+    clock.now = 10
+    assert cache.get_part(key) is None
+    assert cache.get_stats()["expirations"] == 1
+
+
+def test_keys_distinguish_services_and_follow_scope():
+    class Scoped:
+        def __init__(self, backing, scope):
+            self.backing, self.scope = backing, scope
+
+        def get_artifact_cache_scope(self, app_name):
+            return self.backing, self.scope
+
+    cache = ArtifactCache()
+    backing = _Service()
+    assert _key(cache, _Service(), "f") != _key(cache, _Service(), "f")
+    assert _key(cache, Scoped(backing, "ns"), "f") == _key(
+        cache, Scoped(backing, "ns"), "f"
+    )
+    assert _key(cache, Scoped(backing, "ns"), "f") != _key(
+        cache, Scoped(backing, "other"), "f"
+    )
+
+
+def test_compiled_expressions_are_reused():
+    cache = ArtifactCache(max_expressions=1)
+    compiled = []
+
+    def compile_func(source):
+        compiled.append(source)
+        return source.upper()
+
+    assert cache.get_or_compile("jsonpath", "$.a", compile_func) == "$.A"
+    assert cache.get_or_compile("jsonpath", "$.a", compile_func) == "$.A"
+    cache.get_or_compile("jsonpath", "$.b", compile_func)
+    cache.get_or_compile("jsonpath", "$.a", compile_func)
+    assert compiled == ["$.a", "$.b", "$.a"]
+    assert cache.get_stats()["expression_hits"] == 1
+
+
+def test_load_artifact_cached_loads_once():
+    service = CountingArtifactService({"f": _part(b"data")})
+
+    async def load_twice():
+        for _ in range(2):
+            part, _ = await load_artifact_cached(
+                service,
+                app_name="app",
+                user_id="user",
+                session_id="session",
+                filename="f",
+                version=0,
+            )
+            assert part.inline_data.data == b"data"
+
+    asyncio.run(load_twice())
+    assert service.loads == 1
+
+
+def test_repeated_embeds_reuse_loaded_and_parsed_artifact():
+    service = CountingArtifactService(
+        {"data.json": _part(b'{"items": [{"n": 1}, {"n": 2}]}', "application/json")}
+    )
+    context = {
+        "artifact_service": service,
+        "session_context": {"app_name": "a", "user_id": "u", "session_id": "s"},
+    }
+
+    async def evaluate(expression):
+        text, error, _ = await evaluate_embed(
+            "artifact_content", expression, None, context, "[test]", {}
+        )
+        assert error is None
+        return text
+
+    first = asyncio.run(evaluate("data.json >>> jsonpath:$.items[*].n >>> format:json"))
+    second = asyncio.run(evaluate("data.json >>> jsonpath:$.items[0] >>> format:json"))
+
+    assert (first, second) == ("[1,2]", '[{"n":1}]')
+    assert service.loads == 1
+    assert get_artifact_cache().get_stats()["parsed_hits"] == 1
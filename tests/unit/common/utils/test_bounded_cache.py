@@ -0,0 +1,165 @@
+"""
+Unit tests for the bounded TTL/LRU cache and the InMemoryCache singleton.
+"""
+
+import threading
+
+import pytest
+
+from solace_agent_mesh.common.utils.bounded_cache import (
+    EVICTION_REASON_CAPACITY,
+    EVICTION_REASON_EXPIRED,
+    BoundedTTLCache,
+)
+from solace_agent_mesh.common.utils.in_memory_cache import InMemoryCache
+from solace_agent_mesh.gateway.base.task_context import TaskContextManager
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self):
+        return self.now
+
+
+@pytest.fixture
+def clock():
+    return FakeClock()
+
+
+def test_lru_eviction_per_namespace(clock):
+    evicted = []
+    cache = BoundedTTLCache(
+        max_entries=2,
+        namespace_limits={"small": 1},
+        on_evict=lambda *args: evicted.append(args),
+        clock=clock,
+    )
+    cache.set("a", 1)
+    cache.set("b", 2)
+    cache.get("a")
+    cache.set("c", 3)
+    cache.set("x", 10, namespace="small")
+    cache.set("y", 11, namespace="small")
+
+    assert cache.get("b") is None
+    assert cache.get("a") == 1
+    assert cache.get("x", namespace="small") is None
+    assert cache.get("y", namespace="small") == 11
+    assert evicted == [
+        ("default", "b", 2, EVICTION_REASON_CAPACITY),
+        ("small", "x", 10, EVICTION_REASON_CAPACITY),
+    ]
+
+    stats = cache.get_stats()
+    assert stats["default"]["evictions"] == 1
+    assert stats["default"]["size"] == 2
+    assert stats["small"]["capacity"] == 1
+
+
+def test_byte_budget_evicts_least_recently_used_entries(clock):
+    evicted = []
+    cache = BoundedTTLCache(
+        max_bytes=100, on_evict=lambda *args: evicted.append(args[1]), clock=clock
+    )
+    cache.set("a", 1, size=40)
+    cache.set("b", 2, size=40)
+    cache.get("a")
+    cache.set("b", 3, size=30)
+    assert cache.get_stats()["default"]["bytes"] == 70
+
+    cache.set("c", 4, size=50)
+    assert evicted == ["a"]
+
+    # Entries larger than the whole budget are not stored.
+    cache.set("c", 5, size=101)
+    assert cache.get("c") is None
+    assert cache.get("b") == 3
+    assert cache.get_stats()["default"]["bytes"] == 30
+
+
+def test_expired_entries_are_swept_without_being_read(clock):
+    evicted = []
+    cache = BoundedTTLCache(on_evict=lambda *args: evicted.append(args), clock=clock)
+    for i in range(100):
+        cache.set(f"k{i}", i, ttl=10)
+    cache.set("forever", "v")
+
+    clock.now += 11
+    cache.set("fresh", "v", ttl=10)
+
+    assert len(cache) == 2
+    assert len(evicted) == 100
+    assert all(reason == EVICTION_REASON_EXPIRED for *_, reason in evicted)
+    assert cache.get_stats()["default"]["expirations"] == 100
+
+
+def test_overwrite_resets_ttl_and_stale_heap_records_are_ignored(clock):
+    evicted = []
+    cache = BoundedTTLCache(on_evict=lambda *args: evicted.append(args), clock=clock)
+    cache.set("k", 1, ttl=5)
+    cache.set("k", 2, ttl=50)
+    cache.delete("other")
+
+    clock.now += 10
+    assert cache.sweep() == 0
+    assert cache.get("k") == 2
+
+    for _ in range(500):
+        cache.set("k", 3, ttl=50)
+    assert len(cache._expiry_heap) < 200
+
+    clock.now += 100
+    assert cache.get("k") is None
+    assert evicted == [("default", "k", 3, EVICTION_REASON_EXPIRED)]
+
+
+def test_hit_miss_counters_and_delete(clock):
+    cache = BoundedTTLCache(clock=clock)
+    cache.set("k", "v")
+    assert cache.get("k") == "v"
+    assert cache.get("missing", "d") == "d"
+    assert cache.delete("k") is True
+    assert cache.delete("k") is False
+
+    stats = cache.get_stats()["default"]
+    assert (stats["hits"], stats["misses"], stats["size"]) == (1, 1, 0)
+
+
+def test_background_sweeper_fires_callback():
+    expired = threading.Event()
+    cache = BoundedTTLCache(on_evict=lambda *args: expired.set())
+    cache.start_sweeper()
+    try:
+        cache.set("k", "v", ttl=0.05)
+        assert expired.wait(2)
+        assert cache.size() == 0
+    finally:
+        cache.stop_sweeper()
+
+
+def test_in_memory_cache_is_bounded_singleton():
+    cache = InMemoryCache()
+    cache.clear()
+    try:
+        assert InMemoryCache() is cache
+        cache.set("k", "v", ttl=60)
+        assert InMemoryCache().get("k") == "v"
+        assert cache.delete("k") is True
+        for i in range(InMemoryCache.DEFAULT_MAX_ENTRIES + 5):
+            cache.set(i, i)
+        assert len(cache) == InMemoryCache.DEFAULT_MAX_ENTRIES
+    finally:
+        cache.clear()
+
+
+def test_task_context_manager_is_bounded():
+    manager = TaskContextManager(max_entries=2)
+    manager.store_context("t1", {"a": 1})
+    manager.store_context("t2", {"a": 2})
+    manager.store_context("t3", {"a": 3})
+
+    assert manager.get_context("t1") is None
+    assert manager.remove_context("t3") == {"a": 3}
+    assert manager.get_stats()["default"]["evictions"] == 1
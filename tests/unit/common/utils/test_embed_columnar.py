@@ -0,0 +1,144 @@
+"""
+Unit tests for the columnar backend of the artifact_content row modifiers.
+
+Columnar results must be identical to the list-of-dicts path, which is
+exercised by disabling the columnar backend for the reference evaluation.
+"""
+
+import asyncio
+import json
+from unittest.mock import patch
+
+from google.genai import types as adk_types
+from hypothesis import given, settings, strategies as st
+
+from solace_agent_mesh.common.utils.embeds import resolver
+from solace_agent_mesh.common.utils.embeds.columnar import ColumnarTable
+from solace_agent_mesh.common.utils.embeds.modifiers import _apply_sort_rows
+
+
+class FakeArtifactService:
+    def __init__(self, content: bytes, mime_type: str):
+        self.part = adk_types.Part(
+            inline_data=adk_types.Blob(data=content, mime_type=mime_type)
+        )
+
+    async def list_versions(self, **kwargs):
+        return [0]
+
+    async def load_artifact(self, **kwargs):
+        return self.part
+
+
+def _evaluate(
+    content: bytes, mime_type: str, modifiers, output_format: str, columnar: bool
+):
+    context = {
+        "artifact_service": FakeArtifactService(content, mime_type),
+        "session_context": {"app_name": "a", "user_id": "u", "session_id": "s"},
+    }
+    coro = resolver._evaluate_artifact_content_embed_with_chain(
+        artifact_spec_from_directive="data",
+        modifiers_from_directive=modifiers,
+        output_format_from_directive=output_format,
+        context=context,
+        log_identifier="[test]",
+        config={},
+    )
+    with patch.object(resolver, "COLUMNAR_AVAILABLE", columnar):
+        return asyncio.run(coro)
+
+
+def _assert_same(content: bytes, mime_type: str, modifiers, output_format="text"):
+    columnar = _evaluate(content, mime_type, modifiers, output_format, True)
+    reference = _evaluate(content, mime_type, modifiers, output_format, False)
+    assert columnar == reference
+
+
+def test_csv_filter_and_select_never_build_row_dicts():
+    content = b"id,team,score\n" + b"".join(
+        b"%d,%s,%d\n" % (i, b"red" if i % 2 else b"blue", i) for i in range(100)
+    )
+    modifiers = [("filter_rows_eq", "team:blue"), ("select_cols", "score,id")]
+    with patch.object(
+        ColumnarTable, "to_records", side_effect=AssertionError("materialized")
+    ):
+        result, error, _ = _evaluate(content, "text/csv", modifiers, "csv", True)
+
+    assert error is None
+    assert result.splitlines()[:3] == ["score,id", "0,0", "2,2"]
+    _assert_same(content, "text/csv", modifiers, "json")
+
+
+def test_irregular_csv_uses_list_of_dicts():
+    assert ColumnarTable.from_csv("a,b\n1,2\n3\n") is None
+    assert ColumnarTable.from_csv('a,b\n1,2\n"3"\n') is None
+    assert ColumnarTable.from_csv("a,a\n1,2\n") is None
+    _assert_same(b"a,b\n1,2\n3\n", "text/csv", [("select_cols", "a")], "json")
+    _assert_same(b"a,a\n1,2\n", "text/csv", [("filter_rows_eq", "a:2")], "json")
+
+
+def test_sort_rows_is_numeric_only_when_every_value_is_numeric():
+    rows = [{"v": "10"}, {"v": "9"}, {"v": "1e1"}]
+    result, _, error = _apply_sort_rows(rows, "v", None, "[test]")
+    assert error is None
+    assert result == [{"v": "9"}, {"v": "10"}, {"v": "1e1"}]
+
+    rows.append({"v": "x"})
+    result, _, _ = _apply_sort_rows(rows, "v:desc", None, "[test]")
+    assert result == [{"v": "x"}, {"v": "9"}, {"v": "1e1"}, {"v": "10"}]
+
+    _, _, error = _apply_sort_rows(rows, "missing", None, "[test]")
+    assert error == "Sort column 'missing' not found in data keys: ['v']"
+
+
+_row_modifier = st.one_of(
+    st.tuples(st.just("slice_rows"), st.sampled_from(["0:2", "1:", ":-1", "-2:", "x"])),
+    st.tuples(st.just("select_cols"), st.sampled_from(["a", "b,a", "a,a", "zz"])),
+    st.tuples(st.just("filter_rows_eq"), st.sampled_from(["a:1", "b:x", "b:", "bad"])),
+    st.tuples(st.just("select_fields"), st.sampled_from(["a", "b,zz", "zz"])),
+    st.tuples(st.just("sort_rows"), st.sampled_from(["a", "b:desc", "a:asc", "zz"])),
+)
+_other_modifier = st.one_of(
+    st.tuples(st.just("head"), st.sampled_from(["2"])),
+    st.tuples(st.just("jsonpath"), st.sampled_from(["$[*].a"])),
+)
+_chain = st.lists(st.one_of(_row_modifier, _other_modifier), min_size=1, max_size=4)
+_formats = st.sampled_from(["text", "json", "csv"])
+
+
+@settings(max_examples=150, deadline=None)
+@given(
+    rows=st.lists(
+        st.tuples(
+            st.sampled_from(["1", "2", "-1.5", "x"]),
+            st.sampled_from(["x", "y z", "", '"p,q"', "x\r"]),
+        ),
+        max_size=6,
+    ),
+    line_ending=st.sampled_from(["\n", "\r\n", "\n\n"]),
+    modifiers=_chain,
+    output_format=_formats,
+)
+def test_csv_chains_match_list_of_dicts(rows, line_ending, modifiers, output_format):
+    content = f"a,b{line_ending}" + "".join(f"{a},{b}{line_ending}" for a, b in rows)
+    _assert_same(content.encode("utf-8"), "text/csv", modifiers, output_format)
+
+
+@settings(max_examples=150, deadline=None)
+@given(
+    records=st.lists(
+        st.fixed_dictionaries(
+            {
+                "a": st.sampled_from([1, 2, 2.5, "1", None, True]),
+                "b": st.sampled_from(["x", "", [1, 2], {"k": "v"}]),
+            }
+        ),
+        max_size=6,
+    ),
+    modifiers=_chain,
+    output_format=_formats,
+)
+def test_json_chains_match_list_of_dicts(records, modifiers, output_format):
+    content = json.dumps(records).encode("utf-8")
+    _assert_same(content, "application/json", modifiers, output_format)
@@ -0,0 +1,151 @@
+"""
+Unit tests for streaming evaluation of artifact_content modifier chains.
+
+The streamed result must be identical to the materialized chain, which is
+exercised by disabling streaming for the reference evaluation.
+"""
+
+import asyncio
+from unittest.mock import patch
+
+from google.genai import types as adk_types
+from hypothesis import given, settings, strategies as st
+
+from solace_agent_mesh.common.utils.embeds import resolver, streaming
+from solace_agent_mesh.common.utils.embeds.streaming import (
+    iter_decoded_chunks,
+    iter_lines,
+)
+
+
+class FakeArtifactService:
+    def __init__(self, content: bytes, mime_type: str):
+        self.part = adk_types.Part(
+            inline_data=adk_types.Blob(data=content, mime_type=mime_type)
+        )
+
+    async def list_versions(self, **kwargs):
+        return [0]
+
+    async def load_artifact(self, **kwargs):
+        return self.part
+
+
+def _evaluate(content: bytes, mime_type: str, modifiers, stream: bool):
+    context = {
+        "artifact_service": FakeArtifactService(content, mime_type),
+        "session_context": {"app_name": "a", "user_id": "u", "session_id": "s"},
+    }
+    coro = resolver._evaluate_artifact_content_embed_with_chain(
+        artifact_spec_from_directive="data",
+        modifiers_from_directive=modifiers,
+        output_format_from_directive="text",
+        context=context,
+        log_identifier="[test]",
+        config={},
+    )
+    # Streaming is compared against the list-of-dicts path, not the columnar one.
+    with patch.object(resolver, "COLUMNAR_AVAILABLE", False):
+        if stream:
+            return asyncio.run(coro)
+        with patch.object(resolver, "can_stream_artifact", lambda *args: False):
+            return asyncio.run(coro)
+
+
+def _assert_same(content: bytes, mime_type: str, modifiers):
+    streamed = _evaluate(content, mime_type, modifiers, stream=True)
+    materialized = _evaluate(content, mime_type, modifiers, stream=False)
+    assert streamed == materialized
+
+
+def test_iter_lines_matches_splitlines_across_chunk_boundaries():
+    text = "a\r\nb\rc\n d\x0ce\r"
+    data = text.encode("utf-8")
+    for chunk_size in (1, 2, 3, 5):
+        chunks = iter_decoded_chunks(data, chunk_size=chunk_size)
+        assert list(iter_lines(chunks)) == text.splitlines(True)
+        chunks = iter_decoded_chunks(data, chunk_size=chunk_size)
+        assert list(iter_lines(chunks, newline_only=True)) == [
+            "a\r\n",
+            "b\rc\n",
+            " d\x0ce\r",
+        ]
+
+
+def test_head_stops_reading_early():
+    content = b"".join(b"line %d\n" % i for i in range(100_000))
+    decoded = []
+
+    def tracking_chunks(data, chunk_size=streaming.STREAM_CHUNK_SIZE):
+        for chunk in iter_decoded_chunks(data, chunk_size=1024):
+            decoded.append(len(chunk))
+            yield chunk
+
+    with patch.object(streaming, "iter_decoded_chunks", tracking_chunks):
+        result, error, _ = _evaluate(content, "text/plain", [("head", "3")], True)
+
+    assert error is None
+    assert result == "line 0\nline 1\nline 2\n"
+    assert sum(decoded) <= 1024
+
+
+def test_csv_row_chain_then_head_matches_materialized():
+    content = (
+        "id,name,team\r\n"
+        + "".join(
+            f'{i},"name, {i}",{"red" if i % 3 else "blue"}\r\n' for i in range(50)
+        )
+    ).encode("utf-8")
+    _assert_same(
+        content,
+        "text/csv",
+        [("filter_rows_eq", "team:blue"), ("select_cols", "name,id"), ("head", "4")],
+    )
+    _assert_same(content, "text/csv", [("slice_rows", "5:9"), ("tail", "2")])
+    _assert_same(content, "text/csv", [("select_cols", "missing")])
+
+
+def test_embedded_directives_use_materialized_chain():
+    content = "x\n«math:1+1»\ny\n".encode("utf-8")
+    result, error, _ = _evaluate(content, "text/plain", [("tail", "2")], True)
+    assert error is None
+    assert result == "2\ny\n"
+
+
+_text_line = st.text(alphabet='ab ,"\n\r\x0c\u2028', max_size=12)
+_line_modifier = st.one_of(
+    st.tuples(st.just("head"), st.sampled_from(["0", "2", "5", "-1", "x"])),
+    st.tuples(st.just("tail"), st.sampled_from(["0", "1", "3", "-2"])),
+    st.tuples(st.just("grep"), st.sampled_from(["a", "^b", "(", "a|,"])),
+    st.tuples(st.just("slice_lines"), st.sampled_from(["1:3", ":2", "2:", "-2:", "x"])),
+)
+_row_modifier = st.one_of(
+    st.tuples(st.just("slice_rows"), st.sampled_from(["0:2", "1:", ":1", "-1:"])),
+    st.tuples(st.just("select_cols"), st.sampled_from(["a", "b,a", "zz"])),
+    st.tuples(st.just("filter_rows_eq"), st.sampled_from(["a:1", "b:x", "bad"])),
+    st.tuples(st.just("select_fields"), st.sampled_from(["a", "b,zz"])),
+)
+
+
+@settings(max_examples=150, deadline=None)
+@given(
+    lines=st.lists(_text_line, max_size=8),
+    modifiers=st.lists(_line_modifier, min_size=1, max_size=3),
+)
+def test_line_chains_match_materialized(lines, modifiers):
+    _assert_same("".join(lines).encode("utf-8"), "text/plain", modifiers)
+
+
+@settings(max_examples=150, deadline=None)
+@given(
+    rows=st.lists(
+        st.tuples(st.sampled_from(["1", "2", "x"]), st.sampled_from(["x", "y z", ""])),
+        max_size=6,
+    ),
+    modifiers=st.lists(
+        st.one_of(_row_modifier, _line_modifier), min_size=1, max_size=3
+    ),
+)
+def test_csv_chains_match_materialized(rows, modifiers):
+    content = "a,b\n" + "".join(f"{a},{b}\n" for a, b in rows)
+    _assert_same(content.encode("utf-8"), "text/csv", modifiers)
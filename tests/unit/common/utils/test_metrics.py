@@ -0,0 +1,215 @@
+"""
+Unit tests for the metrics registry and the standard component metrics.
+"""
+
+import asyncio
+import time
+import urllib.request
+
+import pytest
+
+from solace_agent_mesh.common.utils.metrics import (
+    ComponentMetrics,
+    MetricsRegistry,
+    monitor_event_loop_lag,
+    start_metrics_http_server,
+    timed_method,
+)
+
+
+@pytest.fixture
+def registry():
+    return MetricsRegistry()
+
+
+def test_counter_and_gauge_rendering(registry):
+    counter = registry.counter("sam_requests", "Requests handled.", ("component",))
+    counter.labels("agent-a").inc()
+    counter.labels(component="agent-a").inc(2)
+    gauge = registry.gauge("sam_depth", "Queue depth.", ("queue",))
+    items = [1, 2, 3]
+    gauge.labels('in"put').set_function(lambda: len(items))
+
+    text = registry.render_prometheus()
+
+    assert "# HELP sam_requests_total Requests handled." in text
+    assert "# TYPE sam_requests_total counter" in text
+    assert 'sam_requests_total{component="agent-a"} 3' in text
+    assert 'sam_depth{queue="in\\"put"} 3' in text
+    items.append(4)
+    assert 'sam_depth{queue="in\\"put"} 4' in registry.render_prometheus()
+
+
+def test_histogram_buckets_are_cumulative(registry):
+    histogram = registry.histogram(
+        "sam_latency_seconds", "Latency.", ("op",), buckets=(0.1, 1.0)
+    )
+    child = histogram.labels("load")
+    for value in (0.05, 0.5, 0.7, 5.0):
+        child.observe(value)
+
+    text = registry.render_prometheus()
+
+    assert 'sam_latency_seconds_bucket{op="load",le="0.1"} 1' in text
+    assert 'sam_latency_seconds_bucket{op="load",le="1"} 3' in text
+    assert 'sam_latency_seconds_bucket{op="load",le="+Inf"} 4' in text
+    assert 'sam_latency_seconds_count{op="load"} 4' in text
+    sample = registry.snapshot()["sam_latency_seconds"]["samples"][0]
+    assert sample["count"] == 4
+    assert sample["sum"] == pytest.approx(6.25)
+    assert sample["buckets"] == {"0.1": 1, "1": 3, "+Inf": 4}
+
+
+def test_metric_type_mismatch_raises(registry):
+    registry.counter("sam_thing", "A thing.")
+    with pytest.raises(ValueError):
+        registry.gauge("sam_thing", "A thing.")
+
+
+def test_wrong_label_count_raises(registry):
+    counter = registry.counter("sam_requests", "Requests.", ("component",))
+    with pytest.raises(ValueError):
+        counter.labels("a", "b")
+
+
+def test_gauge_function_errors_are_reported_as_missing(registry):
+    registry.gauge("sam_broken", "Broken.").labels().set_function(lambda: 1 / 0)
+
+    assert registry.snapshot()["sam_broken"]["samples"][0]["value"] is None
+    assert "sam_broken NaN" in registry.render_prometheus()
+
+
+def test_component_metrics_snapshot_and_remove(registry):
+    first = ComponentMetrics("agent-a", registry=registry)
+    second = ComponentMetrics("agent-b", registry=registry)
+    first.active_tasks.set(2)
+    second.active_tasks.set(5)
+    first.observe_tool("web_search", 0.2, "success")
+    first.record_llm_usage(
+        prompt_tokens=100, completion_tokens=50, cached_tokens=80, duration_seconds=2.0
+    )
+
+    snapshot = first.snapshot()
+
+    assert snapshot["sam_active_tasks"]["samples"] == [
+        {"labels": {"component": "agent-a"}, "value": 2.0}
+    ]
+    tokens = {
+        sample["labels"]["type"]: sample["value"]
+        for sample in snapshot["sam_llm_tokens"]["samples"]
+    }
+    assert tokens == {"prompt": 100, "completion": 50, "cached": 80}
+    rate = snapshot["sam_llm_output_tokens_per_second"]["samples"][0]
+    assert rate["sum"] == pytest.approx(25.0)
+    assert snapshot["sam_tool_duration_seconds"]["samples"][0]["labels"] == {
+        "component": "agent-a",
+        "tool": "web_search",
+        "status": "success",
+    }
+
+    first.remove()
+
+    assert first.snapshot() == {}
+    assert 'sam_active_tasks{component="agent-b"} 5' in registry.render_prometheus()
+
+
+def test_registered_stats_are_read_on_collection(registry):
+    stats = {"pending": 3, "completed": 10, "name": "dispatcher"}
+    registry.register_stats("sam_dispatcher", "Dispatcher load.", lambda: stats)
+
+    text = registry.render_prometheus()
+
+    assert "# TYPE sam_dispatcher gauge" in text
+    assert 'sam_dispatcher{stat="pending"} 3' in text
+    assert 'sam_dispatcher{stat="completed"} 10' in text
+    assert 'stat="name"' not in text
+    stats["pending"] = 0
+    del stats["completed"]
+    samples = registry.snapshot()["sam_dispatcher"]["samples"]
+    assert samples == [{"labels": {"stat": "pending"}, "value": 0}]
+
+
+def test_component_stats_are_grouped_and_removed_with_component(registry):
+    first = ComponentMetrics("gw-a", registry=registry)
+    second = ComponentMetrics("gw-b", registry=registry)
+    first.register_stats(
+        "sam_contexts",
+        "Contexts.",
+        lambda: {"default": {"size": 2}, "sessions": {"size": 1}},
+        group_label="namespace",
+    )
+    second.register_stats(
+        "sam_contexts", "Contexts.", lambda: {"default": {"size": 7}}, "namespace"
+    )
+
+    text = registry.render_prometheus()
+
+    assert 'sam_contexts{component="gw-a",namespace="default",stat="size"} 2' in text
+    assert 'sam_contexts{component="gw-a",namespace="sessions",stat="size"} 1' in text
+    assert 'sam_contexts{component="gw-b",namespace="default",stat="size"} 7' in text
+
+    first.remove()
+
+    text = registry.render_prometheus()
+    assert 'component="gw-a"' not in text
+    assert 'sam_contexts{component="gw-b",namespace="default",stat="size"} 7' in text
+
+
+def test_failing_stats_function_does_not_break_collection(registry):
+    registry.register_stats("sam_broken_stats", "Broken.", lambda: 1 / 0)
+    registry.counter("sam_requests", "Requests.").labels().inc()
+
+    assert "sam_requests_total 1" in registry.render_prometheus()
+
+
+async def test_timed_method_observes_duration_on_error(registry):
+    class Component:
+        def __init__(self):
+            self.metrics = ComponentMetrics("agent-a", registry=registry)
+
+        @timed_method("flush")
+        async def flush(self, fail: bool):
+            if fail:
+                raise RuntimeError("boom")
+            return "ok"
+
+    component = Component()
+    assert await component.flush(False) == "ok"
+    with pytest.raises(RuntimeError):
+        await component.flush(True)
+
+    sample = component.metrics.snapshot()["sam_callback_duration_seconds"]["samples"][0]
+    assert sample["labels"]["callback"] == "flush"
+    assert sample["count"] == 2
+
+
+async def test_event_loop_lag_monitor_observes_blocking(registry):
+    metrics = ComponentMetrics("agent-a", registry=registry)
+    monitor = asyncio.create_task(monitor_event_loop_lag(metrics.event_loop_lag, 0.01))
+    await asyncio.sleep(0)
+    # Block the loop for longer than the monitor's interval.
+    time.sleep(0.1)
+    await asyncio.sleep(0.05)
+    monitor.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await monitor
+
+    sample = metrics.snapshot()["sam_event_loop_lag_seconds"]["samples"][0]
+    assert sample["count"] >= 1
+    assert sample["sum"] >= 0.05
+
+
+def test_http_server_serves_metrics(registry):
+    registry.counter("sam_requests", "Requests.").labels().inc()
+    server = start_metrics_http_server(0, host="127.0.0.1", registry=registry)
+    try:
+        port = server.server_address[1]
+        with urllib.request.urlopen(f"http://127.0.0.1:{port}/metrics") as response:
+            body = response.read().decode("utf-8")
+            content_type = response.headers["Content-Type"]
+    finally:
+        server.shutdown()
+        server.server_close()
+
+    assert "sam_requests_total 1" in body
+    assert content_type.startswith("text/plain")
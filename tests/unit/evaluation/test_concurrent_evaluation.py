@@ -0,0 +1,96 @@
+"""
+Unit tests for event-driven task completion in the evaluation subscriber and
+concurrent test execution in the evaluation runner.
+"""
+
+import threading
+import time
+from types import SimpleNamespace
+
+from evaluation.run import ModelEvaluator, TestRun
+from evaluation.subscriber import TaskTracker
+
+STATUS_TOPIC = "ns/a2a/v1/gateway/status/gw/{}"
+RESPONSE_TOPIC = "ns/a2a/v1/gateway/response/gw/{}"
+TEXT_PAYLOAD = {
+    "result": {"status": {"message": {"parts": [{"kind": "text", "text": "Hi"}]}}}
+}
+
+
+def test_wait_for_task_returns_when_the_response_arrives():
+    tracker = TaskTracker(set(), None)
+    tracker.register_task("t1", submitted_at=time.time())
+
+    def respond():
+        time.sleep(0.05)
+        tracker.record_status(STATUS_TOPIC.format("t1"))
+        time.sleep(0.05)
+        tracker.record_status(STATUS_TOPIC.format("t1"), TEXT_PAYLOAD)
+        tracker.handle_task_completion(RESPONSE_TOPIC.format("t1"))
+
+    threading.Thread(target=respond).start()
+    start = time.perf_counter()
+    assert tracker.wait_for_task("t1", timeout=5)
+    assert time.perf_counter() - start < 1
+
+    timing = tracker.get_timing("t1").to_dict()
+    assert (
+        0
+        < timing["time_to_first_status_seconds"]
+        < timing["time_to_first_token_seconds"]
+    )
+    assert timing["time_to_first_token_seconds"] <= timing["total_latency_seconds"]
+    assert "t1" not in tracker.active_tasks
+
+
+def test_response_before_registration_completes_the_task():
+    tracker = TaskTracker(set(), None)
+    tracker.record_status(STATUS_TOPIC.format("t2"), TEXT_PAYLOAD)
+    tracker.handle_task_completion(RESPONSE_TOPIC.format("t2"))
+
+    tracker.register_task("t2", submitted_at=time.time() - 1)
+    assert tracker.wait_for_task("t2", timeout=0)
+    assert tracker.get_timing("t2").to_dict()["total_latency_seconds"] >= 1
+    assert tracker.get_completed_task_count() == 1
+
+
+def test_timed_out_task_stops_being_tracked():
+    tracker = TaskTracker(set(), None)
+    tracker.register_task("t3")
+    assert not tracker.wait_for_task("t3", timeout=0.01)
+    assert tracker.get_active_task_count() == 0
+
+
+class FakeTestExecutor:
+    def __init__(self):
+        self.in_flight = 0
+        self.max_in_flight = 0
+        self.lock = threading.Lock()
+
+    def execute_test(self, test_run, model_results_path, task_mappings, subscriber):
+        with self.lock:
+            self.in_flight += 1
+            self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        time.sleep(0.05)
+        with self.lock:
+            self.in_flight -= 1
+        return test_run.run_num % 2 == 1
+
+
+def _evaluator(max_concurrent_tasks, num_runs):
+    evaluator = ModelEvaluator.__new__(ModelEvaluator)
+    evaluator.config = SimpleNamespace(max_concurrent_tasks=max_concurrent_tasks)
+    runs = [TestRun("agent", "q", [], 10, "case.test.json", n) for n in range(num_runs)]
+    evaluator.test_builder = SimpleNamespace(build_test_runs=lambda: runs)
+    evaluator.test_executor = FakeTestExecutor()
+    return evaluator
+
+
+def test_tests_run_with_bounded_concurrency():
+    evaluator = _evaluator(max_concurrent_tasks=3, num_runs=9)
+    assert evaluator._execute_all_tests("results", subscriber=None) == 4
+    assert evaluator.test_executor.max_in_flight == 3
+
+    sequential = _evaluator(max_concurrent_tasks=1, num_runs=4)
+    assert sequential._execute_all_tests("results", subscriber=None) == 2
+    assert sequential.test_executor.max_in_flight == 1
@@ -0,0 +1,94 @@
+"""
+Unit tests for the gateway message processor loop's internal queue accounting.
+"""
+
+import asyncio
+import functools
+import queue
+import threading
+from types import SimpleNamespace
+from unittest.mock import MagicMock
+
+from solace_agent_mesh.gateway.base import component as component_module
+from solace_agent_mesh.gateway.base.component import BaseGatewayComponent
+
+
+class _FailingTopicDispatcher:
+    def match(self, topic):
+        raise RuntimeError("boom")
+
+
+def _fake_gateway(items):
+    internal_event_queue = queue.Queue()
+    for item in items:
+        internal_event_queue.put(item)
+    return SimpleNamespace(
+        log_identifier="[TestGateway]",
+        stop_signal=threading.Event(),
+        internal_event_queue=internal_event_queue,
+        message_processor_max_concurrency=4,
+        MESSAGE_PROCESSOR_SHUTDOWN_TIMEOUT_SECONDS=1,
+        metrics=MagicMock(),
+        _build_topic_dispatcher=_FailingTopicDispatcher,
+    )
+
+
+async def _no_sleep(delay):
+    pass
+
+
+async def test_item_that_fails_before_dispatch_is_marked_done(monkeypatch):
+    # Skip the loop's back-off after an error.
+    monkeypatch.setattr(component_module.asyncio, "sleep", _no_sleep)
+    broker_message = MagicMock()
+    gateway = _fake_gateway(
+        [
+            {
+                "topic": "ns/a2a/v1/gateway/status/gw/task-1",
+                "payload": {},
+                "_original_broker_message": broker_message,
+            },
+            None,
+        ]
+    )
+
+    await BaseGatewayComponent._message_processor_loop(gateway)
+
+    broker_message.call_negative_acknowledgements.assert_called_once()
+    assert gateway.internal_event_queue.unfinished_tasks == 0
+
+
+async def test_items_dropped_on_shutdown_are_nacked_and_marked_done():
+    never = asyncio.Event()
+
+    async def blocked_processing(topic, payload, route, broker_message):
+        try:
+            await never.wait()
+        finally:
+            broker_message.call_negative_acknowledgements()
+            gateway.internal_event_queue.task_done()
+
+    running, queued = MagicMock(), MagicMock()
+    topic = "ns/a2a/v1/gateway/status/gw/task-1"
+    gateway = _fake_gateway(
+        [
+            {"topic": topic, "payload": {}, "_original_broker_message": running},
+            {"topic": topic, "payload": {}, "_original_broker_message": queued},
+            None,
+        ]
+    )
+    gateway.MESSAGE_PROCESSOR_SHUTDOWN_TIMEOUT_SECONDS = 0.01
+    gateway._build_topic_dispatcher = lambda: SimpleNamespace(
+        match=lambda topic: SimpleNamespace(handler="agent_event", task_id="task-1")
+    )
+    gateway._process_internal_event = blocked_processing
+    gateway._drop_internal_event = functools.partial(
+        BaseGatewayComponent._drop_internal_event, gateway
+    )
+
+    await BaseGatewayComponent._message_processor_loop(gateway)
+
+    running.call_negative_acknowledgements.assert_called_once()
+    queued.call_negative_acknowledgements.assert_called_once()
+    queued.call_acknowledgements.assert_not_called()
+    assert gateway.internal_event_queue.unfinished_tasks == 0
@@ -0,0 +1,139 @@
+"""
+Unit tests for OrderedTaskDispatcher ordering, concurrency and backpressure.
+"""
+
+import asyncio
+
+from solace_agent_mesh.gateway.base.ordered_dispatcher import OrderedTaskDispatcher
+
+
+def _recorder(log, key, index, delay=0.0):
+    async def work():
+        log.append(("start", key, index))
+        await asyncio.sleep(delay)
+        log.append(("end", key, index))
+
+    return work
+
+
+async def test_preserves_order_per_key_and_overlaps_keys():
+    dispatcher = OrderedTaskDispatcher(max_concurrency=4)
+    events = []
+    await dispatcher.submit("slow", _recorder(events, "slow", 0, delay=0.05))
+    await dispatcher.submit("slow", _recorder(events, "slow", 1))
+    await dispatcher.submit("fast", _recorder(events, "fast", 0))
+
+    assert await dispatcher.join(timeout=1)
+
+    slow = [e for e in events if e[1] == "slow"]
+    assert slow == [
+        ("start", "slow", 0),
+        ("end", "slow", 0),
+        ("start", "slow", 1),
+        ("end", "slow", 1),
+    ]
+    assert events.index(("end", "fast", 0)) < events.index(("end", "slow", 0))
+    assert dispatcher.get_stats()["active_keys"] == 0
+
+
+async def test_concurrency_cap_is_respected():
+    dispatcher = OrderedTaskDispatcher(max_concurrency=2)
+    running = 0
+    peak = 0
+
+    async def work():
+        nonlocal running, peak
+        running += 1
+        peak = max(peak, running)
+        await asyncio.sleep(0.01)
+        running -= 1
+
+    for i in range(6):
+        await dispatcher.submit(f"task-{i}", work)
+    assert await dispatcher.join(timeout=1)
+    assert peak == 2
+    assert dispatcher.get_stats()["completed"] == 6
+
+
+async def test_submit_blocks_when_pending_limit_reached():
+    dispatcher = OrderedTaskDispatcher(max_concurrency=1, max_pending=1)
+    release = asyncio.Event()
+
+    async def blocked():
+        await release.wait()
+
+    await dispatcher.submit("a", blocked)
+    second = asyncio.create_task(dispatcher.submit("b", blocked))
+    await asyncio.sleep(0.01)
+    assert not second.done()
+
+    release.set()
+    await asyncio.wait_for(second, timeout=1)
+    assert await dispatcher.join(timeout=1)
+
+
+async def test_failures_do_not_stop_the_lane():
+    dispatcher = OrderedTaskDispatcher(max_concurrency=1)
+    events = []
+
+    async def failing():
+        raise RuntimeError("boom")
+
+    await dispatcher.submit("t", failing)
+    await dispatcher.submit("t", _recorder(events, "t", 1))
+    assert await dispatcher.join(timeout=1)
+
+    assert events == [("start", "t", 1), ("end", "t", 1)]
+    assert dispatcher.get_stats()["failed"] == 1
+
+
+async def test_shutdown_cancels_outstanding_work():
+    dispatcher = OrderedTaskDispatcher(max_concurrency=1)
+    never = asyncio.Event()
+
+    async def blocked():
+        await never.wait()
+
+    await dispatcher.submit("t", blocked)
+    await dispatcher.submit("t", blocked)
+    await dispatcher.shutdown(timeout=0.01)
+
+    assert dispatcher.pending == 0
+
+
+async def test_shutdown_drops_work_that_never_started():
+    dispatcher = OrderedTaskDispatcher(max_concurrency=1)
+    never = asyncio.Event()
+    dropped = []
+
+    async def blocked():
+        await never.wait()
+
+    await dispatcher.submit("t", blocked, on_drop=lambda: dropped.append("t0"))
+    await dispatcher.submit("t", blocked, on_drop=lambda: dropped.append("t1"))
+    await dispatcher.submit("u", blocked, on_drop=lambda: dropped.append("u0"))
+    await dispatcher.submit(None, blocked, on_drop=lambda: dropped.append("none"))
+    await asyncio.sleep(0)
+    await dispatcher.shutdown(timeout=0.01)
+
+    # "t0" was running, so it is cancelled rather than dropped.
+    assert sorted(dropped) == ["none", "t1", "u0"]
+    assert dispatcher.pending == 0
+    assert dispatcher.get_stats()["dropped"] == 3
+
+
+async def test_shutdown_drops_work_whose_worker_never_ran():
+    dispatcher = OrderedTaskDispatcher(max_concurrency=1)
+    dropped = []
+
+    async def work():
+        pass
+
+    await dispatcher.submit("t", work, on_drop=lambda: dropped.append("t"))
+    # Cancelled before its first step, the worker never runs its own cleanup.
+    for worker in list(dispatcher._workers):
+        worker.cancel()
+    await dispatcher.shutdown(timeout=1)
+
+    assert dropped == ["t"]
+    assert dispatcher.pending == 0
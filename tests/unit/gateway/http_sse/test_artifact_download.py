@@ -0,0 +1,175 @@
+"""
+Unit tests for range and conditional requests on artifact downloads.
+"""
+
+from types import SimpleNamespace
+
+import pytest
+from fastapi import FastAPI, Request
+from fastapi.testclient import TestClient
+
+from solace_agent_mesh.agent.adk.artifacts.streaming import (
+    ArtifactStream,
+    _bytes_range_reader,
+)
+from solace_agent_mesh.common.utils.metrics import ComponentMetrics, MetricsRegistry
+from solace_agent_mesh.gateway.http_sse.routers import artifacts as artifacts_router
+from solace_agent_mesh.gateway.http_sse.routers.artifacts import (
+    ARTIFACT_VERSION_CACHE_CONTROL,
+    _artifact_download_response,
+    _artifact_stream_response,
+)
+
+DATA = b"0123456789" * 10
+
+
+@pytest.fixture
+def client():
+    stream = ArtifactStream(
+        filename="clip.wav",
+        version=3,
+        size_bytes=len(DATA),
+        mime_type="audio/wav",
+        revision="r1",
+        _read_range=_bytes_range_reader(DATA),
+    )
+    metrics = ComponentMetrics("webui", registry=MetricsRegistry())
+    app = FastAPI()
+
+    @app.get("/artifact")
+    async def download(request: Request):
+        return _artifact_stream_response(
+            request, stream, ARTIFACT_VERSION_CACHE_CONTROL, metrics
+        )
+
+    with TestClient(app) as test_client:
+        test_client.etag = stream.etag
+        test_client.metrics = metrics
+        yield test_client
+
+
+def _bytes_read(client):
+    samples = client.metrics.snapshot()["sam_artifact_io_bytes"]["samples"]
+    return sum(s["value"] for s in samples if s["labels"]["direction"] == "read")
+
+
+def test_full_download_has_validators(client):
+    response = client.get("/artifact")
+
+    assert response.status_code == 200
+    assert response.content == DATA
+    assert response.headers["etag"] == client.etag
+    assert response.headers["accept-ranges"] == "bytes"
+    assert response.headers["cache-control"] == ARTIFACT_VERSION_CACHE_CONTROL
+    assert response.headers["content-length"] == str(len(DATA))
+    assert _bytes_read(client) == len(DATA)
+
+
+@pytest.mark.parametrize(
+    "range_header, expected_slice, content_range",
+    [
+        ("bytes=10-19", slice(10, 20), "bytes 10-19/100"),
+        ("bytes=95-", slice(95, 100), "bytes 95-99/100"),
+        ("bytes=-5", slice(95, 100), "bytes 95-99/100"),
+        ("bytes=90-500", slice(90, 100), "bytes 90-99/100"),
+    ],
+)
+def test_single_range_returns_partial_content(
+    client, range_header, expected_slice, content_range
+):
+    response = client.get("/artifact", headers={"Range": range_header})
+
+    assert response.status_code == 206
+    assert response.content == DATA[expected_slice]
+    assert response.headers["content-range"] == content_range
+
+
+@pytest.mark.parametrize(
+    "range_header", ["bytes=0-1,5-6", "items=0-5", "bytes=9-3", "bytes=abc"]
+)
+def test_unsupported_or_malformed_ranges_return_everything(client, range_header):
+    response = client.get("/artifact", headers={"Range": range_header})
+
+    assert response.status_code == 200
+    assert response.content == DATA
+
+
+def test_range_beyond_end_is_not_satisfiable(client):
+    response = client.get("/artifact", headers={"Range": "bytes=100-"})
+
+    assert response.status_code == 416
+    assert response.headers["content-range"] == "bytes */100"
+
+
+def test_matching_if_none_match_returns_not_modified(client):
+    response = client.get(
+        "/artifact", headers={"If-None-Match": f'"other", W/{client.etag}'}
+    )
+
+    assert response.status_code == 304
+    assert response.content == b""
+    assert response.headers["etag"] == client.etag
+
+
+def test_if_range_mismatch_returns_everything(client):
+    response = client.get(
+        "/artifact", headers={"Range": "bytes=0-9", "If-Range": '"stale"'}
+    )
+    assert response.status_code == 200
+    assert response.content == DATA
+
+    response = client.get(
+        "/artifact", headers={"Range": "bytes=0-9", "If-Range": client.etag}
+    )
+    assert response.status_code == 206
+    assert response.content == DATA[:10]
+
+
+@pytest.mark.parametrize(
+    "max_resolve_bytes, resolved", [(len(DATA), True), (len(DATA) - 1, False)]
+)
+def test_embeds_are_only_resolved_within_the_size_limit(
+    monkeypatch, max_resolve_bytes, resolved
+):
+    async def fake_resolve(data_bytes, *args):
+        return b"resolved:" + data_bytes
+
+    monkeypatch.setattr(artifacts_router, "_resolve_embeds_for_download", fake_resolve)
+    stream = ArtifactStream(
+        filename="notes.txt",
+        version=1,
+        size_bytes=len(DATA),
+        mime_type="text/plain",
+        revision="r1",
+        _read_range=_bytes_range_reader(DATA),
+    )
+    component = SimpleNamespace(
+        enable_embed_resolution=True,
+        gateway_max_artifact_resolve_size_bytes=max_resolve_bytes,
+        metrics=ComponentMetrics("webui", registry=MetricsRegistry()),
+    )
+    app = FastAPI()
+
+    @app.get("/artifact")
+    async def download(request: Request):
+        return await _artifact_download_response(
+            request,
+            stream,
+            None,
+            component,
+            "user",
+            "session",
+            ARTIFACT_VERSION_CACHE_CONTROL,
+            "[test]",
+        )
+
+    with TestClient(app) as test_client:
+        response = test_client.get("/artifact")
+
+    assert response.status_code == 200
+    if resolved:
+        assert response.content == b"resolved:" + DATA
+        assert "etag" not in response.headers
+    else:
+        assert response.content == DATA
+        assert response.headers["etag"] == stream.etag
@@ -0,0 +1,115 @@
+"""
+Router tests for streamed artifact uploads: size limit, empty files and
+successful saves on both upload endpoints.
+"""
+
+from types import SimpleNamespace
+
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from solace_agent_mesh.agent.adk.artifacts.filesystem_artifact_service import (
+    FilesystemArtifactService,
+)
+from solace_agent_mesh.common.utils.metrics import ComponentMetrics, MetricsRegistry
+from solace_agent_mesh.gateway.http_sse import dependencies
+from solace_agent_mesh.gateway.http_sse.routers import artifacts
+
+MAX_UPLOAD_SIZE_BYTES = 64
+SESSION_ID = "session-1"
+
+
+class _AllowAllConfigResolver:
+    def is_feature_enabled(self, user_config, feature_descriptor, context):
+        return True
+
+
+@pytest.fixture
+def artifact_service(tmp_path):
+    return FilesystemArtifactService(base_path=str(tmp_path))
+
+
+@pytest.fixture
+def client(artifact_service):
+    config = {"name": "webui", "max_upload_size_bytes": MAX_UPLOAD_SIZE_BYTES}
+    component = SimpleNamespace(
+        gateway_id="webui",
+        get_config=lambda key, default=None: config.get(key, default),
+        metrics=ComponentMetrics("webui", registry=MetricsRegistry()),
+    )
+    app = FastAPI()
+    app.include_router(artifacts.router, prefix="/artifacts")
+    app.dependency_overrides.update(
+        {
+            dependencies.get_shared_artifact_service: lambda: artifact_service,
+            dependencies.get_user_id: lambda: "user-1",
+            dependencies.get_session_validator: lambda: lambda s, u: True,
+            dependencies.get_sac_component: lambda: component,
+            dependencies.get_config_resolver: _AllowAllConfigResolver,
+            dependencies.get_user_config: lambda: {},
+            dependencies.get_session_manager: lambda: None,
+            dependencies.get_session_business_service_optional: lambda: None,
+            dependencies.get_db_optional: lambda: None,
+        }
+    )
+    with TestClient(app) as test_client:
+        yield test_client
+
+
+def _upload(client, endpoint, content):
+    files = {"upload_file": ("notes.txt", content, "text/plain")}
+    if endpoint == "session":
+        return client.post(
+            "/artifacts/upload",
+            files=files,
+            data={"sessionId": SESSION_ID, "filename": "notes.txt"},
+        )
+    return client.post(f"/artifacts/{SESSION_ID}/notes.txt", files=files)
+
+
+ENDPOINTS = ["session", "path"]
+
+
+async def _load(artifact_service):
+    return await artifact_service.load_artifact(
+        app_name="webui",
+        user_id="user-1",
+        session_id=SESSION_ID,
+        filename="notes.txt",
+    )
+
+
+@pytest.mark.parametrize("endpoint", ENDPOINTS)
+async def test_upload_is_saved(client, artifact_service, endpoint):
+    response = _upload(client, endpoint, b"hello world")
+
+    assert response.status_code == 201
+    assert response.json()["size"] == len(b"hello world")
+    part = await _load(artifact_service)
+    assert part.inline_data.data == b"hello world"
+
+
+@pytest.mark.parametrize("endpoint", ENDPOINTS)
+async def test_empty_upload_is_rejected(client, artifact_service, endpoint):
+    response = _upload(client, endpoint, b"")
+
+    assert response.status_code == 400
+    assert await _load(artifact_service) is None
+
+
+@pytest.mark.parametrize("endpoint", ENDPOINTS)
+@pytest.mark.parametrize("size_known", [True, False])
+async def test_oversized_upload_is_rejected(
+    client, artifact_service, monkeypatch, endpoint, size_known
+):
+    if not size_known:
+        # Clients need not send a size; the limit is then enforced while
+        # streaming the chunks into the artifact service.
+        monkeypatch.setattr(artifacts, "UPLOAD_CHUNK_SIZE", 16)
+        monkeypatch.setattr(artifacts, "_reject_oversized_upload", lambda *a: None)
+
+    response = _upload(client, endpoint, b"x" * (MAX_UPLOAD_SIZE_BYTES + 1))
+
+    assert response.status_code == 413
+    assert await _load(artifact_service) is None
@@ -0,0 +1,118 @@
+"""
+Unit tests for the AsyncSession-backed session repositories and service.
+"""
+
+from unittest.mock import Mock
+
+import pytest
+
+pytest.importorskip("aiosqlite")
+
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+
+from solace_agent_mesh.gateway.http_sse.repository import (
+    AsyncMessageRepository,
+    AsyncSessionRepository,
+    Base,
+)
+from solace_agent_mesh.gateway.http_sse.services import session_service as session_service_module
+from solace_agent_mesh.gateway.http_sse.services.session_service import (
+    AsyncSessionService,
+)
+from solace_agent_mesh.gateway.http_sse.shared.enums import SenderType
+from solace_agent_mesh.gateway.http_sse.shared.pagination import PaginationParams
+
+
+@pytest.fixture(autouse=True)
+def clear_count_cache():
+    session_service_module._user_session_counts.clear()
+    yield
+    session_service_module._user_session_counts.clear()
+
+
+@pytest.fixture
+async def async_db(tmp_path):
+    engine = create_async_engine(f"sqlite+aiosqlite:///{tmp_path / 'sessions.db'}")
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+
+    session_factory = async_sessionmaker(bind=engine, expire_on_commit=False)
+    async with session_factory() as db:
+        yield db
+
+    await engine.dispose()
+
+
+@pytest.fixture
+def service():
+    component = Mock()
+    component.database_url = "sqlite+aiosqlite://"
+    return AsyncSessionService(component=component)
+
+
+async def test_create_and_list_sessions(async_db, service):
+    for i in range(3):
+        await service.create_session(
+            async_db, user_id="user-a", session_id=f"s{i}", name=f"Session {i}"
+        )
+    await service.create_session(async_db, user_id="user-b", session_id="other")
+    await async_db.commit()
+
+    page = await service.get_user_sessions(
+        async_db, "user-a", PaginationParams(page_number=1, page_size=2)
+    )
+
+    assert len(page.data) == 2
+    assert page.meta.pagination.count == 3
+    assert page.meta.pagination.next_page == 2
+    assert all(s.user_id == "user-a" for s in page.data)
+
+
+async def test_add_message_creates_session_and_history(async_db, service):
+    await service.add_message_to_session(
+        async_db,
+        session_id="s1",
+        user_id="user-a",
+        message="  hello  ",
+        sender_type=SenderType.USER,
+        sender_name="user-a",
+        agent_id="AgentA",
+    )
+    await async_db.commit()
+
+    history = await service.get_session_history(async_db, "s1", "user-a")
+
+    assert history is not None
+    assert history.session.agent_id == "AgentA"
+    assert [m.message for m in history.messages] == ["hello"]
+    assert await service.get_session_history(async_db, "s1", "user-b") is None
+
+
+async def test_update_and_delete_session(async_db, service):
+    await service.create_session(async_db, user_id="user-a", session_id="s1")
+    assert await AsyncMessageRepository(async_db).find_by_session("s1") == []
+
+    updated = await service.update_session_name(async_db, "s1", "user-a", "Renamed")
+    assert updated.name == "Renamed"
+
+    with pytest.raises(ValueError):
+        await service.update_session_name(async_db, "s1", "user-a", "   ")
+
+    assert await service.delete_session_with_notifications(async_db, "s1", "user-b") is False
+    assert await service.delete_session_with_notifications(async_db, "s1", "user-a") is True
+    assert await AsyncSessionRepository(async_db).find_user_session("s1", "user-a") is None
+
+
+async def test_session_count_is_invalidated_when_the_write_commits(async_db, service):
+    await service.create_session(async_db, user_id="user-a", session_id="s1")
+    await async_db.commit()
+    page = await service.get_user_sessions(async_db, "user-a")
+    assert page.meta.pagination.count == 1
+
+    await service.create_session(async_db, user_id="user-a", session_id="s2")
+    page = await service.get_user_sessions(async_db, "user-a")
+    assert page.meta.pagination.count == 1
+    await async_db.commit()
+
+    page = await service.get_user_sessions(async_db, "user-a")
+    assert page.meta.pagination.count == 2
@@ -0,0 +1,173 @@
+"""
+Unit tests for keyset (cursor) pagination of sessions and session history.
+"""
+
+from unittest.mock import Mock
+
+import pytest
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+
+from solace_agent_mesh.gateway.http_sse.repository import (
+    Base,
+    MessageModel,
+    SessionModel,
+)
+from solace_agent_mesh.gateway.http_sse.services import session_service as session_service_module
+from solace_agent_mesh.gateway.http_sse.services.session_service import SessionService
+from solace_agent_mesh.gateway.http_sse.shared.pagination import (
+    CountCache,
+    PaginationParams,
+    decode_cursor,
+    encode_cursor,
+)
+from solace_agent_mesh.gateway.http_sse.shared.types import PaginationInfo
+
+
+@pytest.fixture(autouse=True)
+def clear_count_cache():
+    session_service_module._user_session_counts.clear()
+    yield
+    session_service_module._user_session_counts.clear()
+
+
+@pytest.fixture
+def db():
+    engine = create_engine("sqlite://")
+    Base.metadata.create_all(engine)
+    session = sessionmaker(bind=engine)()
+    # Several sessions share an updated_time so the id tie-breaker matters.
+    for i in range(25):
+        session.add(
+            SessionModel(
+                id=f"s{i:02d}",
+                user_id="user-a",
+                created_time=1000,
+                updated_time=1000 + i // 3,
+            )
+        )
+    session.add(SessionModel(id="other", user_id="user-b", created_time=1, updated_time=1))
+    for i in range(7):
+        session.add(
+            MessageModel(
+                id=f"m{i}",
+                session_id="s00",
+                message=f"message {i}",
+                sender_type="user",
+                sender_name="user-a",
+                created_time=2000 + i // 2,
+            )
+        )
+    session.commit()
+    yield session
+    session.close()
+
+
+@pytest.fixture
+def service():
+    component = Mock()
+    component.database_url = "sqlite://"
+    return SessionService(component=component)
+
+
+def test_cursor_round_trip():
+    cursor = encode_cursor(1700000000000, "web-session-abc")
+    assert decode_cursor(cursor) == (1700000000000, "web-session-abc")
+
+
+@pytest.mark.parametrize(
+    "bad_cursor",
+    ["not-base64!!", encode_cursor(1, "x")[:-3], "WzEsMl0", encode_cursor(True, "x")],
+)
+def test_invalid_cursor_raises_value_error(bad_cursor):
+    with pytest.raises(ValueError):
+        decode_cursor(bad_cursor)
+
+
+def test_keyset_pages_cover_all_sessions_once(db, service):
+    pagination = PaginationParams(page_number=1, page_size=10)
+    seen = []
+    cursor = None
+    while True:
+        page = service.get_user_sessions(
+            db, "user-a", pagination, cursor=cursor, include_total=False
+        )
+        seen.extend(s.id for s in page.data)
+        assert page.meta.pagination.count is None
+        if cursor is not None:
+            assert page.meta.pagination.next_page is None
+        cursor = page.meta.pagination.next_cursor
+        if cursor is None:
+            break
+
+    offset_order = [
+        s.id
+        for s in service.get_user_sessions(
+            db, "user-a", PaginationParams(page_number=1, page_size=100)
+        ).data
+    ]
+    assert seen == offset_order
+    assert len(set(seen)) == 25
+
+
+def test_offset_page_reports_total_and_cursor(db, service):
+    page = service.get_user_sessions(
+        db, "user-a", PaginationParams(page_number=3, page_size=10)
+    )
+    assert len(page.data) == 5
+    assert page.meta.pagination.count == 25
+    assert page.meta.pagination.total_pages == 3
+    assert page.meta.pagination.next_page is None
+    assert page.meta.pagination.next_cursor is None
+
+
+def test_history_keyset_pages(db, service):
+    pagination = PaginationInfo(
+        page=1, page_size=3, total_items=0, total_pages=0, has_next=False, has_previous=False
+    )
+    history = service.get_session_history(db, "s00", "user-a", pagination)
+    ids = [m.id for m in history.messages]
+    while history.next_cursor:
+        history = service.get_session_history(
+            db, "s00", "user-a", pagination, cursor=history.next_cursor
+        )
+        ids.extend(m.id for m in history.messages)
+
+    assert ids == [f"m{i}" for i in range(7)]
+
+
+def test_count_cache_expires_and_invalidates():
+    cache = CountCache(ttl_seconds=60)
+    calls = []
+
+    def compute():
+        calls.append(1)
+        return 42
+
+    assert cache.get_or_compute("u", compute) == 42
+    assert cache.get_or_compute("u", compute) == 42
+    assert len(calls) == 1
+
+    cache.invalidate("u")
+    cache.get_or_compute("u", compute)
+    assert len(calls) == 2
+
+    expired = CountCache(ttl_seconds=-1)
+    expired.set("u", 1)
+    assert expired.get("u") is None
+
+
+def test_session_count_is_invalidated_when_the_write_commits(db, service):
+    service.create_session(db, "user-a", session_id="new")
+    # A total cached by a concurrent request before the commit must not survive it.
+    assert service.get_user_sessions(db, "user-a").meta.pagination.count == 26
+    session_service_module._user_session_counts.set("user-a", 25)
+    db.commit()
+
+    assert service.get_user_sessions(db, "user-a").meta.pagination.count == 26
+
+    assert service.delete_session_with_notifications(db, "new", "user-a") is True
+    assert service.get_user_sessions(db, "user-a").meta.pagination.count == 26
+    db.commit()
+
+    assert service.get_user_sessions(db, "user-a").meta.pagination.count == 25
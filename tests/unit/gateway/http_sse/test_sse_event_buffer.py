@@ -0,0 +1,92 @@
+"""
+Unit tests for SSEEventBuffer expiry, byte budget and metrics.
+"""
+
+from solace_agent_mesh.gateway.http_sse.sse_event_buffer import SSEEventBuffer
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 100.0
+
+    def __call__(self):
+        return self.now
+
+
+def _event(data: str, event_type: str = "status_update"):
+    return {"event": event_type, "data": data}
+
+
+def test_cleanup_removes_only_expired_buffers_in_order():
+    clock = FakeClock()
+    buffer = SSEEventBuffer(max_queue_size=10, max_age_seconds=60, clock=clock)
+    buffer.buffer_event("old", _event("a"))
+    clock.now += 30
+    buffer.buffer_event("new", _event("b"))
+    buffer.buffer_event("old", _event("c"))
+
+    clock.now += 31
+    buffer.cleanup_stale_buffers()
+
+    assert buffer.get_and_remove_buffer("old") is None
+    assert buffer.get_and_remove_buffer("new") == [_event("b")]
+    metrics = buffer.get_metrics()
+    assert metrics["expired_events"] == 2
+    assert metrics["flushed_events"] == 1
+    assert metrics["buffered_tasks"] == 0
+
+
+def test_per_task_limit_drops_events():
+    buffer = SSEEventBuffer(max_queue_size=2, max_age_seconds=60)
+    for data in "abc":
+        buffer.buffer_event("t1", _event(data))
+
+    assert [e["data"] for e in buffer.get_and_remove_buffer("t1")] == ["a", "b"]
+    assert buffer.get_metrics()["dropped_events"] == 1
+
+
+def test_byte_budget_evicts_oldest_tasks_first():
+    buffer = SSEEventBuffer(max_queue_size=10, max_age_seconds=60, max_total_bytes=100)
+    event = _event("x" * 20, event_type="m")
+    for task_id in ("t1", "t2", "t2", "t3"):
+        buffer.buffer_event(task_id, event)
+    assert buffer.get_metrics()["buffered_bytes"] == 84
+
+    buffer.buffer_event("t3", event)
+
+    assert buffer.get_and_remove_buffer("t1") is None
+    assert len(buffer.get_and_remove_buffer("t3")) == 2
+    metrics = buffer.get_metrics()
+    assert metrics["evicted_events"] == 1
+    assert metrics["buffered_events"] == 2
+    assert metrics["buffered_bytes"] == 42
+
+
+def test_event_larger_than_budget_is_dropped_without_evicting():
+    buffer = SSEEventBuffer(max_queue_size=10, max_age_seconds=60, max_total_bytes=20)
+    buffer.buffer_event("other", _event("ab"))
+    buffer.buffer_event("t1", _event("x" * 50))
+
+    assert buffer.get_and_remove_buffer("t1") is None
+    assert buffer.get_and_remove_buffer("other") == [_event("ab")]
+    metrics = buffer.get_metrics()
+    assert metrics["dropped_events"] == 1
+    assert metrics["evicted_events"] == 0
+
+
+def test_remove_buffer_releases_bytes():
+    buffer = SSEEventBuffer(max_queue_size=10, max_age_seconds=60, max_total_bytes=1000)
+    buffer.buffer_event("t1", _event("abc"))
+    buffer.remove_buffer("t1")
+
+    metrics = buffer.get_metrics()
+    assert metrics["buffered_bytes"] == 0
+    assert metrics["buffered_events"] == 0
+
+
+def test_event_size_counts_utf8_bytes():
+    buffer = SSEEventBuffer(max_queue_size=10, max_age_seconds=60)
+    buffer.buffer_event("t1", _event("héllo ✓"))
+
+    # 7 characters, 10 bytes.
+    assert buffer.get_metrics()["buffered_bytes"] == len("status_update") + 10
@@ -0,0 +1,139 @@
+"""
+Unit tests for SSEManager fan-out, slow-consumer policies and serialization.
+"""
+
+import datetime
+import json
+
+import pytest
+
+from solace_agent_mesh.gateway.http_sse import sse_manager as sse_manager_module
+from solace_agent_mesh.gateway.http_sse.sse_event_buffer import SSEEventBuffer
+from solace_agent_mesh.gateway.http_sse.sse_manager import (
+    SSEManager,
+    serialize_event_data,
+)
+
+
+def _manager(max_queue_size=3, policy="disconnect"):
+    buffer = SSEEventBuffer(max_queue_size=10, max_age_seconds=600)
+    return SSEManager(
+        max_queue_size=max_queue_size,
+        event_buffer=buffer,
+        slow_consumer_policy=policy,
+    )
+
+
+def _drain(queue):
+    items = []
+    while not queue.empty():
+        items.append(queue.get_nowait())
+    return items
+
+
+@pytest.mark.parametrize("use_orjson", [True, False])
+def test_serialize_event_data_sanitizes_only_when_needed(monkeypatch, use_orjson):
+    if not use_orjson:
+        monkeypatch.setattr(sse_manager_module, "orjson", None)
+
+    when = datetime.datetime(2024, 1, 2, 3, 4, 5)
+    assert json.loads(serialize_event_data({"a": [1, "x"], "t": when})) == {
+        "a": [1, "x"],
+        "t": when.isoformat(),
+    }
+    assert json.loads(
+        serialize_event_data({"nan": float("nan"), 1: object.__new__(object)})
+    )["nan"] is None
+
+
+async def test_send_event_buffers_until_connected():
+    manager = _manager()
+    await manager.send_event("t1", {"n": 1}, event_type="status_update")
+
+    queue = await manager.create_sse_connection("t1")
+
+    (payload,) = _drain(queue)
+    assert payload["event"] == "status_update"
+    assert json.loads(payload["data"]) == {"n": 1}
+
+
+async def test_slow_consumer_does_not_block_other_connections():
+    manager = _manager(max_queue_size=2)
+    slow = await manager.create_sse_connection("t1")
+    fast = await manager.create_sse_connection("t1")
+
+    for i in range(3):
+        await manager.send_event("t1", {"n": i})
+        fast.get_nowait()
+
+    items = _drain(slow)
+    assert items[-1] is None
+    assert fast.empty()
+    assert [m["task_id"] for m in manager.get_connection_metrics()] == ["t1"]
+
+
+async def test_drop_oldest_policy_keeps_newest_events():
+    manager = _manager(max_queue_size=2, policy="drop_oldest")
+    queue = await manager.create_sse_connection("t1")
+
+    for i in range(4):
+        await manager.send_event("t1", {"n": i})
+
+    assert [json.loads(p["data"])["n"] for p in _drain(queue)] == [2, 3]
+    (metrics,) = manager.get_connection_metrics("t1")
+    assert metrics["dropped_events"] == 2
+    assert metrics["enqueued_events"] == 4
+    assert metrics["high_watermark"] == 2
+    await manager.create_sse_connection("t2")
+    assert manager.get_connection_stats() == {
+        "connections": 2,
+        "tasks": 2,
+        "queued_events": 0,
+        "max_queue_depth": 0,
+        "max_high_watermark": 2,
+        "dropped_events": 2,
+    }
+
+
+async def test_coalesce_policy_discards_status_updates_first():
+    manager = _manager(max_queue_size=2, policy="coalesce")
+    queue = await manager.create_sse_connection("t1")
+
+    await manager.send_event("t1", {"n": 0}, event_type="artifact_update")
+    await manager.send_event("t1", {"n": 1}, event_type="status_update")
+    await manager.send_event("t1", {"n": 2}, event_type="status_update")
+
+    assert [json.loads(p["data"])["n"] for p in _drain(queue)] == [0, 2]
+
+    await manager.send_event("t1", {"n": 3}, event_type="artifact_update")
+    await manager.send_event("t1", {"n": 4}, event_type="artifact_update")
+    await manager.send_event("t1", {"n": 5}, event_type="artifact_update")
+
+    assert _drain(queue)[-1] is None
+    assert manager.get_connection_metrics("t1") == []
+
+
+async def test_close_all_for_task_signals_full_queue():
+    manager = _manager(max_queue_size=1, policy="drop_oldest")
+    queue = await manager.create_sse_connection("t1")
+    await manager.send_event("t1", {"n": 0})
+
+    await manager.close_all_for_task("t1")
+
+    assert _drain(queue) == [None]
+    assert manager.get_connection_metrics() == []
+
+
+def test_invalid_policy_rejected():
+    with pytest.raises(ValueError):
+        _manager(policy="block")
+
+
+async def test_payload_serialized_once_and_shared():
+    manager = _manager()
+    q1 = await manager.create_sse_connection("t1")
+    q2 = await manager.create_sse_connection("t1")
+
+    await manager.send_event("t1", {"n": 1})
+
+    assert q1.get_nowait() is q2.get_nowait()